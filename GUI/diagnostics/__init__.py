@@ -0,0 +1,2 @@
+# Runtime diagnostics for the desktop app: startup tracing, stall watchdog,
+# trace-event spans and counters, the metrics registry and memory accounting
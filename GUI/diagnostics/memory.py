@@ -0,0 +1,292 @@
+"""
+memory.py
+Memory accounting: retained bytes per subsystem, plus tracemalloc snapshots
+and diffs taken on demand.
+
+Subsystems report through metrics gauges (see metrics.py), so they are only
+measured when a report is asked for:
+
+  - scene bodies, versions and annotations (with footnotes) of every open
+    project editor, via ``track_project``
+  - the kanban undo/redo stacks (``kanban.undo_bytes``)
+  - timeline cards (``timeline.card_bytes``)
+  - cached scene documents (``documents.cached_bytes``)
+
+Sizes are estimates: Python data is measured with ``approximate_size`` and Qt
+objects with per-object costs, because neither ``sys.getsizeof`` nor
+tracemalloc can see memory Qt allocates in C++.
+
+``start_tracing()`` turns on tracemalloc (slowing every allocation, so only
+while someone is looking); ``take_snapshot()`` keeps the last ``SNAPSHOTS``
+snapshots and ``snapshot_diff()`` lists which source lines grew between two of
+them, each tagged with the subsystem its file belongs to.
+This module only uses the standard library.
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+from collections import deque
+from dataclasses import dataclass
+from typing import List, Optional
+
+from GUI.diagnostics import metrics
+
+SNAPSHOTS = 10
+TRACE_FRAMES = 1
+# Gauges behind each subsystem, in the order reports list them
+SUBSYSTEMS = [
+    ("Scene bodies", "scenes.content_bytes"),
+    ("Scene versions", "scenes.versions_bytes"),
+    ("Annotations", "scenes.annotations_bytes"),
+    ("Kanban undo/redo", "kanban.undo_bytes"),
+    ("Timeline cards", "timeline.card_bytes"),
+    ("Cached documents", "documents.cached_bytes"),
+]
+# Source paths (relative to the GUI package) -> subsystem, first match wins
+SOURCE_SUBSYSTEMS = [
+    ("windows/kanban", "kanban"),
+    ("windows/timeline", "timeline"),
+    ("windows/project_editor", "editor"),
+    ("storage/", "storage"),
+    ("export/", "export"),
+    ("diagnostics/", "diagnostics"),
+    ("", "app"),
+]
+GUI_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_snapshots = deque(maxlen=SNAPSHOTS)
+_started_tracing = False  # Only stop tracemalloc if this module started it
+
+
+@dataclass
+class Snapshot:
+    label: str
+    taken_at: float
+    snapshot: tracemalloc.Snapshot
+
+
+@dataclass
+class AllocationDiff:
+    location: str  # "path:line" (or "path" when grouped by file)
+    subsystem: str
+    size: int
+    size_diff: int
+    count_diff: int
+
+
+# Scene gauges -> the scene dict keys they measure
+SCENE_PARTS = {
+    "scenes.content_bytes": ("content",),
+    "scenes.versions_bytes": ("versions",),
+    "scenes.annotations_bytes": ("annotations", "footnotes"),
+}
+
+
+def _scene_bytes(chapters, keys) -> int:
+    total = 0
+    for chapter in chapters:
+        for scene in chapter.get("scenes", []):
+            if not isinstance(scene, dict):
+                # Old projects store a scene as its bare text
+                if keys == SCENE_PARTS["scenes.content_bytes"]:
+                    total += metrics.approximate_size(scene)
+                continue
+            for key in keys:
+                if key in scene:
+                    total += metrics.approximate_size(scene[key])
+    return total
+
+
+def scene_breakdown(chapters) -> dict:
+    """Bytes held by scene bodies, versions and annotations of ``chapters``."""
+    return {name: _scene_bytes(chapters, keys) for name, keys in SCENE_PARTS.items()}
+
+
+def track_project(owner, get_chapters):
+    """
+    Report the scenes of ``get_chapters(owner)`` while ``owner`` is alive
+    (e.g. ``track_project(editor, lambda editor: editor.chapters)``).
+    """
+    for name, keys in SCENE_PARTS.items():
+
+        def read(owner, keys=keys):
+            return _scene_bytes(get_chapters(owner), keys)
+
+        metrics.gauge(name, owner, read)
+
+
+def process_memory() -> dict:
+    """Resident set size of this process now and at its peak (None if unknown)."""
+    rss = peak = None
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            rss = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Reason: Linux reports kilobytes, macOS bytes
+        peak = peak if sys.platform == "darwin" else peak * 1024
+    except (ImportError, OSError):
+        pass
+    return {"rss": rss, "peak_rss": peak}
+
+
+def subsystem_sizes(gauges) -> dict:
+    """Bytes per subsystem label from read gauges (None when not reported)."""
+    return {label: gauges.get(name) for label, name in SUBSYSTEMS}
+
+
+def report(registry=None) -> dict:
+    """
+    Bytes per subsystem (None for subsystems with nothing open), their total,
+    process memory and, while tracing, tracemalloc's current and peak bytes.
+    """
+    subsystems = subsystem_sizes((registry or metrics.REGISTRY).read_gauges())
+    result = {
+        "subsystems": subsystems,
+        "total": sum(size for size in subsystems.values() if size is not None),
+        "process": process_memory(),
+        "traced": None,
+    }
+    traced = traced_memory()
+    if traced is not None:
+        result["traced"] = {"current": traced[0], "peak": traced[1]}
+    return result
+
+
+def subsystem_of(filename) -> str:
+    """The subsystem an allocation's source file belongs to."""
+    path = os.path.abspath(filename)
+    if not path.startswith(GUI_ROOT + os.sep):
+        return "python"
+    relative = path[len(GUI_ROOT) + 1 :].replace(os.sep, "/")
+    for prefix, subsystem in SOURCE_SUBSYSTEMS:
+        if relative.startswith(prefix):
+            return subsystem
+    return "app"
+
+
+def start_tracing(frames=TRACE_FRAMES):
+    """Start tracemalloc (a no-op if something already started it)."""
+    global _started_tracing
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+        _started_tracing = True
+
+
+def stop_tracing():
+    """
+    Forget the snapshots taken and stop tracemalloc if ``start_tracing``
+    started it; tracing started elsewhere (``-X tracemalloc``) keeps running.
+    """
+    global _started_tracing
+    if _started_tracing:
+        tracemalloc.stop()
+        _started_tracing = False
+    _snapshots.clear()
+
+
+def is_tracing() -> bool:
+    return tracemalloc.is_tracing()
+
+
+def traced_memory():
+    """tracemalloc's (current, peak) traced bytes, or None when it is off."""
+    if not tracemalloc.is_tracing():
+        return None
+    return tracemalloc.get_traced_memory()
+
+
+def take_snapshot(label=None) -> Snapshot:
+    """Snapshot the traced allocations; tracing must be on."""
+    if not tracemalloc.is_tracing():
+        raise RuntimeError("Allocation tracing is off; call start_tracing() first")
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ]
+    )
+    record = Snapshot(label or f"Snapshot {len(_snapshots) + 1}", time.time(), snapshot)
+    _snapshots.append(record)
+    return record
+
+
+def snapshots() -> List[Snapshot]:
+    return list(_snapshots)
+
+
+def _location(stat, key_type) -> str:
+    frame = stat.traceback[0]
+    if key_type == "filename":
+        return frame.filename
+    return f"{frame.filename}:{frame.lineno}"
+
+
+def snapshot_diff(
+    older: int = -2,
+    newer: int = -1,
+    limit: Optional[int] = 20,
+    key_type: str = "lineno",
+) -> List[AllocationDiff]:
+    """
+    Where traced memory grew (or shrank) between two kept snapshots, largest
+    change first; ``older`` and ``newer`` index ``snapshots()``.
+    ``limit=None`` returns every location.
+    """
+    if len(_snapshots) < 2:
+        raise ValueError("Need two snapshots to diff")
+    first, second = _snapshots[older], _snapshots[newer]
+    stats = second.snapshot.compare_to(first.snapshot, key_type)
+    return [
+        AllocationDiff(
+            _location(stat, key_type),
+            subsystem_of(stat.traceback[0].filename),
+            stat.size,
+            stat.size_diff,
+            stat.count_diff,
+        )
+        for stat in stats[:limit]
+    ]
+
+
+def top_allocations(
+    index: int = -1, limit: int = 20, key_type: str = "lineno"
+) -> List[AllocationDiff]:
+    """The largest traced allocations of one snapshot (diffs are against nothing)."""
+    if not _snapshots:
+        raise ValueError("No snapshot taken")
+    stats = _snapshots[index].snapshot.statistics(key_type)
+    return [
+        AllocationDiff(
+            _location(stat, key_type),
+            subsystem_of(stat.traceback[0].filename),
+            stat.size,
+            stat.size,
+            stat.count,
+        )
+        for stat in stats[:limit]
+    ]
+
+
+def growth_by_subsystem(older: int = -2, newer: int = -1) -> dict:
+    """Net change in traced bytes per subsystem between two kept snapshots."""
+    totals = {}
+    for diff in snapshot_diff(older, newer, limit=None, key_type="filename"):
+        totals[diff.subsystem] = totals.get(diff.subsystem, 0) + diff.size_diff
+    return totals
+
+
+def latest_diff(limit=20) -> Optional[List[AllocationDiff]]:
+    """Diff of the last two snapshots, or the top of the only one (None if none)."""
+    if len(_snapshots) >= 2:
+        return snapshot_diff(limit=limit)
+    if _snapshots:
+        return top_allocations(limit=limit)
+    return None
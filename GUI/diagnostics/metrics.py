@@ -0,0 +1,188 @@
+"""
+metrics.py
+Central in-process metrics registry read by the Diagnostics panel.
+
+The app feeds it as it works; every call is a dict lookup and a deque append,
+cheap enough for every save and export:
+
+  - ``operation("save.projects", seconds)`` records a timed operation: it adds
+    a sample to the operation's series and to the list of recent operations
+  - ``observe("event_loop.latency_ms", value)`` adds a sample to a series
+  - ``add("json.bytes_written", n)`` adds to a running total
+  - ``gauge("kanban.undo_bytes", board, read)`` registers a value that is only
+    computed when read: ``read(board)`` is called on ``snapshot()``, gauges
+    with the same name are summed, and owners are held weakly so a closed
+    window drops out by itself
+
+Series keep their last ``SAMPLES`` values for percentiles, plus a count and
+running total for the average. This module only uses the standard library.
+"""
+
+import sys
+import threading
+import time
+import weakref
+from collections import deque
+
+SAMPLES = 1000
+RECENT_OPERATIONS = 200
+
+
+def percentile(ordered, fraction):
+    """Nearest-rank percentile of an already sorted list (None if empty)."""
+    if not ordered:
+        return None
+    rank = max(int(round(fraction * len(ordered))) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def approximate_size(obj) -> int:
+    """
+    Deep ``sys.getsizeof`` of plain data (dicts, lists, tuples, sets,
+    strings, numbers); shared objects are counted once.
+    """
+    seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+    return total
+
+
+class Series:
+    """The recent samples of one measured quantity."""
+
+    __slots__ = ("samples", "count", "total", "last")
+
+    def __init__(self, size=SAMPLES):
+        self.samples = deque(maxlen=size)
+        self.count = 0
+        self.total = 0.0
+        self.last = None
+
+    def add(self, value):
+        self.samples.append(value)
+        self.count += 1
+        self.total += value
+        self.last = value
+
+    def summary(self) -> dict:
+        ordered = sorted(self.samples)
+        return {
+            "count": self.count,
+            "last": self.last,
+            "avg": self.total / self.count if self.count else None,
+            "p50": percentile(ordered, 0.50),
+            "p90": percentile(ordered, 0.90),
+            "p99": percentile(ordered, 0.99),
+            "max": ordered[-1] if ordered else None,
+        }
+
+
+class MetricsRegistry:
+    """Series, totals, gauges and recent operations for one process."""
+
+    def __init__(self):
+        self.series = {}
+        self.totals = {}
+        self.operations = deque(maxlen=RECENT_OPERATIONS)  # (name, ms, time)
+        self._gauges = {}  # name -> [(weakref to owner, read)]
+        self._lock = threading.Lock()
+
+    def _series(self, name):
+        series = self.series.get(name)
+        if series is None:
+            with self._lock:
+                series = self.series.setdefault(name, Series())
+        return series
+
+    def observe(self, name, value):
+        self._series(name).add(value)
+
+    def add(self, name, value=1):
+        with self._lock:
+            self.totals[name] = self.totals.get(name, 0) + value
+
+    def operation(self, name, seconds):
+        ms = seconds * 1000
+        self._series(name).add(ms)
+        self.operations.append((name, ms, time.time()))
+
+    def gauge(self, name, owner, read):
+        with self._lock:
+            # Drop owners that are gone, so windows opened all day do not pile up
+            entries = [e for e in self._gauges.get(name, []) if e[0]() is not None]
+            entries.append((weakref.ref(owner), read))
+            self._gauges[name] = entries
+
+    def read_gauges(self) -> dict:
+        values = {}
+        with self._lock:
+            gauges = {name: list(entries) for name, entries in self._gauges.items()}
+        for name, entries in gauges.items():
+            total = None
+            for ref, read in entries:
+                owner = ref()
+                if owner is None:
+                    continue
+                total = (total or 0) + read(owner)
+            with self._lock:
+                live = [e for e in self._gauges.get(name, []) if e[0]() is not None]
+                if live:
+                    self._gauges[name] = live
+                else:
+                    self._gauges.pop(name, None)
+            if total is not None:
+                values[name] = total
+        return values
+
+    def slowest(self, limit=10) -> list:
+        """The slowest of the recent operations, slowest first."""
+        return sorted(self.operations, key=lambda op: -op[1])[:limit]
+
+    def snapshot(self) -> dict:
+        return {
+            "series": {name: s.summary() for name, s in list(self.series.items())},
+            "totals": dict(self.totals),
+            "gauges": self.read_gauges(),
+            "slowest": self.slowest(),
+        }
+
+    def reset(self):
+        """Forget all samples, totals and operations (gauges stay registered)."""
+        with self._lock:
+            self.series = {}
+            self.totals = {}
+        self.operations.clear()
+
+
+REGISTRY = MetricsRegistry()
+
+
+def observe(name, value):
+    REGISTRY.observe(name, value)
+
+
+def add(name, value=1):
+    REGISTRY.add(name, value)
+
+
+def operation(name, seconds):
+    REGISTRY.operation(name, seconds)
+
+
+def gauge(name, owner, read):
+    REGISTRY.gauge(name, owner, read)
+
+
+def snapshot() -> dict:
+    return REGISTRY.snapshot()
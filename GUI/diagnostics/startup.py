@@ -0,0 +1,298 @@
+"""
+startup.py
+Opt-in startup tracer: import times, widget construction and first paint.
+
+Enable it with ``--trace-startup[=PATH]`` on the command line or the
+``WSA_STARTUP_TRACE`` environment variable ("1" or a report path). GUI/main.py
+starts the trace before its first Qt import, so everything the launch path
+imports is measured:
+
+  - imports: an import hook (first on ``sys.meta_path``) times every module
+    as it is loaded, like ``python -X importtime``: cumulative and self time
+    plus nesting depth
+  - spans: ``with span("HomepageWindow"):`` around widget construction and
+    other startup work; a no-op costing one function call when tracing is off
+  - marks: points in time, ending with the main window's first paint
+
+On first paint the report is written as JSON (default
+``startup-trace.json`` in the working directory) and a short summary is
+printed. ``--quit-after-startup`` then exits the app, for benchmarks.
+
+This module does not import Qt at the top level, so it can run before it.
+"""
+
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Optional
+
+ENV_VAR = "WSA_STARTUP_TRACE"
+TRACE_FLAG = "--trace-startup"
+QUIT_FLAG = "--quit-after-startup"
+DEFAULT_REPORT = "startup-trace.json"
+
+_NULL_SPAN = nullcontext()
+_active: Optional["StartupTrace"] = None
+
+
+def _ms(seconds) -> float:
+    return round(seconds * 1000, 3)
+
+
+class _TimedLoader:
+    """Wraps a module's loader for the duration of one import."""
+
+    def __init__(self, loader, trace):
+        self._loader = loader
+        self._trace = trace
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        # Reason: Extension modules do their loading here, so timing starts here
+        self._trace._begin_import(spec.name)
+        try:
+            return self._loader.create_module(spec)
+        except BaseException:
+            self._trace._end_import()
+            raise
+
+    def exec_module(self, module):
+        # The module keeps its real loader; the wrapper leaves no trace
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._trace._end_import()
+
+
+class _ImportHook:
+    """Meta path finder that wraps the loaders other finders return."""
+
+    def __init__(self, trace):
+        self._trace = trace
+
+    def find_spec(self, name, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        loader = spec.loader
+        if loader is not None and hasattr(loader, "exec_module"):
+            spec.loader = _TimedLoader(loader, self._trace)
+        return spec
+
+
+class StartupTrace:
+    """Timings collected from ``start()`` until ``finish()``."""
+
+    def __init__(self, path=DEFAULT_REPORT, quit_when_done=False):
+        self.path = path
+        self.quit_when_done = quit_when_done
+        self.origin = time.perf_counter()
+        self.imports = []  # [module, start, cumulative, self, depth]
+        self.spans = []  # [name, start, duration, depth]
+        self.marks = {}
+        self.finished = False
+        self._import_stack = []  # [record, time spent in nested imports]
+        self._span_depth = 0
+        self._hook = None
+
+    # Imports ------------------------------------------------------------
+
+    def start_imports(self):
+        if self._hook is None:
+            self._hook = _ImportHook(self)
+            sys.meta_path.insert(0, self._hook)
+
+    def stop_imports(self):
+        if self._hook is not None:
+            if self._hook in sys.meta_path:
+                sys.meta_path.remove(self._hook)
+            self._hook = None
+
+    def _begin_import(self, name):
+        now = time.perf_counter()
+        record = [name, now - self.origin, 0.0, 0.0, len(self._import_stack)]
+        self.imports.append(record)
+        self._import_stack.append([record, 0.0, now])
+
+    def _end_import(self):
+        record, nested, started = self._import_stack.pop()
+        elapsed = time.perf_counter() - started
+        record[2] = elapsed
+        record[3] = elapsed - nested
+        if self._import_stack:
+            self._import_stack[-1][1] += elapsed
+
+    # Spans and marks ----------------------------------------------------
+
+    @contextmanager
+    def span(self, name):
+        start = time.perf_counter()
+        record = [name, start - self.origin, 0.0, self._span_depth]
+        self.spans.append(record)
+        self._span_depth += 1
+        try:
+            yield
+        finally:
+            self._span_depth -= 1
+            record[2] = time.perf_counter() - start
+
+    def mark(self, name):
+        self.marks[name] = time.perf_counter() - self.origin
+
+    # Report -------------------------------------------------------------
+
+    def report(self) -> dict:
+        top_level = [record for record in self.imports if record[4] == 0]
+        return {
+            "first_paint_ms": _ms(self.marks.get("first paint", 0.0)),
+            "import_ms": _ms(sum(record[2] for record in top_level)),
+            "modules": len(self.imports),
+            "marks": {name: _ms(value) for name, value in self.marks.items()},
+            "spans": [
+                {"name": name, "start_ms": _ms(start), "ms": _ms(length), "depth": d}
+                for name, start, length, d in self.spans
+            ],
+            "imports": [
+                {
+                    "module": name,
+                    "start_ms": _ms(start),
+                    "ms": _ms(cumulative),
+                    "self_ms": _ms(own),
+                    "depth": depth,
+                }
+                for name, start, cumulative, own, depth in self.imports
+            ],
+        }
+
+    def finish(self) -> dict:
+        """Stop tracing and write the report; returns it."""
+        self.stop_imports()
+        self.finished = True
+        report = self.report()
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(format_summary(report))
+        print(f"[STARTUP] Trace written to {self.path}")
+        return report
+
+
+def format_summary(report, top=10) -> str:
+    """A few lines for the console: totals, spans and the slowest imports."""
+    lines = [
+        f"[STARTUP] First paint {report['first_paint_ms']:.1f} ms, "
+        f"imports {report['import_ms']:.1f} ms ({report['modules']} modules)"
+    ]
+    for span_record in report["spans"]:
+        indent = "  " * span_record["depth"]
+        lines.append(
+            f"[STARTUP]   {indent}{span_record['name']}: {span_record['ms']:.1f} ms"
+        )
+    slowest = sorted(report["imports"], key=lambda record: -record["ms"])[:top]
+    for record in slowest:
+        lines.append(
+            f"[STARTUP]   import {record['module']}: {record['ms']:.1f} ms "
+            f"(self {record['self_ms']:.1f} ms)"
+        )
+    return "\n".join(lines)
+
+
+def parse_options(argv, environ=os.environ):
+    """
+    Return (report path or None, quit after startup) and remove the trace
+    flags from ``argv`` so Qt does not see them.
+    """
+    path = None
+    quit_when_done = False
+    setting = environ.get(ENV_VAR, "")
+    if setting and setting != "0":
+        path = DEFAULT_REPORT if setting == "1" else setting
+    for arg in list(argv[1:]):
+        if arg == TRACE_FLAG or arg.startswith(TRACE_FLAG + "="):
+            path = arg.partition("=")[2] or DEFAULT_REPORT
+            argv.remove(arg)
+        elif arg == QUIT_FLAG:
+            quit_when_done = True
+            argv.remove(arg)
+    return path, quit_when_done
+
+
+def start(path=DEFAULT_REPORT, quit_when_done=False) -> StartupTrace:
+    """Begin tracing now; imports from here on are timed."""
+    global _active
+    if _active is not None:
+        _active.stop_imports()
+    _active = StartupTrace(path, quit_when_done)
+    _active.start_imports()
+    return _active
+
+
+def start_from_argv(argv, environ=os.environ) -> Optional[StartupTrace]:
+    """Start tracing if the command line or environment asks for it."""
+    path, quit_when_done = parse_options(argv, environ)
+    if path is None:
+        return None
+    return start(path, quit_when_done)
+
+
+def active() -> Optional[StartupTrace]:
+    return _active
+
+
+def stop():
+    """Discard the active trace without writing a report."""
+    global _active
+    if _active is not None:
+        _active.stop_imports()
+    _active = None
+
+
+def span(name):
+    """Time a block of startup work; does nothing unless tracing is active."""
+    if _active is None or _active.finished:
+        return _NULL_SPAN
+    return _active.span(name)
+
+
+def mark(name):
+    if _active is not None and not _active.finished:
+        _active.mark(name)
+
+
+def finish_on_first_paint(widget):
+    """
+    Mark the widget's first paint, write the report and, with
+    ``--quit-after-startup``, quit the app. Does nothing unless tracing.
+    """
+    if _active is None or _active.finished:
+        return
+    from PySide6.QtCore import QEvent, QObject, QTimer
+    from PySide6.QtWidgets import QApplication
+
+    trace = _active
+
+    class _FirstPaint(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint and not trace.finished:
+                trace.mark("first paint")
+                widget.removeEventFilter(self)
+                try:
+                    trace.finish()
+                finally:
+                    if trace.quit_when_done:
+                        QTimer.singleShot(0, QApplication.quit)
+            return False
+
+    # Reason: Parented to the widget so the filter lives as long as it does
+    widget.installEventFilter(_FirstPaint(widget))
@@ -0,0 +1,264 @@
+"""
+tracing.py
+Spans and counters for storage, sync and export hot paths, exported as Chrome
+trace-event JSON.
+
+Enable it with ``--trace[=PATH]`` on the command line or the ``WSA_TRACE``
+environment variable ("1" or a report path); the trace is written when the app
+exits (default ``trace.json`` in the working directory). Open it in
+chrome://tracing or https://ui.perfetto.dev.
+
+  - ``@traced("storage")`` times every call of a function; the event is named
+    after the function (``project_store.load_projects``)
+  - ``with span("export", "export", {"format": name}):`` times a block
+  - ``count("session_cache.hit")`` adds to a running counter
+  - ``instant("dashboard.delete_project", "ui", {...})`` marks a point in time
+
+All of them return at once when tracing is off: ``span`` hands back one
+shared no-op context manager and ``traced`` wrappers call straight through,
+a fraction of a microsecond per call, below the ``print`` debugging they
+replace (see benchmarks/bench_tracing.py).
+Events are recorded from any thread (export workers included) and carry
+their thread id. This module only uses the standard library.
+"""
+
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from typing import Optional
+
+ENV_VAR = "WSA_TRACE"
+FLAG = "--trace"
+DEFAULT_REPORT = "trace.json"
+
+_recorder: Optional["TraceRecorder"] = None
+
+
+class _NullSpan:
+    """The span handed out while tracing is off (cheaper than nullcontext)."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Context manager recording one complete ("X") event."""
+
+    __slots__ = ("_recorder", "_name", "_category", "_args", "_start")
+
+    def __init__(self, recorder, name, category, args):
+        self._recorder = recorder
+        self._name = name
+        self._category = category
+        self._args = args
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        args = self._args
+        if exc_type is not None:
+            args = dict(args or {}, error=exc_type.__name__)
+        self._recorder.complete(self._name, self._category, self._start, end, args)
+        return False
+
+
+class TraceRecorder:
+    """Trace events collected from ``enable()`` until ``export()``."""
+
+    def __init__(self, path=DEFAULT_REPORT):
+        self.path = path
+        self.origin = time.perf_counter_ns()
+        self.pid = os.getpid()
+        self.events = []
+        self.counters = {}
+        self._threads = {}
+        self._lock = threading.Lock()
+
+    def _tid(self):
+        tid = threading.get_ident()
+        if tid not in self._threads:
+            self._threads[tid] = threading.current_thread().name
+        return tid
+
+    def _us(self, ns):
+        return (ns - self.origin) / 1000
+
+    def span(self, name, category="app", args=None):
+        return _Span(self, name, category, args)
+
+    def complete(self, name, category, start_ns, end_ns, args=None):
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": self._us(start_ns),
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": self.pid,
+            "tid": self._tid(),
+        }
+        if args:
+            event["args"] = args
+        # Reason: list.append is atomic, so worker threads need no lock here
+        self.events.append(event)
+
+    def count(self, name, value=1):
+        with self._lock:
+            total = self.counters.get(name, 0) + value
+            self.counters[name] = total
+        self.events.append(
+            {
+                "name": name,
+                "ph": "C",
+                "ts": self._us(time.perf_counter_ns()),
+                "pid": self.pid,
+                "tid": self._tid(),
+                "args": {"value": total},
+            }
+        )
+
+    def instant(self, name, category="app", args=None):
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "i",
+            "s": "t",
+            "ts": self._us(time.perf_counter_ns()),
+            "pid": self.pid,
+            "tid": self._tid(),
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def trace(self) -> dict:
+        """The trace in Chrome trace-event format."""
+        names = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": self.pid,
+                "tid": tid,
+                "args": {"name": name},
+            }
+            for tid, name in list(self._threads.items())
+        ]
+        return {
+            "traceEvents": names + list(self.events),
+            "displayTimeUnit": "ms",
+            "otherData": {"counters": dict(self.counters)},
+        }
+
+    def export(self, path=None) -> str:
+        """Write the trace as JSON; returns the path written."""
+        path = path or self.path
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.trace(), f)
+        return path
+
+
+def parse_options(argv, environ=os.environ):
+    """
+    Return the trace report path (None when off) and remove the trace flag
+    from ``argv``.
+    """
+    path = None
+    setting = environ.get(ENV_VAR, "")
+    if setting and setting != "0":
+        path = DEFAULT_REPORT if setting == "1" else setting
+    for arg in list(argv[1:]):
+        if arg == FLAG or arg.startswith(FLAG + "="):
+            path = arg.partition("=")[2] or DEFAULT_REPORT
+            argv.remove(arg)
+    return path
+
+
+def enable(path=DEFAULT_REPORT) -> TraceRecorder:
+    """Start recording; events recorded before are discarded."""
+    global _recorder
+    _recorder = TraceRecorder(path)
+    return _recorder
+
+
+def disable() -> Optional[TraceRecorder]:
+    """Stop recording and return the recorder (not exported)."""
+    global _recorder
+    recorder, _recorder = _recorder, None
+    return recorder
+
+
+def enable_from_argv(argv, environ=os.environ) -> Optional[TraceRecorder]:
+    """
+    Enable tracing if the command line or environment asks for it and write
+    the trace when the process exits.
+    """
+    path = parse_options(argv, environ)
+    if path is None:
+        return None
+    recorder = enable(path)
+
+    def write_at_exit():
+        if _recorder is recorder:
+            print(f"[TRACE] Trace written to {recorder.export()}", file=sys.stderr)
+
+    atexit.register(write_at_exit)
+    return recorder
+
+
+def active() -> Optional[TraceRecorder]:
+    return _recorder
+
+
+def span(name, category="app", args=None):
+    """Time a block; does nothing unless tracing is enabled."""
+    if _recorder is None:
+        return _NULL_SPAN
+    return _Span(_recorder, name, category, args)
+
+
+def count(name, value=1):
+    if _recorder is not None:
+        _recorder.count(name, value)
+
+
+def instant(name, category="app", args=None):
+    if _recorder is not None:
+        _recorder.instant(name, category, args)
+
+
+def traced(category="app", name=None):
+    """
+    Decorator timing every call of a function as a span named
+    ``<module>.<qualname>`` (or ``name``).
+    """
+
+    def decorate(func):
+        span_name = name or (
+            f"{func.__module__.rpartition('.')[2]}.{func.__qualname__}"
+        )
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            recorder = _recorder
+            if recorder is None:
+                return func(*args, **kwargs)
+            with _Span(recorder, span_name, category, None):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
@@ -0,0 +1,290 @@
+"""
+watchdog.py
+Opt-in event-loop stall watchdog: finds where the GUI thread freezes.
+
+Enable it with ``--watchdog[=MS]`` on the command line or the ``WSA_WATCHDOG``
+environment variable ("1" or a threshold in milliseconds). Set
+``WSA_WATCHDOG_LOG`` to a path to also append each stall to a JSON-lines file
+that users can attach to a bug report.
+
+  - a QTimer heartbeat on the GUI thread records when the event loop last ran
+    and the longest gap between beats (event-loop latency)
+  - a helper thread checks the heartbeat; when the GUI thread has been blocked
+    for longer than the threshold it captures the main thread's Python stack
+    (``sys._current_frames``) and logs it with the triggering action: the
+    outermost app function under the event loop, e.g.
+    ``KanbanBoard._autosave``, ``TimelineBoardWidget.dropEvent``
+  - once the loop runs again the stall's total duration is logged
+  - every heartbeat's lateness goes to the metrics registry as
+    ``event_loop.latency_ms`` for the Diagnostics panel
+
+The GUI thread only pays for one timer callback per heartbeat (100 ms by
+default); stacks are captured on the helper thread and only during a stall,
+so the watchdog is cheap enough to leave on.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+from PySide6.QtCore import QTimer
+
+from GUI.diagnostics import metrics
+
+ENV_VAR = "WSA_WATCHDOG"
+LOG_ENV_VAR = "WSA_WATCHDOG_LOG"
+FLAG = "--watchdog"
+THRESHOLD_MS = 500
+HEARTBEAT_MS = 100
+LATENCY_METRIC = "event_loop.latency_ms"
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Reason: Tracing wrappers are never the action that stalled
+DIAGNOSTICS_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+_active: Optional["Watchdog"] = None
+
+
+@dataclass
+class Stall:
+    """One period in which the event loop did not run."""
+
+    trigger: str
+    # "file:line in function" lines, outermost first
+    stack: list = field(default_factory=list)
+    blocked_ms: float = 0.0  # When the stack was captured
+    duration_ms: Optional[float] = None  # Set once the loop runs again
+    started_at: float = 0.0  # time.time() of the last heartbeat before it
+
+
+def _qualname(code) -> str:
+    return getattr(code, "co_qualname", code.co_name)
+
+
+def capture_stack(frame, skip_codes=()):
+    """
+    (trigger, stack lines) for ``frame`` and its callers. The trigger is the
+    outermost frame in the app package called from the frame that runs the
+    event loop (the innermost one whose code is in ``skip_codes``), so the
+    launch script's ``<module>`` frame is never reported; the innermost frame
+    if there is none.
+    """
+    frames = []
+    while frame is not None:
+        frames.append(frame)
+        frame = frame.f_back
+    frames.reverse()
+    stack = [
+        f"{f.f_code.co_filename}:{f.f_lineno} in {_qualname(f.f_code)}" for f in frames
+    ]
+    below_loop = frames
+    for index in range(len(frames) - 1, -1, -1):
+        if frames[index].f_code in skip_codes:
+            below_loop = frames[index + 1 :]
+            break
+    trigger = None
+    for f in below_loop:
+        code = f.f_code
+        filename = code.co_filename
+        if (
+            not filename.startswith(APP_ROOT)
+            or filename.startswith(DIAGNOSTICS_ROOT)
+        ):
+            continue
+        trigger = _qualname(code)
+        break
+    if trigger is None:
+        trigger = _qualname(frames[-1].f_code) if frames else "<unknown>"
+    return trigger, stack
+
+
+class Watchdog:
+    """Heartbeat on the GUI thread plus a helper thread watching it."""
+
+    def __init__(
+        self,
+        threshold_ms=THRESHOLD_MS,
+        heartbeat_ms=HEARTBEAT_MS,
+        log_path=None,
+        skip_codes=(),
+    ):
+        self.threshold = threshold_ms / 1000
+        self.heartbeat = heartbeat_ms / 1000
+        self.log_path = log_path
+        self.skip_codes = frozenset(skip_codes)
+        self.stalls = []
+        self.beats = 0
+        self.max_gap = 0.0
+        self._main_ident = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stopping = threading.Event()
+        self._timer = QTimer()
+        self._timer.setInterval(heartbeat_ms)
+        self._timer.timeout.connect(self._beat)
+        self._thread = threading.Thread(
+            target=self._watch, name="event-loop-watchdog", daemon=True
+        )
+
+    def start(self):
+        self._last_beat = time.monotonic()
+        self._timer.start()
+        self._thread.start()
+
+    def stop(self):
+        self._timer.stop()
+        self._stopping.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def stats(self) -> dict:
+        """Heartbeats seen, worst event-loop latency and stalls so far."""
+        latency = max(self.max_gap - self.heartbeat, 0.0)
+        return {
+            "beats": self.beats,
+            "max_latency_ms": round(latency * 1000, 1),
+            "stalls": len(self.stalls),
+        }
+
+    # GUI thread ---------------------------------------------------------
+
+    def _beat(self):
+        now = time.monotonic()
+        gap = now - self._last_beat
+        self._last_beat = now
+        self.beats += 1
+        if gap > self.max_gap:
+            self.max_gap = gap
+        metrics.observe(LATENCY_METRIC, max(gap - self.heartbeat, 0.0) * 1000)
+
+    # Helper thread ------------------------------------------------------
+
+    def _watch(self):
+        poll = min(self.heartbeat, self.threshold / 4)
+        stall = None
+        stalled_since = 0.0
+        while not self._stopping.wait(poll):
+            beat = self._last_beat
+            if stall is not None:
+                if beat != stalled_since:
+                    duration = beat - stalled_since - self.heartbeat
+                    stall.duration_ms = round(max(duration, 0.0) * 1000, 1)
+                    self._report_end(stall)
+                    stall = None
+                continue
+            blocked = time.monotonic() - beat - self.heartbeat
+            if blocked >= self.threshold:
+                stall = self._capture(blocked, beat)
+                stalled_since = beat
+        if stall is not None:
+            self._report_end(stall)
+
+    def _capture(self, blocked, beat) -> Stall:
+        frame = sys._current_frames().get(self._main_ident)
+        trigger, stack = capture_stack(frame, self.skip_codes)
+        stall = Stall(
+            trigger,
+            stack,
+            blocked_ms=round(blocked * 1000, 1),
+            started_at=time.time() - (time.monotonic() - beat),
+        )
+        self.stalls.append(stall)
+        print(
+            f"[WATCHDOG] Event loop blocked for {stall.blocked_ms:.0f} ms "
+            f"in {trigger}:",
+            file=sys.stderr,
+        )
+        for line in stack:
+            print(f"[WATCHDOG]   {line}", file=sys.stderr)
+        return stall
+
+    def _report_end(self, stall):
+        if stall.duration_ms is not None:
+            print(
+                f"[WATCHDOG] Event loop stalled {stall.duration_ms:.0f} ms "
+                f"in {stall.trigger}",
+                file=sys.stderr,
+            )
+        if self.log_path:
+            try:
+                with open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(asdict(stall)) + "\n")
+            except OSError as e:
+                print(
+                    f"[WATCHDOG] Could not write {self.log_path}: {e}",
+                    file=sys.stderr,
+                )
+
+
+def parse_options(argv, environ=os.environ):
+    """
+    Return the stall threshold in ms (None when off) and remove the watchdog
+    flag from ``argv``.
+    """
+    threshold = None
+    setting = environ.get(ENV_VAR, "")
+    if setting and setting != "0":
+        threshold = THRESHOLD_MS if setting == "1" else _threshold(ENV_VAR, setting)
+    for arg in list(argv[1:]):
+        if arg == FLAG or arg.startswith(FLAG + "="):
+            value = arg.partition("=")[2]
+            threshold = _threshold(FLAG, value) if value else THRESHOLD_MS
+            argv.remove(arg)
+    return threshold
+
+
+def _threshold(name, value) -> float:
+    """``value`` in ms, or ``THRESHOLD_MS`` (with a warning) if it is not one."""
+    try:
+        threshold = float(value)
+    except ValueError:
+        threshold = None
+    # Reason: A diagnostics opt-in must never stop the app from launching
+    if threshold is None or not 0 < threshold < float("inf"):
+        print(
+            f"[WATCHDOG] Ignoring {name}={value!r}: expected a threshold in ms; "
+            f"using {THRESHOLD_MS} ms",
+            file=sys.stderr,
+        )
+        return THRESHOLD_MS
+    return threshold
+
+
+def start(threshold_ms=THRESHOLD_MS, heartbeat_ms=HEARTBEAT_MS, log_path=None):
+    """
+    Start watching the event loop of the calling (GUI) thread. The caller's
+    frame is treated as the one that runs the loop, so it is never reported
+    as the trigger. A QApplication must exist.
+    """
+    return _start(sys._getframe(1).f_code, threshold_ms, heartbeat_ms, log_path)
+
+
+def _start(loop_code, *args) -> Watchdog:
+    global _active
+    stop()
+    _active = Watchdog(*args, skip_codes=(loop_code,))
+    _active.start()
+    return _active
+
+
+def start_from_argv(argv, environ=os.environ) -> Optional[Watchdog]:
+    """Start the watchdog if the command line or environment asks for it."""
+    threshold = parse_options(argv, environ)
+    if threshold is None:
+        return None
+    log_path = environ.get(LOG_ENV_VAR) or None
+    return _start(sys._getframe(1).f_code, threshold, HEARTBEAT_MS, log_path)
+
+
+def active() -> Optional[Watchdog]:
+    return _active
+
+
+def stop():
+    """Stop the active watchdog, if any."""
+    global _active
+    if _active is not None:
+        _active.stop()
+    _active = None
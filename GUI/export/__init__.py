@@ -0,0 +1,30 @@
+# Export pipeline (pure Python, no Qt): formats, render cache, streaming writer,
+# parallel batch export, the DOCX and PDF writers, read-only snapshots and
+# bounded previews
+from GUI.export.formats import FORMATS, ExportFormat, get_format
+from GUI.export.render_cache import RenderCache, clear_render_cache
+from GUI.export.streaming import ExportCancelled, export_project, write_project
+from GUI.export.batch import ExportJob, plan_jobs, run_batch
+from GUI.export.snapshot import FrozenDict, snapshot_project
+from GUI.export.preview import Preview, preview_export
+
+# Reason: Binary writers register themselves with FORMATS on import
+from GUI.export import docx_writer, pdf_writer  # noqa: F401,E402
+
+__all__ = [
+    "FORMATS",
+    "ExportFormat",
+    "get_format",
+    "RenderCache",
+    "clear_render_cache",
+    "ExportCancelled",
+    "export_project",
+    "write_project",
+    "ExportJob",
+    "plan_jobs",
+    "run_batch",
+    "FrozenDict",
+    "snapshot_project",
+    "Preview",
+    "preview_export",
+]
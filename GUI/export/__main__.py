@@ -0,0 +1,7 @@
+# Entry point for ``python -m GUI.export`` (see cli.py)
+import sys
+
+from GUI.export.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,293 @@
+"""
+batch.py
+Parallel export of several formats for one or many projects.
+
+Every (project, format) pair is an ExportJob. Jobs in streamable formats are
+split into chapter ranges ("segments") of roughly ``SEGMENT_SCENES`` scenes.
+Segments from all jobs fan out over a process pool and are written to
+temporary files. The parent process then stitches each job together in
+order between the format's header and footer, so the output is
+byte-identical to export_project. Formats that cannot be streamed in pieces
+(``segmentable = False``) run as one task.
+
+Workers use the "spawn" start method: forking a process that is running Qt
+threads is unsafe, and the workers only import this pure-Python package.
+"""
+
+import concurrent.futures
+import multiprocessing
+import os
+import re
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+from GUI.export.formats import get_format
+from GUI.export.render_cache import RenderCache, cache_namespace
+from GUI.export.streaming import (
+    WRITE_BUFFER_SIZE,
+    ExportCancelled,
+    count_scenes,
+    export_project,
+    write_chapters,
+)
+
+SEGMENT_SCENES = 200
+POLL_INTERVAL = 0.1  # Seconds between cancellation checks while waiting
+
+
+@dataclass
+class ExportJob:
+    """One project exported to one format; progress fields are filled in."""
+
+    project: dict
+    format_name: str
+    output_path: str
+    options: dict = field(default_factory=dict)
+    total: int = 0  # Scenes in the project
+    done: int = 0  # Scenes written so far
+    error: Optional[str] = None
+    finished: bool = False
+
+
+def output_filename(title, extension) -> str:
+    """File name for an exported project, safe on every platform."""
+    stem = re.sub(r'[\\/:*?"<>|\x00-\x1f]+', "_", title or "").strip(" .")
+    return f"{stem or 'project'}.{extension}"
+
+
+def plan_jobs(projects, format_names, output_dir, options=None) -> List[ExportJob]:
+    """
+    One job per (project, format), written to ``output_dir``. Projects with
+    the same title get numbered file names instead of overwriting each other.
+    """
+    jobs = []
+    used = set()
+    for project in projects:
+        for format_name in format_names:
+            extension = get_format(format_name).extension
+            name = output_filename(project.get("title", "project"), extension)
+            stem, number = name[: -len(extension) - 1], 2
+            while name in used:
+                name = f"{stem} ({number}).{extension}"
+                number += 1
+            used.add(name)
+            jobs.append(
+                ExportJob(
+                    project,
+                    format_name,
+                    os.path.join(output_dir, name),
+                    dict(options or {}),
+                )
+            )
+    return jobs
+
+
+def split_chapters(chapters, segment_scenes=SEGMENT_SCENES):
+    """Split chapters into (start, stop, scenes) ranges of about N scenes."""
+    ranges = []
+    start = scenes = 0
+    for index, chapter in enumerate(chapters):
+        scenes += len(chapter.get("scenes", []))
+        if scenes >= segment_scenes:
+            ranges.append((start, index + 1, scenes))
+            start, scenes = index + 1, 0
+    if start < len(chapters):
+        ranges.append((start, len(chapters), scenes))
+    return ranges
+
+
+def _render_segment(
+    format_name, options, chapters, first_index, last_index, path, cache_path
+):
+    """Worker: write one chapter range to ``path``."""
+    fmt = get_format(format_name, **options)
+    if cache_path is not None and fmt.cacheable:
+        fmt.render_cache = RenderCache(
+            cache_path, cache_namespace(fmt.name, fmt.options)
+        )
+    try:
+        with open(
+            path, "w", encoding="utf-8", newline="", buffering=WRITE_BUFFER_SIZE
+        ) as out:
+            return write_chapters(chapters, fmt, out, first_index, last_index)
+    finally:
+        if fmt.render_cache is not None:
+            fmt.render_cache.close()
+
+
+def _export_whole(format_name, options, project, output_path, cache_path):
+    """Worker: export a project in a format that is not split into segments."""
+    export_project(
+        project, format_name, output_path, options=options, cache_path=cache_path
+    )
+    return count_scenes(project)
+
+
+def _assemble(job, segment_paths):
+    """Join a job's segment files between the header and footer."""
+    fmt = get_format(job.format_name, **job.options)
+    partial_path = job.output_path + ".part"
+    try:
+        with open(
+            partial_path,
+            "w",
+            encoding="utf-8",
+            newline="",
+            buffering=WRITE_BUFFER_SIZE,
+        ) as out:
+            out.write(fmt.header(job.project))
+            for path in segment_paths:
+                with open(path, "r", encoding="utf-8", newline="") as segment:
+                    shutil.copyfileobj(segment, out, WRITE_BUFFER_SIZE)
+            out.write(fmt.footer(job.project))
+        os.replace(partial_path, job.output_path)
+    except BaseException:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+
+
+class _InlineExecutor:
+    """
+    Runs tasks in this process (max_workers=1), one per ``run_next()`` call,
+    so cancellation is still checked between segments.
+    """
+
+    def __init__(self):
+        self._queue = []
+
+    def submit(self, fn, *args):
+        future = concurrent.futures.Future()
+        self._queue.append((future, fn, args))
+        return future
+
+    def run_next(self):
+        if not self._queue:
+            return
+        future, fn, args = self._queue.pop(0)
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self._queue = []
+
+
+def run_batch(
+    jobs: List[ExportJob],
+    max_workers: Optional[int] = None,
+    progress: Optional[Callable[[ExportJob, int, int], None]] = None,
+    job_finished: Optional[Callable[[ExportJob], None]] = None,
+    is_cancelled: Optional[Callable[[], bool]] = None,
+    cache_path=None,
+    segment_scenes: int = SEGMENT_SCENES,
+) -> List[ExportJob]:
+    """
+    Run export jobs across a process pool (``max_workers`` defaults to the
+    CPU count; 1 runs everything in this process).
+
+    ``progress(job, done, total)`` reports overall scenes written after every
+    completed segment. ``job_finished(job)`` is called once per job, with
+    ``job.error`` set if it failed; a failed job does not stop the others.
+    Raises ExportCancelled when ``is_cancelled`` returns True. Jobs that were
+    already finished keep their output; unfinished jobs write nothing.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers <= 1:
+        executor = _InlineExecutor()
+    else:
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    overall_total = 0
+    overall_done = 0
+    pending = {}  # future -> (job index, scenes)
+    segments = {}  # job index -> [segment path, ...]
+    remaining = {}  # job index -> unfinished task count
+
+    def finish(index):
+        job = jobs[index]
+        if job.error is None and index in segments:
+            try:
+                _assemble(job, segments[index])
+            except Exception as e:
+                job.error = str(e)
+        job.finished = True
+        if job_finished is not None:
+            job_finished(job)
+
+    with tempfile.TemporaryDirectory(prefix="export-batch-") as temp_dir:
+        try:
+            for index, job in enumerate(jobs):
+                try:
+                    fmt = get_format(job.format_name, **job.options)
+                except ValueError as e:
+                    job.error = str(e)
+                    finish(index)
+                    continue
+                job.total = count_scenes(job.project)
+                overall_total += job.total
+                if not fmt.segmentable:
+                    future = executor.submit(
+                        _export_whole,
+                        job.format_name,
+                        job.options,
+                        job.project,
+                        job.output_path,
+                        cache_path,
+                    )
+                    pending[future] = (index, job.total)
+                    remaining[index] = 1
+                    continue
+                chapters = job.project.get("chapters", [])
+                ranges = split_chapters(chapters, segment_scenes)
+                segments[index] = []
+                remaining[index] = len(ranges)
+                for number, (start, stop, scenes) in enumerate(ranges):
+                    path = os.path.join(temp_dir, f"{index}-{number}")
+                    segments[index].append(path)
+                    future = executor.submit(
+                        _render_segment,
+                        job.format_name,
+                        job.options,
+                        chapters[start:stop],
+                        start,
+                        len(chapters) - 1,
+                        path,
+                        cache_path,
+                    )
+                    pending[future] = (index, scenes)
+                if not ranges:
+                    finish(index)
+
+            while pending:
+                if is_cancelled is not None and is_cancelled():
+                    raise ExportCancelled()
+                if isinstance(executor, _InlineExecutor):
+                    executor.run_next()
+                completed, _ = concurrent.futures.wait(
+                    pending,
+                    timeout=POLL_INTERVAL,
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                for future in completed:
+                    index, scenes = pending.pop(future)
+                    job = jobs[index]
+                    error = future.exception()
+                    if error is not None and job.error is None:
+                        job.error = str(error)
+                    job.done += scenes
+                    overall_done += scenes
+                    if progress is not None:
+                        progress(job, overall_done, overall_total)
+                    remaining[index] -= 1
+                    if remaining[index] == 0:
+                        finish(index)
+        finally:
+            # Reason: Stop queued segments before their files are removed
+            executor.shutdown(wait=True, cancel_futures=True)
+    return jobs
@@ -0,0 +1,177 @@
+"""
+cli.py
+Headless command-line export: ``python -m GUI.export``.
+
+Loads projects from GUI/storage/projects.json (or --projects-file) and runs
+them through the same formats, render cache and batch pipeline as the
+ExportDialog. Nothing here imports PySide6, so it runs on servers without a
+display and starts in milliseconds.
+
+Examples:
+    python -m GUI.export --list
+    python -m GUI.export "My Novel" -f Markdown -f Fountain -o build/
+    python -m GUI.export --glob "Draft*" --all-formats -j 4 -o build/
+    python -m GUI.export --all -f JSON -o backups/
+"""
+
+import argparse
+import fnmatch
+import os
+import sys
+import time
+
+from GUI.export.batch import plan_jobs, run_batch
+from GUI.export.formats import FORMATS
+from GUI.export.streaming import ExportCancelled
+from GUI.storage import project_store
+from GUI.storage.project_store import EXPORT_CACHE_FILE, PROJECTS_FILE
+from GUI.storage.scene_content import migrate_projects
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m GUI.export",
+        description="Export projects without starting the GUI.",
+    )
+    parser.add_argument("titles", nargs="*", help="project titles to export")
+    parser.add_argument(
+        "-g",
+        "--glob",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="also export projects whose title matches PATTERN (repeatable)",
+    )
+    parser.add_argument("--all", action="store_true", help="export every project")
+    parser.add_argument(
+        "-f",
+        "--format",
+        action="append",
+        dest="formats",
+        choices=sorted(FORMATS),
+        metavar="FORMAT",
+        help=f"output format, repeatable (one of: {', '.join(FORMATS)}; "
+        "default: Markdown)",
+    )
+    parser.add_argument(
+        "--all-formats", action="store_true", help="export every available format"
+    )
+    parser.add_argument(
+        "-o", "--output-dir", default=".", help="directory for exported files"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="worker processes (0 = one per CPU; default 1, no pool start-up)",
+    )
+    parser.add_argument(
+        "--projects-file", default=PROJECTS_FILE, help="projects JSON to read"
+    )
+    parser.add_argument(
+        "--cache",
+        default=EXPORT_CACHE_FILE,
+        metavar="PATH",
+        help="render cache file (default: next to the projects)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="do not read or write the cache"
+    )
+    parser.add_argument(
+        "--no-highlights",
+        action="store_true",
+        help="drop annotation highlight markup",
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="list project titles and exit"
+    )
+    parser.add_argument("-q", "--quiet", action="store_true", help="only errors")
+    return parser
+
+
+def load_projects(path):
+    """
+    Projects from ``path`` as dicts, with scenes in compact form. Entries the
+    dashboard saved as a bare name become a project with no chapters.
+    """
+    projects = project_store.load_projects(path)
+    migrate_projects(projects)
+    return [
+        project
+        if isinstance(project, dict)
+        else {"title": str(project), "chapters": []}
+        for project in projects
+    ]
+
+
+def select_projects(projects, titles, patterns, select_all):
+    """Projects named in ``titles`` or matching a glob, in file order."""
+    if select_all:
+        return list(projects)
+    wanted = set(titles)
+    return [
+        project
+        for project in projects
+        if project.get("title") in wanted
+        or any(fnmatch.fnmatchcase(project.get("title", ""), p) for p in patterns)
+    ]
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    projects = load_projects(args.projects_file)
+
+    if args.list:
+        for project in projects:
+            chapters = project.get("chapters", [])
+            scenes = sum(len(ch.get("scenes", [])) for ch in chapters)
+            title = project.get("title", "")
+            print(f"{title}\t{len(chapters)} chapters\t{scenes} scenes")
+        return 0
+
+    if not (args.titles or args.glob or args.all):
+        parser.error("name projects to export, or use --glob or --all")
+    selected = select_projects(projects, args.titles, args.glob, args.all)
+    missing = set(args.titles) - {p.get("title") for p in projects}
+    for title in sorted(missing):
+        print(f"error: no project titled '{title}'", file=sys.stderr)
+    if not selected:
+        print("error: no projects matched", file=sys.stderr)
+        return 1
+
+    formats = list(FORMATS) if args.all_formats else args.formats or ["Markdown"]
+    os.makedirs(args.output_dir, exist_ok=True)
+    options = {"highlights": not args.no_highlights}
+    jobs = plan_jobs(selected, formats, args.output_dir, options)
+
+    def report(job):
+        if job.error:
+            title = job.project.get("title")
+            print(
+                f"error: {job.format_name} export of '{title}' failed: {job.error}",
+                file=sys.stderr,
+            )
+        elif not args.quiet:
+            print(f"{job.format_name}: {job.output_path}")
+
+    start = time.perf_counter()
+    try:
+        run_batch(
+            jobs,
+            max_workers=args.jobs or None,
+            job_finished=report,
+            cache_path=None if args.no_cache else args.cache,
+        )
+    except (ExportCancelled, KeyboardInterrupt):
+        print("export cancelled", file=sys.stderr)
+        return 130
+    failed = sum(1 for job in jobs if job.error)
+    if not args.quiet:
+        print(
+            f"{len(jobs) - failed}/{len(jobs)} exports in "
+            f"{time.perf_counter() - start:.2f}s"
+        )
+    return 1 if failed or missing else 0
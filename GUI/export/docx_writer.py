@@ -0,0 +1,549 @@
+"""
+docx_writer.py
+Streaming DOCX (WordprocessingML) export without third-party packages.
+
+The .docx package is written with ``zipfile``. ``word/document.xml`` is
+streamed into the archive one scene at a time, so memory stays bounded by the
+largest scene no matter how long the manuscript is. Word comments and
+footnotes live in their own parts; they are spooled to temporary files while
+the document streams and copied into the archive at the end (a zip archive
+can only have one entry open for writing).
+
+Mapping:
+  - project title -> Title paragraph; chapters -> Heading 1 (each chapter
+    starts on a new page); scenes -> Heading 2
+  - scene rich text (parsed by html_convert.parse_blocks) -> paragraphs with
+    bold, italic, underline and highlight runs, line breaks and numbered or
+    bulleted list paragraphs; headings inside a scene become Heading 3+
+  - scene "annotations" -> Word comments anchored on the annotated range
+  - scene "footnotes" -> Word footnotes referenced after the annotated text
+
+Annotation and footnote offsets are QTextCursor positions, i.e. offsets into
+the scene's plain text (see scene_text.py); the writer counts the same way
+while emitting runs. With ``highlights=False`` (export without annotations)
+highlights, comments and footnotes are all left out.
+"""
+
+import re
+import shutil
+import tempfile
+import zipfile
+from datetime import datetime, timezone
+from xml.sax.saxutils import escape
+
+from GUI.export.formats import ExportFormat, register_format, scene_body, scene_title
+from GUI.export.html_convert import (
+    BOLD,
+    BREAK,
+    HIGHLIGHT,
+    ITALIC,
+    UNDERLINE,
+    parse_blocks,
+)
+from GUI.export.streaming import ExportCancelled, count_scenes
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+XML_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml."
+
+# Characters XML 1.0 cannot contain
+INVALID_XML_RE = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+# Word's fixed highlight palette
+HIGHLIGHT_NAMES = {
+    "#ffff00": "yellow",
+    "#00ffff": "cyan",
+    "#00ff00": "green",
+    "#ff00ff": "magenta",
+    "#ff0000": "red",
+    "#0000ff": "blue",
+    "#c0c0c0": "lightGray",
+    "#808080": "darkGray",
+}
+
+# Event kinds at a plain-text offset, in the order they are emitted
+_COMMENT_START, _COMMENT_END, _FOOTNOTE = 0, 1, 2
+
+
+def _text(value) -> str:
+    return escape(INVALID_XML_RE.sub("", str(value)))
+
+
+def _t(text) -> str:
+    return f'<w:t xml:space="preserve">{_text(text)}</w:t>'
+
+
+def _run_xml(text, flags, colour, highlights):
+    props = ""
+    if flags & BOLD:
+        props += "<w:b/>"
+    if flags & ITALIC:
+        props += "<w:i/>"
+    if flags & HIGHLIGHT and highlights:
+        name = HIGHLIGHT_NAMES.get((colour or "").lower(), "yellow")
+        props += f'<w:highlight w:val="{name}"/>'
+    if flags & UNDERLINE:
+        props += '<w:u w:val="single"/>'
+    if props:
+        props = f"<w:rPr>{props}</w:rPr>"
+    parts = text.split("\u2028")
+    return "<w:r>" + props + "<w:br/>".join(_t(part) for part in parts) + "</w:r>"
+
+
+def _paragraph(style, content="", extra_props=""):
+    props = f'<w:pStyle w:val="{style}"/>' if style else ""
+    props += extra_props
+    if props:
+        props = f"<w:pPr>{props}</w:pPr>"
+    return f"<w:p>{props}{content}</w:p>"
+
+
+def _annotation_events(scene, comment_id, footnote_id):
+    """Sorted (offset, kind, id, note) events; ids are allocated here."""
+    events = []
+    for note in scene.get("annotations") or []:
+        start, end = _note_range(note)
+        events.append((start, _COMMENT_START, comment_id, note))
+        events.append((end, _COMMENT_END, comment_id, note))
+        comment_id += 1
+    for note in scene.get("footnotes") or []:
+        events.append((_note_range(note)[1], _FOOTNOTE, footnote_id, note))
+        footnote_id += 1
+    events.sort(key=lambda event: (event[0], event[1], event[2]))
+    return events, comment_id, footnote_id
+
+
+def _note_range(note):
+    try:
+        start = max(0, int(note.get("start", 0)))
+        end = max(start, int(note.get("end", start)))
+    except (TypeError, ValueError):
+        start = end = 0
+    return start, end
+
+
+class DocxWriter:
+    """
+    Write a .docx package incrementally: call ``heading``/``scene`` in
+    document order, then ``close()``.
+    """
+
+    def __init__(self, path, title="", author="", highlights=True):
+        self.highlights = highlights
+        self.author = author or "Author"
+        self._comment_id = 0
+        self._footnote_id = 1  # 0 and -1 are the separator footnotes
+        self._ordered_lists = 0  # Each numbered list restarts at 1
+        self._zip = zipfile.ZipFile(
+            path, "w", compression=zipfile.ZIP_DEFLATED, allowZip64=True
+        )
+        self._comments = tempfile.TemporaryFile()
+        self._footnotes = tempfile.TemporaryFile()
+        self._write_static_parts(title)
+        self._document = self._zip.open("word/document.xml", "w", force_zip64=True)
+        self._write(
+            self._document,
+            XML_HEADER + f'<w:document xmlns:w="{W_NS}" xmlns:r="{R_NS}"><w:body>',
+        )
+        if title:
+            self._write(
+                self._document, _paragraph("Title", _run_xml(title, 0, None, False))
+            )
+
+    @staticmethod
+    def _write(stream, text):
+        stream.write(text.encode("utf-8"))
+
+    # Document content ---------------------------------------------------
+
+    def heading(self, text, level, page_break=False):
+        extra = "<w:pageBreakBefore/>" if page_break else ""
+        self._write(
+            self._document,
+            _paragraph(f"Heading{level}", _run_xml(text, 0, None, False), extra),
+        )
+
+    def scene(self, scene):
+        """Write one scene body with its comments and footnotes."""
+        if self.highlights and isinstance(scene, dict):
+            events, self._comment_id, self._footnote_id = _annotation_events(
+                scene, self._comment_id, self._footnote_id
+            )
+        else:
+            events = []
+        paragraphs = []
+        list_numbers = {}  # list id -> numId for this scene's ordered lists
+        offset = 0
+        for index, block in enumerate(parse_blocks(scene_body(scene))):
+            if index:
+                offset += 1  # Block separator
+            content = []
+            for text, flags, _, colour in block.runs:
+                if flags & BREAK:
+                    self._emit_events(events, offset, content)
+                    content.append("<w:r><w:br/></w:r>")
+                    offset += 1
+                    continue
+                pos = 0
+                while events and events[0][0] <= offset + len(text):
+                    cut = min(max(events[0][0] - offset, pos), len(text))
+                    if cut > pos:
+                        content.append(
+                            _run_xml(text[pos:cut], flags, colour, self.highlights)
+                        )
+                    pos = cut
+                    self._emit_event(events.pop(0), content)
+                if pos < len(text):
+                    content.append(
+                        _run_xml(text[pos:], flags, colour, self.highlights)
+                    )
+                offset += len(text)
+            paragraphs.append(
+                (self._block_style(block, list_numbers), content)
+            )
+        if events:
+            # Reason: Notes past the end of the text still need an anchor
+            if not paragraphs:
+                paragraphs.append(((None, ""), []))
+            while events:
+                self._emit_event(events.pop(0), paragraphs[-1][1])
+        self._write(
+            self._document,
+            "".join(
+                _paragraph(style, "".join(content), extra)
+                for (style, extra), content in paragraphs
+            ),
+        )
+
+    def _emit_events(self, events, offset, content):
+        while events and events[0][0] <= offset:
+            self._emit_event(events.pop(0), content)
+
+    def _block_style(self, block, list_numbers):
+        if block.kind == "heading":
+            return f"Heading{min(block.level + 2, 6)}", ""
+        if block.kind != "li":
+            return None, ""
+        if block.ordered:
+            if block.list_id not in list_numbers:
+                self._ordered_lists += 1
+                list_numbers[block.list_id] = self._ordered_lists + 1
+            num_id = list_numbers[block.list_id]
+        else:
+            num_id = 1
+        level = min(block.level - 1, 8)
+        return "ListParagraph", (
+            f'<w:numPr><w:ilvl w:val="{level}"/><w:numId w:val="{num_id}"/></w:numPr>'
+        )
+
+    def _emit_event(self, event, content):
+        _, kind, note_id, note = event
+        if kind == _COMMENT_START:
+            content.append(f'<w:commentRangeStart w:id="{note_id}"/>')
+            self._write(
+                self._comments,
+                f'<w:comment w:id="{note_id}" w:author="{_text(self.author)}">'
+                + _paragraph(
+                    "CommentText",
+                    '<w:r><w:rPr><w:rStyle w:val="CommentReference"/></w:rPr>'
+                    "<w:annotationRef/></w:r>"
+                    + _run_xml(note.get("note", ""), 0, None, False),
+                )
+                + "</w:comment>",
+            )
+        elif kind == _COMMENT_END:
+            content.append(
+                f'<w:commentRangeEnd w:id="{note_id}"/>'
+                '<w:r><w:rPr><w:rStyle w:val="CommentReference"/></w:rPr>'
+                f'<w:commentReference w:id="{note_id}"/></w:r>'
+            )
+        else:
+            content.append(
+                '<w:r><w:rPr><w:rStyle w:val="FootnoteReference"/></w:rPr>'
+                f'<w:footnoteReference w:id="{note_id}"/></w:r>'
+            )
+            self._write(
+                self._footnotes,
+                f'<w:footnote w:id="{note_id}">'
+                + _paragraph(
+                    "FootnoteText",
+                    '<w:r><w:rPr><w:rStyle w:val="FootnoteReference"/></w:rPr>'
+                    "<w:footnoteRef/></w:r>"
+                    + _run_xml(" " + str(note.get("note", "")), 0, None, False),
+                )
+                + "</w:footnote>",
+            )
+
+    # Package parts ------------------------------------------------------
+
+    def close(self):
+        """Finish document.xml and write the remaining parts."""
+        if self._zip is None:
+            return
+        try:
+            self._write(
+                self._document,
+                '<w:sectPr><w:pgSz w:w="12240" w:h="15840"/>'
+                '<w:pgMar w:top="1440" w:right="1440" w:bottom="1440" '
+                'w:left="1440" w:header="720" w:footer="720" w:gutter="0"/>'
+                "</w:sectPr></w:body></w:document>",
+            )
+            self._document.close()
+            self._zip.writestr("word/numbering.xml", self._numbering_xml())
+            self._copy_part(
+                "word/footnotes.xml",
+                XML_HEADER + f'<w:footnotes xmlns:w="{W_NS}">'
+                '<w:footnote w:type="separator" w:id="-1"><w:p><w:r>'
+                "<w:separator/></w:r></w:p></w:footnote>"
+                '<w:footnote w:type="continuationSeparator" w:id="0"><w:p><w:r>'
+                "<w:continuationSeparator/></w:r></w:p></w:footnote>",
+                self._footnotes,
+                "</w:footnotes>",
+            )
+            self._copy_part(
+                "word/comments.xml",
+                XML_HEADER + f'<w:comments xmlns:w="{W_NS}">',
+                self._comments,
+                "</w:comments>",
+            )
+        finally:
+            self.abort()
+
+    def abort(self):
+        """Release files without finishing (used when an export fails)."""
+        if self._zip is None:
+            return
+        if not self._document.closed:
+            self._document.close()
+        self._zip.close()
+        self._zip = None
+        self._comments.close()
+        self._footnotes.close()
+
+    def _copy_part(self, name, head, spool, tail):
+        with self._zip.open(name, "w", force_zip64=True) as part:
+            part.write(head.encode("utf-8"))
+            spool.seek(0)
+            shutil.copyfileobj(spool, part)
+            part.write(tail.encode("utf-8"))
+
+    def _numbering_xml(self):
+        def levels(fmt, text):
+            return "".join(
+                f'<w:lvl w:ilvl="{i}"><w:start w:val="1"/>'
+                f'<w:numFmt w:val="{fmt}"/><w:lvlText w:val="{text(i)}"/>'
+                '<w:lvlJc w:val="left"/><w:pPr>'
+                f'<w:ind w:left="{720 * (i + 1)}" w:hanging="360"/></w:pPr></w:lvl>'
+                for i in range(9)
+            )
+
+        nums = ['<w:num w:numId="1"><w:abstractNumId w:val="0"/></w:num>']
+        for num_id in range(2, self._ordered_lists + 2):
+            nums.append(
+                f'<w:num w:numId="{num_id}"><w:abstractNumId w:val="1"/>'
+                '<w:lvlOverride w:ilvl="0"><w:startOverride w:val="1"/>'
+                "</w:lvlOverride></w:num>"
+            )
+        return (
+            XML_HEADER + f'<w:numbering xmlns:w="{W_NS}">'
+            '<w:abstractNum w:abstractNumId="0">'
+            + levels("bullet", lambda i: "\u2022")
+            + "</w:abstractNum>"
+            '<w:abstractNum w:abstractNumId="1">'
+            + levels("decimal", lambda i: f"%{i + 1}.")
+            + "</w:abstractNum>"
+            + "".join(nums)
+            + "</w:numbering>"
+        )
+
+    def _write_static_parts(self, title):
+        parts = (
+            ("word/document.xml", "document.main+xml"),
+            ("word/styles.xml", "styles+xml"),
+            ("word/settings.xml", "settings+xml"),
+            ("word/numbering.xml", "numbering+xml"),
+            ("word/footnotes.xml", "footnotes+xml"),
+            ("word/comments.xml", "comments+xml"),
+        )
+        self._zip.writestr(
+            "[Content_Types].xml",
+            XML_HEADER
+            + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/'
+            'content-types">'
+            '<Default Extension="rels" ContentType="application/'
+            'vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            + "".join(
+                f'<Override PartName="/{name}" ContentType="{CONTENT_TYPE}{kind}"/>'
+                for name, kind in parts
+            )
+            + '<Override PartName="/docProps/core.xml" ContentType="application/'
+            'vnd.openxmlformats-package.core-properties+xml"/></Types>',
+        )
+        self._zip.writestr(
+            "_rels/.rels",
+            XML_HEADER
+            + '<Relationships xmlns="http://schemas.openxmlformats.org/package/'
+            '2006/relationships">'
+            f'<Relationship Id="rId1" Type="{REL_TYPE}officeDocument" '
+            'Target="word/document.xml"/>'
+            '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/'
+            'package/2006/relationships/metadata/core-properties" '
+            'Target="docProps/core.xml"/></Relationships>',
+        )
+        created = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        self._zip.writestr(
+            "docProps/core.xml",
+            XML_HEADER
+            + '<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/'
+            'package/2006/metadata/core-properties" '
+            'xmlns:dc="http://purl.org/dc/elements/1.1/" '
+            'xmlns:dcterms="http://purl.org/dc/terms/" '
+            'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">'
+            f"<dc:title>{_text(title)}</dc:title>"
+            f"<dc:creator>{_text(self.author)}</dc:creator>"
+            f'<dcterms:created xsi:type="dcterms:W3CDTF">{created}</dcterms:created>'
+            "</cp:coreProperties>",
+        )
+        self._zip.writestr(
+            "word/_rels/document.xml.rels",
+            XML_HEADER
+            + '<Relationships xmlns="http://schemas.openxmlformats.org/package/'
+            '2006/relationships">'
+            + "".join(
+                f'<Relationship Id="rId{i}" Type="{REL_TYPE}{kind}" '
+                f'Target="{kind}.xml"/>'
+                for i, kind in enumerate(
+                    ("styles", "settings", "numbering", "footnotes", "comments"), 1
+                )
+            )
+            + "</Relationships>",
+        )
+        self._zip.writestr(
+            "word/settings.xml",
+            XML_HEADER + f'<w:settings xmlns:w="{W_NS}"><w:footnotePr>'
+            '<w:footnote w:id="-1"/><w:footnote w:id="0"/></w:footnotePr>'
+            "</w:settings>",
+        )
+        self._zip.writestr("word/styles.xml", _styles_xml())
+
+
+def _styles_xml():
+    def paragraph_style(style_id, name, props="", run_props="", default=False):
+        default_attr = ' w:default="1"' if default else ""
+        based = "" if default else '<w:basedOn w:val="Normal"/><w:next w:val="Normal"/>'
+        return (
+            f'<w:style w:type="paragraph"{default_attr} w:styleId="{style_id}">'
+            f'<w:name w:val="{name}"/>{based}<w:qFormat/>'
+            f"<w:pPr>{props}</w:pPr><w:rPr>{run_props}</w:rPr></w:style>"
+        )
+
+    heading_sizes = (36, 30, 26, 24, 24, 24)
+    headings = "".join(
+        paragraph_style(
+            f"Heading{level}",
+            f"heading {level}",
+            '<w:keepNext/><w:spacing w:before="360" w:after="120"/>'
+            f'<w:outlineLvl w:val="{level - 1}"/>',
+            f'<w:b/><w:sz w:val="{size}"/>',
+        )
+        for level, size in enumerate(heading_sizes, 1)
+    )
+    return (
+        XML_HEADER + f'<w:styles xmlns:w="{W_NS}">'
+        "<w:docDefaults><w:rPrDefault><w:rPr>"
+        '<w:rFonts w:ascii="Times New Roman" w:hAnsi="Times New Roman" '
+        'w:cs="Times New Roman"/><w:sz w:val="24"/></w:rPr></w:rPrDefault>'
+        '<w:pPrDefault><w:pPr><w:spacing w:after="120" w:line="360" '
+        'w:lineRule="auto"/></w:pPr></w:pPrDefault></w:docDefaults>'
+        + paragraph_style("Normal", "Normal", default=True)
+        + paragraph_style(
+            "Title", "Title", '<w:jc w:val="center"/>', '<w:b/><w:sz w:val="48"/>'
+        )
+        + headings
+        + paragraph_style("ListParagraph", "List Paragraph", '<w:ind w:left="720"/>')
+        + paragraph_style(
+            "FootnoteText",
+            "footnote text",
+            '<w:spacing w:after="0" w:line="240" w:lineRule="auto"/>',
+            '<w:sz w:val="20"/>',
+        )
+        + paragraph_style("CommentText", "annotation text", "", '<w:sz w:val="20"/>')
+        + '<w:style w:type="character" w:styleId="FootnoteReference">'
+        '<w:name w:val="footnote reference"/>'
+        '<w:rPr><w:vertAlign w:val="superscript"/></w:rPr></w:style>'
+        '<w:style w:type="character" w:styleId="CommentReference">'
+        '<w:name w:val="annotation reference"/>'
+        '<w:rPr><w:sz w:val="16"/></w:rPr></w:style>'
+        "</w:styles>"
+    )
+
+
+def _scene_preview(scene, highlights) -> str:
+    """A scene's paragraphs as text, labelled with their Word styles."""
+    lines = [f"[Heading 2] {scene_title(scene)}"]
+    for block in parse_blocks(scene_body(scene)):
+        if block.kind == "heading":
+            lines.append(f"[Heading {min(block.level + 2, 6)}] {block.text}")
+        elif block.kind == "li":
+            marker = f"{block.number}." if block.ordered else "\u2022"
+            lines.append("    " * (block.level - 1) + f"{marker} {block.text}")
+        else:
+            lines.append(block.text)
+    if highlights and isinstance(scene, dict):
+        for note in scene.get("annotations") or []:
+            lines.append(f"[Comment] {note.get('note', '')}")
+        for note in scene.get("footnotes") or []:
+            lines.append(f"[Footnote] {note.get('note', '')}")
+    return "\n".join(lines) + "\n\n"
+
+
+class DocxFormat(ExportFormat):
+    """Word document; written as a zip package, not through a text stream."""
+
+    name = "DOCX"
+    extension = "docx"
+    binary = True
+    segmentable = False
+
+    def write_file(self, project, path, progress=None, is_cancelled=None):
+        total = count_scenes(project)
+        done = 0
+        writer = DocxWriter(
+            path,
+            project.get("title", "Untitled Project"),
+            (project.get("metadata") or {}).get("author", ""),
+            self.highlights,
+        )
+        try:
+            for index, chapter in enumerate(project.get("chapters", [])):
+                writer.heading(
+                    chapter.get("title", "Untitled Chapter"), 1, page_break=index > 0
+                )
+                for scene in chapter.get("scenes", []):
+                    if is_cancelled is not None and is_cancelled():
+                        raise ExportCancelled()
+                    writer.heading(scene_title(scene), 2)
+                    writer.scene(scene)
+                    done += 1
+                    if progress is not None:
+                        progress(done, total)
+        except BaseException:
+            writer.abort()
+            raise
+        writer.close()
+
+    def preview(self, project):
+        """Paragraph text with Word style labels, scene by scene."""
+        title = project.get("title", "Untitled Project")
+        yield (f"[Title] {title}\n\n" if title else ""), 0
+        done = 0
+        for chapter in project.get("chapters", []):
+            yield f"[Heading 1] {chapter.get('title', 'Untitled Chapter')}\n\n", done
+            for scene in chapter.get("scenes", []):
+                done += 1
+                yield _scene_preview(scene, self.highlights), done
+
+
+register_format(DocxFormat)
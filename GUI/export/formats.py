@@ -0,0 +1,227 @@
+"""
+formats.py
+Export formats for the streaming exporter.
+
+Each format turns one piece of the project (header, chapter, scene, footer)
+into a string; the pipeline in streaming.py writes the pieces to the output
+file as they are produced, so no format ever holds the whole document.
+Scene bodies are converted from Qt rich text by html_convert.py. Pure Python:
+usable from worker threads and headless processes.
+"""
+
+import json
+import textwrap
+
+from GUI.export.html_convert import html_to_fountain, html_to_markdown, html_to_text
+
+
+def scene_title(scene) -> str:
+    if isinstance(scene, dict):
+        return scene.get("title", "Untitled Scene")
+    return str(scene)
+
+
+def scene_body(scene) -> str:
+    return scene.get("content", "") if isinstance(scene, dict) else ""
+
+
+class ExportFormat:
+    """
+    Base class: override the pieces a format needs.
+
+    Options (keyword arguments, all optional):
+      highlights -- keep annotation highlight markup (default True)
+
+    Formats that convert scene bodies override ``convert_body`` and set
+    ``cacheable``; ``body()`` then goes through ``render_cache`` when one is
+    attached (see render_cache.py). ``segmentable`` formats can be written
+    as separate chapter ranges and concatenated (see batch.py). ``binary``
+    formats write their own file in ``write_file(project, path, progress,
+    is_cancelled)`` instead of producing text pieces, and override
+    ``preview`` with a text rendition.
+    """
+
+    name = ""
+    extension = "txt"
+    cacheable = False
+    segmentable = True
+    binary = False
+
+    def __init__(self, **options):
+        self.options = options
+        self.highlights = options.get("highlights", True)
+        self.render_cache = None
+
+    def convert_body(self, content) -> str:
+        return content
+
+    def body(self, scene) -> str:
+        content = scene_body(scene)
+        if self.render_cache is None or not content:
+            return self.convert_body(content)
+        return self.render_cache.get_or_render(content, self.convert_body)
+
+    def header(self, project) -> str:
+        return ""
+
+    def chapter_start(self, chapter, index) -> str:
+        return ""
+
+    def scene(self, scene) -> str:
+        return ""
+
+    def chapter_end(self, chapter, index, is_last) -> str:
+        return ""
+
+    def footer(self, project) -> str:
+        return ""
+
+    def chapter_start_pieces(self, chapter, index):
+        """``chapter_start`` in pieces, for formats where it can be large."""
+        yield self.chapter_start(chapter, index)
+
+    def preview(self, project):
+        """
+        Yield (text, scenes done) pieces of the export lazily, so a preview
+        can stop early; joined, the text is exactly the exported file.
+        """
+        yield self.header(project), 0
+        chapters = project.get("chapters", [])
+        done = 0
+        for index, chapter in enumerate(chapters):
+            for piece in self.chapter_start_pieces(chapter, index):
+                yield piece, done
+            for scene in chapter.get("scenes", []):
+                done += 1
+                yield self.scene(scene), done
+            yield self.chapter_end(chapter, index, index == len(chapters) - 1), done
+        yield self.footer(project), done
+
+
+class MarkdownFormat(ExportFormat):
+    name = "Markdown"
+    extension = "md"
+    cacheable = True
+
+    def header(self, project):
+        return "# " + project.get("title", "Untitled Project") + "\n\n"
+
+    def chapter_start(self, chapter, index):
+        return f"## {chapter.get('title', 'Untitled Chapter')}\n\n"
+
+    def convert_body(self, content):
+        return html_to_markdown(content, self.highlights)
+
+    def scene(self, scene):
+        return f"### {scene_title(scene)}\n\n{self.body(scene)}\n\n"
+
+
+class PlainTextFormat(ExportFormat):
+    name = "Plain Text"
+    extension = "txt"
+    cacheable = True
+
+    def header(self, project):
+        return project.get("title", "Untitled Project") + "\n" + "=" * 50 + "\n\n"
+
+    def chapter_start(self, chapter, index):
+        return chapter.get("title", "Untitled Chapter") + "\n" + "-" * 30 + "\n\n"
+
+    def convert_body(self, content):
+        return html_to_text(content)
+
+    def scene(self, scene):
+        return f"{scene_title(scene)}\n\n{self.body(scene)}\n\n"
+
+
+class FountainFormat(ExportFormat):
+    name = "Fountain"
+    extension = "fountain"
+    cacheable = True
+
+    def header(self, project):
+        return f"Title: {project.get('title', 'Untitled Project')}\n\n"
+
+    def chapter_start(self, chapter, index):
+        return f"# {chapter.get('title', 'Untitled Chapter')}\n\n"
+
+    def convert_body(self, content):
+        return html_to_fountain(content)
+
+    def scene(self, scene):
+        return f"## {scene_title(scene)}\n\n{self.body(scene)}\n\n"
+
+
+# Reason: With indent set, iterencode is the pure-Python generator, so a
+# chapter is encoded lazily piece by piece
+_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+
+def _dump(value, indent_level):
+    """json.dumps(indent=2) for a value nested ``indent_level`` levels deep."""
+    text = json.dumps(value, indent=2, ensure_ascii=False)
+    return textwrap.indent(text, "  " * indent_level)[2 * indent_level :]
+
+
+class JsonFormat(ExportFormat):
+    """
+    Writes exactly what json.dump(project, indent=2) would, one chapter at a
+    time instead of serializing the whole project in one call.
+    """
+
+    name = "JSON"
+    extension = "json"
+
+    def _members(self, project, keys):
+        return [
+            f"  {json.dumps(k, ensure_ascii=False)}: {_dump(project[k], 1)}"
+            for k in keys
+        ]
+
+    def header(self, project):
+        keys = list(project)
+        if "chapters" not in keys:
+            members = self._members(project, keys)
+            return "{\n" + ",\n".join(members) + "\n}" if members else "{}"
+        before = self._members(project, keys[: keys.index("chapters")])
+        opening = '  "chapters": ['
+        if project["chapters"]:
+            opening += "\n"
+        return "{\n" + "".join(m + ",\n" for m in before) + opening
+
+    def chapter_start(self, chapter, index):
+        return ("" if index == 0 else ",\n") + "    " + _dump(chapter, 2)
+
+    def chapter_start_pieces(self, chapter, index):
+        # Same text as chapter_start (JSON has no whitespace-only lines)
+        yield ("" if index == 0 else ",\n") + "    "
+        for piece in _ENCODER.iterencode(chapter):
+            yield piece.replace("\n", "\n    ")
+
+    def footer(self, project):
+        keys = list(project)
+        if "chapters" not in keys:
+            return ""
+        after = self._members(project, keys[keys.index("chapters") + 1 :])
+        closing = "\n  ]" if project["chapters"] else "]"
+        return closing + "".join(",\n" + m for m in after) + "\n}"
+
+
+FORMATS = {
+    fmt.name: fmt
+    for fmt in (MarkdownFormat, PlainTextFormat, JsonFormat, FountainFormat)
+}
+
+
+def register_format(cls):
+    """Make a format available to get_format (used by the binary writers)."""
+    FORMATS[cls.name] = cls
+    return cls
+
+
+def get_format(name, **options) -> ExportFormat:
+    """Return a format instance by display name (e.g. "Markdown", "Plain Text")."""
+    try:
+        return FORMATS[name](**options)
+    except KeyError:
+        raise ValueError(f"Export format '{name}' not yet implemented") from None
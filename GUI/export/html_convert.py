@@ -0,0 +1,373 @@
+"""
+html_convert.py
+Single-pass conversion of scene rich text to Markdown, Fountain or plain text.
+
+Scene bodies are Qt rich-text HTML (full ``toHtml()`` documents or the compact
+form from scene_content.py). ``parse_blocks`` walks the HTML once with
+``html.parser`` and produces paragraphs of formatted runs; no QTextDocument or
+DOM is built, so it runs in worker threads and headless processes without Qt.
+The text renderers below and the DOCX writer all consume those blocks.
+
+Supported subset (what the editor produces):
+  - paragraphs, headings, line breaks and Qt's empty spacer paragraphs
+  - bulleted and numbered lists (Qt's ``-qt-list-indent`` gives the depth)
+  - bold, italic and underline, from ``<span style>`` or ``<b>/<i>/<u>`` tags
+  - annotation highlights (``background-color`` spans) and links
+
+Layout per target:
+  - Markdown: blocks separated by blank lines, list items on consecutive
+    lines, underline rendered as emphasis and highlights as ``==text==``;
+    Markdown syntax characters in the text are escaped
+  - Fountain: one line per block exactly as shown in the editor (blank lines
+    come from empty paragraphs), with ``**bold**``, ``*italic*`` and
+    ``_underline_``; the text itself is passed through, since writers type
+    Fountain syntax directly
+  - plain text: one line per block, list markers kept, no markup
+
+Content that is not HTML (older plain-text scenes) is returned unchanged.
+"""
+
+import re
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import List
+
+from GUI.storage.scene_text import SKIP_TAGS, is_rich_text
+
+MARKDOWN = "markdown"
+FOUNTAIN = "fountain"
+PLAIN = "plain"
+TARGETS = (MARKDOWN, FOUNTAIN, PLAIN)
+
+HEADING_TAGS = frozenset(("h1", "h2", "h3", "h4", "h5", "h6"))
+PARAGRAPH_TAGS = frozenset(("p", "div", "pre", "td", "th", "blockquote"))
+BOLD_TAGS = frozenset(("b", "strong"))
+ITALIC_TAGS = frozenset(("i", "em", "cite"))
+UNDERLINE_TAGS = frozenset(("u", "ins"))
+
+BOLD_WEIGHT_RE = re.compile(r"font-weight:\s*(\d+|bold)")
+LIST_INDENT_RE = re.compile(r"-qt-list-indent:\s*(\d+)")
+BACKGROUND_RE = re.compile(r"background-color:\s*([^;]+)")
+
+MARKDOWN_ESCAPE_RE = re.compile(r"([\\`*_\[\]<>])")
+# Line starts Markdown would read as a heading, quote, list or rule
+MARKDOWN_LINE_START_RE = re.compile(
+    r"^(\s*)(?:(#{1,6}|[>+-])(?=\s|$)|(\d+)([.)])(?=\s|$)|([-=])(?=[-=\s]*$))",
+    re.M,
+)
+
+# Inline markers per target: (bold, italic, underline, highlight)
+MARKERS = {
+    MARKDOWN: ("**", "*", "*", "=="),
+    FOUNTAIN: ("**", "*", "_", ""),
+    PLAIN: ("", "", "", ""),
+}
+HARD_BREAK = {MARKDOWN: "  \n", FOUNTAIN: "\n", PLAIN: "\n"}
+
+# Run format flags; a BREAK run is a line break (<br />) with text "\n"
+BOLD, ITALIC, UNDERLINE, HIGHLIGHT, BREAK = 1, 2, 4, 8, 16
+_NO_FORMAT = (0, None, None)  # (flags, link href, highlight colour)
+
+
+@dataclass
+class Block:
+    """
+    One paragraph of a scene.
+
+    ``kind`` is "p", "heading", "li" or "empty" (Qt's spacer paragraphs).
+    ``level`` is the heading level or list depth; ``runs`` are
+    (text, flags, href, colour) tuples in document order.
+    """
+
+    kind: str
+    level: int = 0
+    list_id: int = 0
+    ordered: bool = False
+    number: int = 0  # Position within an ordered list
+    runs: List[tuple] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        return "".join(run[0] for run in self.runs)
+
+
+def _span_format(style):
+    flags = 0
+    colour = None
+    if style:
+        weight = BOLD_WEIGHT_RE.search(style)
+        if weight and (weight.group(1) == "bold" or int(weight.group(1)) >= 600):
+            flags |= BOLD
+        if "font-style:italic" in style.replace(" ", ""):
+            flags |= ITALIC
+        if "underline" in style:
+            flags |= UNDERLINE
+        background = BACKGROUND_RE.search(style)
+        if background and background.group(1).strip() not in ("transparent", ""):
+            flags |= HIGHLIGHT
+            colour = background.group(1).strip()
+    return flags, colour
+
+
+class _BlockParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.blocks = []
+        self._skip_depth = 0
+        self._lists = []  # [ordered, item count, depth, list id] per open list
+        self._list_count = 0
+        self._block = None  # The open Block
+        self._run = []  # Pending text sharing one format
+        self._run_format = _NO_FORMAT
+        self._formats = [_NO_FORMAT]  # Format stack (inline elements)
+        self._format_tags = []
+
+    def _flush_run(self):
+        if self._run:
+            flags, href, colour = self._run_format
+            self._block.runs.append(("".join(self._run), flags, href, colour))
+            self._run = []
+
+    def _open_block(self, block):
+        if self._block is not None:
+            self._close_block()
+        self._block = block
+
+    def _close_block(self):
+        self._flush_run()
+        block = self._block
+        if block.kind == "empty" and block.text.strip():
+            block.kind = "p"
+        self.blocks.append(block)
+        self._block = None
+
+    def _push_format(self, tag, flags, href, colour):
+        parent_flags, parent_href, parent_colour = self._formats[-1]
+        self._formats.append(
+            (parent_flags | flags, href or parent_href, colour or parent_colour)
+        )
+        self._format_tags.append(tag)
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+            return
+        if self._skip_depth:
+            return
+        attrs = dict(attrs)
+        style = attrs.get("style") or ""
+        empty = "-qt-paragraph-type:empty" in style
+        if tag in ("ul", "ol"):
+            if self._block is not None:
+                self._close_block()
+            indent = LIST_INDENT_RE.search(style)
+            depth = int(indent.group(1)) if indent else len(self._lists) + 1
+            self._list_count += 1
+            self._lists.append([tag == "ol", 0, max(depth, 1), self._list_count])
+        elif tag == "li":
+            kind = "empty" if empty else "li"
+            if not self._lists:
+                self._open_block(Block(kind, 1))
+                return
+            current = self._lists[-1]
+            current[1] += 1
+            ordered, number, depth, list_id = current
+            self._open_block(Block(kind, depth, list_id, ordered, number))
+        elif tag in HEADING_TAGS:
+            self._open_block(Block("heading", int(tag[1])))
+        elif tag in PARAGRAPH_TAGS:
+            self._open_block(Block("empty" if empty else "p"))
+        elif tag == "br":
+            if self._block is None:
+                self._open_block(Block("p"))
+            if self._block.kind != "empty":
+                # Reason: Qt writes empty paragraphs as <p ...><br /></p>
+                self._flush_run()
+                self._block.runs.append(("\n", BREAK, None, None))
+        elif tag == "body":
+            flags, _ = _span_format(style)
+            self._push_format(tag, flags, None, None)
+        else:
+            flags, colour = _span_format(style)
+            if tag in BOLD_TAGS:
+                flags |= BOLD
+            elif tag in ITALIC_TAGS:
+                flags |= ITALIC
+            elif tag in UNDERLINE_TAGS:
+                flags |= UNDERLINE
+            elif tag == "mark":
+                flags |= HIGHLIGHT
+                colour = colour or "#ffff00"
+            href = attrs.get("href") if tag == "a" else None
+            self._push_format(tag, flags, href, colour)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in ("br", "ul", "ol"):
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+            return
+        if self._skip_depth:
+            return
+        if tag in ("ul", "ol"):
+            if self._block is not None:
+                self._close_block()
+            if self._lists:
+                self._lists.pop()
+        elif tag == "li" or tag in HEADING_TAGS or tag in PARAGRAPH_TAGS:
+            if self._block is not None:
+                self._close_block()
+        elif tag in self._format_tags:
+            # Reason: Tolerate unbalanced inline tags by unwinding to the match
+            while self._format_tags:
+                self._formats.pop()
+                if self._format_tags.pop() == tag:
+                    break
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        if self._block is None:
+            # Whitespace between Qt's block elements is layout, not text
+            if not data.strip():
+                return
+            self._open_block(Block("p"))
+        current = self._formats[-1]
+        if current != self._run_format:
+            self._flush_run()
+            self._run_format = current
+        self._run.append(data.replace("\xa0", " "))
+
+    def close(self):
+        super().close()
+        if self._block is not None:
+            self._close_block()
+
+
+def parse_blocks(content) -> List[Block]:
+    """
+    Parse scene content into paragraphs of runs. Plain-text (non-HTML)
+    content becomes one unformatted paragraph per line.
+    """
+    if not content:
+        return []
+    if not is_rich_text(content):
+        return [
+            Block("p", runs=[(line, 0, None, None)] if line else [])
+            for line in content.split("\n")
+        ]
+    parser = _BlockParser()
+    parser.feed(content)
+    parser.close()
+    return parser.blocks
+
+
+# Text renderers ---------------------------------------------------------
+
+
+def _escape_markdown_line_starts(text):
+    def escape(m):
+        if m.group(2):
+            return m.group(1) + "\\" + m.group(2)
+        if m.group(3):
+            return m.group(1) + m.group(3) + "\\" + m.group(4)
+        return m.group(1) + "\\" + m.group(5)
+
+    return MARKDOWN_LINE_START_RE.sub(escape, text)
+
+
+def _render_runs(runs, target, highlights):
+    bold, italic, underline, highlight = MARKERS[target]
+    hard_break = HARD_BREAK[target]
+    markdown = target == MARKDOWN
+    parts = []
+    for text, flags, href, _ in runs:
+        if flags & BREAK:
+            parts.append(hard_break)
+            continue
+        text = text.replace("\u2028", hard_break)
+        if markdown:
+            text = MARKDOWN_ESCAPE_RE.sub(r"\\\1", text)
+        core = text.strip()
+        if not core or (not flags and href is None):
+            parts.append(text)
+            continue
+        opening = ""
+        if flags & HIGHLIGHT and highlights:
+            opening += highlight
+        if flags & BOLD:
+            opening += bold
+        if flags & ITALIC:
+            opening += italic
+        elif flags & UNDERLINE:
+            opening += underline
+        if href is not None and markdown:
+            core = f"[{core}]({href})"
+        lead = text[: len(text) - len(text.lstrip())]
+        trail = text[len(text.rstrip()) :]
+        parts.append(lead + opening + core + opening[::-1] + trail)
+    text = "".join(parts)
+    return _escape_markdown_line_starts(text) if markdown else text
+
+
+def _block_prefix(block, target):
+    if block.kind == "li":
+        marker = f"{block.number}. " if block.ordered else "- "
+        return "  " * (block.level - 1) + marker
+    if block.kind == "heading" and target == MARKDOWN:
+        return "#" * block.level + " "
+    return ""
+
+
+def convert_html(content, target=MARKDOWN, highlights=True) -> str:
+    """
+    Convert scene content to ``target`` ("markdown", "fountain" or "plain").
+
+    ``highlights=False`` drops the Markdown highlight markers around annotated
+    text (the text itself is always kept).
+    """
+    if target not in MARKERS:
+        raise ValueError(f"Unknown conversion target '{target}'")
+    if not content:
+        return ""
+    if not is_rich_text(content):
+        return content
+    blocks = parse_blocks(content)
+    if target != MARKDOWN:
+        return "\n".join(
+            _block_prefix(block, target) + _render_runs(block.runs, target, False)
+            if block.kind != "empty"
+            else ""
+            for block in blocks
+        )
+    out = []
+    previous = None
+    for block in blocks:
+        if block.kind == "empty":
+            continue  # Markdown collapses spacing paragraphs anyway
+        if out:
+            # Reason: Consecutive items (including nested and adjacent
+            # lists) stay on consecutive lines; a change of marker type
+            # starts a new Markdown list by itself
+            in_list = block.kind == "li" and previous == "li"
+            out.append("\n" if in_list else "\n\n")
+        out.append(
+            _block_prefix(block, target) + _render_runs(block.runs, target, highlights)
+        )
+        previous = block.kind
+    return "".join(out)
+
+
+def html_to_markdown(content, highlights=True) -> str:
+    return convert_html(content, MARKDOWN, highlights)
+
+
+def html_to_fountain(content) -> str:
+    return convert_html(content, FOUNTAIN)
+
+
+def html_to_text(content) -> str:
+    return convert_html(content, PLAIN)
@@ -0,0 +1,669 @@
+"""
+pdf_layout.py
+Line breaking and pagination for the PDF exports.
+
+Everything is set in 12 pt Courier, the standard face for manuscripts and
+screenplays. Every Courier glyph is 0.6 em wide, so a line's width is its
+character count and breaking lines needs no font metrics. That also makes the
+layout exactly reproducible: the same project always gives the same pages.
+
+Layout is a chain of generators. ``manuscript_chunks`` / ``screenplay_chunks``
+turn the project into Chunks: runs of wrapped lines with spacing, a
+keep-with-next flag and a rule for splitting across a page break. ``paginate``
+places chunks on a grid of 54 rows (six lines per inch between one-inch
+margins) and yields each Page as soon as it is full, so memory is bounded by
+one page plus the chunks waiting on a keep-with-next rule.
+
+Manuscript (standard manuscript format): title page with the author and an
+approximate word count, chapters starting a third of the way down a new page,
+double-spaced paragraphs with a half-inch first-line indent, "#" between
+scenes, and an "Author / TITLE / page" running header.
+
+Screenplay: scene bodies are read as Fountain, one line per paragraph (see
+html_convert.py): scene headings, action, character cues, parentheticals,
+dialogue, transitions, centered text and ``===`` page breaks, at the usual
+industry margins. Chapter and scene titles are Fountain sections and are not
+printed. Speeches split across pages get "(MORE)" and a "(CONT'D)" cue.
+"""
+
+import re
+from dataclasses import dataclass, field, replace
+from typing import Callable, Iterable, Iterator, List, Optional
+
+from GUI.export.formats import scene_body
+from GUI.export.html_convert import BOLD, BREAK, parse_blocks
+from GUI.storage.manuscript_stats import project_stats
+
+INCH = 72.0
+PAGE_WIDTH = 8.5 * INCH  # US Letter, in points
+PAGE_HEIGHT = 11 * INCH
+FONT_SIZE = 12
+CHAR_WIDTH = FONT_SIZE * 0.6
+LINE_HEIGHT = 12.0
+BODY_TOP = PAGE_HEIGHT - INCH  # Top of the first row
+BODY_ROWS = 54
+HEADER_Y = PAGE_HEIGHT - 0.5 * INCH - 9  # Baseline of the running header
+RIGHT_EDGE = PAGE_WIDTH - INCH
+
+# Manuscript measurements
+MS_LEFT = INCH
+MS_COLUMNS = 65  # 6.5 inches of text
+MS_CHAPTER_DROP = 16  # Rows above a chapter title (a third of the page)
+
+# Screenplay measurements: (left edge in inches, width in characters)
+SP_ACTION = (1.5, 60)
+SP_CHARACTER = (3.7, 38)
+SP_PARENTHETICAL = (3.1, 24)
+SP_DIALOGUE = (2.5, 35)
+
+SCENE_HEADING_RE = re.compile(r"^(?:int|ext|est|int\.?/ext|i/e)[. ]", re.I)
+TRANSITION_RE = re.compile(r"^[^a-z]*TO:$")
+PAGE_BREAK_RE = re.compile(r"^={3,}$")
+NOTE_RE = re.compile(r"\[\[.*?\]\]")
+SENTENCE_END_RE = re.compile(r"[.!?][\"')\]]*$")
+
+
+@dataclass
+class Line:
+    """One laid-out line: ``runs`` are (text, flags) drawn from ``x`` (points)."""
+
+    x: float
+    runs: list
+
+    @property
+    def text(self) -> str:
+        return "".join(run[0] for run in self.runs)
+
+
+@dataclass
+class Page:
+    """A finished page: ``lines`` are (x, baseline y, runs) in PDF points."""
+
+    number: int
+    lines: list = field(default_factory=list)
+
+
+@dataclass
+class Chunk:
+    """
+    Lines that are placed together.
+
+    ``leading`` is rows per line (2 = double spacing). ``space_before`` blank
+    rows are dropped at the top of a page unless the chunk has
+    ``page_break``. ``split(lines, fit)`` may divide the lines when only
+    ``fit`` of them fit on the page, returning (head, tail) or None.
+    """
+
+    lines: List[Line]
+    space_before: int = 0
+    leading: int = 1
+    keep_with_next: bool = False
+    page_break: bool = False
+    split: Optional[Callable] = None
+
+    def height(self, at_top: bool) -> int:
+        rows = (len(self.lines) - 1) * self.leading + 1 if self.lines else 0
+        if at_top and not self.page_break:
+            return rows
+        return rows + self.space_before
+
+
+# Line breaking ----------------------------------------------------------
+
+
+def _slice_runs(runs, start, end):
+    """The part of ``runs`` between character offsets ``start`` and ``end``."""
+    out = []
+    position = 0
+    for text, flags in runs:
+        stop = position + len(text)
+        if stop > start and position < end:
+            piece = text[max(start - position, 0) : end - position]
+            if piece:
+                out.append((piece, flags))
+        position = stop
+        if position >= end:
+            break
+    return out
+
+
+def wrap(runs, width, hanging=0) -> List[list]:
+    """
+    Break formatted runs into lines of at most ``width`` characters, at
+    spaces where possible. Lines after the first are ``hanging`` characters
+    narrower (the caller indents them). Returns a list of run lists.
+    """
+    text = "".join(run[0] for run in runs)
+    if not text.strip():
+        return [[]]
+    lines = []
+    start, end = 0, len(text)
+    while start < end:
+        limit = width if not lines else max(width - hanging, 1)
+        if end - start <= limit:
+            cut = next_start = end
+        else:
+            cut = text.rfind(" ", start, start + limit + 1)
+            if cut <= start:
+                # Reason: A word longer than the line is broken where it must
+                cut = next_start = start + limit
+            else:
+                next_start = cut + 1
+        while cut > start and text[cut - 1] == " ":
+            cut -= 1
+        lines.append(_slice_runs(runs, start, cut))
+        start = next_start
+        while start < end and text[start] == " ":
+            start += 1
+    return lines
+
+
+def _text_runs(block_runs):
+    """
+    Split a block's runs at line breaks into lines of (text, flags) runs,
+    dropping link targets and highlight colours.
+    """
+    lines = [[]]
+    for text, flags, _, _ in block_runs:
+        if flags & BREAK:
+            lines.append([])
+            continue
+        text = text.replace("\t", "    ")
+        parts = text.split("\u2028")
+        for index, part in enumerate(parts):
+            if index:
+                lines.append([])
+            if part:
+                lines[-1].append((part, flags & ~BREAK))
+    return lines
+
+
+def _trim(runs, lead=0, trail=0):
+    """Strip surrounding spaces plus ``lead``/``trail`` forcing characters."""
+    text = "".join(run[0] for run in runs)
+    start = len(text) - len(text.lstrip()) + lead
+    end = len(text.rstrip()) - trail
+    return _slice_runs(runs, start, max(start, end))
+
+
+def _strip_notes(runs):
+    """Drop Fountain [[notes]], which are never printed."""
+    text = "".join(run[0] for run in runs)
+    if "[[" not in text:
+        return runs
+    out, start = [], 0
+    for match in NOTE_RE.finditer(text):
+        out += _slice_runs(runs, start, match.start())
+        start = match.end()
+    return out + _slice_runs(runs, start, len(text))
+
+
+def _upper(runs):
+    return [(text.upper(), flags) for text, flags in runs]
+
+
+def _plain(text, flags=0):
+    return [(text, flags)] if text else []
+
+
+def _width(runs) -> float:
+    return sum(len(text) for text, _ in runs) * CHAR_WIDTH
+
+
+def _centered(runs, left=MS_LEFT, columns=MS_COLUMNS) -> Line:
+    span = columns * CHAR_WIDTH
+    return Line(left + max(span - _width(runs), 0) / 2, runs)
+
+
+def _right_aligned(runs, right=RIGHT_EDGE) -> Line:
+    return Line(right - _width(runs), runs)
+
+
+def _wrapped(runs, x, width, hanging=0) -> List[Line]:
+    return [
+        Line(x if index == 0 else x + hanging * CHAR_WIDTH, line)
+        for index, line in enumerate(wrap(runs, width, hanging))
+    ]
+
+
+# Splitting rules --------------------------------------------------------
+
+
+def split_lines(orphans=2, widows=2):
+    """Split a paragraph, keeping at least N lines on each page."""
+
+    def split(lines, fit):
+        take = min(fit, len(lines) - widows)
+        if take < orphans:
+            return None
+        return lines[:take], lines[take:]
+
+    return split
+
+
+def _split_speech(lines, fit):
+    """
+    Split a speech (cue line, then parentheticals and dialogue) with
+    "(MORE)" at the foot of the page and "(CONT'D)" on the repeated cue.
+    Prefers to break after a sentence; never right after a parenthetical.
+    """
+    cue, content = lines[0], lines[1:]
+    best = None
+    for take in range(min(fit - 2, len(content) - 2), 1, -1):
+        if content[take - 1].x != SP_DIALOGUE[0] * INCH:
+            continue
+        if SENTENCE_END_RE.search(content[take - 1].text):
+            best = take
+            break
+        if best is None:
+            best = take
+    if best is None:
+        return None
+    cue_x = SP_CHARACTER[0] * INCH
+    head = [cue] + content[:best] + [Line(cue_x, _plain("(MORE)"))]
+    cue_text = cue.text
+    if "(CONT'D)" not in cue_text.upper():
+        cue = Line(cue.x, cue.runs + _plain(" (CONT'D)"))
+    return head, [cue] + content[best:]
+
+
+# Pagination -------------------------------------------------------------
+
+
+class _Paginator:
+    def __init__(self, header, rows):
+        self.header = header
+        self.rows = rows
+        self.number = 1
+        self.row = 0
+        self.lines = []
+        self.group = []  # Chunks waiting on keep_with_next
+
+    def _new_page(self) -> Page:
+        page = Page(self.number, self.lines)
+        if self.header is not None:
+            page.lines = self.header(self.number) + page.lines
+        self.number += 1
+        self.row = 0
+        self.lines = []
+        return page
+
+    def _put(self, chunk):
+        if self.row or chunk.page_break:
+            self.row += chunk.space_before
+        for line in chunk.lines:
+            self.lines.append((line.x, _row_y(self.row), line.runs))
+            self.row += chunk.leading
+        if chunk.lines:
+            self.row += 1 - chunk.leading  # Count the last line as one row
+
+    def _fits(self, chunks) -> bool:
+        row = self.row
+        for chunk in chunks:
+            row += chunk.height(row == 0)
+        return row <= self.rows
+
+    def add_page(self, page) -> Iterator[Page]:
+        """Emit a page laid out by the caller (title pages)."""
+        yield from self.flush()
+        if self.row or self.lines:
+            yield self._new_page()
+        page.number = self.number
+        self.number += 1
+        yield page
+
+    def add(self, chunk) -> Iterator[Page]:
+        self.group.append(chunk)
+        if chunk.keep_with_next:
+            return
+        group, self.group = self.group, []
+        yield from self._place(group)
+
+    def flush(self) -> Iterator[Page]:
+        group, self.group = self.group, []
+        if group:
+            yield from self._place(group)
+
+    def finish(self) -> Iterator[Page]:
+        yield from self.flush()
+        if self.lines:
+            yield self._new_page()
+
+    def _place(self, group) -> Iterator[Page]:
+        if group[0].page_break and (self.row or self.lines):
+            yield self._new_page()
+        while group:
+            if self._fits(group):
+                for chunk in group:
+                    self._put(chunk)
+                return
+            *before, last = group
+            if last.split is not None and self._fits(before):
+                row = self.row
+                for chunk in before:
+                    row += chunk.height(row == 0)
+                space = self.rows - row
+                if row or last.page_break:
+                    space -= last.space_before
+                fit = (space - 1) // last.leading + 1 if space > 0 else 0
+                parts = last.split(last.lines, fit) if fit > 0 else None
+                if parts is not None:
+                    head, tail = parts
+                    for chunk in before:
+                        self._put(chunk)
+                    self._put(replace(last, lines=head))
+                    yield self._new_page()
+                    group = [
+                        replace(last, lines=tail, space_before=0, page_break=False)
+                    ]
+                    continue
+            if self.row == 0:
+                # Reason: Taller than a page even on its own; break anywhere
+                yield from self._force(group)
+                return
+            yield self._new_page()
+
+    def _force(self, group) -> Iterator[Page]:
+        for chunk in group:
+            lines = chunk.lines
+            while lines:
+                space = self.rows - self.row
+                if self.row or chunk.page_break:
+                    space -= chunk.space_before
+                fit = max((space - 1) // chunk.leading + 1, 0) if space > 0 else 0
+                if fit >= len(lines):
+                    self._put(replace(chunk, lines=lines))
+                    break
+                if fit:
+                    self._put(replace(chunk, lines=lines[:fit]))
+                    lines = lines[fit:]
+                chunk = replace(chunk, space_before=0, page_break=False)
+                yield self._new_page()
+
+
+def paginate(
+    items: Iterable, header: Optional[Callable] = None, rows: int = BODY_ROWS
+) -> Iterator[Page]:
+    """
+    Lay out Chunks (and ready-made Pages) and yield numbered Pages in order.
+    ``header(number)`` returns extra (x, y, runs) lines for a page.
+    """
+    paginator = _Paginator(header, rows)
+    for item in items:
+        if isinstance(item, Page):
+            yield from paginator.add_page(item)
+        else:
+            yield from paginator.add(item)
+    yield from paginator.finish()
+
+
+def _row_y(row) -> float:
+    return BODY_TOP - (row + 1) * LINE_HEIGHT + 3
+
+
+# Manuscript -------------------------------------------------------------
+
+
+def _round_words(words) -> str:
+    step = 1000 if words >= 10000 else 100
+    return f"about {max(step, (words + step // 2) // step * step):,} words"
+
+
+def manuscript_header(project) -> Callable:
+    """Running header: "Surname / TITLE / n", from the first text page."""
+    author = (project.get("metadata") or {}).get("author", "")
+    title = project.get("title", "Untitled Project").upper()
+    prefix = f"{author.split()[-1]} / " if author.strip() else ""
+
+    def header(number):
+        if number == 1:
+            return []
+        runs = _plain(f"{prefix}{title} / {number - 1}")
+        return [(RIGHT_EDGE - _width(runs), HEADER_Y, runs)]
+
+    return header
+
+
+def _manuscript_title_page(project) -> Page:
+    metadata = project.get("metadata") or {}
+    author = metadata.get("author", "")
+    title = project.get("title", "Untitled Project")
+    # Reason: The editor passes its running totals; counting a long manuscript
+    # again takes about a second, which matters for previews
+    count = (metadata.get("statistics") or {}).get("words")
+    if not isinstance(count, int):
+        count = project_stats(project.get("chapters", [])).words
+    words = _plain(_round_words(count))
+    lines = [(RIGHT_EDGE - _width(words), _row_y(0), words)]
+    if author:
+        lines.insert(0, (MS_LEFT, _row_y(0), _plain(author)))
+    middle = BODY_ROWS // 2 - 2
+    for offset, text in ((0, title.upper()), (2, f"by {author}" if author else "")):
+        if text:
+            line = _centered(_plain(text))
+            lines.append((line.x, _row_y(middle + offset), line.runs))
+    return Page(1, lines)
+
+
+def _manuscript_block(block, first_paragraph) -> List[Chunk]:
+    chunks = []
+    for index, runs in enumerate(_text_runs(block.runs)):
+        runs = _trim(runs)
+        if block.kind == "li":
+            marker = f"{block.number}. " if block.ordered else "- "
+            indent = 5 * block.level
+            lines = _wrapped(
+                _plain(marker) + runs,
+                MS_LEFT + indent * CHAR_WIDTH,
+                MS_COLUMNS - indent,
+                len(marker),
+            )
+        elif block.kind == "heading":
+            lines = _wrapped([(t, f | BOLD) for t, f in runs], MS_LEFT, MS_COLUMNS)
+        else:
+            indent = "" if first_paragraph or index else "     "
+            lines = _wrapped(_plain(indent) + runs, MS_LEFT, MS_COLUMNS)
+        chunks.append(
+            Chunk(
+                lines,
+                space_before=1,
+                leading=2,
+                keep_with_next=block.kind == "heading",
+                split=split_lines(),
+            )
+        )
+    return chunks
+
+
+def manuscript_chunks(project, scene_done: Optional[Callable] = None):
+    """Chunks (and the title page) of a project in manuscript format."""
+    yield _manuscript_title_page(project)
+    chapters = project.get("chapters", [])
+    for chapter in chapters:
+        title = chapter.get("title", "Untitled Chapter")
+        yield Chunk(
+            [_centered(_plain(title))],
+            space_before=MS_CHAPTER_DROP,
+            keep_with_next=True,
+            page_break=True,
+        )
+        first = True
+        for number, scene in enumerate(chapter.get("scenes", [])):
+            if number:
+                yield Chunk([_centered(_plain("#"))], space_before=1, leading=2)
+                first = True
+            for block in parse_blocks(scene_body(scene)):
+                if block.kind == "empty" or not block.text.strip():
+                    continue
+                for chunk in _manuscript_block(block, first):
+                    if first:
+                        chunk.space_before = 3  # Below the chapter title
+                        if number:
+                            chunk.space_before = 1
+                    first = False
+                    yield chunk
+            if scene_done is not None:
+                scene_done()
+    if chapters:
+        yield Chunk([_centered(_plain("END"))], space_before=3)
+
+
+# Screenplay -------------------------------------------------------------
+
+
+def _screenplay_title_page(project) -> Page:
+    author = (project.get("metadata") or {}).get("author", "")
+    title = project.get("title", "Untitled Project")
+    rows = [(18, title.upper())]
+    if author:
+        rows += [(22, "Written by"), (24, author)]
+    lines = []
+    for row, text in rows:
+        line = _centered(_plain(text), SP_ACTION[0] * INCH, SP_ACTION[1])
+        lines.append((line.x, _row_y(row), line.runs))
+    return Page(1, lines)
+
+
+def screenplay_header(number):
+    """Page numbers "2." onwards; the title page and page one have none."""
+    if number <= 2:
+        return []
+    runs = _plain(f"{number - 1}.")
+    return [(RIGHT_EDGE - _width(runs), HEADER_Y, runs)]
+
+
+def _is_character(text):
+    name = text.split("(")[0].strip().rstrip("^").strip()
+    return any(c.isalpha() for c in name) and name == name.upper()
+
+
+def _at(element, runs, hanging=0):
+    left, width = element
+    return _wrapped(runs, left * INCH, width, hanging)
+
+
+class _ScreenplayReader:
+    """Classifies Fountain lines across a project and builds Chunks."""
+
+    def __init__(self):
+        self.speech = None  # Lines of the open speech
+        self.action = None  # Lines of the open action paragraph
+
+    def _close(self):
+        chunk = None
+        if self.speech is not None:
+            chunk = Chunk(self.speech, space_before=1, split=_split_speech)
+        elif self.action is not None:
+            chunk = Chunk(self.action, space_before=1, split=split_lines())
+        self.speech = self.action = None
+        return chunk
+
+    def scene(self, content) -> Iterator[Chunk]:
+        """Chunks for one scene body; a scene starts after a blank line."""
+        lines = []
+        for block in parse_blocks(content):
+            if block.kind == "empty":
+                lines.append(None)
+                continue
+            for runs in _text_runs(block.runs):
+                if block.kind == "li":
+                    marker = f"{block.number}. " if block.ordered else "- "
+                    runs = _plain(marker) + runs
+                text = "".join(run[0] for run in runs)
+                if not text.strip():
+                    lines.append(None)
+                elif NOTE_RE.sub("", text).strip():
+                    lines.append(_strip_notes(runs))
+                # Lines holding only a [[note]] are dropped entirely
+        previous_blank = True
+        for index, runs in enumerate(lines):
+            text = "" if runs is None else "".join(r[0] for r in runs).strip()
+            if not text or PAGE_BREAK_RE.match(text):
+                yield from self._flush()
+                if text:
+                    yield Chunk([], page_break=True)
+                previous_blank = True
+                continue
+            if text.startswith("#") or (text.startswith("=") and len(text) > 1):
+                continue  # Sections and synopses are not printed
+            next_blank = index + 1 >= len(lines) or lines[index + 1] is None
+            yield from self._line(runs, text, previous_blank, next_blank)
+            previous_blank = False
+        yield from self._flush()
+
+    def _line(self, runs, text, previous_blank, next_blank) -> Iterator[Chunk]:
+        if self.speech is not None:
+            if text.startswith("(") and text.endswith(")"):
+                self.speech += _at(SP_PARENTHETICAL, _trim(runs), 1)
+            else:
+                self.speech += _at(SP_DIALOGUE, _trim(runs))
+            return
+        if text.startswith("!"):
+            self._action(_trim(runs, 1))
+        elif previous_blank and (
+            SCENE_HEADING_RE.match(text)
+            or (text.startswith(".") and not text.startswith(".."))
+        ):
+            lead = 1 if text.startswith(".") else 0
+            yield from self._flush()
+            yield Chunk(
+                _at(SP_ACTION, _upper(_trim(runs, lead))),
+                space_before=1,
+                keep_with_next=True,
+            )
+        elif text.startswith(">") and text.endswith("<"):
+            yield from self._flush()
+            yield Chunk(
+                [_centered(_trim(runs, 1, 1), SP_ACTION[0] * INCH, SP_ACTION[1])],
+                space_before=1,
+            )
+        elif previous_blank and next_blank and (
+            text.startswith(">") or TRANSITION_RE.match(text)
+        ):
+            lead = 1 if text.startswith(">") else 0
+            yield from self._flush()
+            yield Chunk(
+                [_right_aligned(_upper(_trim(runs, lead)))], space_before=1
+            )
+        elif previous_blank and not next_blank and (
+            text.startswith("@") or _is_character(text)
+        ):
+            lead = 1 if text.startswith("@") else 0
+            trail = 1 if text.endswith("^") else 0
+            yield from self._flush()
+            self.speech = _at(SP_CHARACTER, _upper(_trim(runs, lead, trail)))[:1]
+        else:
+            self._action(_trim(runs))
+
+    def _action(self, runs):
+        if self.action is None:
+            self.action = []
+        self.action += _at(SP_ACTION, runs)
+
+    def _flush(self) -> Iterator[Chunk]:
+        chunk = self._close()
+        if chunk is not None:
+            yield chunk
+
+
+def screenplay_chunks(project, scene_done: Optional[Callable] = None):
+    """Chunks (and the title page) of a project in screenplay format."""
+    yield _screenplay_title_page(project)
+    reader = _ScreenplayReader()
+    for chapter in project.get("chapters", []):
+        for scene in chapter.get("scenes", []):
+            yield from reader.scene(scene_body(scene))
+            if scene_done is not None:
+                scene_done()
+
+
+LAYOUTS = {
+    "manuscript": (manuscript_chunks, manuscript_header),
+    "screenplay": (screenplay_chunks, lambda project: screenplay_header),
+}
+
+
+def layout_pages(project, layout="manuscript", scene_done=None) -> Iterator[Page]:
+    """Pages of ``project`` in the given layout, yielded as they fill."""
+    chunks, header = LAYOUTS[layout]
+    return paginate(chunks(project, scene_done), header(project))
@@ -0,0 +1,236 @@
+"""
+pdf_writer.py
+Incremental PDF output for the manuscript and screenplay layouts.
+
+Pages come from pdf_layout.py one at a time; each page's content stream and
+page object are written to the file as soon as the page is laid out, and only
+the byte offsets of the objects written so far are kept for the
+cross-reference table. The page tree, catalog and xref are written on close.
+
+The file uses the standard Courier fonts (regular, bold, oblique, bold
+oblique), which every PDF reader provides, so nothing is embedded. Text is
+encoded as WinAnsi (cp1252); characters outside it print as "?". The writer
+adds no timestamps or random IDs, so the same project always produces the same
+bytes.
+"""
+
+import zlib
+from array import array
+
+from GUI.export.formats import ExportFormat, register_format
+from GUI.export.html_convert import BOLD, ITALIC, UNDERLINE
+from GUI.export.pdf_layout import (
+    BODY_TOP,
+    CHAR_WIDTH,
+    FONT_SIZE,
+    INCH,
+    LINE_HEIGHT,
+    MS_COLUMNS,
+    PAGE_HEIGHT,
+    PAGE_WIDTH,
+    layout_pages,
+)
+from GUI.export.streaming import ExportCancelled, count_scenes
+
+FONTS = ("Courier", "Courier-Bold", "Courier-Oblique", "Courier-BoldOblique")
+_CATALOG, _PAGES, _INFO, _FIRST_FONT = 1, 2, 3, 4
+_FIRST_FREE = _FIRST_FONT + len(FONTS)
+
+
+def _number(value) -> str:
+    """Shortest exact form of a coordinate, e.g. 72, 302.4."""
+    return f"{value:.2f}".rstrip("0").rstrip(".")
+
+
+def _string(text) -> bytes:
+    data = text.encode("cp1252", "replace")
+    data = bytes(b for b in data if b >= 32)
+    data = data.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+    return b"(" + data + b")"
+
+
+def page_content(page) -> bytes:
+    """The drawing operators for one laid-out page."""
+    out = [b"BT"]
+    underlines = []
+    font = None
+    for x, y, runs in page.lines:
+        out.append(f"1 0 0 1 {_number(x)} {_number(y)} Tm".encode("ascii"))
+        for text, flags in runs:
+            index = (1 if flags & BOLD else 0) + (2 if flags & ITALIC else 0)
+            if index != font:
+                font = index
+                out.append(f"/F{index + 1} {FONT_SIZE} Tf".encode("ascii"))
+            out.append(_string(text) + b" Tj")
+            width = len(text) * CHAR_WIDTH
+            if flags & UNDERLINE and text.strip():
+                underlines.append((x, x + width, y - 2))
+            x += width
+    out.append(b"ET")
+    if underlines:
+        out.append(b"0.6 w")
+        for start, end, y in underlines:
+            out.append(
+                f"{_number(start)} {_number(y)} m {_number(end)} {_number(y)} l S"
+                .encode("ascii")
+            )
+    return b"\n".join(out)
+
+
+def page_text(page) -> str:
+    """A laid-out page as monospace text, columns counted from the margin."""
+    rows = {}
+    for x, y, runs in page.lines:
+        row = rows.setdefault(round((BODY_TOP - y) / LINE_HEIGHT), [])
+        column = max(0, round((x - INCH) / CHAR_WIDTH))
+        text = "".join(text for text, _ in runs)
+        row.extend(" " * (column - len(row)))
+        row[column : column + len(text)] = text
+    if not rows:
+        return ""
+    return "\n".join(
+        "".join(rows.get(number, ())).rstrip()
+        for number in range(min(rows), max(rows) + 1)
+    )
+
+
+class PdfWriter:
+    """
+    Write a PDF incrementally: ``add_page`` for every page in order, then
+    ``close()``. ``out`` is a binary file object.
+    """
+
+    def __init__(self, out, title="", author=""):
+        self._out = out
+        # Reason: Byte offset per object number, 8 bytes each, for the xref
+        self._offsets = array("Q", bytes(8 * _FIRST_FREE))
+        self._page_count = 0
+        self._position = 0
+        self._emit(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        for index, name in enumerate(FONTS):
+            self._object(
+                _FIRST_FONT + index,
+                f"<< /Type /Font /Subtype /Type1 /BaseFont /{name} "
+                "/Encoding /WinAnsiEncoding >>".encode("ascii"),
+            )
+        info = b"<< /Producer (Writer & Screenwriter Assistant)"
+        if title:
+            info += b" /Title " + _string(title)
+        if author:
+            info += b" /Author " + _string(author)
+        self._object(_INFO, info + b" >>")
+
+    def _emit(self, data):
+        self._out.write(data)
+        self._position += len(data)
+
+    def _object(self, number, body):
+        if number < len(self._offsets):
+            self._offsets[number] = self._position
+        else:
+            self._offsets.append(self._position)
+        self._emit(f"{number} 0 obj\n".encode("ascii") + body + b"\nendobj\n")
+
+    def add_page(self, page):
+        content = zlib.compress(page_content(page), 6)
+        # Pages are written as (content stream, page) object pairs in order
+        stream = _FIRST_FREE + 2 * self._page_count
+        self._object(
+            stream,
+            f"<< /Length {len(content)} /Filter /FlateDecode >>\nstream\n".encode(
+                "ascii"
+            )
+            + content
+            + b"\nendstream",
+        )
+        fonts = " ".join(
+            f"/F{index + 1} {_FIRST_FONT + index} 0 R" for index in range(len(FONTS))
+        )
+        self._object(
+            stream + 1,
+            f"<< /Type /Page /Parent {_PAGES} 0 R "
+            f"/MediaBox [0 0 {_number(PAGE_WIDTH)} {_number(PAGE_HEIGHT)}] "
+            f"/Resources << /Font << {fonts} >> >> /Contents {stream} 0 R >>".encode(
+                "ascii"
+            ),
+        )
+        self._page_count += 1
+
+    def close(self):
+        kids = " ".join(
+            f"{_FIRST_FREE + 2 * index + 1} 0 R" for index in range(self._page_count)
+        )
+        self._object(
+            _PAGES,
+            f"<< /Type /Pages /Kids [{kids}] /Count {self._page_count} >>".encode(
+                "ascii"
+            ),
+        )
+        self._object(_CATALOG, f"<< /Type /Catalog /Pages {_PAGES} 0 R >>".encode())
+        xref = self._position
+        count = len(self._offsets)
+        self._emit(f"xref\n0 {count}\n0000000000 65535 f \n".encode("ascii"))
+        for number in range(1, count):
+            self._emit(f"{self._offsets[number]:010d} 00000 n \n".encode("ascii"))
+        self._emit(
+            f"trailer\n<< /Size {count} /Root {_CATALOG} 0 R /Info {_INFO} 0 R >>\n"
+            f"startxref\n{xref}\n%%EOF\n".encode("ascii")
+        )
+
+
+class PdfFormat(ExportFormat):
+    """Standard manuscript format PDF; laid out and written page by page."""
+
+    name = "PDF"
+    extension = "pdf"
+    binary = True
+    segmentable = False
+    layout = "manuscript"
+
+    def write_file(self, project, path, progress=None, is_cancelled=None):
+        total = count_scenes(project)
+        done = 0
+
+        def scene_done():
+            nonlocal done
+            done += 1
+            if progress is not None:
+                progress(done, total)
+            if is_cancelled is not None and is_cancelled():
+                raise ExportCancelled()
+
+        if is_cancelled is not None and is_cancelled():
+            raise ExportCancelled()
+        with open(path, "wb") as out:
+            writer = PdfWriter(
+                out,
+                project.get("title", "Untitled Project"),
+                (project.get("metadata") or {}).get("author", ""),
+            )
+            for page in layout_pages(project, self.layout, scene_done):
+                writer.add_page(page)
+            writer.close()
+
+    def preview(self, project):
+        """The laid-out pages as monospace text, one page at a time."""
+        done = 0
+
+        def scene_done():
+            nonlocal done
+            done += 1
+
+        for page in layout_pages(project, self.layout, scene_done):
+            rule = f" Page {page.number} ".center(MS_COLUMNS, "-")
+            yield f"{rule}\n{page_text(page)}\n\n", done
+
+
+class ScreenplayPdfFormat(PdfFormat):
+    """Industry screenplay format PDF, read from Fountain-style scene text."""
+
+    name = "Screenplay PDF"
+    extension = "screenplay.pdf"
+    layout = "screenplay"
+
+
+register_format(PdfFormat)
+register_format(ScreenplayPdfFormat)
@@ -0,0 +1,141 @@
+"""
+render_cache.py
+On-disk cache of rendered scene bodies for repeated exports.
+
+A rendered body is stored under (format namespace, scene content hash). The
+namespace combines the format name, its options and the converter version, so
+changing any of them never serves a stale fragment. Re-exporting after editing
+one scene therefore converts only that scene; every other body is one primary
+key lookup.
+
+The cache is a single SQLite file (stdlib ``sqlite3``) next to the projects.
+Lookups go to disk, so memory stays bounded by one scene just like the
+streaming writer, and separate export processes can share the file. Entries
+not used for ``MAX_AGE_DAYS`` are pruned when a cache is closed.
+"""
+
+import json
+import os
+import sqlite3
+import time
+from typing import Callable, Optional
+
+from GUI.storage.manuscript_stats import content_hash
+
+# Bump when converter output changes so old fragments are never reused
+CONVERTER_VERSION = 1
+MAX_AGE_DAYS = 30
+# New fragments are buffered and written in small batches, each in its own
+# short transaction, so parallel batch workers never queue on the write lock
+COMMIT_EVERY = 32
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fragments (
+    namespace TEXT NOT NULL,
+    digest BLOB NOT NULL,
+    fragment TEXT NOT NULL,
+    used INTEGER NOT NULL,
+    PRIMARY KEY (namespace, digest)
+) WITHOUT ROWID
+"""
+
+
+def cache_namespace(format_name: str, options: Optional[dict] = None) -> str:
+    """Namespace for one (format, options) combination."""
+    return json.dumps(
+        [format_name, options or {}, CONVERTER_VERSION], sort_keys=True
+    )
+
+
+class RenderCache:
+    """
+    Fragments for one namespace, read from and written to ``path``.
+
+    Use as a context manager or call ``close()``; new fragments are kept in
+    memory and written every ``COMMIT_EVERY`` scenes and on close. Not shared
+    between threads.
+    """
+
+    def __init__(self, path, namespace: str):
+        self.path = os.fspath(path)
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+        self._used = set()  # Digests served from disk, refreshed on close
+        self._now = int(time.time())
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(self.path, timeout=30)
+        # Reason: WAL lets other export processes read while this one writes
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(_SCHEMA)
+        self._pending = {}  # digest -> fragment not yet written
+
+    def get_or_render(self, content: str, render: Callable[[str], str]) -> str:
+        digest = content_hash(content)
+        if digest in self._pending:
+            self.hits += 1
+            return self._pending[digest]
+        row = self._db.execute(
+            "SELECT fragment FROM fragments WHERE namespace = ? AND digest = ?",
+            (self.namespace, digest),
+        ).fetchone()
+        if row is not None:
+            self.hits += 1
+            self._used.add(digest)
+            return row[0]
+        self.misses += 1
+        fragment = render(content)
+        self._pending[digest] = fragment
+        if len(self._pending) >= COMMIT_EVERY:
+            self._flush()
+        return fragment
+
+    def _flush(self):
+        # Reason: The write lock is taken only for this one executemany, never
+        # while a scene renders, which is what serialized parallel workers
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO fragments VALUES (?, ?, ?, ?)",
+                [
+                    (self.namespace, digest, fragment, self._now)
+                    for digest, fragment in self._pending.items()
+                ],
+            )
+        self._pending = {}
+
+    def close(self):
+        """Commit new fragments, refresh used ones and prune old entries."""
+        if self._db is None:
+            return
+        try:
+            self._flush()
+            with self._db:
+                self._db.executemany(
+                    "UPDATE fragments SET used = ? "
+                    "WHERE namespace = ? AND digest = ?",
+                    [(self._now, self.namespace, digest) for digest in self._used],
+                )
+                self._db.execute(
+                    "DELETE FROM fragments WHERE used < ?",
+                    (self._now - MAX_AGE_DAYS * 86400,),
+                )
+        finally:
+            self._db.close()
+            self._db = None
+            self._used = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def clear_render_cache(path):
+    """Delete the cache file (e.g. from a "clear caches" action or tests)."""
+    path = os.fspath(path)
+    for suffix in ("", "-journal", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
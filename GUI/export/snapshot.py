@@ -0,0 +1,93 @@
+"""
+snapshot.py
+Read-only project snapshots for export workers.
+
+The export dialog used to shallow-copy the project and then remove
+annotations from the live scene dicts, so an export without annotations
+stripped them from the open project. ``snapshot_project`` instead rebuilds
+only the containers (dicts become FrozenDict, lists become tuples) and
+shares every string, so scene text is never copied. Taking a snapshot costs
+one small object per chapter, scene and annotation, no matter how long the
+manuscript is. The editor's data is never mutated, later edits do not leak
+into a running export, and workers in other threads or processes can read
+the snapshot without locks.
+
+Snapshots behave like the plain project data everywhere the exporters look:
+FrozenDict is a dict and tuples serialize as JSON arrays, so JSON output is
+unchanged. They pickle for the batch process pool.
+"""
+
+ANNOTATION_KEYS = ("annotations", "footnotes")
+# Immutable leaf types, returned without a function call per value
+_ATOMS = frozenset((str, int, float, bool, type(None)))
+
+
+class FrozenDict(dict):
+    """A dict that refuses to change after construction."""
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("project snapshots are read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+def freeze(value):
+    """Read-only copy of nested dicts and lists; other values are shared."""
+    if type(value) in _ATOMS:
+        return value
+    if isinstance(value, dict):
+        if type(value) is FrozenDict:
+            return value
+        return FrozenDict(
+            {
+                key: item if type(item) in _ATOMS else freeze(item)
+                for key, item in value.items()
+            }
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(item if type(item) in _ATOMS else freeze(item) for item in value)
+    return value
+
+
+def _scene(scene, annotations):
+    if not isinstance(scene, dict):
+        return scene  # Legacy string scene
+    return FrozenDict(
+        {
+            key: value if type(value) in _ATOMS else freeze(value)
+            for key, value in scene.items()
+            if annotations or key not in ANNOTATION_KEYS
+        }
+    )
+
+
+def _chapter(chapter, annotations):
+    if not isinstance(chapter, dict):
+        return freeze(chapter)
+    frozen = {}
+    for key, value in chapter.items():
+        if key == "scenes" and isinstance(value, list):
+            frozen[key] = tuple(_scene(scene, annotations) for scene in value)
+        else:
+            frozen[key] = freeze(value)
+    return FrozenDict(frozen)
+
+
+def snapshot_project(project, annotations=True) -> FrozenDict:
+    """
+    Freeze ``project`` for export. With ``annotations=False`` the scene
+    "annotations" and "footnotes" are left out of the snapshot only.
+    """
+    frozen = {}
+    for key, value in project.items():
+        if key == "chapters" and isinstance(value, list):
+            frozen[key] = tuple(_chapter(chapter, annotations) for chapter in value)
+        else:
+            frozen[key] = freeze(value)
+    return FrozenDict(frozen)
@@ -0,0 +1,127 @@
+"""
+streaming.py
+Streaming export pipeline.
+
+The project is written chapter by chapter and scene by scene through a
+buffered file, so peak memory is bounded by the largest scene rather than the
+whole manuscript. Progress is reported per scene, cancellation is checked
+between scenes, and output goes to a temporary ``.part`` file that only
+replaces the target once the export has completed.
+"""
+
+import os
+from typing import Callable, Optional
+
+from GUI.export.formats import ExportFormat, get_format
+from GUI.export.render_cache import RenderCache, cache_namespace
+
+WRITE_BUFFER_SIZE = 256 * 1024
+
+
+class ExportCancelled(Exception):
+    """Raised when an export is cancelled; the target file is left untouched."""
+
+
+def count_scenes(project) -> int:
+    return sum(len(ch.get("scenes", [])) for ch in project.get("chapters", []))
+
+
+def write_project(
+    project,
+    fmt: ExportFormat,
+    out,
+    progress: Optional[Callable[[int, int], None]] = None,
+    is_cancelled: Optional[Callable[[], bool]] = None,
+):
+    """
+    Write the project to a text stream ``out`` in the given format.
+
+    ``progress(done, total)`` is called after every scene; ``is_cancelled``
+    is polled before every scene and raises ExportCancelled when it is True.
+    """
+    total = count_scenes(project)
+    chapters = project.get("chapters", [])
+    out.write(fmt.header(project))
+    write_chapters(
+        chapters, fmt, out, 0, len(chapters) - 1, progress, is_cancelled, total
+    )
+    out.write(fmt.footer(project))
+
+
+def write_chapters(
+    chapters,
+    fmt: ExportFormat,
+    out,
+    first_index: int,
+    last_index: int,
+    progress: Optional[Callable[[int, int], None]] = None,
+    is_cancelled: Optional[Callable[[], bool]] = None,
+    total: Optional[int] = None,
+):
+    """
+    Write a run of consecutive chapters (no project header or footer).
+
+    ``first_index`` is the position of ``chapters[0]`` in the project and
+    ``last_index`` the project's last chapter index, so a range written on its
+    own is byte-identical to the same chapters inside a full export. Returns
+    the number of scenes written.
+    """
+    if total is None:
+        total = sum(len(ch.get("scenes", [])) for ch in chapters)
+    done = 0
+    write = out.write
+    for index, chapter in enumerate(chapters, first_index):
+        write(fmt.chapter_start(chapter, index))
+        for scene in chapter.get("scenes", []):
+            if is_cancelled is not None and is_cancelled():
+                raise ExportCancelled()
+            write(fmt.scene(scene))
+            done += 1
+            if progress is not None:
+                progress(done, total)
+        write(fmt.chapter_end(chapter, index, index == last_index))
+    return done
+
+
+def export_project(
+    project,
+    format_name: str,
+    output_path,
+    progress: Optional[Callable[[int, int], None]] = None,
+    is_cancelled: Optional[Callable[[], bool]] = None,
+    buffer_size: int = WRITE_BUFFER_SIZE,
+    options: Optional[dict] = None,
+    cache_path=None,
+):
+    """
+    Export a project to ``output_path``. ``options`` are passed to the format
+    (see ExportFormat). With ``cache_path``, converted scene bodies are read
+    from and stored in the render cache at that path. Raises ValueError for an
+    unknown format and ExportCancelled if cancelled (no partial file is left
+    behind).
+    """
+    fmt = get_format(format_name, **(options or {}))
+    output_path = os.fspath(output_path)
+    partial_path = output_path + ".part"
+    if cache_path is not None and fmt.cacheable:
+        fmt.render_cache = RenderCache(
+            cache_path, cache_namespace(fmt.name, fmt.options)
+        )
+    try:
+        if fmt.binary:
+            fmt.write_file(project, partial_path, progress, is_cancelled)
+        else:
+            with open(
+                partial_path, "w", encoding="utf-8", newline="", buffering=buffer_size
+            ) as out:
+                write_project(project, fmt, out, progress, is_cancelled)
+        os.replace(partial_path, output_path)
+    except BaseException:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+    finally:
+        # Reason: Fragments rendered before a cancel are still valid
+        if fmt.render_cache is not None:
+            fmt.render_cache.close()
+    return output_path
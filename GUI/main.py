@@ -1,12 +1,25 @@
-from PySide6.QtWidgets import QApplication, QWidget
-from GUI.windows.homepage import HomepageWindow
 import sys
 
+from GUI.diagnostics import startup, tracing
+
+# Reason: The startup trace must begin before the imports it measures
+startup.start_from_argv(sys.argv)
+tracing.enable_from_argv(sys.argv)
+
+from PySide6.QtWidgets import QApplication, QWidget  # noqa: E402
+from GUI.diagnostics import watchdog  # noqa: E402
+from GUI.windows.homepage import HomepageWindow  # noqa: E402
+
 
 def main():
-    app = QApplication(sys.argv)
-    window = HomepageWindow()
-    window.show()
+    with startup.span("QApplication"):
+        app = QApplication(sys.argv)
+    watchdog.start_from_argv(sys.argv)
+    with startup.span("HomepageWindow"):
+        window = HomepageWindow()
+    startup.finish_on_first_paint(window)
+    with startup.span("show"):
+        window.show()
     sys.exit(app.exec())
 
 
@@ -4,15 +4,20 @@ Modular data model and persistence for Characters.
 Follows the pattern of kanban_store.py.
 """
 
-import json
 import os
 from typing import List, Optional, Dict
 from pathlib import Path
 
+from GUI.diagnostics import tracing
+from GUI.storage import session_cache
+
 CHARACTER_FILE = Path(__file__).parent / "characters.json"
 
 
 class Character:
+    # Reason: No per-instance __dict__; a 100k-entity bible is loaded at once
+    __slots__ = ("id", "name", "description", "traits")
+
     def __init__(
         self, id: str, name: str, description: str = "", traits: Optional[Dict] = None
     ):
@@ -38,6 +43,32 @@ class Character:
             traits=data.get("traits", {}),
         )
 
+    @classmethod
+    def from_rows(cls, rows) -> List["Character"]:
+        """Build characters from a list of dicts (the JSON file) in one pass."""
+        return [
+            cls(
+                row["id"],
+                row["name"],
+                row.get("description", ""),
+                row.get("traits"),
+            )
+            for row in rows
+        ]
+
+    @staticmethod
+    def to_rows(characters) -> List[dict]:
+        """The dicts ``from_rows`` reads, without a method call per character."""
+        return [
+            {
+                "id": character.id,
+                "name": character.name,
+                "description": character.description,
+                "traits": character.traits,
+            }
+            for character in characters
+        ]
+
 
 class CharacterStore:
     def __init__(self, file_path: Path = CHARACTER_FILE):
@@ -45,19 +76,19 @@ class CharacterStore:
         self.characters: List[Character] = []
         self.load()
 
+    @tracing.traced("storage")
     def load(self):
-        if self.file_path.exists():
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self.characters = [Character.from_dict(c) for c in data]
-        else:
-            self.characters = []
+        data = session_cache.load_json(self.file_path, [])
+        self.characters = Character.from_rows(data)
 
+    @tracing.traced("storage")
     def save(self):
-        with open(self.file_path, "w", encoding="utf-8") as f:
-            json.dump(
-                [c.to_dict() for c in self.characters], f, indent=2, ensure_ascii=False
-            )
+        session_cache.dump_json(
+            self.file_path,
+            Character.to_rows(self.characters),
+            indent=2,
+            ensure_ascii=False,
+        )
 
     def add(self, character: Character):
         self.characters.append(character)
@@ -4,15 +4,19 @@ Modular data model and persistence for Events.
 Follows the pattern of kanban_store.py.
 """
 
-import json
 import os
 from typing import List, Optional, Dict
 from pathlib import Path
 
+from GUI.diagnostics import tracing
+from GUI.storage import session_cache
+
 EVENT_FILE = Path(__file__).parent / "events.json"
 
 
 class Event:
+    __slots__ = ("id", "title", "description", "metadata")
+
     def __init__(
         self,
         id: str,
@@ -42,6 +46,32 @@ class Event:
             metadata=data.get("metadata", {}),
         )
 
+    @classmethod
+    def from_rows(cls, rows) -> List["Event"]:
+        """Build events from a list of dicts (the JSON file) in one pass."""
+        return [
+            cls(
+                row["id"],
+                row["title"],
+                row.get("description", ""),
+                row.get("metadata"),
+            )
+            for row in rows
+        ]
+
+    @staticmethod
+    def to_rows(events) -> List[dict]:
+        """The dicts ``from_rows`` reads, without a method call per event."""
+        return [
+            {
+                "id": event.id,
+                "title": event.title,
+                "description": event.description,
+                "metadata": event.metadata,
+            }
+            for event in events
+        ]
+
 
 class EventStore:
     def __init__(self, file_path: Path = EVENT_FILE):
@@ -49,19 +79,19 @@ class EventStore:
         self.events: List[Event] = []
         self.load()
 
+    @tracing.traced("storage")
     def load(self):
-        if self.file_path.exists():
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self.events = [Event.from_dict(e) for e in data]
-        else:
-            self.events = []
+        data = session_cache.load_json(self.file_path, [])
+        self.events = Event.from_rows(data)
 
+    @tracing.traced("storage")
     def save(self):
-        with open(self.file_path, "w", encoding="utf-8") as f:
-            json.dump(
-                [e.to_dict() for e in self.events], f, indent=2, ensure_ascii=False
-            )
+        session_cache.dump_json(
+            self.file_path,
+            Event.to_rows(self.events),
+            indent=2,
+            ensure_ascii=False,
+        )
 
     def add(self, event: Event):
         self.events.append(event)
@@ -0,0 +1,208 @@
+"""
+find_replace.py
+Project-wide find and replace over scene content.
+
+Scene bodies are Qt rich-text HTML, so replacements are applied to the text
+between tags only: markup, attributes and the <head>/<style> block are never
+touched. Everything here is pure Python so the scan can run on a worker thread
+against an immutable snapshot of the scene contents.
+"""
+
+import difflib
+import html
+import re
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+from GUI.storage.scene_text import html_to_plain_text, is_rich_text
+
+TAG_RE = re.compile(r"(<[^>]*>)")
+SKIP_TAG_RE = re.compile(r"<\s*(/?)\s*(head|style|script|title)\b", re.IGNORECASE)
+
+
+@dataclass
+class SceneReplacement:
+    key: Tuple[int, int]  # (chapter_idx, scene_idx)
+    chapter_title: str
+    scene_title: str
+    old_content: str
+    new_content: str
+    count: int
+
+
+def compile_pattern(find: str, regex=False, case_sensitive=False, whole_word=False):
+    """
+    Compile the search pattern. Raises ValueError for an empty search or an
+    invalid regular expression.
+    """
+    if not find:
+        raise ValueError("Search text is empty")
+    source = find if regex else re.escape(find)
+    if whole_word:
+        source = rf"\b(?:{source})\b"
+    flags = 0 if case_sensitive else re.IGNORECASE
+    try:
+        return re.compile(source, flags)
+    except re.error as e:
+        raise ValueError(f"Invalid regular expression: {e}") from e
+
+
+def _substitute(pattern, replacement: str, regex: bool):
+    # Reason: In literal mode backslashes in the replacement are plain text,
+    # so pass a function instead of a template to re.subn.
+    if regex:
+        return lambda text: pattern.subn(replacement, text)
+    return lambda text: pattern.subn(lambda m: replacement, text)
+
+
+def replace_in_content(content: str, pattern, replacement: str, regex=False):
+    """
+    Replace matches in one scene's content. Returns (new_content, count).
+
+    For HTML content only text segments between tags are rewritten; a match
+    cannot span a tag boundary (e.g. a word that is half bold).
+    """
+    if not content:
+        return content, 0
+    subn = _substitute(pattern, replacement, regex)
+    if not is_rich_text(content):
+        return subn(content)
+    parts = TAG_RE.split(content)
+    total = 0
+    skip_depth = 0
+    # Odd indexes are tags, even indexes are the text between them
+    for i, part in enumerate(parts):
+        if i % 2:
+            m = SKIP_TAG_RE.match(part)
+            if m and not part.endswith("/>"):
+                skip_depth += -1 if m.group(1) else 1
+                skip_depth = max(0, skip_depth)
+            continue
+        if not part or skip_depth:
+            continue
+        text = html.unescape(part)
+        new_text, count = subn(text)
+        if count:
+            parts[i] = html.escape(new_text, quote=False)
+            total += count
+    if not total:
+        return content, 0
+    return "".join(parts), total
+
+
+def collect_scenes(chapters) -> List[Tuple[Tuple[int, int], str, str, str]]:
+    """
+    Snapshot (key, chapter title, scene title, content) for every dict scene.
+    Contents are immutable strings, so the snapshot is safe to hand to a thread.
+    """
+    scenes = []
+    for cidx, chapter in enumerate(chapters):
+        for sidx, scene in enumerate(chapter.get("scenes", [])):
+            if isinstance(scene, dict):
+                scenes.append(
+                    (
+                        (cidx, sidx),
+                        chapter.get("title", ""),
+                        scene.get("title", "Untitled"),
+                        scene.get("content", ""),
+                    )
+                )
+    return scenes
+
+
+def find_replacements(
+    scenes,
+    pattern,
+    replacement: str,
+    regex=False,
+    progress: Optional[Callable[[int], None]] = None,
+    is_cancelled: Optional[Callable[[], bool]] = None,
+) -> Optional[List[SceneReplacement]]:
+    """
+    Compute the replacement for every scene in a collect_scenes() snapshot.
+
+    Returns the changed scenes only, or None if ``is_cancelled`` returned True.
+    ``progress`` receives a percentage whenever it advances.
+    """
+    changes = []
+    total = len(scenes)
+    last_percent = -1
+    for done, (key, chapter_title, scene_title, content) in enumerate(scenes, 1):
+        if is_cancelled is not None and is_cancelled():
+            return None
+        new_content, count = replace_in_content(content, pattern, replacement, regex)
+        if count:
+            changes.append(
+                SceneReplacement(
+                    key, chapter_title, scene_title, content, new_content, count
+                )
+            )
+        if progress is not None:
+            percent = done * 100 // total
+            if percent != last_percent:
+                last_percent = percent
+                progress(percent)
+    return changes
+
+
+def preview_diff(change: SceneReplacement, context: int = 1) -> str:
+    """Unified diff of the scene's plain text before and after the replacement."""
+    old_lines = html_to_plain_text(change.old_content).splitlines()
+    new_lines = html_to_plain_text(change.new_content).splitlines()
+    label = f"{change.chapter_title} › {change.scene_title}"
+    return "\n".join(
+        difflib.unified_diff(
+            old_lines,
+            new_lines,
+            fromfile=f"{label} (before)",
+            tofile=f"{label} (after)",
+            n=context,
+            lineterm="",
+        )
+    )
+
+
+def _scene_at(chapters, key):
+    cidx, sidx = key
+    if 0 <= cidx < len(chapters):
+        scenes = chapters[cidx].get("scenes", [])
+        if 0 <= sidx < len(scenes) and isinstance(scenes[sidx], dict):
+            return scenes[sidx]
+    return None
+
+
+def apply_replacements(chapters, changes) -> List[SceneReplacement]:
+    """
+    Write the replacements into the chapters as one batch.
+
+    Each changed scene gets exactly one version snapshot of its previous
+    content. Scenes edited since the preview was computed are skipped.
+    Returns the applied changes, which revert_replacements() can undo.
+    """
+    applied = []
+    for change in changes:
+        scene = _scene_at(chapters, change.key)
+        if scene is None or scene.get("content", "") != change.old_content:
+            continue
+        scene.setdefault("versions", []).append({"content": change.old_content})
+        scene["content"] = change.new_content
+        applied.append(change)
+    return applied
+
+
+def revert_replacements(chapters, applied) -> List[SceneReplacement]:
+    """
+    Undo a batch returned by apply_replacements(). Scenes edited after the
+    batch was applied are left alone. Returns the reverted changes.
+    """
+    reverted = []
+    for change in reversed(applied):
+        scene = _scene_at(chapters, change.key)
+        if scene is None or scene.get("content", "") != change.new_content:
+            continue
+        scene["content"] = change.old_content
+        versions = scene.get("versions", [])
+        if versions and versions[-1] == {"content": change.old_content}:
+            versions.pop()
+        reverted.append(change)
+    return reverted
@@ -2,33 +2,34 @@ import json
 import os
 import datetime
 
+from GUI.diagnostics import tracing
+from GUI.storage import session_cache
+
 KANBAN_FILE = os.path.join(os.path.dirname(__file__), "kanban_board.json")
 KANBAN_HISTORY_DIR = os.path.join(os.path.dirname(__file__), "kanban_history")
 
 
+@tracing.traced("storage")
 def load_kanban_board():
-    if os.path.exists(KANBAN_FILE):
-        with open(KANBAN_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            # Defensive: ensure all cards have 'metadata' and 'links' fields
-            for col_cards in data.values():
-                for card in col_cards:
-                    if isinstance(card, dict):
-                        if "metadata" not in card or not isinstance(
-                            card["metadata"], dict
-                        ):
-                            card["metadata"] = {}
-                        if "links" not in card["metadata"] or not isinstance(
-                            card["metadata"].get("links"), list
-                        ):
-                            card["metadata"]["links"] = []
-            return data
-    return {}
-
-
+    data = session_cache.load_json(KANBAN_FILE)
+    if data is None:
+        return {}
+    # Defensive: ensure all cards have 'metadata' and 'links' fields
+    for col_cards in data.values():
+        for card in col_cards:
+            if isinstance(card, dict):
+                if "metadata" not in card or not isinstance(card["metadata"], dict):
+                    card["metadata"] = {}
+                if "links" not in card["metadata"] or not isinstance(
+                    card["metadata"].get("links"), list
+                ):
+                    card["metadata"]["links"] = []
+    return data
+
+
+@tracing.traced("storage")
 def save_kanban_board(state):
-    with open(KANBAN_FILE, "w", encoding="utf-8") as f:
-        json.dump(state, f, ensure_ascii=False, indent=2)
+    session_cache.dump_json(KANBAN_FILE, state, ensure_ascii=False, indent=2)
     # Also save a timestamped version for history
     if not os.path.exists(KANBAN_HISTORY_DIR):
         os.makedirs(KANBAN_HISTORY_DIR)
@@ -46,6 +47,7 @@ def list_kanban_versions():
     return files
 
 
+@tracing.traced("storage")
 def load_kanban_version(filename):
     path = os.path.join(KANBAN_HISTORY_DIR, filename)
     if os.path.exists(path):
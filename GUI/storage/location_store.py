@@ -4,15 +4,19 @@ Modular data model and persistence for Locations.
 Follows the pattern of kanban_store.py.
 """
 
-import json
 import os
 from typing import List, Optional, Dict
 from pathlib import Path
 
+from GUI.diagnostics import tracing
+from GUI.storage import session_cache
+
 LOCATION_FILE = Path(__file__).parent / "locations.json"
 
 
 class Location:
+    __slots__ = ("id", "name", "description", "details")
+
     def __init__(
         self, id: str, name: str, description: str = "", details: Optional[Dict] = None
     ):
@@ -38,6 +42,32 @@ class Location:
             details=data.get("details", {}),
         )
 
+    @classmethod
+    def from_rows(cls, rows) -> List["Location"]:
+        """Build locations from a list of dicts (the JSON file) in one pass."""
+        return [
+            cls(
+                row["id"],
+                row["name"],
+                row.get("description", ""),
+                row.get("details"),
+            )
+            for row in rows
+        ]
+
+    @staticmethod
+    def to_rows(locations) -> List[dict]:
+        """The dicts ``from_rows`` reads, without a method call per location."""
+        return [
+            {
+                "id": location.id,
+                "name": location.name,
+                "description": location.description,
+                "details": location.details,
+            }
+            for location in locations
+        ]
+
 
 class LocationStore:
     def __init__(self, file_path: Path = LOCATION_FILE):
@@ -45,19 +75,19 @@ class LocationStore:
         self.locations: List[Location] = []
         self.load()
 
+    @tracing.traced("storage")
     def load(self):
-        if self.file_path.exists():
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self.locations = [Location.from_dict(l) for l in data]
-        else:
-            self.locations = []
+        data = session_cache.load_json(self.file_path, [])
+        self.locations = Location.from_rows(data)
 
+    @tracing.traced("storage")
     def save(self):
-        with open(self.file_path, "w", encoding="utf-8") as f:
-            json.dump(
-                [l.to_dict() for l in self.locations], f, indent=2, ensure_ascii=False
-            )
+        session_cache.dump_json(
+            self.file_path,
+            Location.to_rows(self.locations),
+            indent=2,
+            ensure_ascii=False,
+        )
 
     def add(self, location: Location):
         self.locations.append(location)
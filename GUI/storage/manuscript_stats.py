@@ -0,0 +1,207 @@
+"""
+manuscript_stats.py
+Incremental word count and manuscript statistics.
+
+Per-scene counts (words, characters, paragraphs, dialogue lines) are cached by
+a hash of the scene content, then rolled up per chapter and for the whole
+project. After an edit only the changed scene is recounted and the roll-ups
+are adjusted by the difference, so live totals never re-read the manuscript.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Tuple
+
+from GUI.storage.scene_text import html_to_plain_text
+
+WORD_RE = re.compile(r"\w+(?:['’]\w+)*")
+# A line is dialogue if it opens with a quote/dash or contains a quoted span
+DIALOGUE_RE = re.compile(r'^\s*["“«—–]|"[^"]+"|“[^”]+”|«[^»]+»')
+
+
+@dataclass(frozen=True)
+class TextStats:
+    words: int = 0
+    characters: int = 0
+    paragraphs: int = 0
+    dialogue_lines: int = 0
+
+    def __add__(self, other):
+        return TextStats(
+            self.words + other.words,
+            self.characters + other.characters,
+            self.paragraphs + other.paragraphs,
+            self.dialogue_lines + other.dialogue_lines,
+        )
+
+    def __sub__(self, other):
+        return TextStats(
+            self.words - other.words,
+            self.characters - other.characters,
+            self.paragraphs - other.paragraphs,
+            self.dialogue_lines - other.dialogue_lines,
+        )
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+EMPTY_STATS = TextStats()
+
+
+def format_stats(stats: TextStats) -> str:
+    """Short human-readable summary used by the editor and dashboard."""
+    return (
+        f"{stats.words:,} words · {stats.characters:,} characters · "
+        f"{stats.paragraphs:,} paragraphs · {stats.dialogue_lines:,} dialogue lines"
+    )
+
+
+def compute_text_stats(text: str) -> TextStats:
+    """
+    Count plain text. Characters exclude line breaks; paragraphs are the
+    non-blank lines.
+    """
+    words = 0
+    characters = 0
+    paragraphs = 0
+    dialogue = 0
+    for line in text.split("\n"):
+        characters += len(line)
+        if not line.strip():
+            continue
+        paragraphs += 1
+        words += len(WORD_RE.findall(line))
+        if DIALOGUE_RE.search(line):
+            dialogue += 1
+    return TextStats(words, characters, paragraphs, dialogue)
+
+
+def content_hash(content: str) -> bytes:
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+
+
+class ManuscriptStats:
+    """
+    Statistics bound to a project's chapters, keyed by (chapter_idx, scene_idx).
+
+    Call ``scene_changed`` after a scene edit and ``invalidate`` after
+    structural edits, like ProjectSearchIndex. Totals are refreshed lazily on
+    the next read.
+    """
+
+    def __init__(self, get_chapters: Callable[[], list]):
+        self._get_chapters = get_chapters
+        self._source = None
+        # Reason: Keyed by content hash so identical and restored content
+        # (undo, version history) is never counted twice.
+        self._by_hash: Dict[bytes, TextStats] = {}
+        # key -> (content object, hash, stats)
+        self._scenes: Dict[Tuple[int, int], Tuple[str, bytes, TextStats]] = {}
+        self._chapters: List[TextStats] = []
+        self._total = EMPTY_STATS
+        self._dirty = set()
+        self._needs_sync = True
+        self.recounted = 0  # Scenes actually re-counted (for tests/diagnostics)
+
+    def scene_changed(self, cidx: int, sidx: int):
+        self._dirty.add((cidx, sidx))
+
+    def invalidate(self):
+        self._needs_sync = True
+
+    def _count(self, content: str) -> Tuple[bytes, TextStats]:
+        digest = content_hash(content)
+        stats = self._by_hash.get(digest)
+        if stats is None:
+            stats = compute_text_stats(html_to_plain_text(content))
+            self._by_hash[digest] = stats
+            self.recounted += 1
+        return digest, stats
+
+    def _scene_record(self, key, scene):
+        content = scene.get("content", "") if isinstance(scene, dict) else ""
+        record = self._scenes.get(key)
+        if record is not None and record[0] is content:
+            return record
+        digest, stats = self._count(content or "")
+        record = (content, digest, stats)
+        self._scenes[key] = record
+        return record
+
+    def _sync(self, chapters):
+        self._source = chapters
+        scenes = {}
+        self._chapters = []
+        total = EMPTY_STATS
+        for cidx, chapter in enumerate(chapters):
+            chapter_total = EMPTY_STATS
+            for sidx, scene in enumerate(chapter.get("scenes", [])):
+                record = self._scene_record((cidx, sidx), scene)
+                scenes[(cidx, sidx)] = record
+                chapter_total = chapter_total + record[2]
+            self._chapters.append(chapter_total)
+            total = total + chapter_total
+        self._scenes = scenes
+        self._total = total
+        live = {record[1] for record in scenes.values()}
+        self._by_hash = {h: s for h, s in self._by_hash.items() if h in live}
+        self._needs_sync = False
+
+    def refresh(self):
+        chapters = self._get_chapters()
+        if self._needs_sync or self._source is not chapters:
+            self._sync(chapters)
+        else:
+            for key in self._dirty:
+                cidx, sidx = key
+                if cidx >= len(chapters) or cidx >= len(self._chapters):
+                    continue
+                scenes = chapters[cidx].get("scenes", [])
+                if sidx >= len(scenes):
+                    continue
+                old = self._scenes.get(key)
+                old_stats = old[2] if old is not None else EMPTY_STATS
+                new_stats = self._scene_record(key, scenes[sidx])[2]
+                if new_stats != old_stats:
+                    delta = new_stats - old_stats
+                    self._chapters[cidx] = self._chapters[cidx] + delta
+                    self._total = self._total + delta
+            # Reason: Every keystroke adds a hash; drop the dead ones now and then
+            if len(self._by_hash) > 2 * len(self._scenes) + 256:
+                live = {record[1] for record in self._scenes.values()}
+                self._by_hash = {h: s for h, s in self._by_hash.items() if h in live}
+        self._dirty.clear()
+
+    def scene_stats(self, cidx: int, sidx: int) -> TextStats:
+        self.refresh()
+        record = self._scenes.get((cidx, sidx))
+        return record[2] if record is not None else EMPTY_STATS
+
+    def chapter_stats(self, cidx: int) -> TextStats:
+        self.refresh()
+        if 0 <= cidx < len(self._chapters):
+            return self._chapters[cidx]
+        return EMPTY_STATS
+
+    def project_stats(self) -> TextStats:
+        self.refresh()
+        return self._total
+
+    def summary(self) -> Dict[str, object]:
+        """Project totals plus per-chapter totals, for manifests and exports."""
+        self.refresh()
+        chapters = self._get_chapters()
+        return {
+            **self._total.as_dict(),
+            "chapters": [
+                {"title": chapter.get("title", ""), **stats.as_dict()}
+                for chapter, stats in zip(chapters, self._chapters)
+            ],
+        }
+
+
+def project_stats(chapters) -> TextStats:
+    """One-off project totals for chapters that are not open in an editor."""
+    return ManuscriptStats(lambda: chapters).project_stats()
@@ -0,0 +1,146 @@
+"""
+markdown_render.py
+Block-incremental Markdown to HTML rendering for the scene preview.
+
+The scene text is split into top-level Markdown blocks (paragraphs, lists,
+fenced code, ...) and each block is rendered on its own, with the HTML cached
+by block text. After an edit only the blocks that actually changed are
+rendered again; everything else is a dictionary lookup.
+
+The ``markdown`` package is used when installed; otherwise a small built-in
+renderer covers the common subset (headings, emphasis, lists, quotes, code,
+links). Rendering block by block means reference-style links and lists that
+span blank lines are not joined across blocks.
+"""
+
+import html
+import re
+from collections import OrderedDict
+from typing import List
+
+try:
+    import markdown as _markdown
+except ImportError:  # Optional dependency
+    _markdown = None
+
+BLOCK_CACHE_SIZE = 4096
+FENCE_RE = re.compile(r"^\s*(```|~~~)")
+
+
+def split_blocks(text: str) -> List[str]:
+    """
+    Split Markdown into top-level blocks separated by blank lines. Fenced code
+    blocks are kept whole even if they contain blank lines.
+    """
+    blocks = []
+    current = []
+    fence = None
+    for line in text.split("\n"):
+        m = FENCE_RE.match(line)
+        if fence is not None:
+            current.append(line)
+            if m and m.group(1) == fence:
+                fence = None
+            continue
+        if m:
+            fence = m.group(1)
+            current.append(line)
+            continue
+        if line.strip():
+            current.append(line)
+        elif current:
+            blocks.append("\n".join(current))
+            current = []
+    if current:
+        blocks.append("\n".join(current))
+    return blocks
+
+
+CODE_RE = re.compile(r"`([^`]+)`")
+BOLD_RE = re.compile(r"\*\*(.+?)\*\*|__(.+?)__")
+ITALIC_RE = re.compile(
+    r"(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*|(?<!\w)_(?!\s)(.+?)(?<!\s)_(?!\w)"
+)
+LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)\s]+)\)")
+
+
+def _render_inline(text: str) -> str:
+    text = html.escape(text, quote=False)
+    text = CODE_RE.sub(r"<code>\1</code>", text)
+    text = BOLD_RE.sub(lambda m: f"<strong>{m.group(1) or m.group(2)}</strong>", text)
+    text = ITALIC_RE.sub(lambda m: f"<em>{m.group(1) or m.group(2)}</em>", text)
+    return LINK_RE.sub(r'<a href="\2">\1</a>', text)
+
+
+def _render_list(lines, ordered):
+    tag = "ol" if ordered else "ul"
+    marker = re.compile(r"^\s*(\d+[.)]|[-*+])\s+")
+    items = []
+    for line in lines:
+        m = marker.match(line)
+        if m:
+            items.append(line[m.end():])
+        elif items:
+            items[-1] += " " + line.strip()
+    body = "".join(f"<li>{_render_inline(item)}</li>" for item in items)
+    return f"<{tag}>{body}</{tag}>"
+
+
+def render_block_builtin(block: str) -> str:
+    """Render one Markdown block with the built-in subset renderer."""
+    lines = block.split("\n")
+    first = lines[0].lstrip()
+    if FENCE_RE.match(first):
+        closed = len(lines) > 1 and FENCE_RE.match(lines[-1])
+        code = "\n".join(lines[1:-1] if closed else lines[1:])
+        return f"<pre><code>{html.escape(code, quote=False)}</code></pre>"
+    m = re.match(r"(#{1,6})\s+(.*?)\s*#*$", first)
+    if m and len(lines) == 1:
+        level = len(m.group(1))
+        return f"<h{level}>{_render_inline(m.group(2))}</h{level}>"
+    if re.fullmatch(r"(\*\s*){3,}|(-\s*){3,}|(_\s*){3,}", first):
+        return "<hr />"
+    if all(line.lstrip().startswith(">") for line in lines):
+        inner = "\n".join(re.sub(r"^\s*>\s?", "", line) for line in lines)
+        return f"<blockquote>{render_block_builtin(inner)}</blockquote>"
+    if re.match(r"^\s*[-*+]\s+", first):
+        return _render_list(lines, ordered=False)
+    if re.match(r"^\s*\d+[.)]\s+", first):
+        return _render_list(lines, ordered=True)
+    return "<p>" + "<br />".join(_render_inline(line) for line in lines) + "</p>"
+
+
+def render_block(block: str) -> str:
+    """Render one Markdown block to HTML."""
+    if _markdown is not None:
+        return _markdown.markdown(block)
+    return render_block_builtin(block)
+
+
+class IncrementalMarkdownRenderer:
+    """
+    Renders whole documents, re-rendering only blocks not seen recently.
+
+    Not thread-safe: use it from one worker at a time.
+    """
+
+    def __init__(self, cache_size=BLOCK_CACHE_SIZE):
+        self.cache_size = cache_size
+        self._cache = OrderedDict()  # block text -> html
+        self.rendered_blocks = 0  # Blocks actually rendered (cache misses)
+
+    def render(self, text: str) -> str:
+        parts = []
+        cache = self._cache
+        for block in split_blocks(text):
+            fragment = cache.get(block)
+            if fragment is None:
+                fragment = render_block(block)
+                cache[block] = fragment
+                self.rendered_blocks += 1
+                if len(cache) > self.cache_size:
+                    cache.popitem(last=False)
+            else:
+                cache.move_to_end(block)
+            parts.append(fragment)
+        return "\n".join(parts)
@@ -1,19 +1,37 @@
-import json
 import os
 
+from GUI.diagnostics import tracing
+from GUI.storage import session_cache
+
 PROJECTS_FILE = os.path.join(os.path.dirname(__file__), "projects.json")
+# Rendered export fragments, reused across exports (see GUI/export/render_cache.py)
+EXPORT_CACHE_FILE = os.path.join(os.path.dirname(__file__), "export_cache.sqlite")
 
 
-def load_projects():
-    if os.path.exists(PROJECTS_FILE):
-        with open(PROJECTS_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return []
+@tracing.traced("storage")
+def load_projects(path=None):
+    return session_cache.load_json(path or PROJECTS_FILE, [])
 
 
+@tracing.traced("storage")
 def save_projects(projects):
-    with open(PROJECTS_FILE, "w", encoding="utf-8") as f:
-        json.dump(projects, f, ensure_ascii=False, indent=2)
+    session_cache.dump_json(PROJECTS_FILE, projects, ensure_ascii=False, indent=2)
+
+
+@tracing.traced("storage")
+def migrate_scene_content():
+    """
+    Convert every scene in projects.json to compact content storage
+    (see scene_content.py) and save the file if anything changed.
+    Returns the migration report.
+    """
+    from GUI.storage.scene_content import migrate_projects
+
+    projects = load_projects()
+    report = migrate_projects(projects)
+    if report["scenes"] or report["versions"]:
+        save_projects(projects)
+    return report
 
 
 # Reason: Simple JSON-based persistence for project names. Replace with DB in production.
@@ -0,0 +1,118 @@
+"""
+scene_content.py
+Compact canonical storage for scene content.
+
+``QTextEdit.toHtml()`` wraps every scene in a DOCTYPE, a <head> with a
+<style> block and a <body> carrying the editor font, and repeats the same
+default margin/indent declarations on every paragraph. For short scenes that
+boilerplate is most of the file.
+
+The compact form keeps only the <body> contents and drops block style
+declarations equal to the editor defaults. It is still Qt rich text, so
+readers that only need text (search, statistics, export) use it unchanged;
+``expand_scene_html`` restores the defaults through one shared stylesheet
+before the content is handed to Qt, and the round trip
+``compact(toHtml(setHtml(expand(c)))) == c`` holds.
+"""
+
+import re
+
+# Block declarations Qt writes for ordinary typed paragraphs
+DEFAULT_BLOCK_DECLARATIONS = (
+    "margin-top:0px",
+    "margin-bottom:0px",
+    "margin-left:0px",
+    "margin-right:0px",
+    "-qt-block-indent:0",
+    "text-indent:0px",
+)
+_DEFAULT_DECLARATIONS = frozenset(DEFAULT_BLOCK_DECLARATIONS)
+
+# Shared stylesheet that puts the stripped defaults back when Qt parses it
+SCENE_STYLESHEET = (
+    "p, li { white-space: pre-wrap; }\n"
+    "p, li, h1, h2, h3, h4, h5, h6 { " + "; ".join(DEFAULT_BLOCK_DECLARATIONS) + "; }"
+)
+
+_BODY_RE = re.compile(r"<body[^>]*>(.*)</body>", re.DOTALL | re.IGNORECASE)
+_BLOCK_STYLE_RE = re.compile(r'<(p|li|h[1-6])\b([^>]*?)\sstyle="([^"]*)"')
+
+
+def is_full_qt_html(content: str) -> bool:
+    """True for a complete toHtml() document (DOCTYPE/<html>/<body> wrapper)."""
+    head = content[:200].lstrip().lower()
+    return head.startswith("<!doctype") or head.startswith("<html")
+
+
+def _compact_block_style(match) -> str:
+    tag, attrs, style = match.groups()
+    kept = [
+        d
+        for d in (part.strip() for part in style.split(";"))
+        if d and d.replace(" ", "") not in _DEFAULT_DECLARATIONS
+    ]
+    if not kept:
+        return f"<{tag}{attrs}"
+    return f'<{tag}{attrs} style="{"; ".join(kept)};"'
+
+
+def compact_scene_html(content: str) -> str:
+    """
+    Convert toHtml() output to the compact form. Plain-text and already
+    compact content is returned unchanged.
+    """
+    if not content or not is_full_qt_html(content):
+        return content
+    m = _BODY_RE.search(content)
+    body = m.group(1) if m else ""
+    if body.startswith("\n"):
+        body = body[1:]
+    return _BLOCK_STYLE_RE.sub(_compact_block_style, body)
+
+
+def expand_scene_html(content: str) -> str:
+    """
+    Return HTML for QTextEdit.setHtml(): compact content is wrapped with the
+    shared stylesheet; full documents and plain text pass through.
+    """
+    if not content or is_full_qt_html(content):
+        return content
+    if "<" not in content or ">" not in content:
+        return content
+    return (
+        '<html><head><meta name="qrichtext" content="1" />'
+        f'<style type="text/css">\n{SCENE_STYLESHEET}\n</style></head>'
+        f"<body>\n{content}</body></html>"
+    )
+
+
+def migrate_projects(projects) -> dict:
+    """
+    Rewrite every scene (and saved version) in place to the compact form.
+    Returns counts and the total bytes before/after, for reporting.
+    """
+    report = {"scenes": 0, "versions": 0, "bytes_before": 0, "bytes_after": 0}
+
+    def migrate(holder, counter):
+        content = holder.get("content")
+        if not isinstance(content, str):
+            return
+        compact = compact_scene_html(content)
+        report["bytes_before"] += len(content.encode("utf-8"))
+        report["bytes_after"] += len(compact.encode("utf-8"))
+        if compact != content:
+            holder["content"] = compact
+            report[counter] += 1
+
+    for project in projects:
+        if not isinstance(project, dict):
+            continue
+        for chapter in project.get("chapters", []):
+            for scene in chapter.get("scenes", []):
+                if not isinstance(scene, dict):
+                    continue
+                migrate(scene, "scenes")
+                for version in scene.get("versions", []):
+                    if isinstance(version, dict):
+                        migrate(version, "versions")
+    return report
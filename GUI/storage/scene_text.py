@@ -0,0 +1,101 @@
+"""
+scene_text.py
+Plain-text extraction for scene content stored as Qt rich-text HTML.
+
+Scene bodies in projects.json are ``QTextEdit.toHtml()`` documents (or plain
+strings for older scenes). These helpers turn them into the same plain text
+``QTextDocument.toPlainText()`` would produce, without creating any Qt objects,
+so offsets computed here can be used directly as QTextCursor positions.
+"""
+
+from html.parser import HTMLParser
+
+# Elements that start a new text block in Qt's rich-text model
+BLOCK_TAGS = frozenset(
+    ("p", "li", "h1", "h2", "h3", "h4", "h5", "h6", "pre", "div", "td", "th")
+)
+# Elements whose text is never part of the document body
+SKIP_TAGS = frozenset(("head", "style", "script", "title"))
+
+# Qt stores <br /> as U+2028; toPlainText() reports it as "\n" (one char)
+LINE_SEPARATOR = "\n"
+
+
+class _PlainTextParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self._skip_depth = 0
+        self._block_depth = 0
+        self._has_blocks = False
+        self._empty_block = False
+
+    def _start_block(self):
+        if self._has_blocks:
+            self.parts.append("\n")
+        self._has_blocks = True
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in BLOCK_TAGS:
+            self._start_block()
+            self._block_depth += 1
+            style = dict(attrs).get("style") or ""
+            self._empty_block = "-qt-paragraph-type:empty" in style
+        elif tag == "br":
+            # Reason: Qt writes empty paragraphs as <p ...><br /></p>
+            if not self._empty_block:
+                self.parts.append(LINE_SEPARATOR)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag in SKIP_TAGS or tag in BLOCK_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in BLOCK_TAGS:
+            self._block_depth = max(0, self._block_depth - 1)
+            self._empty_block = False
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        if not self._block_depth:
+            # Whitespace between Qt's block elements is layout, not text
+            if not data.strip():
+                return
+            if not self._has_blocks:
+                self._has_blocks = True
+        self.parts.append(data.replace("\xa0", " "))
+
+
+def is_rich_text(content: str) -> bool:
+    """Return True if the content looks like HTML rather than plain text."""
+    return "<" in content and ">" in content
+
+
+def html_to_plain_text(content) -> str:
+    """
+    Convert scene content (Qt HTML or plain text) to plain text.
+
+    Blocks and in-block line breaks are both written as "\\n", matching
+    QTextDocument character positions one-to-one.
+    """
+    if not content:
+        return ""
+    if not is_rich_text(content):
+        return content
+    parser = _PlainTextParser()
+    parser.feed(content)
+    parser.close()
+    return "".join(parser.parts)
+
+
+def scene_plain_text(scene) -> str:
+    """Plain text of a scene dict (or legacy string scene, which has no body)."""
+    if isinstance(scene, dict):
+        return html_to_plain_text(scene.get("content", ""))
+    return ""
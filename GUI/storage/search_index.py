@@ -0,0 +1,319 @@
+"""
+search_index.py
+Project-wide full-text search over scene text.
+
+SearchIndex is an in-memory inverted index with positional postings: for each
+term it stores, per document, the ordinal positions of that term, plus the
+character span of every token so hits map straight back to editor offsets.
+Queries support bare terms, "quoted phrases" and prefix* terms; all clauses
+must match (AND).
+
+ProjectSearchIndex keeps a SearchIndex in step with a project's chapters and
+only re-tokenizes scenes whose content actually changed.
+"""
+
+import re
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from GUI.storage.scene_text import html_to_plain_text
+
+TOKEN_RE = re.compile(r"\w+")
+QUERY_RE = re.compile(r'"([^"]*)"|(\S+)')
+SNIPPET_CONTEXT = 30
+
+
+@dataclass
+class SearchHit:
+    key: Hashable  # document key, e.g. (chapter_idx, scene_idx)
+    start: int  # character offset of the match in the plain text
+    end: int
+    snippet: str
+
+
+def tokenize(text: str):
+    """
+    Yield (term, start, end) for each word in text, terms lower-cased.
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        for m in TOKEN_RE.finditer(lowered):
+            yield m.group(), m.start(), m.end()
+    else:
+        # Reason: Some characters change length when lower-cased; fall back
+        # to per-token lowering so offsets stay valid for the original text.
+        for m in TOKEN_RE.finditer(text):
+            yield m.group().lower(), m.start(), m.end()
+
+
+def parse_query(query: str) -> List[List[Tuple[str, bool]]]:
+    """
+    Split a query into clauses. Each clause is a list of (term, is_prefix)
+    steps that must appear consecutively; single-step clauses are plain terms.
+    """
+    clauses = []
+    for m in QUERY_RE.finditer(query):
+        phrase, word = m.group(1), m.group(2)
+        raw = phrase if phrase is not None else word
+        prefix = phrase is None and raw.endswith("*")
+        terms = [t for t, _, _ in tokenize(raw)]
+        if not terms:
+            continue
+        steps = [(t, False) for t in terms]
+        if prefix:
+            steps[-1] = (steps[-1][0], True)
+        clauses.append(steps)
+    return clauses
+
+
+class SearchIndex:
+    def __init__(self):
+        # term -> {doc key -> array of token ordinals}
+        self._postings: Dict[str, Dict[Hashable, array]] = {}
+        self._doc_terms: Dict[Hashable, Tuple[str, ...]] = {}
+        self._doc_starts: Dict[Hashable, array] = {}
+        self._doc_ends: Dict[Hashable, array] = {}
+        self._doc_texts: Dict[Hashable, str] = {}
+        self._sorted_terms: Optional[List[str]] = None
+
+    def __len__(self):
+        return len(self._doc_texts)
+
+    def __contains__(self, key):
+        return key in self._doc_texts
+
+    def keys(self):
+        return self._doc_texts.keys()
+
+    def text(self, key) -> str:
+        return self._doc_texts.get(key, "")
+
+    def add_document(self, key: Hashable, text: str):
+        """Index (or re-index) a document's plain text under key."""
+        if key in self._doc_texts:
+            self.remove_document(key)
+        starts = array("I")
+        ends = array("I")
+        positions: Dict[str, List[int]] = {}
+        # Same rules as tokenize(), inlined: this loop dominates build time
+        source = text.lower()
+        fold = len(source) != len(text)
+        if fold:
+            source = text
+        for ordinal, m in enumerate(TOKEN_RE.finditer(source)):
+            start, end = m.span()
+            starts.append(start)
+            ends.append(end)
+            term = m.group().lower() if fold else m.group()
+            positions.setdefault(term, []).append(ordinal)
+        postings = self._postings
+        new_terms = False
+        for term, ords in positions.items():
+            docs = postings.get(term)
+            if docs is None:
+                docs = postings[term] = {}
+                new_terms = True
+            docs[key] = array("I", ords)
+        if new_terms:
+            self._sorted_terms = None
+        self._doc_terms[key] = tuple(positions)
+        self._doc_starts[key] = starts
+        self._doc_ends[key] = ends
+        self._doc_texts[key] = text
+
+    def remove_document(self, key: Hashable):
+        terms = self._doc_terms.pop(key, None)
+        if terms is None:
+            return
+        for term in terms:
+            docs = self._postings.get(term)
+            if docs is None:
+                continue
+            docs.pop(key, None)
+            if not docs:
+                del self._postings[term]
+                self._sorted_terms = None
+        del self._doc_starts[key]
+        del self._doc_ends[key]
+        del self._doc_texts[key]
+
+    def clear(self):
+        self._postings.clear()
+        self._doc_terms.clear()
+        self._doc_starts.clear()
+        self._doc_ends.clear()
+        self._doc_texts.clear()
+        self._sorted_terms = None
+
+    def _terms_with_prefix(self, prefix: str) -> List[str]:
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        terms = self._sorted_terms
+        i = bisect_left(terms, prefix)
+        found = []
+        while i < len(terms) and terms[i].startswith(prefix):
+            found.append(terms[i])
+            i += 1
+        return found
+
+    def _step_postings(self, term: str, is_prefix: bool) -> List[Dict]:
+        """Return the posting dicts ({doc key -> ordinals}) one query step reads."""
+        if not is_prefix:
+            docs = self._postings.get(term)
+            return [docs] if docs else []
+        return [self._postings[t] for t in self._terms_with_prefix(term)]
+
+    @staticmethod
+    def _step_keys(postings: List[Dict]) -> set:
+        if len(postings) == 1:
+            return set(postings[0])
+        keys = set()
+        for docs in postings:
+            keys.update(docs)
+        return keys
+
+    @staticmethod
+    def _step_positions(postings: List[Dict], key) -> set:
+        positions = set()
+        for docs in postings:
+            ords = docs.get(key)
+            if ords is not None:
+                positions.update(ords)
+        return positions
+
+    def _clause_starts(self, clause, key) -> List[int]:
+        """Return the start ordinals where a clause matches inside one document."""
+        starts = self._step_positions(clause[0], key)
+        for offset, step in enumerate(clause[1:], 1):
+            if not starts:
+                break
+            # Narrow the candidate starts one step at a time; most fail early
+            positions = self._step_positions(step, key)
+            starts = {p for p in starts if p + offset in positions}
+        return sorted(starts)
+
+    def search(self, query: str, limit: int = 200) -> List[SearchHit]:
+        """
+        Run a query and return hits in document order (at most ``limit``).
+        Keys must be orderable (e.g. (chapter_idx, scene_idx) tuples).
+        """
+        clauses = []
+        candidates = None
+        for steps in parse_query(query):
+            clause = [self._step_postings(t, p) for t, p in steps]
+            if not all(clause):
+                return []
+            for step in clause:
+                keys = self._step_keys(step)
+                candidates = keys if candidates is None else candidates & keys
+            clauses.append(clause)
+        if not candidates:
+            return []
+        # Reason: Positions are only checked doc by doc in output order, so a
+        # common phrase stops as soon as ``limit`` hits have been collected.
+        hits = []
+        for key in sorted(candidates):
+            spans = set()
+            for clause in clauses:
+                starts = self._clause_starts(clause, key)
+                if not starts:
+                    spans = None
+                    break
+                last = len(clause) - 1
+                starts_arr = self._doc_starts[key]
+                ends_arr = self._doc_ends[key]
+                for ordinal in starts:
+                    spans.add((starts_arr[ordinal], ends_arr[ordinal + last]))
+            if not spans:
+                continue
+            text = self._doc_texts[key]
+            for start, end in sorted(spans):
+                hits.append(SearchHit(key, start, end, _snippet(text, start, end)))
+                if len(hits) >= limit:
+                    return hits
+        return hits
+
+
+def _snippet(text: str, start: int, end: int) -> str:
+    left = max(0, start - SNIPPET_CONTEXT)
+    right = min(len(text), end + SNIPPET_CONTEXT)
+    snippet = text[left:right].replace("\n", " ")
+    if left > 0:
+        snippet = "…" + snippet
+    if right < len(text):
+        snippet += "…"
+    return snippet
+
+
+class ProjectSearchIndex:
+    """
+    SearchIndex bound to a project's chapters, keyed by (chapter_idx, scene_idx).
+
+    The editor calls ``scene_changed`` when it commits a scene and
+    ``invalidate`` after structural edits; ``refresh`` (run before every
+    search) then re-tokenizes only scenes whose content object changed.
+    """
+
+    def __init__(self, get_chapters: Callable[[], list]):
+        self.index = SearchIndex()
+        self._get_chapters = get_chapters
+        self._source = None
+        self._indexed: Dict[Tuple[int, int], object] = {}
+        self._dirty = set()
+        self._needs_sync = True
+
+    def scene_changed(self, cidx: int, sidx: int):
+        self._dirty.add((cidx, sidx))
+
+    def invalidate(self):
+        self._needs_sync = True
+
+    def _index_scene(self, key, scene):
+        content = scene.get("content", "") if isinstance(scene, dict) else ""
+        if key in self._indexed and self._indexed[key] is content:
+            return
+        self._indexed[key] = content
+        self.index.add_document(key, html_to_plain_text(content))
+
+    def _scene_at(self, chapters, key):
+        cidx, sidx = key
+        if 0 <= cidx < len(chapters):
+            scenes = chapters[cidx].get("scenes", [])
+            if 0 <= sidx < len(scenes):
+                return scenes[sidx]
+        return None
+
+    def refresh(self):
+        chapters = self._get_chapters()
+        if self._needs_sync or self._source is not chapters:
+            self._source = chapters
+            seen = set()
+            for cidx, chapter in enumerate(chapters):
+                for sidx, scene in enumerate(chapter.get("scenes", [])):
+                    seen.add((cidx, sidx))
+                    self._index_scene((cidx, sidx), scene)
+            for key in [k for k in self._indexed if k not in seen]:
+                del self._indexed[key]
+                self.index.remove_document(key)
+            self._needs_sync = False
+        else:
+            for key in self._dirty:
+                scene = self._scene_at(chapters, key)
+                if scene is not None:
+                    self._index_scene(key, scene)
+        self._dirty.clear()
+
+    def search(self, query: str, limit: int = 200) -> List[SearchHit]:
+        self.refresh()
+        return self.index.search(query, limit)
+
+    def describe(self, key) -> Tuple[str, str]:
+        """Return (chapter title, scene title) for a hit key."""
+        chapters = self._get_chapters()
+        scene = self._scene_at(chapters, key)
+        if scene is None:
+            return "", ""
+        title = scene.get("title", "Untitled") if isinstance(scene, dict) else str(scene)
+        return chapters[key[0]].get("title", ""), title
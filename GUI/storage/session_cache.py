@@ -0,0 +1,217 @@
+"""
+session_cache.py
+Warm-start cache for the JSON stores and the last workspace.
+
+Every launch used to parse projects.json, kanban_board.json and the entity
+files from scratch. The stores now load and save through ``load_json`` and
+``dump_json``, which keep a ``marshal`` copy of each file's parsed data in a
+``.session_cache`` directory next to it. marshal only holds plain values
+(dicts, lists, strings, numbers), loads several times faster than
+``json.loads`` on scene text, and unlike pickle cannot run code when read.
+
+A cache entry records the source's size, mtime and BLAKE2b hash. It is used
+when size and mtime still match; a file touched without being changed (same
+size and hash) is accepted too. Entries written within ``RACY_NS`` of the
+source's mtime are always checked by hash, because a same-size edit in the
+same timestamp tick would otherwise go unnoticed (the "racy git" problem);
+once the mtime has settled, a verified entry is re-stamped so later loads
+skip the hash.
+Saving through ``dump_json`` writes the JSON file and drops its cache entry;
+the next ``load_json`` parses the file once and caches it again. Saves (the
+editor's autosave among them) run on the GUI thread, so they never pay for
+the cache.
+
+``save_workspace`` / ``load_workspace`` keep the last opened project and the
+selected chapter, scene and tab, so the dashboard and editor can reopen
+where the user left off. Set ``WSA_SESSION_CACHE=0`` to disable the cache.
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import sys
+import time
+
+from GUI.diagnostics import metrics, tracing
+
+CACHE_DIR_NAME = ".session_cache"
+WORKSPACE_FILE = os.path.join(
+    os.path.dirname(__file__), CACHE_DIR_NAME, "workspace.bin"
+)
+# Reason: marshal's format may change between Python versions
+MAGIC = b"WSAC" + bytes((marshal.version, *sys.version_info[:2]))
+LENGTH_BYTES = 4
+RACY_NS = 2_000_000_000  # Coarser than any filesystem's mtime resolution
+ENABLED = os.environ.get("WSA_SESSION_CACHE", "1") != "0"
+
+
+def cache_path(path) -> str:
+    path = os.fspath(path)
+    directory, name = os.path.split(os.path.abspath(path))
+    return os.path.join(directory, CACHE_DIR_NAME, name + ".bin")
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _write_atomic(path, *values):
+    """Write ``values`` as length-prefixed marshal blobs after MAGIC."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp, "wb") as f:
+            f.write(MAGIC)
+            for value in values:
+                blob = marshal.dumps(value)
+                f.write(len(blob).to_bytes(LENGTH_BYTES, "little"))
+                f.write(blob)
+        os.replace(temp, path)
+    except (OSError, ValueError):
+        # Reason: The cache is an optimization; failing to write it is harmless
+        try:
+            os.remove(temp)
+        except OSError:
+            pass
+
+
+def _blobs(path):
+    """
+    The marshal blobs of a cache file, as memoryviews to ``marshal.loads``.
+    """
+    # Reason: marshal.load() on a file reads in small chunks and is ~10x slower
+    with open(path, "rb") as f:
+        raw = memoryview(f.read())
+    if raw[: len(MAGIC)] != MAGIC:
+        raise ValueError("stale cache format")
+    blobs = []
+    offset = len(MAGIC)
+    while offset < len(raw):
+        length = int.from_bytes(raw[offset : offset + LENGTH_BYTES], "little")
+        offset += LENGTH_BYTES
+        if offset + length > len(raw):
+            raise EOFError("truncated cache file")
+        blobs.append(raw[offset : offset + length])
+        offset += length
+    return blobs
+
+
+def _store(path, data, digest):
+    stat = os.stat(path)
+    meta = {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "hash": digest,
+        "written_ns": time.time_ns(),
+    }
+    _write_atomic(cache_path(path), meta, data)
+
+
+def _cached(path, stat):
+    """
+    (data, verified by hash) from the cache for ``path``; data is None when
+    the entry is missing or stale.
+    """
+    try:
+        meta_blob, data_blob = _blobs(cache_path(path))
+        meta = marshal.loads(meta_blob)
+        if meta["size"] != stat.st_size:
+            return None, False
+        trusted = (
+            meta["mtime_ns"] == stat.st_mtime_ns
+            and meta["written_ns"] - stat.st_mtime_ns >= RACY_NS
+        )
+        if not trusted:
+            with open(path, "rb") as source:
+                if _digest(source.read()) != meta["hash"]:
+                    return None, False
+        return marshal.loads(data_blob), not trusted
+    except (OSError, EOFError, ValueError, TypeError, KeyError):
+        return None, False
+
+
+def _metric_name(path) -> str:
+    """Store name for metrics: the file name without extension."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def load_json(path, default=None):
+    """
+    ``json.load`` of ``path`` through the cache; ``default`` if the file does
+    not exist. Invalid JSON raises as before and is never cached.
+    """
+    start = time.perf_counter()
+    data = _load(path, default)
+    metrics.operation("load." + _metric_name(path), time.perf_counter() - start)
+    return data
+
+
+def _load(path, default):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return default
+    if ENABLED:
+        data, verified = _cached(path, stat)
+        if data is not None:
+            tracing.count("session_cache.hit")
+            if verified and time.time_ns() - stat.st_mtime_ns >= RACY_NS:
+                # Hash matched and the mtime is settled: trust it next time
+                with open(path, "rb") as f:
+                    _store(path, data, _digest(f.read()))
+            return data
+        tracing.count("session_cache.miss")
+    with open(path, "rb") as f:
+        raw = f.read()
+    data = json.loads(raw.decode("utf-8"))
+    if ENABLED:
+        _store(path, data, _digest(raw))
+    return data
+
+
+def dump_json(path, data, **json_options):
+    """Write ``data`` to ``path`` as JSON (``json.dumps`` options)."""
+    start = time.perf_counter()
+    raw = json.dumps(data, **json_options).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(raw)
+    if ENABLED:
+        clear(path)
+    metrics.operation("save." + _metric_name(path), time.perf_counter() - start)
+    metrics.add("json.bytes_written", len(raw))
+
+
+def clear(path):
+    """Drop the cache entry for ``path``."""
+    try:
+        os.remove(cache_path(path))
+    except FileNotFoundError:
+        pass
+
+
+# Workspace --------------------------------------------------------------
+
+
+def load_workspace() -> dict:
+    """Last saved workspace state, or {} when there is none."""
+    if not ENABLED:
+        return {}
+    try:
+        (blob,) = _blobs(WORKSPACE_FILE)
+        state = marshal.loads(blob)
+    except (OSError, EOFError, ValueError, TypeError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def save_workspace(state: dict):
+    if ENABLED:
+        _write_atomic(WORKSPACE_FILE, dict(state))
+
+
+def update_workspace(**fields):
+    """Merge ``fields`` into the saved workspace state."""
+    state = load_workspace()
+    state.update(fields)
+    save_workspace(state)
@@ -9,8 +9,11 @@ from PySide6.QtWidgets import (
     QInputDialog,
     QMessageBox,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
+from GUI.diagnostics import tracing
+from GUI.storage import session_cache
 from GUI.storage.project_store import load_projects, save_projects
+from GUI.storage.manuscript_stats import ManuscriptStats, format_stats
 
 
 class DashboardWindow(QMainWindow):
@@ -24,7 +27,25 @@ class DashboardWindow(QMainWindow):
         self.setWindowTitle("Dashboard – Projects")
         self.setMinimumSize(500, 400)
         self.projects = load_projects() or ["My First Project"]
+        # Reason: One stats engine per project object; an open editor shares its own
+        self._project_stats = {}
         self._init_ui()
+        # Reason: Reselect the project open in the last session (session_cache.py)
+        last = session_cache.load_workspace().get("project")
+        titles = [self._title(p) for p in self.projects]
+        if last in titles:
+            # Reason: Counting a large manuscript takes about a second, so the
+            # stats are shown after the first paint, not during start-up
+            self.list_widget.blockSignals(True)
+            self.list_widget.setCurrentRow(titles.index(last))
+            self.list_widget.blockSignals(False)
+            QTimer.singleShot(0, self, self._show_selected_stats)
+
+    @staticmethod
+    def _title(project):
+        if isinstance(project, dict) and "title" in project:
+            return project["title"]
+        return str(project)
 
     def _init_ui(self):
         central = QWidget()
@@ -33,14 +54,13 @@ class DashboardWindow(QMainWindow):
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         title.setStyleSheet("font-size: 20px; font-weight: bold; margin-bottom: 10px;")
         self.list_widget = QListWidget()
-        self.list_widget.addItems(
-            [
-                p["title"] if isinstance(p, dict) and "title" in p else str(p)
-                for p in self.projects
-            ]
-        )
+        self.list_widget.addItems([self._title(p) for p in self.projects])
         layout.addWidget(title)
         layout.addWidget(self.list_widget)
+        self.stats_label = QLabel("")
+        self.stats_label.setStyleSheet("color: gray;")
+        layout.addWidget(self.stats_label)
+        self.list_widget.currentRowChanged.connect(self._show_project_stats)
 
         # Double-click to open project
         self.list_widget.itemDoubleClicked.connect(self.open_selected_project)
@@ -74,9 +94,53 @@ class DashboardWindow(QMainWindow):
             )
             return
         project = self.projects[row]
+        title = self._title(project)
         self.project_editor = ProjectEditorWindow(self, project=project)
+        self.project_editor.workspace_project = title
+        workspace = session_cache.load_workspace()
+        if workspace.get("project") == title:
+            self.project_editor.restore_workspace(workspace)
+        else:
+            session_cache.save_workspace({"project": title})
+        if isinstance(project, dict):
+            self._project_stats[id(project)] = (
+                project,
+                self.project_editor.manuscript_stats,
+            )
+        self.project_editor.stats_changed.connect(
+            lambda stats, p=project: self._on_editor_stats_changed(p, stats)
+        )
         self.project_editor.show()
 
+    def _stats_for(self, project):
+        """Return the cached ManuscriptStats for a project dict."""
+        entry = self._project_stats.get(id(project))
+        if entry is None or entry[0] is not project:
+            stats = ManuscriptStats(lambda: project.get("chapters", []))
+            entry = self._project_stats[id(project)] = (project, stats)
+        return entry[1]
+
+    def _show_selected_stats(self):
+        self._show_project_stats(self.list_widget.currentRow())
+
+    def _show_project_stats(self, row):
+        """Show word-count totals for the selected project."""
+        if row < 0 or row >= len(self.projects):
+            self.stats_label.setText("")
+            return
+        project = self.projects[row]
+        if not isinstance(project, dict):
+            self.stats_label.setText("")
+            return
+        totals = self._stats_for(project).project_stats()
+        self.stats_label.setText(format_stats(totals))
+
+    def _on_editor_stats_changed(self, project, stats):
+        """Live totals pushed by an open Project Editor."""
+        row = self.list_widget.currentRow()
+        if 0 <= row < len(self.projects) and self.projects[row] is project:
+            self.stats_label.setText(format_stats(stats))
+
     def create_project(self):
         name, ok = QInputDialog.getText(self, "Create Project", "Project name:")
         if ok and name:
@@ -88,15 +152,6 @@ class DashboardWindow(QMainWindow):
         row = self.list_widget.currentRow()
         if row >= 0:
             name = self.list_widget.item(row).text()
-            print(f"Attempting to delete project: {name}")  # Debugging output
-            print(
-                f"Current projects before deletion: {self.projects}"
-            )  # Debugging output
-            titles_before = [
-                proj.get("title", "") if isinstance(proj, dict) else str(proj)
-                for proj in self.projects
-            ]
-            print(f"Project titles before deletion: {titles_before}")
             reply = QMessageBox.question(
                 self,
                 "Delete Project",
@@ -144,15 +199,7 @@ class DashboardWindow(QMainWindow):
                     else:
                         i += 1
                 save_projects(self.projects)
-                print(f"Deleted project: {name}")  # Debugging output
-                print(f"Projects after deletion: {self.projects}")  # Debugging output
-                titles_after = [
-                    proj.get("title", "") if isinstance(proj, dict) else str(proj)
-                    for proj in self.projects
-                ]
-                print(f"Project titles after deletion: {titles_after}")
-            else:
-                print(f"Deletion cancelled for project: {name}")  # Debugging output
+                tracing.instant("dashboard.delete_project", "ui", {"project": name})
 
     def rename_project(self):
         row = self.list_widget.currentRow()
@@ -0,0 +1,290 @@
+"""
+diagnostics_panel.py
+GUI panel with live performance metrics from the central registry
+(GUI/diagnostics/metrics.py): per-store save and load times, JSON bytes
+written, undo stack memory, cached documents, event-loop latency percentiles
+and the slowest recent operations.
+
+A memory section lists the bytes retained per subsystem
+(GUI/diagnostics/memory.py). "Trace Allocations" turns on tracemalloc;
+each "Take Snapshot" then shows which source lines grew since the previous
+snapshot.
+
+The panel refreshes once a second while visible. When the stall watchdog is
+not running it samples event-loop latency itself with a short QTimer, so
+latency is only measured while someone is looking at it.
+"""
+
+import os
+import time
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QHeaderView,
+)
+
+from GUI.diagnostics import memory, metrics, watchdog
+
+REFRESH_MS = 1000
+PROBE_MS = 50
+STORE_COLUMNS = ["Store", "Last save ms", "Avg save ms", "Saves", "Last load ms"]
+SLOWEST_COLUMNS = ["Operation", "ms", "Seconds ago"]
+MEMORY_COLUMNS = ["Subsystem", "Size"]
+ALLOCATION_COLUMNS = ["Location", "Subsystem", "Size", "Change", "Blocks"]
+ALLOCATION_ROWS = 25
+REPO_ROOT = os.path.dirname(memory.GUI_ROOT)
+
+
+def format_bytes(size) -> str:
+    if size is None:
+        return "n/a"
+    if size < 1024:
+        return f"{size} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+def _ms(value) -> str:
+    return "" if value is None else f"{value:.1f}"
+
+
+def _signed_bytes(size) -> str:
+    return ("-" if size < 0 else "+") + format_bytes(abs(size))
+
+
+def _short_location(location) -> str:
+    if location.startswith(REPO_ROOT + os.sep):
+        return location[len(REPO_ROOT) + 1 :]
+    return location
+
+
+class DiagnosticsPanel(QWidget):
+    def __init__(self, parent=None, registry=None):
+        super().__init__(parent)
+        self.registry = registry or metrics.REGISTRY
+        self._last_probe = None
+        self.init_ui()
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(REFRESH_MS)
+        self._refresh_timer.timeout.connect(self.refresh)
+        self._probe_timer = QTimer(self)
+        self._probe_timer.setInterval(PROBE_MS)
+        self._probe_timer.timeout.connect(self._probe)
+
+    def init_ui(self):
+        self.layout = QVBoxLayout()
+        self.summary_label = QLabel()
+        self.summary_label.setWordWrap(True)
+        self.layout.addWidget(self.summary_label)
+        self.latency_label = QLabel()
+        self.layout.addWidget(self.latency_label)
+
+        self.layout.addWidget(QLabel("Stores"))
+        self.stores_table = self._create_table(STORE_COLUMNS)
+        self.layout.addWidget(self.stores_table)
+        self.layout.addWidget(QLabel("Slowest recent operations"))
+        self.slowest_table = self._create_table(SLOWEST_COLUMNS)
+        self.layout.addWidget(self.slowest_table)
+
+        self.layout.addWidget(QLabel("Memory"))
+        self.memory_label = QLabel()
+        self.layout.addWidget(self.memory_label)
+        self.memory_table = self._create_table(MEMORY_COLUMNS)
+        self.layout.addWidget(self.memory_table)
+        trace_layout = QHBoxLayout()
+        self.trace_btn = QPushButton("Trace Allocations")
+        self.trace_btn.setCheckable(True)
+        self.snapshot_btn = QPushButton("Take Snapshot")
+        self.snapshot_btn.setEnabled(False)
+        trace_layout.addWidget(self.trace_btn)
+        trace_layout.addWidget(self.snapshot_btn)
+        self.layout.addLayout(trace_layout)
+        self.allocations_label = QLabel()
+        self.allocations_label.setWordWrap(True)
+        self.layout.addWidget(self.allocations_label)
+        self.allocations_table = self._create_table(ALLOCATION_COLUMNS)
+        self.layout.addWidget(self.allocations_table)
+        self.trace_btn.toggled.connect(self.set_tracing)
+        self.snapshot_btn.clicked.connect(self.take_snapshot)
+
+        btn_layout = QHBoxLayout()
+        self.refresh_btn = QPushButton("Refresh")
+        self.reset_btn = QPushButton("Reset")
+        btn_layout.addWidget(self.refresh_btn)
+        btn_layout.addWidget(self.reset_btn)
+        self.layout.addLayout(btn_layout)
+        self.setLayout(self.layout)
+        self.refresh_btn.clicked.connect(self.refresh)
+        self.reset_btn.clicked.connect(self.reset)
+
+    def _create_table(self, columns):
+        table = QTableWidget(0, len(columns))
+        table.setHorizontalHeaderLabels(columns)
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        table.verticalHeader().setVisible(False)
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        return table
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._refresh_timer.start()
+        self._last_probe = None
+        self._probe_timer.start()
+        self.refresh()
+
+    def hideEvent(self, event):
+        self._refresh_timer.stop()
+        self._probe_timer.stop()
+        super().hideEvent(event)
+
+    def closeEvent(self, event):
+        # Reason: tracemalloc slows every allocation; never leave it running
+        if self.trace_btn.isChecked():
+            self.set_tracing(False)
+        super().closeEvent(event)
+
+    def _probe(self):
+        # Reason: The watchdog's heartbeat already feeds the latency series
+        if watchdog.active() is not None:
+            self._last_probe = None
+            return
+        now = time.monotonic()
+        if self._last_probe is not None:
+            late = (now - self._last_probe) * 1000 - PROBE_MS
+            self.registry.observe(watchdog.LATENCY_METRIC, max(late, 0.0))
+        self._last_probe = now
+
+    def reset(self):
+        self.registry.reset()
+        self.refresh()
+
+    def refresh(self):
+        snapshot = self.registry.snapshot()
+        series = snapshot["series"]
+        gauges = snapshot["gauges"]
+        written = snapshot["totals"].get("json.bytes_written", 0)
+        documents = gauges.get("documents.cached")
+        self.summary_label.setText(
+            f"JSON written: {format_bytes(written)}"
+            f"   Undo stacks: {format_bytes(gauges.get('kanban.undo_bytes'))}"
+            f"   Cached documents: {'n/a' if documents is None else documents}"
+            f" ({format_bytes(gauges.get('documents.cached_bytes'))})"
+        )
+        latency = series.get(watchdog.LATENCY_METRIC)
+        if latency is None:
+            self.latency_label.setText("Event-loop latency: no samples yet")
+        else:
+            self.latency_label.setText(
+                "Event-loop latency (ms): "
+                f"p50 {_ms(latency['p50'])}   p90 {_ms(latency['p90'])}   "
+                f"p99 {_ms(latency['p99'])}   max {_ms(latency['max'])}"
+            )
+        self._fill_stores(series)
+        self._fill_slowest(snapshot["slowest"])
+        self._fill_memory(gauges)
+
+    def _fill_stores(self, series):
+        stores = sorted(
+            {
+                name.partition(".")[2]
+                for name in series
+                if name.startswith(("save.", "load."))
+            }
+        )
+        self.stores_table.setRowCount(len(stores))
+        for row, store in enumerate(stores):
+            save = series.get("save." + store, {})
+            load = series.get("load." + store, {})
+            values = [
+                store,
+                _ms(save.get("last")),
+                _ms(save.get("avg")),
+                str(save.get("count", 0)),
+                _ms(load.get("last")),
+            ]
+            for column, value in enumerate(values):
+                self.stores_table.setItem(row, column, QTableWidgetItem(value))
+
+    def _fill_slowest(self, operations):
+        now = time.time()
+        self.slowest_table.setRowCount(len(operations))
+        for row, (name, ms, when) in enumerate(operations):
+            values = [name, f"{ms:.1f}", f"{now - when:.0f}"]
+            for column, value in enumerate(values):
+                self.slowest_table.setItem(row, column, QTableWidgetItem(value))
+
+    def _fill_memory(self, gauges):
+        process = memory.process_memory()
+        text = (
+            f"Process: {format_bytes(process['rss'])}"
+            f" (peak {format_bytes(process['peak_rss'])})"
+        )
+        traced = memory.traced_memory()
+        if traced is not None:
+            current, peak = (format_bytes(size) for size in traced)
+            text += f"   Traced: {current} (peak {peak})"
+        self.memory_label.setText(text)
+        sizes = memory.subsystem_sizes(gauges)
+        self.memory_table.setRowCount(len(sizes))
+        for row, (label, size) in enumerate(sizes.items()):
+            self.memory_table.setItem(row, 0, QTableWidgetItem(label))
+            self.memory_table.setItem(row, 1, QTableWidgetItem(format_bytes(size)))
+
+    def set_tracing(self, enabled):
+        """Start or stop tracemalloc; stopping drops the snapshots."""
+        if enabled:
+            memory.start_tracing()
+            self.allocations_label.setText(
+                "Tracing allocations (the app runs slower). Take a snapshot, use "
+                "the app, then take another to see what grew."
+            )
+        else:
+            memory.stop_tracing()
+            self.allocations_label.setText("")
+            self.allocations_table.setRowCount(0)
+        self.snapshot_btn.setEnabled(enabled)
+        if self.trace_btn.isChecked() != enabled:
+            self.trace_btn.setChecked(enabled)
+
+    def take_snapshot(self):
+        if not memory.is_tracing():
+            return
+        taken = memory.take_snapshot()
+        kept = memory.snapshots()
+        if len(kept) >= 2:
+            growth = memory.growth_by_subsystem()
+            parts = ", ".join(
+                f"{name} {_signed_bytes(size)}"
+                for name, size in sorted(growth.items(), key=lambda i: -abs(i[1]))
+                if size
+            )
+            self.allocations_label.setText(
+                f"{taken.label} vs {kept[-2].label}: {parts or 'no change'}"
+            )
+        else:
+            self.allocations_label.setText(
+                f"{taken.label}: largest allocations. Take another snapshot to diff."
+            )
+        self._fill_allocations(memory.latest_diff(limit=ALLOCATION_ROWS) or [])
+        self.refresh()
+
+    def _fill_allocations(self, diffs):
+        self.allocations_table.setRowCount(len(diffs))
+        for row, diff in enumerate(diffs):
+            values = [
+                _short_location(diff.location),
+                diff.subsystem,
+                format_bytes(diff.size),
+                _signed_bytes(diff.size_diff),
+                f"{diff.count_diff:+d}",
+            ]
+            for column, value in enumerate(values):
+                self.allocations_table.setItem(row, column, QTableWidgetItem(value))
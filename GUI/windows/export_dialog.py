@@ -18,10 +18,34 @@ from PySide6.QtWidgets import (
     QGroupBox,
 )
 from PySide6.QtCore import Qt, QThread, QTimer, Signal
-import json
+from PySide6.QtGui import QFontDatabase
 import os
+import time
 from pathlib import Path
 
+from GUI.diagnostics import metrics, tracing
+from GUI.export import (
+    FORMATS,
+    ExportCancelled,
+    export_project,
+    plan_jobs,
+    preview_export,
+    run_batch,
+    snapshot_project,
+)
+from GUI.storage.project_store import EXPORT_CACHE_FILE
+
+# Combo box label prefix -> export format name
+FORMAT_NAMES = {
+    "Markdown": "Markdown",
+    "Plain": "Plain Text",
+    "JSON": "JSON",
+    "Fountain": "Fountain",
+    "DOCX": "DOCX",
+    "PDF": "PDF",
+    "Screenplay": "Screenplay PDF",
+}
+
 
 class ExportWorker(QThread):
     """Worker thread for export operations"""
@@ -29,114 +53,106 @@ class ExportWorker(QThread):
     finished = Signal(str)  # Signal with success/error message
     progress = Signal(int)  # Progress percentage
 
-    def __init__(self, export_data, format_type, output_path):
+    def __init__(
+        self, export_data, format_type, output_path, options=None, cache_path=None
+    ):
         super().__init__()
         self.export_data = export_data
         self.format_type = format_type
         self.output_path = output_path
+        self.options = options or {}
+        self.cache_path = cache_path  # Render cache file; None disables it
+        self._cancel_requested = False
+        self._last_percent = -1
+
+    def cancel(self):
+        """Ask the export to stop before the next scene."""
+        self._cancel_requested = True
+
+    def _on_scene_written(self, done, total):
+        percent = done * 100 // total if total else 100
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.progress.emit(percent)
+        tracing.count("export.scenes")
 
     def run(self):
         try:
-            self.progress.emit(25)
-
-            if self.format_type == "Markdown":
-                self._export_markdown()
-            elif self.format_type == "JSON":
-                self._export_json()
-            elif self.format_type == "Plain Text":
-                self._export_plain_text()
-            elif self.format_type == "Fountain":
-                self._export_fountain()
-            else:
-                # For DOCX/PDF, we'd need additional libraries
-                self.finished.emit(
-                    f"Export format '{self.format_type}' not yet implemented"
+            self.progress.emit(0)
+            args = {"format": self.format_type}
+            start = time.perf_counter()
+            with tracing.span("ExportWorker.run", "export", args):
+                export_project(
+                    self.export_data,
+                    self.format_type,
+                    self.output_path,
+                    progress=self._on_scene_written,
+                    is_cancelled=lambda: self._cancel_requested,
+                    options=self.options,
+                    cache_path=self.cache_path,
                 )
-                return
-
+            seconds = time.perf_counter() - start
+            metrics.operation(f"export.{self.format_type}", seconds)
             self.progress.emit(100)
             self.finished.emit(f"Successfully exported to {self.output_path}")
-
+        except ExportCancelled:
+            self.finished.emit("Export cancelled")
+        except ValueError as e:
+            # Unknown format (no writer registered)
+            self.finished.emit(str(e))
         except Exception as e:
             self.finished.emit(f"Export failed: {str(e)}")
 
-    def _export_markdown(self):
-        """Export project to Markdown format"""
-        content = "# " + self.export_data.get("title", "Untitled Project") + "\n\n"
 
-        for chapter in self.export_data.get("chapters", []):
-            content += f"## {chapter.get('title', 'Untitled Chapter')}\n\n"
+class BatchExportWorker(QThread):
+    """Worker thread that runs a multi-format batch export on a process pool"""
 
-            for scene in chapter.get("scenes", []):
-                scene_title = (
-                    scene.get("title", "Untitled Scene")
-                    if isinstance(scene, dict)
-                    else str(scene)
-                )
-                scene_content = (
-                    scene.get("content", "") if isinstance(scene, dict) else ""
-                )
+    finished = Signal(str)  # Signal with summary message
+    progress = Signal(int)  # Overall progress percentage
+    job_done = Signal(str)  # One line per finished job
 
-                content += f"### {scene_title}\n\n"
-                content += scene_content + "\n\n"
+    def __init__(self, jobs, cache_path=None, max_workers=None):
+        super().__init__()
+        self.jobs = jobs
+        self.cache_path = cache_path
+        self.max_workers = max_workers
+        self._cancel_requested = False
 
-        with open(self.output_path, "w", encoding="utf-8") as f:
-            f.write(content)
+    def cancel(self):
+        self._cancel_requested = True
 
-    def _export_json(self):
-        """Export project to JSON format"""
-        with open(self.output_path, "w", encoding="utf-8") as f:
-            json.dump(self.export_data, f, indent=2, ensure_ascii=False)
+    def _on_progress(self, job, done, total):
+        self.progress.emit(done * 100 // total if total else 100)
 
-    def _export_plain_text(self):
-        """Export project to plain text format"""
-        content = (
-            self.export_data.get("title", "Untitled Project") + "\n" + "=" * 50 + "\n\n"
-        )
+    def _on_job_finished(self, job):
+        if job.error:
+            self.job_done.emit(f"{job.format_name} failed: {job.error}")
+        else:
+            self.job_done.emit(f"Exported {job.format_name} to {job.output_path}")
 
-        for chapter in self.export_data.get("chapters", []):
-            content += (
-                chapter.get("title", "Untitled Chapter") + "\n" + "-" * 30 + "\n\n"
+    def run(self):
+        try:
+            self.progress.emit(0)
+            run_batch(
+                self.jobs,
+                max_workers=self.max_workers,
+                progress=self._on_progress,
+                job_finished=self._on_job_finished,
+                is_cancelled=lambda: self._cancel_requested,
+                cache_path=self.cache_path,
             )
-
-            for scene in chapter.get("scenes", []):
-                scene_title = (
-                    scene.get("title", "Untitled Scene")
-                    if isinstance(scene, dict)
-                    else str(scene)
-                )
-                scene_content = (
-                    scene.get("content", "") if isinstance(scene, dict) else ""
-                )
-
-                content += scene_title + "\n\n"
-                content += scene_content + "\n\n"
-
-        with open(self.output_path, "w", encoding="utf-8") as f:
-            f.write(content)
-
-    def _export_fountain(self):
-        """Export project to Fountain screenplay format"""
-        content = f"Title: {self.export_data.get('title', 'Untitled Project')}\n\n"
-
-        for chapter in self.export_data.get("chapters", []):
-            content += f"# {chapter.get('title', 'Untitled Chapter')}\n\n"
-
-            for scene in chapter.get("scenes", []):
-                scene_title = (
-                    scene.get("title", "Untitled Scene")
-                    if isinstance(scene, dict)
-                    else str(scene)
-                )
-                scene_content = (
-                    scene.get("content", "") if isinstance(scene, dict) else ""
+            self.progress.emit(100)
+            failed = sum(1 for job in self.jobs if job.error)
+            if failed:
+                self.finished.emit(f"Batch export failed for {failed} format(s)")
+            else:
+                self.finished.emit(
+                    f"Successfully exported {len(self.jobs)} formats"
                 )
-
-                content += f"## {scene_title}\n\n"
-                content += scene_content + "\n\n"
-
-        with open(self.output_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        except ExportCancelled:
+            self.finished.emit("Export cancelled")
+        except Exception as e:
+            self.finished.emit(f"Export failed: {str(e)}")
 
 
 class ExportDialog(QDialog):
@@ -177,8 +193,9 @@ class ExportDialog(QDialog):
                 "Plain Text (.txt)",
                 "JSON (.json)",
                 "Fountain (.fountain)",
-                "DOCX (Word Document) - Coming Soon",
-                "PDF - Coming Soon",
+                "DOCX (Word Document) (.docx)",
+                "PDF Manuscript (.pdf)",
+                "Screenplay PDF (.pdf)",
             ]
         )
         format_layout.addWidget(QLabel("Select export format:"))
@@ -216,50 +233,42 @@ class ExportDialog(QDialog):
         self.export_btn = QPushButton("Export")
         self.export_btn.clicked.connect(self._start_export)
 
+        self.batch_btn = QPushButton("Export All Formats...")
+        self.batch_btn.setToolTip(
+            "Export every available format to a folder, in parallel"
+        )
+        self.batch_btn.clicked.connect(self._start_batch_export)
+
         self.preview_btn = QPushButton("Preview")
         self.preview_btn.clicked.connect(self._show_preview)
 
         cancel_btn = QPushButton("Cancel")
-        cancel_btn.clicked.connect(self.reject)
+        cancel_btn.clicked.connect(self._cancel)
 
         button_layout.addWidget(self.preview_btn)
         button_layout.addWidget(self.export_btn)
+        button_layout.addWidget(self.batch_btn)
         button_layout.addWidget(cancel_btn)
         layout.addLayout(button_layout)
 
     def _show_preview(self):
-        """Show a preview of the export content"""
+        """Show the start of the export, rendered by the real exporter"""
         format_text = self.format_combo.currentText().split()[0]
-
-        # Generate preview content
-        preview = f"Preview for {format_text} export:\n\n"
-
-        if format_text == "Markdown":
-            preview += f"# {self.project_data.get('title', 'Untitled')}\n\n"
-            for i, chapter in enumerate(
-                self.project_data.get("chapters", [])[:2]
-            ):  # Show first 2 chapters
-                preview += f"## {chapter.get('title', f'Chapter {i+1}')}\n\n"
-                for j, scene in enumerate(
-                    chapter.get("scenes", [])[:2]
-                ):  # Show first 2 scenes
-                    scene_title = (
-                        scene.get("title", f"Scene {j+1}")
-                        if isinstance(scene, dict)
-                        else str(scene)
-                    )
-                    preview += f"### {scene_title}\n\n"
-                    if isinstance(scene, dict) and scene.get("content"):
-                        preview += scene["content"][:100] + "...\n\n"
-
-        elif format_text == "JSON":
-            preview += (
-                json.dumps(self.project_data, indent=2, ensure_ascii=False)[:500]
-                + "..."
+        include_annotations = self.include_annotations.isChecked()
+        try:
+            # Reason: The exporter stops after a few pages, so this is instant
+            # however long the project is
+            result = preview_export(
+                snapshot_project(self.project_data, annotations=include_annotations),
+                FORMAT_NAMES.get(format_text, format_text),
+                options={"highlights": include_annotations},
             )
-
-        else:
-            preview += f"Preview for {format_text} format would appear here..."
+        except ValueError as e:
+            QMessageBox.information(self, "Export Preview", str(e))
+            return
+        preview = result.text
+        if result.truncated:
+            preview += "\n\n[Preview ends here; the export continues]"
 
         # Show preview dialog
         preview_dialog = QDialog(self)
@@ -268,6 +277,7 @@ class ExportDialog(QDialog):
 
         layout = QVBoxLayout(preview_dialog)
         text_edit = QTextEdit()
+        text_edit.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
         text_edit.setPlainText(preview)
         text_edit.setReadOnly(True)
         layout.addWidget(text_edit)
@@ -302,37 +312,83 @@ class ExportDialog(QDialog):
         if not output_path:
             return
 
-        # Prepare export data
-        export_data = dict(self.project_data)
-        if not self.include_annotations.isChecked():
-            # Remove annotations from export data
-            for chapter in export_data.get("chapters", []):
-                for scene in chapter.get("scenes", []):
-                    if isinstance(scene, dict):
-                        scene.pop("annotations", None)
-                        scene.pop("footnotes", None)
+        # Reason: Read-only snapshot; the open project is never modified
+        export_data = snapshot_project(
+            self.project_data, annotations=self.include_annotations.isChecked()
+        )
 
         # Start export worker
         self.export_btn.setEnabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
 
-        self.export_worker = ExportWorker(export_data, format_text, output_path)
+        self.export_worker = ExportWorker(
+            export_data,
+            FORMAT_NAMES.get(format_text, format_text),
+            output_path,
+            options={"highlights": self.include_annotations.isChecked()},
+            cache_path=EXPORT_CACHE_FILE,
+        )
         self.export_worker.progress.connect(self.progress_bar.setValue)
         self.export_worker.finished.connect(self._on_export_finished)
         self.export_worker.start()
 
         self.status_text.append(f"Starting {format_text} export to {output_path}...")
 
+    def _start_batch_export(self):
+        """Export all available formats into one folder"""
+        output_dir = QFileDialog.getExistingDirectory(self, "Export All Formats To")
+        if not output_dir:
+            return
+        include_annotations = self.include_annotations.isChecked()
+        jobs = plan_jobs(
+            [snapshot_project(self.project_data, annotations=include_annotations)],
+            list(FORMATS),
+            output_dir,
+            {"highlights": include_annotations},
+        )
+        self.export_btn.setEnabled(False)
+        self.batch_btn.setEnabled(False)
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setValue(0)
+
+        self.export_worker = BatchExportWorker(jobs, cache_path=EXPORT_CACHE_FILE)
+        self.export_worker.progress.connect(self.progress_bar.setValue)
+        self.export_worker.job_done.connect(self.status_text.append)
+        self.export_worker.finished.connect(self._on_export_finished)
+        self.export_worker.start()
+
+        self.status_text.append(
+            f"Starting batch export of {len(jobs)} formats to {output_dir}..."
+        )
+
+    def _cancel(self):
+        """Cancel a running export, or close the dialog when idle"""
+        if self.export_worker is not None and self.export_worker.isRunning():
+            self.export_worker.cancel()
+            self.status_text.append("Cancelling export...")
+            return
+        self.reject()
+
+    def reject(self):
+        # Reason: Never leave a running QThread behind a destroyed dialog
+        if self.export_worker is not None and self.export_worker.isRunning():
+            self.export_worker.cancel()
+            self.export_worker.wait()
+        super().reject()
+
     def _on_export_finished(self, message):
         """Handle export completion"""
         self.export_btn.setEnabled(True)
+        self.batch_btn.setEnabled(True)
         self.progress_bar.setVisible(False)
         self.status_text.append(message)
 
         if "Successfully" in message:
             QMessageBox.information(self, "Export Complete", message)
             self.accept()
+        elif message == "Export cancelled":
+            self.progress_bar.setValue(0)
         else:
             QMessageBox.warning(self, "Export Failed", message)
 
@@ -343,6 +399,9 @@ class ExportDialog(QDialog):
             "JSON": "JSON Files (*.json)",
             "Plain": "Text Files (*.txt)",
             "Fountain": "Fountain Files (*.fountain)",
+            "DOCX": "Word Documents (*.docx)",
+            "PDF": "PDF Files (*.pdf)",
+            "Screenplay": "PDF Files (*.pdf)",
         }
         return filters.get(format_type, "All Files (*)")
 
@@ -353,5 +412,8 @@ class ExportDialog(QDialog):
             "JSON": "json",
             "Plain": "txt",
             "Fountain": "fountain",
+            "DOCX": "docx",
+            "PDF": "pdf",
+            "Screenplay": "pdf",
         }
         return extensions.get(format_type, "txt")
@@ -1,7 +1,6 @@
 from PySide6.QtWidgets import QMainWindow, QLabel, QVBoxLayout, QWidget, QPushButton
 from PySide6.QtCore import Qt
 from GUI.windows.auth_dialogs import LoginDialog, RegisterDialog, LogoutDialog
-from GUI.windows.dashboard import DashboardWindow
 
 
 class HomepageWindow(QMainWindow):
@@ -32,6 +31,7 @@ class HomepageWindow(QMainWindow):
         btn_characters = QPushButton("Characters Panel")
         btn_locations = QPushButton("Locations Panel")
         btn_events = QPushButton("Events Panel")
+        btn_diagnostics = QPushButton("Diagnostics Panel")
         for btn in (
             btn_login,
             btn_register,
@@ -41,6 +41,7 @@ class HomepageWindow(QMainWindow):
             btn_characters,
             btn_locations,
             btn_events,
+            btn_diagnostics,
         ):
             btn.setMinimumWidth(180)
             btn.setStyleSheet("font-size: 15px; margin: 8px 0;")
@@ -53,6 +54,7 @@ class HomepageWindow(QMainWindow):
         btn_characters.clicked.connect(self.open_character_panel)
         btn_locations.clicked.connect(self.open_location_panel)
         btn_events.clicked.connect(self.open_event_panel)
+        btn_diagnostics.clicked.connect(self.open_diagnostics_panel)
 
         layout.addWidget(title)
         layout.addWidget(subtitle)
@@ -65,6 +67,7 @@ class HomepageWindow(QMainWindow):
         layout.addWidget(btn_characters)
         layout.addWidget(btn_locations)
         layout.addWidget(btn_events)
+        layout.addWidget(btn_diagnostics)
 
         # Set layout and central widget at the end
         central_widget.setLayout(layout)
@@ -91,6 +94,13 @@ class HomepageWindow(QMainWindow):
         self.event_panel.setWindowTitle("Events Panel")
         self.event_panel.show()
 
+    def open_diagnostics_panel(self):
+        from GUI.windows.diagnostics_panel import DiagnosticsPanel
+
+        self.diagnostics_panel = DiagnosticsPanel(self)
+        self.diagnostics_panel.setWindowTitle("Diagnostics Panel")
+        self.diagnostics_panel.show()
+
     def open_project_editor_window(self):
         from GUI.windows.project_editor_window import ProjectEditorWindow
 
@@ -98,6 +108,8 @@ class HomepageWindow(QMainWindow):
         self.project_editor.show()
 
     def open_dashboard_window(self):
+        from GUI.windows.dashboard import DashboardWindow
+
         self.dashboard = DashboardWindow(self)
         self.dashboard.show()
 
@@ -22,6 +22,7 @@ from PySide6.QtWidgets import (
     QFrame,
 )
 from PySide6.QtCore import Qt, Signal, QTimer
+from GUI.diagnostics import metrics
 from GUI.storage import kanban_store
 from dataclasses import dataclass
 
@@ -35,6 +36,7 @@ from typing import List, Dict, Any, Optional, Callable
 
 from .kanban_card_link_widget import KanbanCardLinkWidget
 from .kanban_models import KanbanCard, CardDetailsDialog, Column
+from .link_catalog import LinkCatalog
 from .kanban_board2 import (
     convert_kanban_to_timeline,
     navigate_to_link,
@@ -199,6 +201,7 @@ class KanbanBoardWidget(QWidget):
         self._autosave_timer.timeout.connect(self._autosave)
         self._undo_stack = []
         self._redo_stack = []
+        metrics.gauge("kanban.undo_bytes", self, KanbanBoardWidget._undo_bytes)
         self._autosave_delay_ms = 1000
         self.load_board()
 
@@ -230,6 +233,10 @@ class KanbanBoardWidget(QWidget):
             return
         timer.start(self._autosave_delay_ms)
 
+    def _undo_bytes(self):
+        """Approximate memory held by the undo and redo snapshots."""
+        return metrics.approximate_size((self._undo_stack, self._redo_stack))
+
     def push_undo(self):
         """
         Push current state to undo stack before making changes.
@@ -518,8 +525,14 @@ class KanbanBoardWidget(QWidget):
         if not isinstance(item, KanbanCard):
             return
         self.push_undo()
-        # Pass available links to CardDetailsDialog
-        available_links = self.get_available_links() if self.get_available_links else []
+        # Pass available links to CardDetailsDialog; a LinkCatalog is passed
+        # through as-is so the dialog can reuse its cached, shared model
+        if isinstance(self.get_available_links, LinkCatalog):
+            available_links = self.get_available_links
+        else:
+            available_links = (
+                self.get_available_links() if self.get_available_links else []
+            )
         dlg = CardDetailsDialog(item, self, available_links=available_links)
         if dlg.exec() == QDialog.Accepted:
             details = dlg.get_details()
@@ -1,3 +1,7 @@
+from GUI.diagnostics import tracing
+
+
+@tracing.traced("sync")
 def sync_all_kanban_to_timeline(widget):
     """
     Sync all Kanban cards in all columns to the Timeline. Show a summary dialog.
@@ -27,6 +31,7 @@ def sync_all_kanban_to_timeline(widget):
     msg.exec()
 
 
+@tracing.traced("sync")
 def sync_column_kanban_to_timeline(widget, list_widget):
     """
     Sync all Kanban cards in a column to the Timeline. Show a summary dialog.
@@ -54,6 +59,7 @@ def sync_column_kanban_to_timeline(widget, list_widget):
     msg.exec()
 
 
+@tracing.traced("sync")
 def convert_kanban_to_timeline_bulk(widget, kanban_card):
     """
     Bulk version: returns status string instead of showing dialogs.
@@ -95,10 +101,8 @@ from PySide6.QtWidgets import QMessageBox
 from .kanban_models import KanbanCard, CardDetailsDialog, Column
 
 
+@tracing.traced("sync")
 def convert_kanban_to_timeline(self, kanban_card):
-    print(
-        f"[DEBUG] _convert_kanban_to_timeline called for card id={kanban_card.metadata.get('id')}"
-    )
     """
     Convert a KanbanCard to a TimelineCard by passing its metadata.
     Attempts to find the TimelineTab in the parent chain and add the card.
@@ -125,7 +129,6 @@ def convert_kanban_to_timeline(self, kanban_card):
                     self, "Already Exists", "This card already exists in the timeline."
                 )
                 return
-            print(f"[DEBUG] Adding card to timeline: {kanban_card.metadata}")
             timeline_widget.add_card(kanban_card.metadata)
             QMessageBox.information(self, "Converted", "Card added to Timeline.")
         else:
@@ -1,4 +1,8 @@
+from GUI.diagnostics import tracing
+
+
 # --- Timeline to Kanban Integration Utility ---
+@tracing.traced("sync")
 def sync_timeline_cards_to_kanban_columns(timeline_cards, kanban_columns):
     """
     Sync a list of timeline card objects (with .metadata or dict) to Kanban columns.
@@ -38,6 +42,7 @@ def sync_timeline_cards_to_kanban_columns(timeline_cards, kanban_columns):
 
 
 # --- Timeline/Storyboard Integration Utilities ---
+@tracing.traced("sync")
 def sync_kanban_cards_to_timeline_widget(kanban_cards, timeline_widget):
     """
     Sync a list of KanbanCard objects to a TimelineBoardWidget.
@@ -137,13 +142,21 @@ from PySide6.QtWidgets import (
     QLabel,
     QHBoxLayout,
     QListWidget,
+    QListView,
 )
 from PySide6.QtGui import QColor
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QItemSelection, QItemSelectionModel, QModelIndex
 from dataclasses import dataclass
 import uuid
 from typing import List, Dict, Any, Optional, Callable
 
+from .link_catalog import (
+    LINK_ID_ROLE,
+    LinkCatalog,
+    LinkFilterProxyModel,
+    build_link_model,
+)
+
 
 class KanbanCard(QListWidgetItem):
     """
@@ -231,46 +244,45 @@ class CardDetailsDialog(QDialog):
         self.tags_edit = QLineEdit(", ".join(card.metadata.get("tags", [])))
         layout.addWidget(QLabel("Tags (comma separated):"))
         layout.addWidget(self.tags_edit)
+        # Links come from a shared LinkCatalog (cached model) or a plain list
+        if isinstance(available_links, LinkCatalog):
+            self._link_model = available_links.model()
+            self._link_row = available_links.row_for_id
+        else:
+            links = available_links or []
+            self._link_model = build_link_model(links)
+            rows = {link["id"]: row for row, link in enumerate(links)}
+            self._link_row = lambda link_id: rows.get(link_id, -1)
+        self.link_filter_edit = QLineEdit()
+        self.link_filter_edit.setPlaceholderText("Search scenes/chapters...")
+        self.link_filter_edit.setClearButtonEnabled(True)
+        self.link_filter_edit.textChanged.connect(self._on_link_filter_changed)
+        layout.addWidget(self.link_filter_edit)
         layout.addWidget(QLabel("Quick Navigation Link (Scene/Chapter):"))
-        self.quick_nav_list = QListWidget()
-        self.quick_nav_list.setSelectionMode(QListWidget.SingleSelection)
-        self._quick_nav_id_map = {}
-        links = available_links or []
-        for link in links:
-            if link["type"] == "chapter":
-                display = f"[Chapter] {link['title']}"
-            else:
-                display = f"[Scene] {link['title']} (in {link['chapter']})"
-            item = QListWidgetItem(display)
-            item.setData(Qt.UserRole, link["id"])
-            self.quick_nav_list.addItem(item)
-            self._quick_nav_id_map[link["id"]] = item
+        self.quick_nav_list = self._create_link_view(QListView.SingleSelection)
         layout.addWidget(self.quick_nav_list)
         layout.addWidget(QLabel("Other Linked Scenes/Chapters (for reference):"))
-        self.links_list = QListWidget()
-        self.links_list.setSelectionMode(QListWidget.MultiSelection)
-        self._link_id_map = {}
-        for link in links:
-            if link["type"] == "chapter":
-                display = f"[Chapter] {link['title']}"
-            else:
-                display = f"[Scene] {link['title']} (in {link['chapter']})"
-            item = QListWidgetItem(display)
-            item.setData(Qt.UserRole, link["id"])
-            self.links_list.addItem(item)
-            self._link_id_map[link["id"]] = item
+        self.links_list = self._create_link_view(QListView.MultiSelection)
         layout.addWidget(self.links_list)
+        # Reason: Selection lives in these sets, not the views, so filtering
+        # rows out of view never drops a link the user already picked.
+        self._quick_nav_id = None
+        self._selected_link_ids = set()
+        self._applying_filter = False
         links_meta = card.metadata.get("links")
-        quick_nav_id = None
         if isinstance(links_meta, list) and links_meta:
-            quick_nav_id = links_meta[0]
-        if quick_nav_id:
-            if quick_nav_id in self._quick_nav_id_map:
-                self._quick_nav_id_map[quick_nav_id].setSelected(True)
-        if isinstance(links_meta, list):
+            if self._link_row(links_meta[0]) >= 0:
+                self._quick_nav_id = links_meta[0]
             for link_id in links_meta:
-                if link_id in self._link_id_map:
-                    self._link_id_map[link_id].setSelected(True)
+                if self._link_row(link_id) >= 0:
+                    self._selected_link_ids.add(link_id)
+        self._restore_link_selection()
+        self.quick_nav_list.selectionModel().selectionChanged.connect(
+            self._on_quick_nav_selection_changed
+        )
+        self.links_list.selectionModel().selectionChanged.connect(
+            self._on_links_selection_changed
+        )
         color_btn = QPushButton("Set Color")
         color_btn.clicked.connect(self.choose_color)
         layout.addWidget(color_btn)
@@ -284,21 +296,99 @@ class CardDetailsDialog(QDialog):
         btns.addWidget(cancel_btn)
         layout.addLayout(btns)
 
+    def _create_link_view(self, selection_mode):
+        view = QListView()
+        view.setSelectionMode(selection_mode)
+        view.setEditTriggers(QListView.NoEditTriggers)
+        # Reason: Uniform rows let Qt skip measuring every item on large projects
+        view.setUniformItemSizes(True)
+        view.setModel(LinkFilterProxyModel(self._link_model, view))
+        return view
+
+    def _on_link_filter_changed(self, text):
+        self._applying_filter = True
+        try:
+            for view in (self.quick_nav_list, self.links_list):
+                view.model().setFilterFixedString(text)
+            self._restore_link_selection()
+        finally:
+            self._applying_filter = False
+
+    def _proxy_index(self, view, link_id):
+        row = self._link_row(link_id)
+        if row < 0:
+            return QModelIndex()
+        return view.model().mapFromSource(self._link_model.index(row, 0))
+
+    def _restore_link_selection(self):
+        """Re-apply the tracked selection to whatever rows are currently visible."""
+        was_applying = self._applying_filter
+        self._applying_filter = True
+        try:
+            quick_sel = self.quick_nav_list.selectionModel()
+            quick_sel.clearSelection()
+            if self._quick_nav_id:
+                index = self._proxy_index(self.quick_nav_list, self._quick_nav_id)
+                if index.isValid():
+                    quick_sel.select(index, QItemSelectionModel.Select)
+            selection = QItemSelection()
+            for link_id in self._selected_link_ids:
+                index = self._proxy_index(self.links_list, link_id)
+                if index.isValid():
+                    selection.select(index, index)
+            links_sel = self.links_list.selectionModel()
+            links_sel.select(selection, QItemSelectionModel.ClearAndSelect)
+        finally:
+            self._applying_filter = was_applying
+
+    def _on_quick_nav_selection_changed(self, selected, deselected):
+        if self._applying_filter:
+            return
+        indexes = selected.indexes()
+        if indexes:
+            self._quick_nav_id = indexes[0].data(LINK_ID_ROLE)
+        elif deselected.indexes():
+            self._quick_nav_id = None
+
+    def _on_links_selection_changed(self, selected, deselected):
+        if self._applying_filter:
+            return
+        for index in deselected.indexes():
+            self._selected_link_ids.discard(index.data(LINK_ID_ROLE))
+        for index in selected.indexes():
+            self._selected_link_ids.add(index.data(LINK_ID_ROLE))
+
+    def set_quick_nav_link(self, link_id: Optional[str]) -> None:
+        """Set (or clear with None) the quick navigation link."""
+        if link_id is not None and self._link_row(link_id) < 0:
+            return
+        self._quick_nav_id = link_id
+        self._restore_link_selection()
+
+    def set_link_selected(self, link_id: str, selected: bool = True) -> None:
+        """Select or deselect an additional reference link by id."""
+        if self._link_row(link_id) < 0:
+            return
+        if selected:
+            self._selected_link_ids.add(link_id)
+        else:
+            self._selected_link_ids.discard(link_id)
+        self._restore_link_selection()
+
+    def selected_link_ids(self) -> List[str]:
+        """Return the selected additional link ids in catalog order."""
+        return sorted(self._selected_link_ids, key=self._link_row)
+
     def choose_color(self):
         color = QColorDialog.getColor()
         if color.isValid():
             self.selected_color = color.name()
 
     def get_details(self):
-        quick_nav_items = self.quick_nav_list.selectedItems()
-        quick_nav_id = quick_nav_items[0].data(Qt.UserRole) if quick_nav_items else None
-        additional_links = [
-            item.data(Qt.UserRole) for item in self.links_list.selectedItems()
-        ]
         links = []
-        if quick_nav_id:
-            links.append(quick_nav_id)
-        for link_id in additional_links:
+        if self._quick_nav_id:
+            links.append(self._quick_nav_id)
+        for link_id in self.selected_link_ids():
             if link_id and link_id not in links:
                 links.append(link_id)
         return {
@@ -0,0 +1,127 @@
+"""
+link_catalog.py – Cached chapter/scene link catalog for Kanban card linking
+
+Builds the list of linkable chapters and scenes once per project structure and
+shares a single Qt item model between every CardDetailsDialog, so opening a
+card no longer re-walks the manuscript or rebuilds thousands of list items.
+
+# Reason: Link ids are positional ("chapter:0:scene:3"), so only structural
+# edits (add/rename/delete/reorder) can change the catalog; text edits never do.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+
+from PySide6.QtCore import Qt, QSortFilterProxyModel
+from PySide6.QtGui import QStandardItem, QStandardItemModel
+
+LINK_ID_ROLE = Qt.UserRole
+
+
+def build_links(chapters) -> List[Dict[str, Any]]:
+    """
+    Walk the chapters/scenes once and return link dicts for Kanban linking.
+
+    Each dict has id, type ("chapter" or "scene") and title; scene links also
+    carry the title of their chapter.
+    """
+    links = []
+    for cidx, chapter in enumerate(chapters):
+        chapter_id = f"chapter:{cidx}"
+        links.append({"id": chapter_id, "type": "chapter", "title": chapter["title"]})
+        for sidx, scene in enumerate(chapter.get("scenes", [])):
+            scene_id = f"chapter:{cidx}:scene:{sidx}"
+            scene_title = scene["title"] if isinstance(scene, dict) else str(scene)
+            links.append(
+                {
+                    "id": scene_id,
+                    "type": "scene",
+                    "title": scene_title,
+                    "chapter": chapter["title"],
+                }
+            )
+    return links
+
+
+def link_display_text(link: Dict[str, Any]) -> str:
+    """Return the text shown for a link in the card details lists."""
+    if link["type"] == "chapter":
+        return f"[Chapter] {link['title']}"
+    return f"[Scene] {link['title']} (in {link.get('chapter', '')})"
+
+
+def build_link_model(links: List[Dict[str, Any]]) -> QStandardItemModel:
+    """Build a single-column item model holding one row per link."""
+    model = QStandardItemModel()
+    root = model.invisibleRootItem()
+    rows = []
+    for link in links:
+        item = QStandardItem(link_display_text(link))
+        item.setData(link["id"], LINK_ID_ROLE)
+        item.setEditable(False)
+        rows.append(item)
+    # Reason: appendRows on the root is far cheaper than one appendRow per link.
+    if rows:
+        root.appendRows(rows)
+    return model
+
+
+class LinkFilterProxyModel(QSortFilterProxyModel):
+    """Case-insensitive, substring type-ahead filter over a link model."""
+
+    def __init__(self, source_model=None, parent=None):
+        super().__init__(parent)
+        self.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.setFilterRole(Qt.DisplayRole)
+        if source_model is not None:
+            self.setSourceModel(source_model)
+
+
+class LinkCatalog:
+    """
+    Cached catalog of chapter/scene links for a project.
+
+    The catalog is callable, so it can be passed anywhere a
+    ``get_available_links`` callback is expected. Call ``invalidate()`` after
+    structural edits; the links and the shared model are rebuilt lazily on
+    the next access. Replacing the chapters list object also invalidates it.
+    """
+
+    def __init__(self, get_chapters: Callable[[], list]):
+        self._get_chapters = get_chapters
+        self._source = None
+        self._links: Optional[List[Dict[str, Any]]] = None
+        self._rows: Dict[str, int] = {}
+        self._model: Optional[QStandardItemModel] = None
+        self.version = 0
+
+    def __call__(self) -> List[Dict[str, Any]]:
+        return self.links()
+
+    def invalidate(self):
+        """Drop the cached links and model after a structural edit."""
+        self._links = None
+        self._model = None
+        self.version += 1
+
+    def links(self) -> List[Dict[str, Any]]:
+        chapters = self._get_chapters()
+        if self._links is None or self._source is not chapters:
+            if self._links is not None:
+                self.version += 1
+            self._source = chapters
+            self._links = build_links(chapters)
+            self._rows = {link["id"]: row for row, link in enumerate(self._links)}
+            self._model = None
+        return self._links
+
+    def model(self) -> QStandardItemModel:
+        """Return the shared item model, building it once per catalog version."""
+        links = self.links()
+        if self._model is None:
+            self._model = build_link_model(links)
+        return self._model
+
+    def row_for_id(self, link_id: str) -> int:
+        """Return the model row for a link id, or -1 if it is not in the catalog."""
+        self.links()
+        return self._rows.get(link_id, -1)
@@ -0,0 +1,155 @@
+"""
+Scene document cache for Project Editor
+- Keeps parsed QTextDocuments for recently viewed scenes in an LRU
+- Switching scenes swaps a ready document into the editor with setDocument
+  instead of re-parsing the scene's HTML through setHtml
+- Memory is capped by an approximate byte budget
+"""
+
+from collections import OrderedDict
+
+from PySide6.QtCore import QObject
+from PySide6.QtGui import QTextDocument
+
+from GUI.diagnostics import metrics
+from GUI.storage.scene_content import expand_scene_html
+
+DEFAULT_BYTE_BUDGET = 32 * 1024 * 1024
+# Rough per-character cost of a laid-out QTextDocument (fragments, layout lines)
+LAYOUT_BYTES_PER_CHAR = 16
+
+
+def estimate_document_bytes(content: str, document: QTextDocument) -> int:
+    """Approximate memory held by a cached document: UTF-16 source plus layout."""
+    return 2 * len(content) + LAYOUT_BYTES_PER_CHAR * document.characterCount()
+
+
+class SceneDocumentCache(QObject):
+    """
+    Bounded LRU of QTextDocuments keyed by (chapter_idx, scene_idx).
+
+    Each entry remembers the content string it was built from; a lookup whose
+    content no longer matches rebuilds the document, so structural edits and
+    external content changes can never show stale text. The document most
+    recently handed out by ``document()`` is pinned and never evicted, since
+    it is the one on screen.
+    """
+
+    def __init__(self, byte_budget=DEFAULT_BYTE_BUDGET, parent=None):
+        super().__init__(parent)
+        self.byte_budget = byte_budget
+        self.default_font = None  # Editor font, so cached HTML matches setHtml
+        self._entries = OrderedDict()  # key -> [content, document, cost]
+        self._total_bytes = 0
+        self._pinned = None
+        self._retired = []  # Replaced documents the editor may still show
+        self.hits = 0
+        self.misses = 0
+        metrics.gauge("documents.cached", self, len)
+        metrics.gauge("documents.cached_bytes", self, lambda cache: cache.total_bytes)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def total_bytes(self):
+        return self._total_bytes
+
+    def _build(self, content):
+        document = QTextDocument(self)
+        if self.default_font is not None:
+            document.setDefaultFont(self.default_font)
+        if "<" in content and ">" in content:
+            document.setHtml(expand_scene_html(content))
+        else:
+            document.setPlainText(content)
+        document.setModified(False)
+        return document
+
+    def _lookup(self, key, content):
+        entry = self._entries.get(key)
+        if entry is not None and (entry[0] is content or entry[0] == content):
+            self._entries.move_to_end(key)
+            return entry[1], True
+        if entry is not None:
+            self._discard(key)
+        document = self._build(content)
+        cost = estimate_document_bytes(content, document)
+        self._entries[key] = [content, document, cost]
+        self._total_bytes += cost
+        return document, False
+
+    def document(self, key, content) -> QTextDocument:
+        """Return the document for a scene (pinned as the visible one)."""
+        document, hit = self._lookup(key, content or "")
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        self._pinned = key
+        # Reason: The caller swaps the returned document in before control
+        # returns to the event loop, so deferred deletion is now safe.
+        for old in self._retired:
+            if old is not document:
+                old.deleteLater()
+        self._retired = []
+        self._evict()
+        return document
+
+    def release(self):
+        """Unpin the visible document once the editor shows something else."""
+        self._pinned = None
+        for old in self._retired:
+            old.deleteLater()
+        self._retired = []
+        self._evict()
+
+    def preload(self, key, content, text_width=None):
+        """
+        Build a document ahead of time without changing the visible one.
+        With ``text_width`` the document is also laid out at that width.
+        """
+        document, hit = self._lookup(key, content or "")
+        if not hit and text_width and text_width > 0:
+            document.setTextWidth(text_width)
+            document.size()  # Forces layout now rather than on first paint
+        self._evict()
+
+    def note_content(self, key, content):
+        """Record that the visible document was edited and now equals content."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        entry[0] = content
+        cost = estimate_document_bytes(content, entry[1])
+        self._total_bytes += cost - entry[2]
+        entry[2] = cost
+
+    def _discard(self, key):
+        content, document, cost = self._entries.pop(key)
+        self._total_bytes -= cost
+        if key == self._pinned:
+            self._retired.append(document)
+        else:
+            document.deleteLater()
+
+    def _evict(self):
+        if self._total_bytes <= self.byte_budget:
+            return
+        for key in list(self._entries):
+            if self._total_bytes <= self.byte_budget:
+                break
+            if key != self._pinned:
+                self._discard(key)
+
+    def clear(self):
+        """
+        Drop every cached document. The one on screen is only retired, so it
+        stays valid until the editor is handed another document.
+        """
+        for key in list(self._entries):
+            self._discard(key)
+        self._pinned = None
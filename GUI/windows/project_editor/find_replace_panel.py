@@ -0,0 +1,228 @@
+"""
+Find and replace panel for Project Editor
+- Literal or regex find/replace across every chapter and scene
+- The scan runs on a worker thread with progress and cancellation
+- Shows a per-scene diff preview before anything is changed
+"""
+
+from PySide6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QCheckBox,
+    QPushButton,
+    QProgressBar,
+    QListWidget,
+    QListWidgetItem,
+    QPlainTextEdit,
+    QSplitter,
+)
+from PySide6.QtCore import Qt, QThread, Signal
+
+from GUI.storage.find_replace import (
+    collect_scenes,
+    compile_pattern,
+    find_replacements,
+    preview_diff,
+)
+
+
+class FindReplaceWorker(QThread):
+    """Worker thread that computes replacements over a scene snapshot"""
+
+    progress = Signal(int)  # Progress percentage
+    finished_changes = Signal(object)  # List of SceneReplacement
+    cancelled = Signal()
+
+    def __init__(self, scenes, pattern, replacement, regex=False):
+        super().__init__()
+        self.scenes = scenes
+        self.pattern = pattern
+        self.replacement = replacement
+        self.regex = regex
+        self._cancel_requested = False
+
+    def cancel(self):
+        self._cancel_requested = True
+
+    def run(self):
+        changes = find_replacements(
+            self.scenes,
+            self.pattern,
+            self.replacement,
+            self.regex,
+            progress=self.progress.emit,
+            is_cancelled=lambda: self._cancel_requested,
+        )
+        if changes is None:
+            self.cancelled.emit()
+        else:
+            self.finished_changes.emit(changes)
+
+
+class FindReplacePanel(QWidget):
+    """
+    Find/replace window bound to the editor's chapters.
+
+    Emits ``replace_requested(changes)`` when the user applies the previewed
+    changes and ``undo_requested()`` for "Undo Replace All"; the editor window
+    owns the chapters and performs both.
+    """
+
+    replace_requested = Signal(object)
+    undo_requested = Signal()
+
+    def __init__(self, get_chapters, parent=None):
+        super().__init__(parent, Qt.Window)
+        self._get_chapters = get_chapters
+        self.worker = None
+        self.changes = []
+        self.setWindowTitle("Find and Replace")
+        self.resize(640, 520)
+        layout = QVBoxLayout(self)
+
+        self.find_edit = QLineEdit()
+        self.find_edit.setPlaceholderText("Find")
+        layout.addWidget(self.find_edit)
+        self.replace_edit = QLineEdit()
+        self.replace_edit.setPlaceholderText("Replace with")
+        layout.addWidget(self.replace_edit)
+
+        options = QHBoxLayout()
+        self.regex_check = QCheckBox("Regular expression")
+        self.case_check = QCheckBox("Match case")
+        self.whole_word_check = QCheckBox("Whole words")
+        options.addWidget(self.regex_check)
+        options.addWidget(self.case_check)
+        options.addWidget(self.whole_word_check)
+        options.addStretch()
+        layout.addLayout(options)
+
+        buttons = QHBoxLayout()
+        self.btn_preview = QPushButton("Preview")
+        self.btn_replace = QPushButton("Replace All")
+        self.btn_cancel = QPushButton("Cancel")
+        self.btn_undo = QPushButton("Undo Replace All")
+        self.btn_replace.setEnabled(False)
+        self.btn_cancel.setEnabled(False)
+        self.btn_undo.setEnabled(False)
+        self.btn_preview.clicked.connect(self.start_preview)
+        self.btn_replace.clicked.connect(self._apply)
+        self.btn_cancel.clicked.connect(self.cancel)
+        self.btn_undo.clicked.connect(self.undo_requested.emit)
+        for btn in (self.btn_preview, self.btn_replace, self.btn_cancel, self.btn_undo):
+            buttons.addWidget(btn)
+        layout.addLayout(buttons)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        layout.addWidget(self.progress_bar)
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+
+        splitter = QSplitter(Qt.Vertical)
+        self.changes_list = QListWidget()
+        self.changes_list.currentRowChanged.connect(self._show_diff)
+        splitter.addWidget(self.changes_list)
+        self.diff_view = QPlainTextEdit()
+        self.diff_view.setReadOnly(True)
+        self.diff_view.setLineWrapMode(QPlainTextEdit.NoWrap)
+        splitter.addWidget(self.diff_view)
+        layout.addWidget(splitter, 1)
+
+        # Reason: Any edit to the query makes the current preview stale
+        for edit in (self.find_edit, self.replace_edit):
+            edit.textChanged.connect(self._clear_preview)
+        for check in (self.regex_check, self.case_check, self.whole_word_check):
+            check.toggled.connect(self._clear_preview)
+
+    def start_preview(self):
+        """Start computing the replacements on a worker thread."""
+        if self.worker is not None and self.worker.isRunning():
+            return
+        self._clear_preview()
+        try:
+            pattern = compile_pattern(
+                self.find_edit.text(),
+                regex=self.regex_check.isChecked(),
+                case_sensitive=self.case_check.isChecked(),
+                whole_word=self.whole_word_check.isChecked(),
+            )
+        except ValueError as e:
+            self.status_label.setText(str(e))
+            return
+        self.worker = FindReplaceWorker(
+            collect_scenes(self._get_chapters()),
+            pattern,
+            self.replace_edit.text(),
+            self.regex_check.isChecked(),
+        )
+        self.worker.progress.connect(self.progress_bar.setValue)
+        self.worker.finished_changes.connect(self._on_preview_ready)
+        self.worker.cancelled.connect(self._on_cancelled)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        self.btn_preview.setEnabled(False)
+        self.btn_cancel.setEnabled(True)
+        self.status_label.setText("Searching...")
+        self.worker.start()
+
+    def cancel(self):
+        if self.worker is not None:
+            self.worker.cancel()
+
+    def _finish_worker(self):
+        self.progress_bar.setVisible(False)
+        self.btn_preview.setEnabled(True)
+        self.btn_cancel.setEnabled(False)
+
+    def _on_cancelled(self):
+        self._finish_worker()
+        self.status_label.setText("Cancelled")
+
+    def _on_preview_ready(self, changes):
+        self._finish_worker()
+        self.changes = changes
+        total = sum(change.count for change in changes)
+        for change in changes:
+            item = QListWidgetItem(
+                f"{change.chapter_title} › {change.scene_title} ({change.count})"
+            )
+            self.changes_list.addItem(item)
+        self.status_label.setText(
+            f"{total} replacement(s) in {len(changes)} scene(s)"
+        )
+        self.btn_replace.setEnabled(bool(changes))
+        if changes:
+            self.changes_list.setCurrentRow(0)
+
+    def _show_diff(self, row):
+        if 0 <= row < len(self.changes):
+            self.diff_view.setPlainText(preview_diff(self.changes[row]))
+        else:
+            self.diff_view.clear()
+
+    def _clear_preview(self, *args):
+        self.changes = []
+        self.changes_list.clear()
+        self.diff_view.clear()
+        self.btn_replace.setEnabled(False)
+
+    def _apply(self):
+        changes = self.changes
+        if not changes:
+            return
+        self._clear_preview()
+        self.replace_requested.emit(changes)
+
+    def set_undo_available(self, available):
+        self.btn_undo.setEnabled(available)
+
+    def closeEvent(self, event):
+        # Reason: Never leave a running QThread behind a destroyed window
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.cancel()
+            self.worker.wait()
+        super().closeEvent(event)
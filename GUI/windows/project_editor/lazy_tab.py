@@ -0,0 +1,39 @@
+"""
+Lazily built tab pages for Project Editor
+- A LazyTab holds the place of a heavy tab page (Story Planning, Kanban Board)
+  and builds the real widget the first time the tab is shown
+- The factory does its own imports, so the page's modules are not loaded,
+  and files such as kanban_board.json are not read, before the window appears
+"""
+
+from PySide6.QtWidgets import QVBoxLayout, QWidget
+
+
+class LazyTab(QWidget):
+    """
+    Empty tab page that calls ``factory()`` when first shown and embeds the
+    widget it returns. ``widget()`` builds the page on demand for code that
+    needs it before the user opens the tab.
+    """
+
+    def __init__(self, factory, parent=None):
+        super().__init__(parent)
+        self._factory = factory
+        self._widget = None
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+
+    @property
+    def is_built(self) -> bool:
+        return self._widget is not None
+
+    def widget(self) -> QWidget:
+        if self._widget is None:
+            self._widget = self._factory()
+            self._factory = None
+            self._layout.addWidget(self._widget)
+        return self._widget
+
+    def showEvent(self, event):
+        self.widget()
+        super().showEvent(event)
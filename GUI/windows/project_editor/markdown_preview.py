@@ -0,0 +1,107 @@
+"""
+Markdown preview for Project Editor
+- Debounced: keystrokes only restart a timer, rendering happens after a pause
+- Rendering runs on a worker thread and re-renders only changed blocks
+- Every request carries a sequence number; results older than the latest
+  request are discarded, and at most one render is queued behind the
+  running one
+"""
+
+from PySide6.QtWidgets import QTextBrowser
+from PySide6.QtCore import QThread, QTimer, Signal
+
+from GUI.storage.markdown_render import IncrementalMarkdownRenderer
+
+PREVIEW_DEBOUNCE_MS = 300
+
+
+class MarkdownRenderWorker(QThread):
+    """Worker thread that renders one snapshot of the scene text"""
+
+    rendered = Signal(int, str)  # (sequence number, html)
+
+    def __init__(self, renderer, seq, text):
+        super().__init__()
+        self.renderer = renderer
+        self.seq = seq
+        self.text = text
+
+    def run(self):
+        self.rendered.emit(self.seq, self.renderer.render(self.text))
+
+
+class MarkdownPreview(QTextBrowser):
+    """
+    Read-only preview of the scene text rendered as Markdown.
+
+    ``get_text`` is called on the GUI thread when a render starts, so it sees
+    the latest editor contents; call ``schedule()`` on every text change.
+    """
+
+    preview_updated = Signal(int)  # Sequence number of the shown render
+
+    def __init__(self, get_text, parent=None, debounce_ms=PREVIEW_DEBOUNCE_MS):
+        super().__init__(parent)
+        self.setOpenExternalLinks(True)
+        self._get_text = get_text
+        self.renderer = IncrementalMarkdownRenderer()
+        self._seq = 0
+        self._worker = None
+        self._pending = None  # (seq, text) waiting for the running worker
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self.render_now)
+
+    @property
+    def latest_seq(self):
+        return self._seq
+
+    def schedule(self):
+        """Re-render after the debounce interval (cheap; safe per keystroke)."""
+        self._timer.start()
+
+    def render_now(self):
+        """Snapshot the text and render it on the worker thread."""
+        self._timer.stop()
+        self._seq += 1
+        request = (self._seq, self._get_text())
+        if self._worker is not None and self._worker.isRunning():
+            # Reason: Only the newest text matters; replace any queued request
+            self._pending = request
+            return
+        self._start(*request)
+
+    def cancel(self):
+        """Drop pending work; in-flight results will be ignored as stale."""
+        self._timer.stop()
+        self._pending = None
+        self._seq += 1
+
+    def _start(self, seq, text):
+        if self._worker is not None:
+            # Reason: finished is emitted before the thread has fully exited;
+            # dropping the last reference then would destroy a running QThread
+            self._worker.wait()
+        worker = MarkdownRenderWorker(self.renderer, seq, text)
+        worker.rendered.connect(self._on_rendered)
+        worker.finished.connect(self._on_worker_finished)
+        self._worker = worker
+        worker.start()
+
+    def _on_rendered(self, seq, html):
+        if seq != self._seq:
+            return  # Stale: newer input arrived while rendering
+        self.setHtml(html)
+        self.preview_updated.emit(seq)
+
+    def _on_worker_finished(self):
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            self._start(*pending)
+
+    def shutdown(self):
+        """Stop rendering and wait for the worker (call before destruction)."""
+        self.cancel()
+        if self._worker is not None:
+            self._worker.wait()
@@ -0,0 +1,86 @@
+"""
+Manuscript search panel for Project Editor
+- Type-ahead full-text search across every chapter and scene
+- Activating a result jumps the editor to the scene and match offset
+"""
+
+import time
+
+from PySide6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QLabel,
+    QLineEdit,
+    QListWidget,
+    QListWidgetItem,
+)
+from PySide6.QtCore import Qt, QTimer, Signal
+
+RESULT_LIMIT = 200
+SEARCH_DEBOUNCE_MS = 150
+
+
+class SearchPanel(QWidget):
+    """
+    Search window bound to a ProjectSearchIndex.
+
+    Emits ``result_activated(key, start, end)`` where key is the
+    (chapter_idx, scene_idx) of the hit and start/end are plain-text offsets.
+    """
+
+    result_activated = Signal(object, int, int)
+
+    def __init__(self, search_index, parent=None):
+        super().__init__(parent, Qt.Window)
+        self.search_index = search_index
+        self.setWindowTitle("Find in Manuscript")
+        self.resize(480, 420)
+        layout = QVBoxLayout(self)
+        self.query_edit = QLineEdit()
+        self.query_edit.setPlaceholderText('Search: words, "exact phrase", prefix*')
+        self.query_edit.setClearButtonEnabled(True)
+        layout.addWidget(self.query_edit)
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+        self.results_list = QListWidget()
+        self.results_list.setUniformItemSizes(True)
+        layout.addWidget(self.results_list, 1)
+
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.timeout.connect(self.run_search)
+        self.query_edit.textChanged.connect(
+            lambda _: self._search_timer.start(SEARCH_DEBOUNCE_MS)
+        )
+        self.query_edit.returnPressed.connect(self.run_search)
+        self.results_list.itemActivated.connect(self._on_result_activated)
+        self.results_list.itemDoubleClicked.connect(self._on_result_activated)
+
+    def run_search(self, query=None):
+        """Run the current (or given) query and fill the results list."""
+        self._search_timer.stop()
+        if query is None:
+            query = self.query_edit.text()
+        self.results_list.clear()
+        if not query.strip():
+            self.status_label.setText("")
+            return []
+        started = time.perf_counter()
+        hits = self.search_index.search(query, limit=RESULT_LIMIT)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        for hit in hits:
+            chapter_title, scene_title = self.search_index.describe(hit.key)
+            item = QListWidgetItem(f"{chapter_title} › {scene_title}: {hit.snippet}")
+            item.setData(Qt.UserRole, (hit.key, hit.start, hit.end))
+            self.results_list.addItem(item)
+        more = "+" if len(hits) >= RESULT_LIMIT else ""
+        self.status_label.setText(
+            f"{len(hits)}{more} result(s) in {elapsed_ms:.1f} ms"
+        )
+        return hits
+
+    def _on_result_activated(self, item):
+        data = item.data(Qt.UserRole)
+        if data:
+            key, start, end = data
+            self.result_activated.emit(key, start, end)
@@ -1,4 +1,5 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout, QPushButton
+from GUI.diagnostics import tracing
 from GUI.windows.timeline_board import TimelineBoardWidget
 
 
@@ -20,6 +21,7 @@ class TimelineTab(QWidget):
         sync_btns.addWidget(btn_sync_from_timeline)
         layout.addLayout(sync_btns)
 
+    @tracing.traced("sync")
     def sync_scenes_to_timeline(self):
         self.timeline_widget.layout.setSpacing(12)
         self.timeline_widget.layout.setContentsMargins(12, 12, 12, 12)
@@ -31,6 +33,7 @@ class TimelineTab(QWidget):
             title = scene["title"] if isinstance(scene, dict) else str(scene)
             self.timeline_widget.add_card(title)
 
+    @tracing.traced("sync")
     def sync_timeline_to_scenes(self):
         timeline_titles = [c.title for c in self.timeline_widget.cards]
         scenes = self.get_scenes()
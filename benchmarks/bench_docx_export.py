@@ -0,0 +1,91 @@
+"""
+bench_docx_export.py
+Time and memory benchmark for the streaming DOCX writer (GUI/export/docx_writer.py).
+
+Exports a synthetic manuscript (the scene HTML from bench_html_convert.py,
+with an annotation and a footnote on every scene) to a temporary .docx and
+reports wall time, MB/s of input HTML, output size and the tracemalloc
+peak (from a second, traced run).
+Run it at two sizes to check that peak memory does not grow with the
+manuscript.
+
+Usage (from the repo root):
+    python benchmarks/bench_docx_export.py [--words 1000000] [--no-notes]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_html_convert import build_scenes  # noqa: E402
+
+from GUI.export import export_project  # noqa: E402
+
+
+def build_project(words, notes=True, scenes_per_chapter=10):
+    scenes = [
+        {
+            "title": f"Scene {i}",
+            "content": content,
+            "annotations": (
+                [{"text": "", "note": "Check this", "start": 10, "end": 40}]
+                if notes
+                else []
+            ),
+            "footnotes": (
+                [{"text": "", "note": "Source", "start": 60, "end": 80}]
+                if notes
+                else []
+            ),
+        }
+        for i, content in enumerate(build_scenes(words))
+    ]
+    chapters = [
+        {
+            "title": f"Chapter {i // scenes_per_chapter + 1}",
+            "scenes": scenes[i : i + scenes_per_chapter],
+        }
+        for i in range(0, len(scenes), scenes_per_chapter)
+    ]
+    return {"title": "Benchmark", "chapters": chapters, "metadata": {}}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--words", type=int, default=1_000_000)
+    parser.add_argument(
+        "--no-notes", action="store_true", help="leave out comments and footnotes"
+    )
+    args = parser.parse_args(argv)
+
+    project = build_project(args.words, notes=not args.no_notes)
+    size_mb = sum(
+        len(scene["content"].encode("utf-8"))
+        for chapter in project["chapters"]
+        for scene in chapter["scenes"]
+    ) / 1e6
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "bench.docx")
+        start = time.perf_counter()
+        export_project(project, "DOCX", path)
+        elapsed = time.perf_counter() - start
+        # Reason: Tracing slows the export, so memory is measured on a second run
+        tracemalloc.start()
+        export_project(project, "DOCX", path)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        output_mb = os.path.getsize(path) / 1e6
+    print(f"~{args.words} words, {size_mb:.1f} MB of scene HTML")
+    print(f"  export      {elapsed:8.2f}s {size_mb / elapsed:8.1f} MB/s")
+    print(f"  output      {output_mb:8.1f} MB")
+    print(f"  peak memory {peak / 1e6:8.1f} MB (tracemalloc, excluding input)")
+
+
+if __name__ == "__main__":
+    main()
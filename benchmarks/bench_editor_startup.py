@@ -0,0 +1,106 @@
+"""
+bench_editor_startup.py
+Time to first paint of the project editor window (GUI/windows/project_editor_window.py).
+
+Each run starts a fresh interpreter, so module imports are included, and
+reports the median of:
+  - import: importing project_editor_window
+  - build: constructing ProjectEditorWindow with a synthetic project
+  - first paint: show() until the window's first paint event
+  - total: interpreter-relative time from the import until the first paint
+plus the time to open the Story Planning and Kanban Board tabs afterwards.
+
+Usage (from the repo root):
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_editor_startup.py [--runs 5]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = r"""
+import json, sys, time
+start = time.perf_counter()
+from PySide6.QtCore import QEvent, QObject
+from PySide6.QtWidgets import QApplication
+app = QApplication(sys.argv[:1])
+qt_ready = time.perf_counter()
+from GUI.windows.project_editor_window import ProjectEditorWindow
+imported = time.perf_counter()
+chapters = [
+    {
+        "title": f"Chapter {c}",
+        "scenes": [
+            {"title": f"Scene {s}", "content": "<p>Rain on the harbour.</p>"}
+            for s in range(20)
+        ],
+    }
+    for c in range(20)
+]
+window = ProjectEditorWindow(project={"chapters": chapters})
+built = time.perf_counter()
+painted = []
+
+
+class PaintWatch(QObject):
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and not painted:
+            painted.append(time.perf_counter())
+        return False
+
+
+watch = PaintWatch()
+window.installEventFilter(watch)
+window.show()
+while not painted:
+    app.processEvents()
+tabs = {}
+for index in range(1, window.tab_widget.count()):
+    opened = time.perf_counter()
+    window.tab_widget.setCurrentIndex(index)
+    app.processEvents()
+    tabs[window.tab_widget.tabText(index)] = time.perf_counter() - opened
+print(json.dumps({
+    "import": imported - qt_ready,
+    "build": built - imported,
+    "first paint": painted[0] - built,
+    "total": painted[0] - qt_ready,
+    **{f"open {name}": value for name, value in tabs.items()},
+}))
+window.close()
+"""
+
+
+def run_once():
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    # Reason: The window prints debug lines; the result is the last line
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    runs = [run_once() for _ in range(args.runs)]
+    for key in runs[0]:
+        median = statistics.median(run[key] for run in runs)
+        print(f"{key:<28} {median * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
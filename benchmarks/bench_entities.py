@@ -0,0 +1,171 @@
+"""
+bench_entities.py
+Load time and memory of the story-bible entity records (Character, Location,
+Event in GUI/storage).
+
+Builds the 100k-entity bible of workloads.py (half characters, a quarter each
+locations and events) and compares the slotted records and their bulk
+``from_rows`` / ``to_rows`` codecs with dict-backed classes converted one
+object at a time through ``from_dict`` / ``to_dict``, as the stores did
+before. For each kind it reports:
+  - build: list of dicts (as decoded from JSON) -> records
+  - rows: records -> list of dicts, as saved
+  - retained: tracemalloc bytes held by the records after decoding the JSON
+    and dropping the decoded rows
+plus a cold (JSON) and warm (session cache) load through the real stores.
+
+Usage (from the repo root):
+    python benchmarks/bench_entities.py [--entities 100000] [--repeat 5]
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from workloads import build_bible  # noqa: E402
+
+from GUI.storage import session_cache  # noqa: E402
+from GUI.storage.character_store import Character, CharacterStore  # noqa: E402
+from GUI.storage.event_store import Event, EventStore  # noqa: E402
+from GUI.storage.location_store import Location, LocationStore  # noqa: E402
+
+
+class DictRecord:
+    """A record with a per-instance __dict__, as the entity classes were."""
+
+    def __init__(self, id, label, description="", extra=None):
+        self.id = id
+        self.label = label
+        self.description = description
+        self.extra = extra or {}
+
+
+def dict_records(label_key, extra_key):
+    def from_dict(data):
+        return DictRecord(
+            id=data["id"],
+            label=data[label_key],
+            description=data.get("description", ""),
+            extra=data.get(extra_key, {}),
+        )
+
+    def to_dict(record):
+        return {
+            "id": record.id,
+            label_key: record.label,
+            "description": record.description,
+            extra_key: record.extra,
+        }
+
+    return (
+        lambda rows: [from_dict(row) for row in rows],
+        lambda records: [to_dict(record) for record in records],
+    )
+
+
+KINDS = [
+    ("characters", Character, CharacterStore, dict_records("name", "traits")),
+    ("locations", Location, LocationStore, dict_records("name", "details")),
+    ("events", Event, EventStore, dict_records("title", "metadata")),
+]
+
+
+def best_time(function, argument, repeat):
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function(argument)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def retained_bytes(build, text):
+    gc.collect()
+    tracemalloc.start()
+    records = build(json.loads(text))
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del records
+    return size
+
+
+def store_load(store_class, path, warm, repeat):
+    times = []
+    for _ in range(repeat):
+        if not warm:
+            session_cache.clear(path)
+        gc.collect()
+        start = time.perf_counter()
+        store_class(path)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--entities", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    bible = build_bible(args.entities, random.Random(7))
+    print(
+        f"{'kind':<12}{'records':<8}{'build ms':>10}{'rows ms':>10}"
+        f"{'retained MB':>13}"
+    )
+    totals = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name, record_class, store_class, (legacy_build, legacy_rows) in KINDS:
+            rows = bible[name]
+            text = json.dumps(rows, ensure_ascii=False)
+            built = record_class.from_rows(rows)
+            legacy = legacy_build(rows)
+            cases = [
+                ("dict", legacy_build, legacy_rows, legacy),
+                ("slots", record_class.from_rows, record_class.to_rows, built),
+            ]
+            for label, build, to_rows, records in cases:
+                result = (
+                    best_time(build, rows, args.repeat),
+                    best_time(to_rows, records, args.repeat),
+                    retained_bytes(build, text),
+                )
+                totals.setdefault(label, [0, 0, 0])
+                totals[label] = [a + b for a, b in zip(totals[label], result)]
+                print(
+                    f"{name:<12}{label:<8}{result[0] * 1000:>10.1f}"
+                    f"{result[1] * 1000:>10.1f}{result[2] / 1e6:>13.1f}"
+                )
+            path = os.path.join(directory, f"{name}.json")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+            # Reason: A just-written file is hash-checked on every warm load
+            # (see session_cache.RACY_NS); an older mtime gives the usual case
+            settled = time.time_ns() - 2 * session_cache.RACY_NS
+            os.utime(path, ns=(settled, settled))
+            cold = store_load(store_class, path, False, args.repeat)
+            warm = store_load(store_class, path, True, args.repeat)
+            print(
+                f"{'':<12}{store_class.__name__} load: cold {cold * 1000:.1f} ms,"
+                f" warm {warm * 1000:.1f} ms"
+            )
+    for label, (build, to_rows, size) in totals.items():
+        print(
+            f"{'total':<12}{label:<8}{build * 1000:>10.1f}{to_rows * 1000:>10.1f}"
+            f"{size / 1e6:>13.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""
+bench_html_convert.py
+Throughput benchmark for the export HTML converter (GUI/export/html_convert.py).
+
+Builds a synthetic manuscript of Qt-style scene HTML (paragraphs with bold,
+italic, underline and annotation-highlight spans, dialogue, lists and empty
+spacer paragraphs) and converts every scene to Markdown, Fountain and plain
+text, reporting MB/s of input HTML. Runs without Qt; pass --qt to compare with
+loading each scene into a QTextDocument and calling toMarkdown().
+
+Usage (from the repo root):
+    python benchmarks/bench_html_convert.py [--words 1000000] [--repeat 3] [--qt]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GUI.export.html_convert import TARGETS, convert_html  # noqa: E402
+from GUI.storage.scene_content import expand_scene_html  # noqa: E402
+
+WORDS = (
+    "the rain fell on the quiet harbour while she waited for a letter that "
+    "never came and the old captain counted ships under a grey morning sky"
+).split()
+SPANS = (
+    '<span style=" font-weight:700;">{}</span>',
+    '<span style=" font-style:italic;">{}</span>',
+    '<span style=" text-decoration: underline;">{}</span>',
+    '<span style=" background-color:#ffff00;">{}</span>',
+)
+
+
+def make_paragraph(rng):
+    words = [rng.choice(WORDS) for _ in range(rng.randint(8, 60))]
+    if rng.random() < 0.3:
+        i = rng.randrange(len(words))
+        words[i] = rng.choice(SPANS).format(words[i])
+    text = " ".join(words)
+    if rng.random() < 0.3:
+        text = "&quot;Listen,&quot; " + text
+    return text
+
+
+def make_scene(rng, words_per_scene):
+    blocks = []
+    count = 0
+    while count < words_per_scene:
+        if rng.random() < 0.05:
+            items = [make_paragraph(rng) for _ in range(3)]
+            blocks.append(
+                '<ul style="-qt-list-indent: 1;">\n'
+                + "\n".join(f"<li>{item}</li>" for item in items)
+                + "</ul>"
+            )
+            count += sum(len(item.split()) for item in items)
+            continue
+        paragraph = make_paragraph(rng)
+        blocks.append(f"<p>{paragraph}</p>")
+        count += len(paragraph.split())
+        if rng.random() < 0.2:
+            blocks.append('<p style="-qt-paragraph-type:empty;"><br /></p>')
+    return "\n".join(blocks)
+
+
+def build_scenes(words, words_per_scene=2000, full_html=False, seed=7):
+    rng = random.Random(seed)
+    scenes = [
+        make_scene(rng, words_per_scene)
+        for _ in range(max(1, words // words_per_scene))
+    ]
+    if full_html:
+        scenes = [expand_scene_html(scene) for scene in scenes]
+    return scenes
+
+
+def bench(label, scenes, convert, repeat):
+    size_mb = sum(len(s.encode("utf-8")) for s in scenes) / 1e6
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for scene in scenes:
+            convert(scene)
+        best = min(best, time.perf_counter() - start)
+    print(f"  {label:<24} {best:8.2f}s {size_mb / best:8.1f} MB/s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--words", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--qt", action="store_true", help="also time QTextDocument.toMarkdown()"
+    )
+    args = parser.parse_args(argv)
+
+    for full_html in (False, True):
+        scenes = build_scenes(args.words, full_html=full_html)
+        size_mb = sum(len(s.encode("utf-8")) for s in scenes) / 1e6
+        kind = "full Qt HTML" if full_html else "compact HTML"
+        print(f"{kind}: {len(scenes)} scenes, {size_mb:.1f} MB, ~{args.words} words")
+        for target in TARGETS:
+            bench(target, scenes, lambda s, t=target: convert_html(s, t), args.repeat)
+        if args.qt:
+            from PySide6.QtGui import QGuiApplication, QTextDocument
+
+            app = QGuiApplication.instance() or QGuiApplication([])  # noqa: F841
+
+            def qt_markdown(scene):
+                document = QTextDocument()
+                document.setHtml(scene)
+                return document.toMarkdown()
+
+            bench("QTextDocument markdown", scenes, qt_markdown, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
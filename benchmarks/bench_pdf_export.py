@@ -0,0 +1,133 @@
+"""
+bench_pdf_export.py
+Layout and write speed of the PDF exports (GUI/export/pdf_layout.py, pdf_writer.py).
+
+Screenplay: builds a synthetic feature (scene headings, action, speeches with
+parentheticals, transitions) sized to about 120 pages and reports layout time
+alone and layout plus PDF writing. Manuscript: exports the synthetic
+manuscript from bench_html_convert.py and reports time, pages and the
+tracemalloc peak of a second, traced run, which should not grow with --words.
+
+Usage (from the repo root):
+    python benchmarks/bench_pdf_export.py [--pages 120] [--words 1000000]
+"""
+
+import argparse
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from html import escape
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_html_convert import WORDS, build_scenes  # noqa: E402
+
+from GUI.export import export_project  # noqa: E402
+from GUI.export.pdf_layout import layout_pages  # noqa: E402
+from GUI.export.pdf_writer import PdfWriter  # noqa: E402
+
+CHARACTERS = ("MARY", "JOHN", "THE CAPTAIN", "ELENA (V.O.)")
+EMPTY = '<p style="-qt-paragraph-type:empty;"><br /></p>'
+
+
+def sentence(rng, low, high):
+    words = [rng.choice(WORDS) for _ in range(rng.randint(low, high))]
+    return " ".join(words).capitalize() + "."
+
+
+def make_screenplay_scene(rng, number):
+    lines = [f"INT. LOCATION {number} - {rng.choice(('DAY', 'NIGHT'))}", ""]
+    for _ in range(rng.randint(3, 6)):
+        lines += [" ".join(sentence(rng, 6, 14) for _ in range(3)), ""]
+        lines.append(rng.choice(CHARACTERS))
+        if rng.random() < 0.3:
+            lines.append(f"({rng.choice(WORDS)})")
+        lines += [" ".join(sentence(rng, 4, 12) for _ in range(2)), ""]
+    lines += ["CUT TO:", ""]
+    return "\n".join(f"<p>{escape(line)}</p>" if line else EMPTY for line in lines)
+
+
+def build_screenplay(pages, seed=7):
+    rng = random.Random(seed)
+    scenes = [
+        {"title": f"Scene {i}", "content": make_screenplay_scene(rng, i)}
+        for i in range(pages * 10 // 9)  # About 0.9 pages per scene
+    ]
+    return {
+        "title": "Benchmark Feature",
+        "chapters": [{"title": "Act One", "scenes": scenes}],
+        "metadata": {"author": "Bench Writer"},
+    }
+
+
+def build_manuscript(words):
+    scenes = [
+        {"title": f"Scene {i}", "content": content}
+        for i, content in enumerate(build_scenes(words))
+    ]
+    chapters = [
+        {"title": f"Chapter {i // 10 + 1}", "scenes": scenes[i : i + 10]}
+        for i in range(0, len(scenes), 10)
+    ]
+    return {"title": "Benchmark", "chapters": chapters, "metadata": {}}
+
+
+def best_of(repeat, fn):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def write_pdf(project, layout):
+    out = io.BytesIO()
+    writer = PdfWriter(out)
+    for page in layout_pages(project, layout):
+        writer.add_page(page)
+    writer.close()
+    return out.getbuffer().nbytes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--pages", type=int, default=120)
+    parser.add_argument("--words", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    script = build_screenplay(args.pages)
+    elapsed, pages = best_of(
+        args.repeat, lambda: sum(1 for _ in layout_pages(script, "screenplay"))
+    )
+    print(f"screenplay: {pages} pages")
+    print(f"  layout          {elapsed * 1000:8.1f} ms")
+    elapsed, size = best_of(args.repeat, lambda: write_pdf(script, "screenplay"))
+    print(f"  layout + write  {elapsed * 1000:8.1f} ms ({size / 1e3:.0f} kB)")
+
+    manuscript = build_manuscript(args.words)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "bench.pdf")
+        start = time.perf_counter()
+        export_project(manuscript, "PDF", path)
+        elapsed = time.perf_counter() - start
+        # Reason: Tracing slows the export, so memory is measured on a second run
+        tracemalloc.start()
+        export_project(manuscript, "PDF", path)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        size = os.path.getsize(path)
+    pages = sum(1 for _ in layout_pages(manuscript))
+    print(f"manuscript: ~{args.words} words, {pages} pages")
+    print(f"  export          {elapsed:8.2f} s ({size / 1e6:.1f} MB)")
+    print(f"  peak memory     {peak / 1e6:8.1f} MB (tracemalloc, excluding input)")
+
+
+if __name__ == "__main__":
+    main()
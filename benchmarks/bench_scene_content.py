@@ -0,0 +1,139 @@
+"""
+bench_scene_content.py
+Size and speed benchmark for compact scene content storage.
+
+Builds a synthetic project whose scenes are real QTextEdit.toHtml() output,
+then compares the full Qt HTML with the compact form (scene_content.py) for:
+  - projects.json size on disk
+  - json save (dump) and load
+  - plain-text extraction (what search, statistics and export read)
+  - loading a scene into a QTextDocument
+
+Usage (from the repo root):
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_scene_content.py [--scenes N]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtGui import QTextDocument  # noqa: E402
+from PySide6.QtWidgets import QApplication, QTextEdit  # noqa: E402
+
+from GUI.storage.scene_content import (  # noqa: E402
+    compact_scene_html,
+    expand_scene_html,
+    migrate_projects,
+)
+from GUI.storage.scene_text import html_to_plain_text  # noqa: E402
+
+WORDS = (
+    "the rain fell on the quiet harbour while she waited for a letter that "
+    "never came and the old captain counted ships under a grey morning sky"
+).split()
+
+
+def make_scene_html(editor, rng, paragraphs):
+    """Type a scene into a real QTextEdit and return its toHtml()."""
+    lines = []
+    for _ in range(paragraphs):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(8, 60))]
+        if rng.random() < 0.3:
+            words.insert(0, '"Listen,"')
+        lines.append(" ".join(words))
+        if rng.random() < 0.2:
+            lines.append("")
+    editor.setPlainText("\n".join(lines))
+    return editor.toHtml()
+
+
+def build_project(scenes, paragraphs, seed=7):
+    editor = QTextEdit()
+    rng = random.Random(seed)
+    chapters = []
+    for i in range(scenes):
+        if i % 10 == 0:
+            chapters.append({"title": f"Chapter {len(chapters) + 1}", "scenes": []})
+        chapters[-1]["scenes"].append(
+            {
+                "title": f"Scene {i + 1}",
+                "content": make_scene_html(editor, rng, rng.randint(1, paragraphs)),
+            }
+        )
+    return [{"title": "Benchmark", "chapters": chapters}]
+
+
+def timed(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def measure(projects):
+    text = json.dumps(projects, ensure_ascii=False, indent=2)
+    scenes = [
+        scene["content"]
+        for chapter in projects[0]["chapters"]
+        for scene in chapter["scenes"]
+    ]
+
+    def load_documents():
+        for content in scenes:
+            QTextDocument().setHtml(expand_scene_html(content))
+
+    return {
+        "bytes": len(text.encode("utf-8")),
+        "save_ms": timed(lambda: json.dumps(projects, ensure_ascii=False, indent=2)),
+        "load_ms": timed(lambda: json.loads(text)),
+        "plain_text_ms": timed(lambda: [html_to_plain_text(c) for c in scenes]),
+        "qt_load_ms": timed(load_documents, repeat=1),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--scenes", type=int, default=500)
+    parser.add_argument("--paragraphs", type=int, default=12)
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication([])
+    projects = build_project(args.scenes, args.paragraphs)
+    full = measure(projects)
+    started = time.perf_counter()
+    report = migrate_projects(projects)
+    migrate_ms = (time.perf_counter() - started) * 1000
+    compact = measure(projects)
+
+    # Sanity check: compact content must load back to identical Qt HTML
+    editor = QTextEdit()
+    sample = projects[0]["chapters"][0]["scenes"][0]["content"]
+    editor.setHtml(expand_scene_html(sample))
+    assert compact_scene_html(editor.toHtml()) == sample
+
+    print(
+        f"{args.scenes} scenes, migrated {report['scenes']} in {migrate_ms:.1f} ms"
+    )
+    print(f"{'metric':<16}{'full html':>14}{'compact':>14}{'ratio':>10}")
+    for key in ("bytes", "save_ms", "load_ms", "plain_text_ms", "qt_load_ms"):
+        ratio = compact[key] / full[key] if full[key] else 0.0
+        fmt = "{:>14,.0f}" if key == "bytes" else "{:>14.1f}"
+        print(
+            f"{key:<16}"
+            + fmt.format(full[key])
+            + fmt.format(compact[key])
+            + f"{ratio:>10.2f}"
+        )
+    editor.deleteLater()
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
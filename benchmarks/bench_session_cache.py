@@ -0,0 +1,146 @@
+"""
+bench_session_cache.py
+Cold JSON parse vs warm session cache load for the app's data files.
+
+Writes a synthetic projects.json (scene text), kanban_board.json (many small
+cards) and characters.json into a temp directory and times, per file:
+  - json: a plain ``json.load``, as every launch did before the cache
+  - first: ``session_cache.load_json`` with no cache yet (parse + write entry)
+  - warm: a cache hit trusted by size and mtime
+  - hashed: a cache hit verified by hash (source touched, or recently written)
+
+Usage (from the repo root):
+    python benchmarks/bench_session_cache.py [--scenes N] [--cards N] [--runs N]
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GUI.storage import session_cache  # noqa: E402
+
+WORDS = (
+    "the rain fell on the quiet harbour while she waited for a letter that "
+    "never came and the old captain counted ships under a grey morning sky"
+).split()
+SETTLED_NS = 1_000_000_000_000_000_000  # An mtime well outside the racy window
+
+
+def paragraph(rng, words):
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def make_files(directory, scenes, cards, seed=7):
+    rng = random.Random(seed)
+    chapters = []
+    for i in range(scenes):
+        if i % 10 == 0:
+            chapters.append({"title": f"Chapter {len(chapters) + 1}", "scenes": []})
+        text = "\n\n".join(paragraph(rng, rng.randint(20, 80)) for _ in range(12))
+        chapters[-1]["scenes"].append(
+            {"title": f"Scene {i + 1}", "content": text, "tags": ["draft"]}
+        )
+    projects = [{"title": "Benchmark Novel", "chapters": chapters}]
+    board = {
+        column: [
+            {
+                "id": f"{column}-{n}",
+                "title": paragraph(rng, 4),
+                "description": paragraph(rng, 12),
+                "labels": ["plot"],
+                "due": None,
+            }
+            for n in range(cards // 4)
+        ]
+        for column in ("To Do", "In Progress", "Review", "Done")
+    }
+    characters = [
+        {
+            "id": str(n),
+            "name": f"Character {n}",
+            "description": paragraph(rng, 40),
+            "traits": {"age": rng.randint(10, 90), "role": "minor"},
+            "notes": paragraph(rng, 20),
+        }
+        for n in range(cards // 2)
+    ]
+    paths = {}
+    for name, data in (
+        ("projects.json", projects),
+        ("kanban_board.json", board),
+        ("characters.json", characters),
+    ):
+        path = os.path.join(directory, name)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.utime(path, ns=(SETTLED_NS, SETTLED_NS))
+        paths[name] = path
+    return paths
+
+
+def timed(function, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def plain_load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def first_load(path):
+    session_cache.clear(path)
+    return session_cache.load_json(path)
+
+
+def hashed_load(path):
+    # Reason: A write stamp inside the racy window forces the hash check
+    data = plain_load(path)
+    session_cache._store(path, data, session_cache._digest(open(path, "rb").read()))
+    start = time.perf_counter()
+    session_cache._cached(path, os.stat(path))
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--scenes", type=int, default=500)
+    parser.add_argument("--cards", type=int, default=2000)
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = make_files(directory, args.scenes, args.cards)
+        print(
+            f"{'file':<20}{'size':>10}{'json':>10}{'first':>10}{'warm':>10}"
+            f"{'hashed':>10}{'speedup':>9}"
+        )
+        for name, path in paths.items():
+            size = os.path.getsize(path) / 1_000_000
+            parse = timed(lambda: plain_load(path), args.runs)
+            first = timed(lambda: first_load(path), args.runs)
+            session_cache.load_json(path)
+            warm = timed(lambda: session_cache.load_json(path), args.runs)
+            hashed = statistics.median(
+                hashed_load(path) for _ in range(args.runs)
+            ) * 1000
+            print(
+                f"{name:<20}{size:>8.2f}MB{parse:>8.1f}ms{first:>8.1f}ms"
+                f"{warm:>8.1f}ms{hashed:>8.1f}ms{parse / warm:>8.1f}x"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+bench_tracing.py
+Per-call cost of the trace spans and counters (GUI/diagnostics/tracing.py).
+
+Times, in nanoseconds per call, with tracing off and on:
+  - a bare function call (baseline)
+  - the same function under ``@traced``
+  - ``with span(...)`` around a call
+  - ``count(...)``
+and, for comparison, the ``print`` debugging the spans replaced (written to
+/dev/null, so terminal speed is not measured).
+
+Usage (from the repo root):
+    python benchmarks/bench_tracing.py [--calls N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GUI.diagnostics import tracing  # noqa: E402
+
+
+def work():
+    return None
+
+
+traced_work = tracing.traced("bench")(work)
+
+
+def per_call(function, calls):
+    start = time.perf_counter_ns()
+    function(calls)
+    return (time.perf_counter_ns() - start) / calls
+
+
+def bare(calls):
+    for _ in range(calls):
+        work()
+
+
+def decorated(calls):
+    for _ in range(calls):
+        traced_work()
+
+
+def spanned(calls):
+    for _ in range(calls):
+        with tracing.span("bench"):
+            work()
+
+
+def counted(calls):
+    for _ in range(calls):
+        tracing.count("bench")
+
+
+def printed(calls):
+    with open(os.devnull, "w") as devnull:
+        for i in range(calls):
+            print(f"[DEBUG] Adding card with id={i}, title=Scene {i}", file=devnull)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    cases = [("bare call", bare), ("@traced", decorated), ("span", spanned)]
+    cases.append(("count", counted))
+    print(f"{'case':<12}{'off ns':>10}{'on ns':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for label, function in cases:
+            tracing.disable()
+            off = per_call(function, args.calls)
+            tracing.enable(os.path.join(directory, "trace.json"))
+            on = per_call(function, args.calls)
+            tracing.disable()
+            print(f"{label:<12}{off:>10.0f}{on:>10.0f}")
+    print(f"{'print':<12}{per_call(printed, args.calls):>10.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""
+bench_watchdog.py
+Overhead of the event-loop stall watchdog (GUI/diagnostics/watchdog.py).
+
+Runs the same GUI-thread workloads with the watchdog off and on (default
+threshold and heartbeat):
+  - events: zero-interval QTimer callbacks, i.e. event-loop throughput
+  - compute: pure-Python work inside one callback, which the helper thread
+    competes with for the GIL while it polls; long enough by default to be
+    reported as a stall, so stack capture is included
+Reports the median of --runs for each and the relative overhead.
+
+Usage (from the repo root):
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_watchdog.py [--events N]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtCore import QEventLoop, QTimer  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from GUI.diagnostics import watchdog  # noqa: E402
+
+
+def event_chain(count):
+    loop = QEventLoop()
+    timer = QTimer()
+    timer.setInterval(0)
+    remaining = [count]
+
+    def step():
+        remaining[0] -= 1
+        if not remaining[0]:
+            timer.stop()
+            loop.quit()
+
+    timer.timeout.connect(step)
+    start = time.perf_counter()
+    timer.start()
+    loop.exec()
+    return time.perf_counter() - start
+
+
+def compute(iterations):
+    loop = QEventLoop()
+    elapsed = []
+
+    def work():
+        start = time.perf_counter()
+        total = 0
+        for i in range(iterations):
+            total += i * i % 7
+        elapsed.append(time.perf_counter() - start)
+        loop.quit()
+
+    QTimer.singleShot(0, work)
+    loop.exec()
+    return elapsed[0]
+
+
+def measure(runs, workload, size, enabled):
+    times = []
+    for _ in range(runs):
+        if enabled:
+            watchdog.start()
+        try:
+            times.append(workload(size))
+        finally:
+            watchdog.stop()
+    return statistics.median(times) * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--events", type=int, default=50_000)
+    parser.add_argument("--iterations", type=int, default=5_000_000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+    QApplication.instance() or QApplication(sys.argv)
+
+    for label, workload, size in (
+        ("events", event_chain, args.events),
+        ("compute", compute, args.iterations),
+    ):
+        off = measure(args.runs, workload, size, False)
+        on = measure(args.runs, workload, size, True)
+        print(
+            f"{label:<8} off {off:8.1f} ms   on {on:8.1f} ms   "
+            f"overhead {(on / off - 1) * 100:+5.1f}%"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,251 @@
+"""
+workloads.py
+Deterministic synthetic workloads at the size of a large, long-lived project.
+
+At scale 1.0 it builds:
+  - a 1M-word manuscript (the scene HTML from bench_html_convert.py, 10 scenes
+    per chapter) where every scene has older versions, annotations and
+    footnotes
+  - a 20k-card kanban board spread over the three default columns, in the
+    ``save_state(full=True)`` shape
+  - a 5k-beat timeline, in the ``TimelineBoardWidget.save_state()`` shape
+  - a 100k-entity story bible: characters, locations and events in the
+    ``to_dict()`` shape of their stores
+
+Kanban cards and timeline beats share ids for a third of the beats and link
+to real chapters and scenes, so the sync functions do real matching work.
+The same ``scale`` and ``seed`` always give the same data. ``write_workload``
+writes every piece to the file its store reads, so a directory can stand in
+for GUI/storage.
+
+Usage (from the repo root):
+    python benchmarks/workloads.py OUTPUT_DIR [--scale 1.0] [--seed 7]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_html_convert import WORDS, make_scene  # noqa: E402
+
+SIZES = {
+    "words": 1_000_000,
+    "kanban_cards": 20_000,
+    "timeline_beats": 5_000,
+    "entities": 100_000,
+}
+WORDS_PER_SCENE = 2000
+SCENES_PER_CHAPTER = 10
+VERSIONS_PER_SCENE = 2
+COLUMNS = ["To Do", "In Progress", "Done"]
+TAGS = ["plot", "subplot", "character", "setting", "revise", "research", "twist"]
+COLORS = [None, "#fde68a", "#bbf7d0", "#bfdbfe", "#fecaca", "#e9d5ff"]
+FILES = {
+    "projects": "projects.json",
+    "kanban": "kanban_board.json",
+    "timeline": "timeline_board.json",
+    "characters": "characters.json",
+    "locations": "locations.json",
+    "events": "events.json",
+}
+
+
+def scaled_sizes(scale=1.0) -> dict:
+    """``SIZES`` multiplied by ``scale`` (at least one of everything)."""
+    sizes = {name: max(1, int(count * scale)) for name, count in SIZES.items()}
+    sizes["words"] = max(sizes["words"], WORDS_PER_SCENE)
+    return sizes
+
+
+def _id(rng) -> str:
+    return f"{rng.getrandbits(128):032x}"
+
+
+def _sentence(rng, low=6, high=20) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(low, high))]
+    return " ".join(words).capitalize() + "."
+
+
+def _text(rng, sentences) -> str:
+    return " ".join(_sentence(rng) for _ in range(sentences))
+
+
+def _notes(rng, content, count):
+    notes = []
+    for _ in range(count):
+        start = rng.randrange(max(len(content) - 200, 1))
+        notes.append(
+            {
+                "text": "",
+                "note": _sentence(rng, 3, 12),
+                "start": start,
+                "end": start + rng.randint(10, 120),
+            }
+        )
+    return notes
+
+
+def build_manuscript(words, rng, versions=VERSIONS_PER_SCENE) -> dict:
+    """
+    One project dict as stored in projects.json. Older versions are drafts
+    cut short at 60-95% of the current text, as an author's would be.
+    """
+    scenes = []
+    for i in range(max(1, words // WORDS_PER_SCENE)):
+        content = make_scene(rng, WORDS_PER_SCENE)
+        drafts = sorted(rng.uniform(0.6, 0.95) for _ in range(versions))
+        scenes.append(
+            {
+                "title": f"Scene {i + 1}",
+                "content": content,
+                "versions": [
+                    {"content": content[: int(len(content) * cut)]} for cut in drafts
+                ],
+                "annotations": _notes(rng, content, rng.randint(1, 4)),
+                "footnotes": _notes(rng, content, rng.randint(0, 2)),
+            }
+        )
+    chapters = [
+        {
+            "title": f"Chapter {i // SCENES_PER_CHAPTER + 1}",
+            "scenes": scenes[i : i + SCENES_PER_CHAPTER],
+        }
+        for i in range(0, len(scenes), SCENES_PER_CHAPTER)
+    ]
+    return {"title": "Synthetic Novel", "chapters": chapters, "metadata": {}}
+
+
+def _link_ids(project):
+    links = []
+    for cidx, chapter in enumerate(project["chapters"]):
+        links.append(f"chapter:{cidx}")
+        links.extend(
+            f"chapter:{cidx}:scene:{sidx}" for sidx in range(len(chapter["scenes"]))
+        )
+    return links
+
+
+def _card(rng, card_id, title, links):
+    return {
+        "id": card_id,
+        "title": title,
+        "notes": _text(rng, rng.randint(0, 3)),
+        "tags": rng.sample(TAGS, rng.randint(0, 3)),
+        "color": rng.choice(COLORS),
+        "links": rng.sample(links, min(len(links), rng.randint(0, 3))),
+    }
+
+
+def build_kanban(cards, rng, links, ids=()) -> dict:
+    """A ``save_state(full=True)`` board; ``ids`` are used first for card ids."""
+    ids = list(ids)
+    state = {column: [] for column in COLUMNS}
+    for i in range(cards):
+        card_id = ids[i] if i < len(ids) else _id(rng)
+        metadata = _card(rng, card_id, f"Card {i + 1}: {_sentence(rng, 2, 6)}", links)
+        column = COLUMNS[rng.choices((0, 1, 2), weights=(5, 2, 3))[0]]
+        state[column].append({"title": metadata["title"], "metadata": metadata})
+    return state
+
+
+def build_timeline(beats, rng, links) -> list:
+    return [
+        _card(rng, _id(rng), f"Beat {i + 1}: {_sentence(rng, 2, 6)}", links)
+        for i in range(beats)
+    ]
+
+
+def build_bible(entities, rng) -> dict:
+    """Half characters, a quarter each locations and events."""
+    characters = entities // 2
+    locations = entities // 4
+    events = entities - characters - locations
+    return {
+        "characters": [
+            {
+                "id": _id(rng),
+                "name": f"Character {i + 1}",
+                "description": _text(rng, rng.randint(1, 4)),
+                "traits": {
+                    "age": rng.randint(8, 90),
+                    "role": rng.choice(["lead", "support", "extra", "antagonist"]),
+                    "motivation": _sentence(rng, 4, 10),
+                },
+            }
+            for i in range(characters)
+        ],
+        "locations": [
+            {
+                "id": _id(rng),
+                "name": f"Location {i + 1}",
+                "description": _text(rng, rng.randint(1, 4)),
+                "details": {"region": rng.choice(TAGS), "climate": rng.choice(WORDS)},
+            }
+            for i in range(locations)
+        ],
+        "events": [
+            {
+                "id": _id(rng),
+                "title": f"Event {i + 1}",
+                "description": _text(rng, rng.randint(1, 3)),
+                "metadata": {
+                    "year": rng.randint(1800, 2100),
+                    "tags": [rng.choice(TAGS)],
+                },
+            }
+            for i in range(events)
+        ],
+    }
+
+
+def build_workload(scale=1.0, seed=7) -> dict:
+    """Every workload piece at ``scale``, keyed like ``FILES``."""
+    sizes = scaled_sizes(scale)
+    rng = random.Random(seed)
+    project = build_manuscript(sizes["words"], rng)
+    links = _link_ids(project)
+    timeline = build_timeline(sizes["timeline_beats"], rng, links)
+    # Reason: A third of the beats also sit on the board, so syncs update as
+    # well as add cards
+    shared = [beat["id"] for beat in timeline[: len(timeline) // 3]]
+    workload = {
+        "projects": [project],
+        "kanban": build_kanban(sizes["kanban_cards"], rng, links, shared),
+        "timeline": timeline,
+    }
+    workload.update(build_bible(sizes["entities"], rng))
+    return workload
+
+
+def write_workload(directory, scale=1.0, seed=7) -> dict:
+    """
+    Write the workload into ``directory`` in the stores' own JSON layout.
+    Returns the path written for each piece.
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = {}
+    for name, data in build_workload(scale, seed).items():
+        paths[name] = os.path.join(directory, FILES[name])
+        with open(paths[name], "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("output_dir")
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+    for name, path in write_workload(args.output_dir, args.scale, args.seed).items():
+        print(f"{name:<12}{os.path.getsize(path) / 1e6:>10.1f} MB  {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,7 @@ Fixtures:
 - temp_json_file: Creates a temporary JSON file for testing
 - readonly_file: Creates a file and makes it read-only
 - corrupted_json_file: Creates a JSON file with invalid/corrupted content
+- synthetic_workload: Writes a 1% synthetic large project (benchmarks/workloads.py)
 
 All fixtures clean up after themselves.
 """
@@ -70,3 +71,14 @@ def corrupted_json_file(tmp_path):
     file_path.write_text("{ this is not valid json }")
     yield file_path
     # Cleanup handled by tmp_path
+
+
+@pytest.fixture
+def synthetic_workload(tmp_path):
+    """
+    Writes the benchmark workload at 1% scale (10k words, 200 kanban cards,
+    50 timeline beats, 1k entities) and returns the path of each file.
+    """
+    from benchmarks import workloads
+
+    yield workloads.write_workload(tmp_path / "workload", scale=0.01)
@@ -0,0 +1,111 @@
+"""
+Tests for parallel multi-format batch export (batch.py) and BatchExportWorker.
+Covers normal, edge, and failure cases.
+"""
+
+import os
+import zipfile
+
+import pytest
+from GUI.export import FORMATS, ExportCancelled, export_project, plan_jobs, run_batch
+from GUI.export.batch import split_chapters
+from GUI.windows.export_dialog import BatchExportWorker
+
+
+def make_project(title="Novel", chapters=5, scenes=3):
+    return {
+        "title": title,
+        "chapters": [
+            {
+                "title": f"Chapter {c}",
+                "scenes": [
+                    {"title": f"S{c}.{s}", "content": f"<p>Text <b>{c}.{s}</b></p>"}
+                    for s in range(scenes)
+                ],
+            }
+            for c in range(chapters)
+        ],
+        "metadata": {"genre": "Mystery"},
+    }
+
+
+def test_plan_jobs_and_split_chapters(tmp_path):
+    jobs = plan_jobs(
+        [make_project(), make_project(), make_project("a/b")],
+        ["Markdown", "JSON"],
+        str(tmp_path),
+    )
+    names = [os.path.basename(job.output_path) for job in jobs]
+    assert names == [
+        "Novel.md",
+        "Novel.json",
+        "Novel (2).md",
+        "Novel (2).json",
+        "a_b.md",
+        "a_b.json",
+    ]
+    chapters = make_project(chapters=5, scenes=3)["chapters"]
+    assert split_chapters(chapters, 6) == [(0, 2, 6), (2, 4, 6), (4, 5, 3)]
+    assert split_chapters([], 6) == []
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_batch_matches_single_exports(tmp_path, max_workers):
+    projects = [make_project(), make_project("Empty", chapters=0)]
+    jobs = plan_jobs(projects, list(FORMATS), str(tmp_path / "batch"))
+    os.makedirs(tmp_path / "batch")
+    progress, finished = [], []
+    run_batch(
+        jobs,
+        max_workers=max_workers,
+        progress=lambda job, done, total: progress.append((done, total)),
+        job_finished=finished.append,
+        segment_scenes=4,
+    )
+    assert len(finished) == len(jobs) and not any(job.error for job in jobs)
+    assert progress[-1] == (15 * len(FORMATS), 15 * len(FORMATS))
+    for job in jobs:
+        expected = tmp_path / "single"
+        export_project(job.project, job.format_name, expected)
+        if job.format_name == "DOCX":
+            # Reason: Zip entries carry timestamps; compare the document part
+            with zipfile.ZipFile(job.output_path) as ours:
+                with zipfile.ZipFile(expected) as theirs:
+                    part = "word/document.xml"
+                    assert ours.read(part) == theirs.read(part)
+            continue
+        with open(job.output_path, "rb") as f:
+            assert f.read() == expected.read_bytes()
+
+
+def test_failed_job_and_cancel(tmp_path):
+    jobs = plan_jobs([make_project()], ["Markdown"], str(tmp_path))
+    jobs[0].format_name = "RTF"
+    jobs += plan_jobs([make_project("Other")], ["Fountain"], str(tmp_path))
+    run_batch(jobs, max_workers=1)
+    assert "not yet implemented" in jobs[0].error
+    assert jobs[1].error is None and os.path.exists(jobs[1].output_path)
+
+    seen = []
+    cancelled = plan_jobs([make_project("Stop")], ["Markdown"], str(tmp_path))
+    with pytest.raises(ExportCancelled):
+        run_batch(
+            cancelled,
+            max_workers=1,
+            progress=lambda job, done, total: seen.append(done),
+            is_cancelled=lambda: bool(seen),
+            segment_scenes=3,
+        )
+    assert not os.path.exists(cancelled[0].output_path)
+    assert not any(name.endswith(".part") for name in os.listdir(tmp_path))
+
+
+def test_batch_worker_messages(tmp_path, qtbot):
+    jobs = plan_jobs([make_project()], ["Markdown", "JSON"], str(tmp_path))
+    worker = BatchExportWorker(jobs, max_workers=1)
+    lines, messages = [], []
+    worker.job_done.connect(lines.append)
+    worker.finished.connect(messages.append)
+    worker.run()
+    assert messages == ["Successfully exported 2 formats"]
+    assert lines[0] == f"Exported Markdown to {jobs[0].output_path}"
@@ -29,13 +29,13 @@ def test_card_details_dialog_links_normal(qtbot):
     dlg = CardDetailsDialog(card, None, available_links=links)
     qtbot.addWidget(dlg)
     # Check that the correct item is pre-selected
-    selected = [item.data(Qt.UserRole) for item in dlg.links_list.selectedItems()]
+    selected = [
+        index.data(Qt.UserRole)
+        for index in dlg.links_list.selectionModel().selectedIndexes()
+    ]
     assert "chapter:0:scene:1" in selected
     # Simulate user selecting another link
-    for i in range(dlg.links_list.count()):
-        item = dlg.links_list.item(i)
-        if item.data(Qt.UserRole) == "chapter:1":
-            item.setSelected(True)
+    dlg.set_link_selected("chapter:1")
     details = dlg.get_details()
     assert "chapter:1" in details["links"]
     assert "chapter:0:scene:1" in details["links"]
@@ -56,5 +56,33 @@ def test_card_details_dialog_links_invalid(qtbot):
     dlg = CardDetailsDialog(card, None, available_links=links)
     qtbot.addWidget(dlg)
     # Should not select any invalid link
-    selected = [item.data(Qt.UserRole) for item in dlg.links_list.selectedItems()]
-    assert "nonexistent" not in selected
+    assert "nonexistent" not in dlg.selected_link_ids()
+    assert dlg.get_details()["links"] == []
+
+
+def test_card_details_dialog_filter_keeps_selection(qtbot):
+    card = KanbanCard("Test Card", metadata={"links": ["chapter:0:scene:0"]})
+    dlg = CardDetailsDialog(card, None, available_links=make_links())
+    qtbot.addWidget(dlg)
+    # Type-ahead hides the selected scene, but the selection must survive
+    dlg.link_filter_edit.setText("chapter 2")
+    assert dlg.links_list.model().rowCount() == 1
+    dlg.set_link_selected("chapter:1")
+    dlg.link_filter_edit.setText("")
+    assert dlg.links_list.model().rowCount() == len(make_links())
+    assert dlg.get_details()["links"] == ["chapter:0:scene:0", "chapter:1"]
+
+
+def test_card_details_dialog_shares_catalog_model(qtbot):
+    from GUI.windows.link_catalog import LinkCatalog
+
+    chapters = [{"title": "Chapter 1", "scenes": [{"title": "Scene 1"}]}]
+    catalog = LinkCatalog(lambda: chapters)
+    card = KanbanCard("Test Card", metadata={"links": ["chapter:0:scene:0"]})
+    dlg1 = CardDetailsDialog(card, None, available_links=catalog)
+    dlg2 = CardDetailsDialog(card, None, available_links=catalog)
+    qtbot.addWidget(dlg1)
+    qtbot.addWidget(dlg2)
+    assert dlg1.links_list.model().sourceModel() is catalog.model()
+    assert dlg2.links_list.model().sourceModel() is catalog.model()
+    assert dlg1.get_details()["links"] == ["chapter:0:scene:0"]
@@ -0,0 +1,142 @@
+"""
+Tests for the metrics registry (GUI/diagnostics/metrics.py) and the
+Diagnostics panel (GUI/windows/diagnostics_panel.py).
+Covers normal, edge, and failure cases.
+"""
+
+import gc
+
+import pytest
+from GUI.diagnostics import metrics, watchdog
+from GUI.storage import kanban_store, session_cache
+from GUI.windows.diagnostics_panel import DiagnosticsPanel, format_bytes
+from GUI.windows.homepage import HomepageWindow
+from GUI.windows.kanban_board import KanbanBoardWidget
+from GUI.windows.project_editor.document_cache import SceneDocumentCache
+
+
+class Owner:
+    def __init__(self, value):
+        self.value = value
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = metrics.MetricsRegistry()
+    monkeypatch.setattr(metrics, "REGISTRY", registry)
+    return registry
+
+
+def test_series_percentiles_and_totals(registry):
+    assert metrics.percentile([], 0.5) is None
+    for value in range(1, 101):
+        metrics.observe("latency", value)
+    summary = registry.snapshot()["series"]["latency"]
+    assert (summary["p50"], summary["p90"], summary["p99"]) == (50, 90, 99)
+    assert summary["max"] == 100 and summary["avg"] == 50.5 and summary["last"] == 100
+    metrics.add("bytes", 10)
+    metrics.add("bytes", 5)
+    assert registry.snapshot()["totals"] == {"bytes": 15}
+    registry.reset()
+    assert registry.snapshot()["series"] == {} and registry.totals == {}
+
+
+def test_operations_keep_the_slowest_recent(registry):
+    for n in range(metrics.RECENT_OPERATIONS + 10):
+        metrics.operation(f"op{n}", n / 1000)
+    slowest = registry.slowest(3)
+    assert [name for name, _, _ in slowest] == ["op209", "op208", "op207"]
+    assert len(registry.operations) == metrics.RECENT_OPERATIONS
+    assert registry.series["op5"].last == pytest.approx(5.0)
+
+
+def test_gauges_are_summed_and_dropped_with_their_owner(registry):
+    first, second = Owner(3), Owner(4)
+    metrics.gauge("items", first, lambda owner: owner.value)
+    metrics.gauge("items", second, lambda owner: owner.value)
+    assert registry.read_gauges() == {"items": 7}
+    del first
+    gc.collect()
+    assert registry.read_gauges() == {"items": 4}
+    del second
+    gc.collect()
+    assert registry.read_gauges() == {} and registry._gauges == {}
+
+
+def test_approximate_size_counts_shared_objects_once():
+    text = "x" * 1000
+    assert metrics.approximate_size([text, text]) < 2 * len(text)
+    assert metrics.approximate_size({"a": [1, 2], "b": (3,)}) > 0
+
+
+def test_store_saves_feed_the_registry(registry, tmp_path):
+    path = tmp_path / "projects.json"
+    session_cache.dump_json(path, [{"title": "Novel"}])
+    session_cache.load_json(path)
+    snapshot = registry.snapshot()
+    assert snapshot["series"]["save.projects"]["count"] == 1
+    assert snapshot["series"]["load.projects"]["count"] == 1
+    assert snapshot["totals"]["json.bytes_written"] == path.stat().st_size
+
+
+def test_panel_shows_live_metrics(qtbot, registry, tmp_path, monkeypatch):
+    monkeypatch.setattr(kanban_store, "KANBAN_FILE", str(tmp_path / "board.json"))
+    monkeypatch.setattr(kanban_store, "KANBAN_HISTORY_DIR", str(tmp_path / "hist"))
+    board = KanbanBoardWidget()
+    qtbot.addWidget(board)
+    board.push_undo()
+    cache = SceneDocumentCache()
+    cache.document((0, 0), "Some scene text")
+    session_cache.dump_json(tmp_path / "characters.json", [])
+    metrics.operation("export.PDF", 1.5)
+
+    panel = DiagnosticsPanel()
+    qtbot.addWidget(panel)
+    panel.show()
+    qtbot.waitUntil(lambda: "p50" in panel.latency_label.text(), timeout=2000)
+    panel.refresh()
+    summary = panel.summary_label.text()
+    assert "Cached documents: 1" in summary and "Undo stacks: n/a" not in summary
+    stores = [
+        panel.stores_table.item(row, 0).text()
+        for row in range(panel.stores_table.rowCount())
+    ]
+    assert stores == ["board", "characters"]
+    assert panel.slowest_table.item(0, 0).text() == "export.PDF"
+    assert panel.slowest_table.item(0, 1).text() == "1500.0"
+    panel.reset()
+    assert panel.slowest_table.rowCount() == 0
+    assert "JSON written: 0 B" in panel.summary_label.text()
+    panel.hide()
+    assert not panel._probe_timer.isActive() and not panel._refresh_timer.isActive()
+
+
+def test_panel_leaves_latency_to_an_active_watchdog(qtbot, registry):
+    panel = DiagnosticsPanel()
+    qtbot.addWidget(panel)
+    dog = watchdog.start(threshold_ms=1000, heartbeat_ms=20)
+    try:
+        panel.show()
+        qtbot.waitUntil(
+            lambda: registry.series.get(watchdog.LATENCY_METRIC) is not None
+            and registry.series[watchdog.LATENCY_METRIC].count >= 3,
+            timeout=2000,
+        )
+        assert panel._last_probe is None and dog.beats >= 3
+    finally:
+        watchdog.stop()
+
+
+def test_format_bytes():
+    assert format_bytes(None) == "n/a"
+    assert format_bytes(512) == "512 B"
+    assert format_bytes(2048) == "2.0 KB"
+    assert format_bytes(3 * 1024 * 1024) == "3.0 MB"
+
+
+def test_homepage_opens_the_panel(qtbot):
+    homepage = HomepageWindow()
+    qtbot.addWidget(homepage)
+    homepage.open_diagnostics_panel()
+    assert isinstance(homepage.diagnostics_panel, DiagnosticsPanel)
+    assert homepage.diagnostics_panel.windowTitle() == "Diagnostics Panel"
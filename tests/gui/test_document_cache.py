@@ -0,0 +1,104 @@
+"""
+Tests for the scene QTextDocument LRU cache.
+Covers normal, edge, and failure cases.
+"""
+
+import pytest
+from PySide6.QtWidgets import QApplication
+from GUI.storage.scene_content import compact_scene_html
+from GUI.windows.project_editor.document_cache import SceneDocumentCache
+
+
+@pytest.fixture(scope="module")
+def app():
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+def test_cache_hit_and_stale_content(app):
+    cache = SceneDocumentCache()
+    doc = cache.document((0, 0), "<p>Hello</p>")
+    assert doc.toPlainText() == "Hello"
+    assert cache.document((0, 0), "<p>Hello</p>") is doc
+    assert (cache.hits, cache.misses) == (1, 1)
+    # Content changed outside the editor: the document is rebuilt
+    rebuilt = cache.document((0, 0), "<p>Bye</p>")
+    assert rebuilt is not doc
+    assert rebuilt.toPlainText() == "Bye"
+
+
+def test_byte_budget_evicts_lru_but_never_pinned(app):
+    cache = SceneDocumentCache(byte_budget=1)
+    cache.preload((0, 1), "one")
+    cache.preload((0, 2), "two")
+    shown = cache.document((0, 0), "x" * 1000)
+    # Over budget: everything but the visible document is dropped
+    assert list(cache._entries) == [(0, 0)]
+    assert cache.document((0, 0), "x" * 1000) is shown
+    cache.release()
+    cache.preload((0, 3), "three")
+    assert (0, 0) not in cache
+
+
+def test_editor_swaps_cached_documents(app, qtbot):
+    from GUI.windows.project_editor_window import ProjectEditorWindow
+
+    win = ProjectEditorWindow(
+        project={
+            "chapters": [
+                {
+                    "title": "Chapter 1",
+                    "scenes": [
+                        {"title": "A", "content": "<p>First</p>"},
+                        {"title": "B", "content": "<p>Second</p>"},
+                        {"title": "C", "content": "<p>Third</p>"},
+                    ],
+                }
+            ]
+        }
+    )
+    qtbot.addWidget(win)
+    win.chapter_list.setCurrentRow(0)
+    win.scene_list.setCurrentRow(0)
+    first_doc = win.text_editor.document()
+    assert win.text_editor.toPlainText() == "First"
+    win._preload_neighbor_scenes()
+    assert (0, 1) in win.document_cache
+    win.go_to_next_scene()
+    assert win.text_editor.toPlainText() == "Second"
+    assert win.document_cache.hits == 1
+    # Typing is recorded so going back reuses the same document
+    win.text_editor.setPlainText("Second edited")
+    win.go_to_prev_scene()
+    assert win.text_editor.document() is first_doc
+    win.go_to_next_scene()
+    assert win.text_editor.toPlainText() == "Second edited"
+    saved = win.chapters[0]["scenes"][1]["content"]
+    assert saved == compact_scene_html(win.text_editor.toHtml())
+    # Deselecting the chapter shows a blank document without wiping the cache
+    win._on_chapter_selected(None, None)
+    assert win.text_editor.toPlainText() == ""
+    assert win.chapters[0]["scenes"][0]["content"] == "<p>First</p>"
+    assert first_doc.toPlainText() == "First"
+
+
+def test_structural_edit_drops_position_keyed_documents(app, qtbot):
+    from GUI.windows.project_editor_window import ProjectEditorWindow
+
+    scenes = [{"title": "A", "content": ""}, {"title": "B", "content": ""}]
+    win = ProjectEditorWindow(project={"chapters": [{"title": "C1", "scenes": scenes}]})
+    qtbot.addWidget(win)
+    win.chapter_list.setCurrentRow(0)
+    win.scene_list.setCurrentRow(0)
+    first_doc = win.text_editor.document()
+    win.text_editor.insertPlainText("undo me")
+    win.text_editor.undo()
+    # Scene A is deleted and B takes its position with equal (empty) text:
+    # B must not inherit A's document and undo stack
+    del scenes[0]
+    win._structure_changed()
+    assert len(win.document_cache) == 0
+    win.scene_list.takeItem(1)
+    win._on_scene_selected(None, None)
+    assert win.text_editor.document() is not first_doc
+    assert not win.text_editor.document().isUndoAvailable()
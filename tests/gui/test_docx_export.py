@@ -0,0 +1,147 @@
+"""
+Tests for the streaming DOCX writer (docx_writer.py).
+Covers normal, edge, and failure cases.
+"""
+
+import zipfile
+from xml.etree import ElementTree
+
+import pytest
+from GUI.export import FORMATS, ExportCancelled, export_project
+from GUI.windows.export_dialog import FORMAT_NAMES
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+def make_project(content, **scene):
+    return {
+        "title": "Novel",
+        "chapters": [
+            {
+                "title": "One",
+                "scenes": [dict(title="Opening", content=content, **scene)],
+            },
+            {"title": "Two", "scenes": [{"title": "Later", "content": "Plain"}]},
+        ],
+        "metadata": {"author": "A. Writer"},
+    }
+
+
+def export(tmp_path, project, **options):
+    path = tmp_path / "out.docx"
+    export_project(project, "DOCX", path, options=options)
+    with zipfile.ZipFile(path) as package:
+        return {
+            name: ElementTree.fromstring(package.read(name))
+            for name in package.namelist()
+        }
+
+
+def paragraphs(root):
+    return [
+        (
+            p.find(f"{W}pPr/{W}pStyle").get(f"{W}val")
+            if p.find(f"{W}pPr/{W}pStyle") is not None
+            else None,
+            "".join(t.text or "" for t in p.iter(f"{W}t")),
+        )
+        for p in root.iter(f"{W}p")
+    ]
+
+
+def test_structure_and_formatting(tmp_path):
+    parts = export(
+        tmp_path,
+        make_project(
+            "<p>Hello <b>bold</b> <i>it</i> <u>under</u><br/>next</p>"
+            "<ol><li>first</li><li>second</li></ol><ul><li>dot</li></ul>"
+        ),
+    )
+    assert {"[Content_Types].xml", "word/numbering.xml"} <= set(parts)
+    document = parts["word/document.xml"]
+    assert paragraphs(document) == [
+        ("Title", "Novel"),
+        ("Heading1", "One"),
+        ("Heading2", "Opening"),
+        (None, "Hello bold it undernext"),
+        ("ListParagraph", "first"),
+        ("ListParagraph", "second"),
+        ("ListParagraph", "dot"),
+        ("Heading1", "Two"),
+        ("Heading2", "Later"),
+        (None, "Plain"),
+    ]
+    runs = {
+        "".join(t.text for t in r.iter(f"{W}t")): r for r in document.iter(f"{W}r")
+    }
+    assert runs["bold"].find(f"{W}rPr/{W}b") is not None
+    assert runs["it"].find(f"{W}rPr/{W}i") is not None
+    assert runs["under"].find(f"{W}rPr/{W}u") is not None
+    assert runs["Hello "].find(f"{W}rPr") is None
+    assert len(list(document.iter(f"{W}br"))) == 1
+    num_ids = [
+        n.get(f"{W}val") for n in document.iter(f"{W}numId")
+    ]  # Ordered list gets its own numbering, bullets share numId 1
+    assert num_ids[0] == num_ids[1] != num_ids[2] == "1"
+    assert len(list(document.iter(f"{W}pageBreakBefore"))) == 1
+
+
+def test_comments_and_footnotes_follow_offsets(tmp_path):
+    project = make_project(
+        "<p>The quick fox</p><p>jumps</p>",
+        annotations=[{"text": "quick", "note": "Adjective?", "start": 4, "end": 9}],
+        footnotes=[{"text": "jumps", "note": "Verb", "start": 14, "end": 19}],
+    )
+    parts = export(tmp_path, project)
+    body = list(parts["word/document.xml"].iter())
+    tags = [
+        e.tag.replace(W, "") if e.tag != f"{W}t" else e.text
+        for e in body
+        if e.tag
+        in (
+            f"{W}t",
+            f"{W}commentRangeStart",
+            f"{W}commentRangeEnd",
+            f"{W}footnoteReference",
+        )
+    ]
+    assert tags[3:9] == [
+        "The ",
+        "commentRangeStart",
+        "quick",
+        "commentRangeEnd",
+        " fox",
+        "jumps",
+    ]
+    assert tags[9] == "footnoteReference"
+    comment = parts["word/comments.xml"].find(f"{W}comment")
+    assert comment.get(f"{W}author") == "A. Writer"
+    assert "Adjective?" in "".join(t.text for t in comment.iter(f"{W}t"))
+    notes = parts["word/footnotes.xml"].findall(f"{W}footnote")
+    assert [n.get(f"{W}id") for n in notes] == ["-1", "0", "1"]
+
+    plain = export(tmp_path, project, highlights=False)
+    assert plain["word/comments.xml"].find(f"{W}comment") is None
+    assert len(plain["word/footnotes.xml"].findall(f"{W}footnote")) == 2
+    assert not list(plain["word/document.xml"].iter(f"{W}commentRangeStart"))
+
+
+def test_awkward_input_is_still_valid_xml(tmp_path):
+    project = make_project(
+        "<p>a &amp; b &lt;c&gt; \x01 ☃</p>",
+        annotations=[{"text": "x", "note": "<off end>", "start": 500, "end": "bad"}],
+    )
+    project["chapters"][1]["scenes"] = ["Legacy string scene", {}]
+    parts = export(tmp_path, project)
+    text = [t for _, t in paragraphs(parts["word/document.xml"])]
+    assert "a & b <c>  ☃" in text and "Legacy string scene" in text
+    assert parts["word/comments.xml"].find(f"{W}comment") is not None
+
+
+def test_cancel_leaves_no_file_and_dialog_mapping(tmp_path):
+    with pytest.raises(ExportCancelled):
+        export_project(
+            make_project("x"), "DOCX", tmp_path / "out.docx", is_cancelled=lambda: True
+        )
+    assert list(tmp_path.iterdir()) == []
+    assert FORMAT_NAMES["DOCX"] == "DOCX" and FORMATS["DOCX"].binary
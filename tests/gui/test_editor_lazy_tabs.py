@@ -0,0 +1,97 @@
+"""
+Test lazily built tabs (lazy_tab.py) in ProjectEditorWindow.
+Covers normal, edge, and failure cases.
+"""
+
+import pytest
+from PySide6.QtWidgets import QApplication, QLabel
+from GUI.storage import kanban_store
+from GUI.windows.project_editor.lazy_tab import LazyTab
+from GUI.windows.project_editor_window import ProjectEditorWindow
+
+
+@pytest.fixture(scope="module")
+def app():
+    import sys
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    yield app
+
+
+@pytest.fixture
+def board_loads(monkeypatch):
+    loads = []
+    monkeypatch.setattr(
+        kanban_store, "load_kanban_board", lambda: loads.append(1) or None
+    )
+    monkeypatch.setattr(kanban_store, "save_kanban_board", lambda state: None)
+    return loads
+
+
+@pytest.fixture
+def editor(app, board_loads):
+    project = {
+        "chapters": [{"title": "One", "scenes": [{"title": "A"}, {"title": "B"}]}]
+    }
+    win = ProjectEditorWindow(project=project)
+    win.show()
+    yield win
+    win.close()
+
+
+def test_planning_tabs_are_built_on_first_activation(editor, board_loads):
+    assert not editor.timeline_tab.is_built and not editor.kanban_tab.is_built
+    assert board_loads == []
+    editor.tab_widget.setCurrentWidget(editor.kanban_tab)
+    QApplication.processEvents()
+    assert editor.kanban_tab.is_built and board_loads == [1]
+    board = editor.kanban_tab.widget()
+    editor.tab_widget.setCurrentIndex(0)
+    editor.tab_widget.setCurrentWidget(editor.kanban_tab)
+    assert editor.kanban_tab.widget() is board and board_loads == [1]
+    assert not editor.timeline_tab.is_built
+    assert [editor.tab_widget.tabText(i) for i in range(3)] == [
+        "Editor",
+        "Story Planning",
+        "Kanban Board",
+    ]
+
+
+def test_sync_to_timeline_builds_and_shows_the_tab(editor):
+    editor.chapter_list.setCurrentRow(0)
+    editor._sync_scenes_to_timeline()
+    assert editor.tab_widget.currentWidget() is editor.timeline_tab
+    cards = editor.timeline_tab.widget().timeline_widget.cards
+    assert [card.title for card in cards] == ["A", "B"]
+
+
+def test_lazy_tab_factory_runs_once(app):
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return QLabel("page")
+
+    tab = LazyTab(factory)
+    assert not tab.is_built and calls == []
+    label = tab.widget()
+    tab.show()
+    assert tab.widget() is label and calls == [1]
+    assert label.parent() is tab
+    tab.close()
+
+
+def test_lazy_tab_factory_error_is_retried(app):
+    attempts = []
+
+    def factory():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("not ready")
+        return QLabel("page")
+
+    tab = LazyTab(factory)
+    with pytest.raises(RuntimeError):
+        tab.widget()
+    assert not tab.is_built
+    assert isinstance(tab.widget(), QLabel) and len(attempts) == 2
@@ -0,0 +1,76 @@
+"""
+Tests for the slotted entity records and their bulk row codecs
+(Character, Location, Event in GUI/storage).
+Covers normal, edge, and failure cases.
+"""
+
+import json
+
+import pytest
+from GUI.storage.character_store import Character, CharacterStore
+from GUI.storage.event_store import Event, EventStore
+from GUI.storage.location_store import Location, LocationStore
+
+KINDS = [
+    (Character, CharacterStore, "characters", "name", "traits"),
+    (Location, LocationStore, "locations", "name", "details"),
+    (Event, EventStore, "events", "title", "metadata"),
+]
+
+
+def make_rows(label, extra, count=3):
+    return [
+        {
+            "id": str(n),
+            label: f"Entity {n}",
+            "description": f"Description {n}",
+            extra: {"kind": "minor", "rank": n},
+        }
+        for n in range(count)
+    ]
+
+
+@pytest.mark.parametrize("record, store_class, attr, label, extra", KINDS)
+def test_rows_round_trip_like_to_dict(record, store_class, attr, label, extra):
+    rows = make_rows(label, extra)
+    records = record.from_rows(rows)
+    assert [getattr(r, label) for r in records] == ["Entity 0", "Entity 1", "Entity 2"]
+    assert record.to_rows(records) == rows
+    assert record.to_rows(records) == [r.to_dict() for r in records]
+    assert [r.to_dict() for r in record.from_rows(rows)] == [
+        record.from_dict(row).to_dict() for row in rows
+    ]
+
+
+@pytest.mark.parametrize("record, store_class, attr, label, extra", KINDS)
+def test_rows_fill_defaults_and_reject_missing_keys(
+    record, store_class, attr, label, extra
+):
+    (loaded,) = record.from_rows([{"id": "1", label: "Bare", extra: None}])
+    assert loaded.description == "" and getattr(loaded, extra) == {}
+    assert record.from_rows([]) == [] and record.to_rows([]) == []
+    with pytest.raises(KeyError):
+        record.from_rows([{"id": "1"}])
+
+
+@pytest.mark.parametrize("record, store_class, attr, label, extra", KINDS)
+def test_records_have_no_instance_dict(record, store_class, attr, label, extra):
+    (loaded,) = record.from_rows(make_rows(label, extra, count=1))
+    assert not hasattr(loaded, "__dict__")
+    with pytest.raises(AttributeError):
+        loaded.nickname = "Not a field"
+
+
+@pytest.mark.parametrize("record, store_class, attr, label, extra", KINDS)
+def test_stores_load_and_save_through_the_codecs(
+    tmp_path, record, store_class, attr, label, extra
+):
+    path = tmp_path / f"{attr}.json"
+    rows = make_rows(label, extra, count=50)
+    path.write_text(json.dumps(rows), encoding="utf-8")
+    store = store_class(path)
+    assert len(getattr(store, attr)) == 50 and store.get("7") is not None
+    store.delete("7")
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    assert saved == [row for row in rows if row["id"] != "7"]
+    assert record.to_rows(getattr(store_class(path), attr)) == saved
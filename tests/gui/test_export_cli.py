@@ -0,0 +1,108 @@
+"""
+Tests for the headless export CLI (python -m GUI.export).
+Covers normal, edge, and failure cases.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from GUI.export import FORMATS
+from GUI.export.cli import main
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+
+@pytest.fixture
+def projects_file(tmp_path):
+    projects = [
+        {
+            "title": title,
+            "chapters": [
+                {
+                    "title": "One",
+                    "scenes": [{"title": "S", "content": "<p><b>Hi</b></p>"}],
+                }
+            ],
+        }
+        for title in ("Draft A", "Draft B", "Final")
+    ]
+    path = tmp_path / "projects.json"
+    path.write_text(json.dumps(projects), encoding="utf-8")
+    return str(path)
+
+
+def run(projects_file, tmp_path, *args):
+    return main(
+        ["--projects-file", projects_file, "--cache", str(tmp_path / "c.sqlite")]
+        + list(args)
+    )
+
+
+def test_export_by_title_glob_and_formats(projects_file, tmp_path, capsys):
+    out = tmp_path / "out"
+    args = ["Final", "-f", "Fountain", "-o", str(out)]
+    assert run(projects_file, tmp_path, *args) == 0
+    assert (out / "Final.fountain").read_text(encoding="utf-8").endswith("**Hi**\n\n")
+    assert capsys.readouterr().out.startswith(f"Fountain: {out / 'Final.fountain'}")
+
+    args = ["--glob", "Draft*", "--all-formats", "-o", str(out), "-q"]
+    assert run(projects_file, tmp_path, *args) == 0
+    extensions = [fmt.extension for fmt in FORMATS.values()]
+    drafts = [f"Draft {x}.{ext}" for x in "AB" for ext in extensions]
+    assert sorted(os.listdir(out)) == sorted(["Final.fountain"] + drafts)
+    assert capsys.readouterr().out == ""  # --quiet
+
+
+def test_list_and_errors(projects_file, tmp_path, capsys):
+    assert run(projects_file, tmp_path, "--list") == 0
+    assert "Draft A\t1 chapters\t1 scenes" in capsys.readouterr().out
+
+    assert run(projects_file, tmp_path, "Missing", "-o", str(tmp_path)) == 1
+    assert "no project titled 'Missing'" in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        run(projects_file, tmp_path)  # Nothing selected
+    with pytest.raises(SystemExit):
+        run(projects_file, tmp_path, "--all", "-f", "RTF")
+
+
+def test_projects_saved_as_bare_names(tmp_path, capsys):
+    # The dashboard saves a new project as just its name
+    path = tmp_path / "projects.json"
+    scene = {"title": "S", "content": "<p><b>Hi</b></p>"}
+    novel = {"title": "Novel", "chapters": [{"title": "One", "scenes": [scene]}]}
+    projects = ["My First Project", novel]
+    path.write_text(json.dumps(projects), encoding="utf-8")
+    assert run(str(path), tmp_path, "--list") == 0
+    out = capsys.readouterr().out
+    assert "My First Project\t0 chapters\t0 scenes" in out
+    assert "Novel\t1 chapters\t1 scenes" in out
+
+    out_dir = tmp_path / "out"
+    args = ["My First Project", "Novel", "-f", "Markdown", "-o", str(out_dir)]
+    assert run(str(path), tmp_path, *args) == 0
+    assert sorted(os.listdir(out_dir)) == ["My First Project.md", "Novel.md"]
+
+
+def test_module_runs_without_pyside(projects_file, tmp_path):
+    code = (
+        "import sys, runpy\n"
+        "sys.argv = ['GUI.export'] + sys.argv[1:]\n"
+        "try:\n"
+        "    runpy.run_module('GUI.export', run_name='__main__')\n"
+        "except SystemExit as e:\n"
+        "    assert e.code == 0, e.code\n"
+        "assert not [m for m in sys.modules if m.startswith('PySide6')]\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code, "--projects-file", projects_file, "--all"]
+        + ["--no-cache", "-o", str(tmp_path / "cli"), "-j", "2"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    assert len(os.listdir(tmp_path / "cli")) == 3
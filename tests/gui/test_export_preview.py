@@ -0,0 +1,128 @@
+"""
+Tests for bounded export previews (preview.py) and ExportDialog's preview.
+Covers normal, edge, and failure cases.
+"""
+
+import io
+
+import pytest
+from GUI.export import (
+    FORMATS,
+    get_format,
+    preview_export,
+    snapshot_project,
+    write_project,
+)
+from GUI.windows import export_dialog
+from GUI.windows.export_dialog import ExportDialog
+
+TEXT_FORMATS = [name for name, cls in FORMATS.items() if not cls.binary]
+
+
+class Unreadable(dict):
+    """A scene the preview must never reach."""
+
+    def get(self, *args):
+        raise AssertionError("preview read past its limit")
+
+    def items(self):
+        raise AssertionError("preview read past its limit")
+
+
+def make_project(chapters=3, scenes=4):
+    return {
+        "title": "Novel",
+        "chapters": [
+            {
+                "title": f"Chapter {c}",
+                "scenes": [
+                    {
+                        "title": f"Scene {s}",
+                        "content": f"<p>Café <b>{c}.{s}</b> text</p>",
+                        "annotations": [{"note": "check", "start": 0, "end": 4}],
+                    }
+                    for s in range(scenes)
+                ]
+                + ["Legacy scene"],
+            }
+            for c in range(chapters)
+        ],
+        "metadata": {"author": "Jo Ames"},
+    }
+
+
+def exported(project, name):
+    out = io.StringIO()
+    write_project(project, get_format(name), out)
+    return out.getvalue()
+
+
+@pytest.mark.parametrize("name", TEXT_FORMATS)
+def test_text_preview_is_the_start_of_the_export(name):
+    project = make_project()
+    full = exported(project, name)
+    whole = preview_export(project, name, max_bytes=10**9, max_scenes=None)
+    assert whole.text == full and not whole.truncated and whole.scenes == 15
+    cut = preview_export(project, name, max_bytes=101, max_scenes=None)
+    assert cut.truncated and full.startswith(cut.text)
+    assert len(cut.text.encode("utf-8")) <= 101
+
+
+@pytest.mark.parametrize("name", list(FORMATS))
+def test_preview_stops_before_reading_the_rest(name):
+    # Enough scenes to fill the first pages of the paginated formats
+    project = make_project(chapters=1, scenes=60)
+    project["chapters"].append({"title": "Later", "scenes": [Unreadable()]})
+    # The manuscript title page uses the editor's word count when it is given
+    project["metadata"]["statistics"] = {"words": 1000}
+    result = preview_export(project, name, max_bytes=300, max_scenes=2)
+    assert result.truncated and result.text
+    if name in TEXT_FORMATS:
+        assert exported(make_project(1, 60), name).startswith(result.text)
+
+
+def test_scene_limit_and_empty_project():
+    project = make_project(chapters=1, scenes=10)
+    result = preview_export(project, "Markdown", max_scenes=2)
+    assert result.scenes == 2 and result.truncated
+    assert "Scene 1" in result.text and "Scene 2" not in result.text
+    exact = preview_export(make_project(1, 1), "Markdown", max_scenes=2)
+    assert not exact.truncated
+    empty = preview_export({"title": "Empty", "chapters": []}, "PDF")
+    assert "EMPTY" in empty.text and not empty.truncated
+    with pytest.raises(ValueError):
+        preview_export(project, "RTF")
+
+
+def test_binary_previews_render_text():
+    docx = preview_export(make_project(1, 1), "DOCX", max_scenes=None).text
+    assert docx.startswith("[Title] Novel\n\n[Heading 1] Chapter 0\n\n")
+    assert "Café 0.0 text\n[Comment] check" in docx
+    plain = preview_export(
+        make_project(1, 1), "DOCX", max_scenes=None, options={"highlights": False}
+    )
+    assert "[Comment]" not in plain.text
+    pdf = preview_export(make_project(1, 1), "PDF", max_scenes=None).text
+    lines = pdf.split("\n")
+    assert lines[0].strip("-") == " Page 1 "
+    assert lines[1].startswith("Jo Ames") and lines[1].endswith("about 100 words")
+    assert "Ames / NOVEL / 1" in pdf and "\nCafé 0.0 text\n" in pdf
+
+
+def test_dialog_preview_uses_the_exporter(qtbot, monkeypatch):
+    project = make_project(chapters=1, scenes=50)
+    dialog = ExportDialog(project)
+    qtbot.addWidget(dialog)
+    shown = []
+
+    def fake_exec(preview_dialog):
+        text_edit = preview_dialog.findChild(export_dialog.QTextEdit)
+        shown.append(text_edit.toPlainText())
+
+    monkeypatch.setattr(export_dialog.QDialog, "exec", fake_exec)
+    dialog.include_annotations.setChecked(False)
+    dialog.format_combo.setCurrentText("JSON (.json)")
+    dialog._show_preview()
+    full = exported(snapshot_project(project, annotations=False), "JSON")
+    assert shown[0].startswith(full[:200])
+    assert "Preview ends here" in shown[0] and "check" not in shown[0]
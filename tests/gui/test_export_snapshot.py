@@ -0,0 +1,100 @@
+"""
+Tests for read-only export snapshots (snapshot.py) and their use in ExportDialog.
+Covers normal, edge, and failure cases.
+"""
+
+import copy
+import io
+import json
+import pickle
+
+import pytest
+from GUI.export import FrozenDict, get_format, snapshot_project, write_project
+from GUI.windows import export_dialog
+from GUI.windows.export_dialog import ExportDialog
+
+
+def make_project():
+    return {
+        "title": "Novel",
+        "chapters": [
+            {
+                "title": "One",
+                "scenes": [
+                    {
+                        "title": "S",
+                        "content": "<p>Text</p>",
+                        "annotations": [{"note": "n", "start": 0, "end": 4}],
+                        "footnotes": [{"note": "f", "start": 1, "end": 2}],
+                    },
+                    "Legacy scene",
+                ],
+            }
+        ],
+        "metadata": {"tags": ["a", "b"]},
+    }
+
+
+def test_snapshot_filters_without_touching_live_data():
+    project = make_project()
+    before = copy.deepcopy(project)
+    snapshot = snapshot_project(project, annotations=False)
+    assert project == before
+    scene = snapshot["chapters"][0]["scenes"][0]
+    assert "annotations" not in scene and "footnotes" not in scene
+    assert snapshot["chapters"][0]["scenes"][1] == "Legacy scene"
+    # Scene text is shared, not copied
+    assert scene["content"] is project["chapters"][0]["scenes"][0]["content"]
+
+
+def test_snapshot_is_read_only_and_isolated_from_later_edits():
+    project = make_project()
+    snapshot = snapshot_project(project)
+    with pytest.raises(TypeError):
+        snapshot["title"] = "Changed"
+    with pytest.raises(TypeError):
+        snapshot["chapters"][0]["scenes"][0].pop("content")
+    with pytest.raises(AttributeError):
+        snapshot["chapters"][0]["scenes"].append({})
+    project["chapters"][0]["scenes"][0]["content"] = "<p>Edited</p>"
+    project["chapters"][0]["scenes"][0]["annotations"].append({"note": "new"})
+    project["chapters"].append({"title": "Two", "scenes": []})
+    scene = snapshot["chapters"][0]["scenes"][0]
+    assert scene["content"] == "<p>Text</p>" and len(scene["annotations"]) == 1
+    assert len(snapshot["chapters"]) == 1
+
+
+def test_snapshot_exports_and_pickles_like_plain_data():
+    project = make_project()
+    snapshot = snapshot_project(project)
+    for name in ("JSON", "Markdown"):
+        outputs = []
+        for data in (project, snapshot):
+            out = io.StringIO()
+            write_project(data, get_format(name), out)
+            outputs.append(out.getvalue())
+        assert outputs[0] == outputs[1]
+    assert json.loads(json.dumps(snapshot)) == project
+    restored = pickle.loads(pickle.dumps(snapshot))
+    assert type(restored) is FrozenDict and restored == snapshot
+
+
+def test_dialog_export_keeps_project(qtbot, tmp_path, monkeypatch):
+    project = make_project()
+    before = copy.deepcopy(project)
+    dialog = ExportDialog(project)
+    qtbot.addWidget(dialog)
+    dialog.include_annotations.setChecked(False)
+    target = str(tmp_path / "out.json")
+    monkeypatch.setattr(
+        export_dialog.QFileDialog,
+        "getSaveFileName",
+        lambda *args, **kwargs: (target, ""),
+    )
+    monkeypatch.setattr(export_dialog.QMessageBox, "information", lambda *a: None)
+    dialog.format_combo.setCurrentText("JSON (.json)")
+    dialog._start_export()
+    dialog.export_worker.wait()
+    assert project == before
+    with open(target, encoding="utf-8") as f:
+        assert "annotations" not in f.read()
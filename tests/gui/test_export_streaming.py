@@ -0,0 +1,122 @@
+"""
+Tests for the streaming export pipeline and ExportWorker.
+Covers normal, edge, and failure cases.
+"""
+
+import io
+import json
+import tracemalloc
+
+import pytest
+from GUI.export import ExportCancelled, export_project, get_format, write_project
+from GUI.windows.export_dialog import ExportWorker
+
+
+def make_project(scenes_per_chapter=2, chapters=2, body="Body text"):
+    return {
+        "title": "Novel",
+        "chapters": [
+            {
+                "title": f"Chapter {c}",
+                "scenes": [
+                    {"title": f"Scene {c}.{s}", "content": f"{body} {c}.{s}"}
+                    for s in range(scenes_per_chapter)
+                ],
+            }
+            for c in range(chapters)
+        ],
+        "metadata": {"version": "1.0"},
+    }
+
+
+def render(project, name):
+    out = io.StringIO()
+    write_project(project, get_format(name), out)
+    return out.getvalue()
+
+
+def test_text_formats_layout():
+    scenes = [{"title": "S", "content": "x"}, "Old"]
+    project = {"title": "T", "chapters": [{"title": "C", "scenes": scenes}]}
+    markdown = render(project, "Markdown")
+    assert markdown == "# T\n\n## C\n\n### S\n\nx\n\n### Old\n\n\n\n"
+    fountain = render(project, "Fountain")
+    assert fountain == "Title: T\n\n# C\n\n## S\n\nx\n\n## Old\n\n\n\n"
+    plain = render(project, "Plain Text")
+    assert plain.startswith("T\n" + "=" * 50 + "\n\nC\n" + "-" * 30)
+
+
+@pytest.mark.parametrize(
+    "project",
+    [make_project(), {"title": "Empty", "chapters": []}, {"title": "No chapters"}, {}],
+)
+def test_json_matches_json_dump(project):
+    expected = json.dumps(project, indent=2, ensure_ascii=False)
+    assert render(project, "JSON") == expected
+
+
+def test_progress_per_scene_and_cancel(tmp_path):
+    project = make_project(scenes_per_chapter=5, chapters=4)
+    calls = []
+    target = tmp_path / "out.md"
+    export_project(
+        project, "Markdown", target, progress=lambda d, t: calls.append((d, t))
+    )
+    assert calls == [(i, 20) for i in range(1, 21)]
+    assert target.read_text(encoding="utf-8").startswith("# Novel")
+
+    # Cancelling leaves the previous export untouched and no partial file
+    before = target.read_text(encoding="utf-8")
+    seen = []
+    with pytest.raises(ExportCancelled):
+        export_project(
+            make_project(body="NEW", scenes_per_chapter=5, chapters=4),
+            "Markdown",
+            target,
+            progress=lambda d, t: seen.append(d),
+            is_cancelled=lambda: len(seen) >= 3,
+        )
+    assert target.read_text(encoding="utf-8") == before
+    assert list(tmp_path.iterdir()) == [target]
+
+
+def test_unknown_format_raises(tmp_path):
+    with pytest.raises(ValueError):
+        export_project(make_project(), "RTF", tmp_path / "out.rtf")
+
+
+def test_peak_memory_independent_of_manuscript_size():
+    class NullWriter:
+        def write(self, text):
+            return len(text)
+
+    def peak(project):
+        tracemalloc.start()
+        write_project(project, get_format("Markdown"), NullWriter())
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak_bytes
+
+    body = "word " * 200
+    small = peak(make_project(scenes_per_chapter=10, chapters=5, body=body))
+    large = peak(make_project(scenes_per_chapter=10, chapters=100, body=body))
+    # 20x the manuscript, roughly the same working set (one scene at a time)
+    assert large < small * 2 + 64 * 1024
+
+
+def test_export_worker_progress_and_cancel(tmp_path, qtbot):
+    target = tmp_path / "out.txt"
+    worker = ExportWorker(make_project(), "Plain Text", str(target))
+    messages, percents = [], []
+    worker.finished.connect(messages.append)
+    worker.progress.connect(percents.append)
+    worker.run()
+    assert messages == [f"Successfully exported to {target}"]
+    assert percents == [0, 25, 50, 75, 100, 100]
+
+    cancelled = ExportWorker(make_project(), "Markdown", str(tmp_path / "c.md"))
+    cancelled.finished.connect(messages.append)
+    cancelled.cancel()
+    cancelled.run()
+    assert messages[-1] == "Export cancelled"
+    assert not (tmp_path / "c.md").exists()
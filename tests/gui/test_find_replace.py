@@ -0,0 +1,136 @@
+"""
+Tests for project-wide find and replace.
+Covers normal, edge, and failure cases.
+"""
+
+import pytest
+from PySide6.QtWidgets import QApplication, QTextEdit
+from GUI.storage.find_replace import (
+    apply_replacements,
+    collect_scenes,
+    compile_pattern,
+    find_replacements,
+    preview_diff,
+    replace_in_content,
+    revert_replacements,
+)
+from GUI.windows.project_editor.find_replace_panel import FindReplaceWorker
+
+
+@pytest.fixture(scope="module")
+def app():
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+def make_chapters():
+    return [
+        {
+            "title": "Chapter 1",
+            "scenes": [
+                {"title": "Opening", "content": "<p>Anna met <b>Anna</b>'s dog.</p>"},
+                {"title": "Quiet", "content": "Nobody here."},
+            ],
+        },
+        {"title": "Chapter 2", "scenes": [{"title": "End", "content": "anna left"}]},
+    ]
+
+
+def test_replace_only_touches_text_segments(app):
+    editor = QTextEdit()
+    editor.setHtml("<p>Span &amp; <span style='font-weight:600'>span</span></p>")
+    html = editor.toHtml()
+    pattern = compile_pattern("span")
+    new_html, count = replace_in_content(html, pattern, "Bridge")
+    assert count == 2
+    # Markup (<span ...>) and the <style> block survive unchanged
+    assert new_html.count("<span") == html.count("<span")
+    editor.setHtml(new_html)
+    assert editor.toPlainText() == "Bridge & Bridge"
+
+
+def test_pattern_options_and_errors():
+    whole = compile_pattern("cat", whole_word=True)
+    assert replace_in_content("cat catalog", whole, "dog") == ("dog catalog", 1)
+    cased = compile_pattern("cat", case_sensitive=True)
+    assert replace_in_content("Cat cat", cased, "dog") == ("Cat dog", 1)
+    regex = compile_pattern(r"(\w+) (\w+)", regex=True)
+    swapped = replace_in_content("john smith", regex, r"\2 \1", regex=True)
+    assert swapped == ("smith john", 1)
+    # Literal mode keeps backslashes in the replacement as plain text
+    assert replace_in_content("a", compile_pattern("a"), r"\1") == (r"\1", 1)
+    with pytest.raises(ValueError):
+        compile_pattern("(", regex=True)
+    with pytest.raises(ValueError):
+        compile_pattern("")
+
+
+def test_find_apply_and_revert_batch():
+    chapters = make_chapters()
+    changes = find_replacements(
+        collect_scenes(chapters), compile_pattern("anna"), "Beth"
+    )
+    assert [(c.key, c.count) for c in changes] == [((0, 0), 2), ((1, 0), 1)]
+    assert "-Anna met Anna's dog." in preview_diff(changes[0])
+    assert "+Beth met Beth's dog." in preview_diff(changes[0])
+    applied = apply_replacements(chapters, changes)
+    assert len(applied) == 2
+    assert chapters[1]["scenes"][0]["content"] == "Beth left"
+    # Exactly one version snapshot per changed scene
+    first = chapters[0]["scenes"][0]
+    assert first["versions"] == [{"content": changes[0].old_content}]
+    assert "versions" not in chapters[0]["scenes"][1]
+    revert_replacements(chapters, applied)
+    assert first["content"] == changes[0].old_content
+    assert chapters[1]["scenes"][0]["content"] == "anna left"
+    assert chapters[0]["scenes"][0]["versions"] == []
+
+
+def test_stale_scene_is_skipped_and_cancel():
+    chapters = make_chapters()
+    changes = find_replacements(
+        collect_scenes(chapters), compile_pattern("anna"), "Beth"
+    )
+    chapters[1]["scenes"][0]["content"] = "edited meanwhile"
+    assert [c.key for c in apply_replacements(chapters, changes)] == [(0, 0)]
+    assert chapters[1]["scenes"][0]["content"] == "edited meanwhile"
+    result = find_replacements(
+        collect_scenes(chapters), compile_pattern("x"), "y", is_cancelled=lambda: True
+    )
+    assert result is None
+
+
+def test_worker_reports_progress_and_changes(app, qtbot):
+    scenes = collect_scenes(make_chapters())
+    worker = FindReplaceWorker(scenes, compile_pattern("anna"), "Beth")
+    progress = []
+    worker.progress.connect(progress.append)
+    with qtbot.waitSignal(worker.finished_changes, timeout=5000) as blocker:
+        worker.start()
+    worker.wait()
+    assert len(blocker.args[0]) == 2
+    assert progress[-1] == 100
+
+
+def test_editor_replace_all_is_one_undoable_batch(app, qtbot):
+    from GUI.windows.project_editor_window import ProjectEditorWindow
+
+    win = ProjectEditorWindow(project={"chapters": make_chapters()})
+    qtbot.addWidget(win)
+    win.chapter_list.setCurrentRow(0)
+    win.scene_list.setCurrentRow(0)
+    win._open_find_replace_panel()
+    panel = win._find_replace_panel
+    panel.find_edit.setText("anna")
+    panel.replace_edit.setText("Beth")
+    panel.start_preview()
+    qtbot.waitUntil(lambda: panel.btn_replace.isEnabled(), timeout=5000)
+    panel.btn_replace.click()
+    assert win.text_editor.toPlainText() == "Beth met Beth's dog."
+    assert [h.key for h in win.search_index.search("beth")] == [(0, 0), (0, 0), (1, 0)]
+    assert win.undo_replace_action.isEnabled()
+    win._handle_undo()
+    assert win.text_editor.toPlainText() == "Anna met Anna's dog."
+    assert win.chapters[1]["scenes"][0]["content"] == "anna left"
+    assert not win.undo_replace_action.isEnabled()
+    panel.close()
@@ -0,0 +1,110 @@
+"""
+Tests for the export HTML converter (html_convert.py).
+Covers normal, edge, and failure cases.
+"""
+
+import io
+
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont, QTextBlockFormat, QTextCharFormat, QTextListFormat
+from PySide6.QtWidgets import QTextEdit
+from GUI.export import get_format, write_project
+from GUI.export.html_convert import convert_html, html_to_markdown, html_to_text
+from GUI.storage.scene_content import compact_scene_html
+
+
+@pytest.fixture
+def rich_html(qtbot):
+    """A scene typed into a real QTextEdit with every supported feature."""
+    editor = QTextEdit()
+    qtbot.addWidget(editor)
+    cursor = editor.textCursor()
+
+    def insert(text, bold=False, italic=False, underline=False, background=None):
+        fmt = QTextCharFormat()
+        if bold:
+            fmt.setFontWeight(QFont.Bold)
+        fmt.setFontItalic(italic)
+        fmt.setFontUnderline(underline)
+        if background is not None:
+            fmt.setBackground(background)
+        cursor.insertText(text, fmt)
+
+    insert("Plain ")
+    insert("bold", bold=True)
+    insert(" and ")
+    insert("ital", italic=True)
+    insert(" ")
+    insert("under", underline=True)
+    insert(" ")
+    insert("noted", background=Qt.yellow)
+    insert(" <tag> & *stars*")
+    cursor.insertBlock()
+    insert("# not a heading")
+    cursor.insertText(" second line")
+    cursor.insertBlock()
+    cursor.insertList(QTextListFormat.ListDisc)
+    insert("one")
+    cursor.insertBlock()
+    insert("two")
+    cursor.insertBlock()
+    cursor.setBlockFormat(QTextBlockFormat())
+    cursor.insertBlock()
+    insert("after")
+    return editor.toHtml()
+
+
+def test_markdown_conversion(rich_html):
+    assert html_to_markdown(rich_html) == (
+        "Plain **bold** and *ital* *under* ==noted== \\<tag\\> & \\*stars\\*\n\n"
+        "\\# not a heading  \nsecond line\n\n"
+        "- one\n- two\n\n"
+        "after"
+    )
+    no_highlights = html_to_markdown(rich_html, highlights=False)
+    assert " noted " in no_highlights and "==" not in no_highlights
+
+
+def test_fountain_and_plain_follow_editor_lines(rich_html):
+    assert convert_html(rich_html, "fountain").splitlines() == [
+        "Plain **bold** and *ital* _under_ noted <tag> & *stars*",
+        "# not a heading",
+        "second line",
+        "",
+        "- one",
+        "- two",
+        "",
+        "after",
+    ]
+    assert html_to_text(rich_html).splitlines()[0] == (
+        "Plain bold and ital under noted <tag> & *stars*"
+    )
+
+
+def test_compact_content_converts_identically(rich_html):
+    compact = compact_scene_html(rich_html)
+    for target in ("markdown", "fountain", "plain"):
+        assert convert_html(compact, target) == convert_html(rich_html, target)
+
+
+def test_edge_cases():
+    assert convert_html("") == ""
+    assert convert_html("Old *plain* scene\nline") == "Old *plain* scene\nline"
+    html = "<ol><li>a</li><li>b</li></ol><p><b>bold </b><a href='x.html'>link</a></p>"
+    assert html_to_markdown(html) == "1. a\n2. b\n\n**bold** [link](x.html)"
+    # Unbalanced inline tags do not leak formatting into later text
+    assert html_to_markdown("<p><b>open <i>x</b> plain</p>") == "**open** ***x*** plain"
+    with pytest.raises(ValueError):
+        convert_html("<p>x</p>", "docx")
+
+
+def test_formats_convert_scene_bodies(rich_html):
+    project = {
+        "title": "T",
+        "chapters": [{"title": "C", "scenes": [{"title": "S", "content": rich_html}]}],
+    }
+    for name in ("Markdown", "Plain Text", "Fountain"):
+        out = io.StringIO()
+        write_project(project, get_format(name), out)
+        assert "<span" not in out.getvalue() and "bold" in out.getvalue()
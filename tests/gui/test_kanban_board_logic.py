@@ -310,11 +310,8 @@ def test_card_details_dialog_accept(qtbot):
     dlg.tags_edit.setText("a, b, c")
 
     # Select the available links we want
-    for i in range(dlg.links_list.count()):
-        item = dlg.links_list.item(i)
-        link_id = item.data(Qt.UserRole)
-        if link_id in ["sceneX", "sceneY"]:
-            item.setSelected(True)
+    for link_id in ["sceneX", "sceneY"]:
+        dlg.set_link_selected(link_id)
 
     dlg.selected_color = "#00ff00"
     details = dlg.get_details()
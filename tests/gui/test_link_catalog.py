@@ -0,0 +1,82 @@
+"""
+Tests for LinkCatalog: cached chapter/scene links and shared filter model.
+Covers normal, edge, and failure cases.
+"""
+
+import pytest
+from PySide6.QtCore import Qt
+from GUI.windows.link_catalog import (
+    LinkCatalog,
+    LinkFilterProxyModel,
+    build_links,
+)
+
+
+def make_chapters():
+    return [
+        {
+            "title": "Chapter 1",
+            "scenes": [{"title": "Opening", "content": ""}, "Legacy Scene"],
+        },
+        {"title": "Chapter 2", "scenes": []},
+    ]
+
+
+def test_build_links_normal():
+    links = build_links(make_chapters())
+    assert [l["id"] for l in links] == [
+        "chapter:0",
+        "chapter:0:scene:0",
+        "chapter:0:scene:1",
+        "chapter:1",
+    ]
+    assert links[2]["title"] == "Legacy Scene"
+    assert links[1]["chapter"] == "Chapter 1"
+
+
+def test_catalog_cached_until_invalidated(qtbot):
+    chapters = make_chapters()
+    calls = []
+
+    def get_chapters():
+        calls.append(1)
+        return chapters
+
+    catalog = LinkCatalog(get_chapters)
+    first = catalog()
+    model = catalog.model()
+    # Text edits do not touch the catalog: same objects are returned
+    chapters[0]["scenes"][0]["content"] = "<p>edited</p>"
+    assert catalog() is first
+    assert catalog.model() is model
+    # Structural edit + invalidate rebuilds
+    chapters[1]["scenes"].append({"title": "New Scene"})
+    catalog.invalidate()
+    assert catalog() is not first
+    assert catalog.row_for_id("chapter:1:scene:0") == 4
+    assert catalog.model() is not model
+    assert catalog.model().rowCount() == 5
+
+
+def test_catalog_rebuilds_when_chapters_replaced():
+    holder = {"chapters": make_chapters()}
+    catalog = LinkCatalog(lambda: holder["chapters"])
+    assert len(catalog()) == 4
+    holder["chapters"] = [{"title": "Only", "scenes": []}]
+    assert [l["id"] for l in catalog()] == ["chapter:0"]
+
+
+def test_catalog_missing_id():
+    catalog = LinkCatalog(lambda: [])
+    assert catalog() == []
+    assert catalog.row_for_id("chapter:0") == -1
+
+
+def test_filter_proxy_type_ahead(qtbot):
+    catalog = LinkCatalog(make_chapters)
+    proxy = LinkFilterProxyModel(catalog.model())
+    proxy.setFilterFixedString("open")
+    assert proxy.rowCount() == 1
+    assert proxy.index(0, 0).data(Qt.UserRole) == "chapter:0:scene:0"
+    proxy.setFilterFixedString("no such link")
+    assert proxy.rowCount() == 0
@@ -0,0 +1,117 @@
+"""
+Tests for the debounced, off-thread Markdown preview.
+Covers normal, edge, and failure cases.
+"""
+
+import pytest
+from PySide6.QtWidgets import QApplication
+from GUI.storage.markdown_render import (
+    IncrementalMarkdownRenderer,
+    render_block_builtin,
+    split_blocks,
+)
+from GUI.windows.project_editor.markdown_preview import MarkdownPreview
+
+
+@pytest.fixture(scope="module")
+def app():
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+def test_split_blocks_keeps_fences_whole():
+    text = "# Title\n\npara one\nline two\n\n```\ncode\n\nmore\n```\n\n\nlast"
+    assert split_blocks(text) == [
+        "# Title",
+        "para one\nline two",
+        "```\ncode\n\nmore\n```",
+        "last",
+    ]
+    assert split_blocks("") == []
+
+
+def test_builtin_renderer_subset():
+    assert render_block_builtin("## Head") == "<h2>Head</h2>"
+    assert render_block_builtin("**b** *i* `c` <x>") == (
+        "<p><strong>b</strong> <em>i</em> <code>c</code> &lt;x&gt;</p>"
+    )
+    assert render_block_builtin("- a\n- b") == "<ul><li>a</li><li>b</li></ul>"
+    assert render_block_builtin("> quoted") == "<blockquote><p>quoted</p></blockquote>"
+
+
+def test_only_changed_blocks_are_rendered():
+    renderer = IncrementalMarkdownRenderer()
+    text = "\n\n".join(f"Paragraph {i}" for i in range(50))
+    renderer.render(text)
+    assert renderer.rendered_blocks == 50
+    renderer.render(text.replace("Paragraph 7", "Paragraph seven"))
+    assert renderer.rendered_blocks == 51
+
+
+def test_stale_results_are_discarded(app, qtbot):
+    texts = iter(["first", "second", "third"])
+    preview = MarkdownPreview(lambda: next(texts))
+    qtbot.addWidget(preview)
+    shown = []
+    preview.preview_updated.connect(shown.append)
+    preview.render_now()
+    preview.render_now()
+    preview.render_now()
+    qtbot.waitUntil(lambda: preview.latest_seq in shown, timeout=5000)
+    preview.shutdown()
+    # Only the newest request is ever displayed
+    assert shown == [3]
+    assert "third" in preview.toPlainText()
+
+
+def test_replaced_workers_have_fully_exited(app, qtbot, monkeypatch):
+    preview = MarkdownPreview(lambda: "text\n\n" * 200)
+    qtbot.addWidget(preview)
+    replaced = []
+    real_start = MarkdownPreview._start
+
+    def start(self, seq, text):
+        old = self._worker
+        real_start(self, seq, text)
+        if old is not None:
+            replaced.append(old.isFinished())
+
+    monkeypatch.setattr(MarkdownPreview, "_start", start)
+    for _ in range(30):
+        preview.render_now()
+        app.processEvents()
+    qtbot.waitUntil(lambda: not preview._worker.isRunning(), timeout=5000)
+    preview.shutdown()
+    assert replaced and all(replaced)
+
+
+def test_schedule_is_debounced(app, qtbot):
+    calls = []
+    preview = MarkdownPreview(lambda: calls.append(1) or "text", debounce_ms=50)
+    qtbot.addWidget(preview)
+    for _ in range(20):
+        preview.schedule()
+    # Keystrokes never read the text; one render after the pause
+    assert calls == []
+    with qtbot.waitSignal(preview.preview_updated, timeout=5000):
+        pass
+    preview.shutdown()
+    assert calls == [1]
+
+
+def test_editor_toggle_renders_scene(app, qtbot):
+    from GUI.windows.project_editor_window import ProjectEditorWindow
+
+    scene = {"title": "S", "content": ""}
+    win = ProjectEditorWindow(project={"chapters": [{"title": "C", "scenes": [scene]}]})
+    qtbot.addWidget(win)
+    win.chapter_list.setCurrentRow(0)
+    win.scene_list.setCurrentRow(0)
+    win.text_editor.setPlainText("# Heading\n\nSome **bold** text")
+    with qtbot.waitSignal(win.markdown_view.preview_updated, timeout=5000):
+        win.toggle_markdown_preview(True)
+    assert not win.markdown_view.isHidden()
+    assert "Heading" in win.markdown_view.toPlainText()
+    win.toggle_markdown_preview(False)
+    assert win.markdown_view.isHidden()
+    win.close()
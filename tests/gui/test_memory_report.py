@@ -0,0 +1,175 @@
+"""
+Tests for memory accounting (GUI/diagnostics/memory.py) and the memory section
+of the Diagnostics panel.
+Covers normal, edge, and failure cases.
+"""
+
+import gc
+import tracemalloc
+
+import pytest
+from GUI.diagnostics import memory, metrics
+from GUI.storage import kanban_store
+from GUI.windows.diagnostics_panel import DiagnosticsPanel
+from GUI.windows.kanban_board import KanbanBoardWidget
+from GUI.windows.project_editor_window import ProjectEditorWindow
+from GUI.windows.timeline_board import CARD_WIDGET_BYTES, TimelineBoardWidget
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = metrics.MetricsRegistry()
+    monkeypatch.setattr(metrics, "REGISTRY", registry)
+    return registry
+
+
+@pytest.fixture
+def tracing():
+    memory.stop_tracing()
+    memory.start_tracing()
+    yield
+    memory.stop_tracing()
+
+
+def make_chapters(versions=2):
+    scene = {
+        "title": "One",
+        "content": "word " * 1000,
+        "versions": [{"content": "draft " * 800} for _ in range(versions)],
+        "annotations": [{"text": "", "note": "Check", "start": 0, "end": 4}],
+        "footnotes": [],
+    }
+    return [{"title": "Chapter", "scenes": [scene, "Old plain scene"]}]
+
+
+def test_scene_breakdown_attributes_bytes_per_part():
+    sizes = memory.scene_breakdown(make_chapters())
+    assert sizes["scenes.versions_bytes"] > 2 * len("draft " * 800)
+    assert sizes["scenes.content_bytes"] > len("word " * 1000)
+    assert 0 < sizes["scenes.annotations_bytes"] < sizes["scenes.content_bytes"]
+    more = memory.scene_breakdown(make_chapters(versions=4))
+    assert more["scenes.versions_bytes"] > sizes["scenes.versions_bytes"]
+    assert memory.scene_breakdown([]) == dict.fromkeys(memory.SCENE_PARTS, 0)
+
+
+def test_report_covers_every_subsystem(qtbot, registry, tmp_path, monkeypatch):
+    monkeypatch.setattr(kanban_store, "KANBAN_FILE", str(tmp_path / "board.json"))
+    monkeypatch.setattr(kanban_store, "KANBAN_HISTORY_DIR", str(tmp_path / "hist"))
+    editor = ProjectEditorWindow(project={"chapters": make_chapters()})
+    qtbot.addWidget(editor)
+    board = KanbanBoardWidget()
+    qtbot.addWidget(board)
+    board.push_undo()
+    timeline = TimelineBoardWidget()
+    qtbot.addWidget(timeline)
+    timeline.add_card("Beat")
+
+    report = memory.report()
+    subsystems = report["subsystems"]
+    assert list(subsystems) == [label for label, _ in memory.SUBSYSTEMS]
+    expected = memory.scene_breakdown(editor.chapters)
+    assert subsystems["Scene versions"] == expected["scenes.versions_bytes"]
+    assert subsystems["Kanban undo/redo"] > 0
+    assert subsystems["Timeline cards"] > CARD_WIDGET_BYTES
+    assert report["total"] >= sum(expected.values())
+    assert report["traced"] is None
+    assert report["process"]["rss"] is None or report["process"]["rss"] > 0
+
+
+def test_closed_windows_drop_out_of_the_report(qtbot, registry):
+    timeline = TimelineBoardWidget()
+    timeline.add_card("Beat")
+    assert memory.report()["subsystems"]["Timeline cards"] is not None
+    timeline.deleteLater()
+    del timeline
+    qtbot.wait(10)
+    gc.collect()
+    assert memory.report()["subsystems"]["Timeline cards"] is None
+
+
+def test_snapshot_diff_finds_what_grew(tracing):
+    memory.take_snapshot("before")
+    retained = [bytearray(1000) for _ in range(200)]  # noqa: F841
+    memory.take_snapshot("after")
+    diffs = memory.snapshot_diff(limit=5)
+    top = diffs[0]
+    assert top.location.startswith(__file__) and top.size_diff >= 200_000
+    assert top.count_diff >= 200 and top.subsystem == "python"
+    assert memory.growth_by_subsystem()["python"] >= 200_000
+    assert [s.label for s in memory.snapshots()] == ["before", "after"]
+    assert memory.report()["traced"]["current"] >= 200_000
+
+
+def test_snapshots_need_tracing_and_a_pair():
+    memory.stop_tracing()
+    with pytest.raises(RuntimeError):
+        memory.take_snapshot()
+    assert memory.latest_diff() is None
+    memory.start_tracing()
+    try:
+        retained = [bytearray(1000) for _ in range(50)]  # noqa: F841
+        memory.take_snapshot()
+        with pytest.raises(ValueError):
+            memory.snapshot_diff()
+        assert memory.latest_diff(limit=3)[0].size > 0
+    finally:
+        memory.stop_tracing()
+    assert memory.snapshots() == []
+
+
+def test_tracing_started_elsewhere_is_left_running():
+    memory.stop_tracing()
+    tracemalloc.start()  # As -X tracemalloc or another tool would
+    try:
+        memory.start_tracing()
+        memory.take_snapshot()
+        memory.stop_tracing()
+        assert tracemalloc.is_tracing() and memory.snapshots() == []
+    finally:
+        tracemalloc.stop()
+
+
+def test_snapshots_are_bounded(tracing):
+    for _ in range(memory.SNAPSHOTS + 2):
+        memory.take_snapshot()
+    assert len(memory.snapshots()) == memory.SNAPSHOTS
+
+
+def test_subsystem_of_maps_source_files():
+    root = memory.GUI_ROOT
+    assert memory.subsystem_of(f"{root}/windows/kanban_board.py") == "kanban"
+    assert memory.subsystem_of(f"{root}/windows/timeline_board.py") == "timeline"
+    assert memory.subsystem_of(f"{root}/storage/project_store.py") == "storage"
+    assert memory.subsystem_of(f"{root}/windows/dashboard.py") == "app"
+    assert memory.subsystem_of("/usr/lib/python3/json/decoder.py") == "python"
+
+
+def test_panel_memory_section(qtbot, registry):
+    timeline = TimelineBoardWidget()
+    qtbot.addWidget(timeline)
+    timeline.add_card("Beat")
+    panel = DiagnosticsPanel()
+    qtbot.addWidget(panel)
+    panel.refresh()
+    rows = {
+        panel.memory_table.item(row, 0).text(): panel.memory_table.item(row, 1).text()
+        for row in range(panel.memory_table.rowCount())
+    }
+    assert rows["Timeline cards"] != "n/a" and rows["Scene versions"] == "n/a"
+    assert panel.memory_label.text().startswith("Process:")
+    assert not panel.snapshot_btn.isEnabled()
+
+    panel.trace_btn.setChecked(True)
+    try:
+        assert memory.is_tracing() and panel.snapshot_btn.isEnabled()
+        retained = [bytearray(1000) for _ in range(50)]  # noqa: F841
+        panel.take_snapshot()
+        assert "Take another snapshot" in panel.allocations_label.text()
+        assert panel.allocations_table.rowCount() > 0
+        panel.take_snapshot()
+        assert "Snapshot 2 vs Snapshot 1" in panel.allocations_label.text()
+        assert "Traced:" in panel.memory_label.text()
+    finally:
+        panel.close()
+    assert not memory.is_tracing() and not panel.trace_btn.isChecked()
+    assert panel.allocations_table.rowCount() == 0
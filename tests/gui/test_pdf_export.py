@@ -0,0 +1,177 @@
+"""
+Tests for the PDF layout engine (pdf_layout.py) and writer (pdf_writer.py).
+Covers normal, edge, and failure cases.
+"""
+
+import re
+import zlib
+from html import escape
+
+import pytest
+from GUI.export import FORMATS, ExportCancelled, export_project
+from GUI.export.html_convert import BOLD, ITALIC
+from GUI.export.pdf_layout import (
+    BODY_ROWS,
+    CHAR_WIDTH,
+    INCH,
+    Chunk,
+    Line,
+    layout_pages,
+    paginate,
+    split_lines,
+    wrap,
+)
+from GUI.windows.export_dialog import FORMAT_NAMES
+
+
+EMPTY = 'style="-qt-paragraph-type:empty;"'
+
+
+def texts(page):
+    return ["".join(t for t, _ in runs) for _, _, runs in page.lines]
+
+
+def by_text(page):
+    return {"".join(t for t, _ in runs): x for x, _, runs in page.lines}
+
+
+def qt_html(text):
+    """Scene HTML as the editor saves it: one paragraph per line."""
+    return "".join(
+        f"<p>{escape(line)}</p>" if line else f"<p {EMPTY}><br /></p>"
+        for line in text.split("\n")
+    )
+
+
+def screenplay(*scenes, author="Ann Writer"):
+    return {
+        "title": "Feature",
+        "chapters": [
+            {"title": "Act", "scenes": [{"title": "s", "content": c} for c in scenes]}
+        ],
+        "metadata": {"author": author},
+    }
+
+
+def test_wrap_breaks_at_spaces_and_keeps_formatting():
+    runs = [("alpha ", 0), ("beta gamma", BOLD), (" delta", ITALIC)]
+    assert wrap(runs, 11) == [
+        [("alpha ", 0), ("beta", BOLD)],
+        [("gamma", BOLD), (" delta", ITALIC)],
+    ]
+    assert wrap([("abcdefghij", 0)], 4) == [
+        [("abcd", 0)],
+        [("efgh", 0)],
+        [("ij", 0)],
+    ]
+    assert wrap([("a b c d", 0)], 3, hanging=1) == [
+        [("a b", 0)],
+        [("c", 0)],
+        [("d", 0)],
+    ]
+    assert wrap([("   ", 0)], 10) == [[]]
+
+
+def test_paginate_keeps_headings_with_text_and_splits_paragraphs():
+    heading = Chunk([Line(0, [("H", 0)])], space_before=1, keep_with_next=True)
+    filler = Chunk([Line(0, [("x", 0)])] * (BODY_ROWS - 3))
+    body = Chunk([Line(0, [(str(i), 0)]) for i in range(6)], split=split_lines())
+    pages = list(paginate([filler, heading, body]))
+    # Heading plus two lines fit, but the heading must not be stranded alone
+    assert texts(pages[0])[-1] == "x" and texts(pages[1])[:2] == ["H", "0"]
+    tall = Chunk([Line(0, [("y", 0)])] * (BODY_ROWS * 2 + 5))
+    assert [len(p.lines) for p in paginate([tall])] == [BODY_ROWS, BODY_ROWS, 5]
+    split = list(paginate([filler, Chunk(body.lines, split=split_lines())]))
+    assert texts(split[0])[-3:] == ["0", "1", "2"]
+    assert texts(split[1]) == ["3", "4", "5"]
+
+
+def test_screenplay_elements_use_industry_margins():
+    pages = list(
+        layout_pages(
+            screenplay(
+                qt_html(
+                    "# Section\n\nint. house - night\n\nRain falls. [[fix this]]\n\n"
+                    "JOHN (V.O.)\n(quietly)\nHello there.\n\n"
+                    "CUT TO:\n\n>THE END<\n\n.flashback\n\n!LOUD NOISE"
+                )
+            ),
+            "screenplay",
+        )
+    )
+    assert texts(pages[0]) == ["FEATURE", "Written by", "Ann Writer"]
+    x = by_text(pages[1])
+    assert x["INT. HOUSE - NIGHT"] == x["Rain falls."] == 1.5 * INCH
+    assert x["JOHN (V.O.)"] == 3.7 * INCH
+    assert x["(quietly)"] == 3.1 * INCH
+    assert x["Hello there."] == 2.5 * INCH
+    assert x["CUT TO:"] == 7.5 * INCH - 7 * CHAR_WIDTH
+    assert x["LOUD NOISE"] == 1.5 * INCH and "FLASHBACK" in x
+    assert x["THE END"] > 1.5 * INCH
+    assert not any("Section" in t or "fix" in t for t in x)
+    assert texts(pages[1])[0] == "INT. HOUSE - NIGHT"  # No number on page one
+
+
+def test_long_speech_gets_more_and_contd():
+    speech = "Line one is here. " * 200
+    pages = list(
+        layout_pages(screenplay("EXT. FIELD - DAY\n\nMARY\n" + speech), "screenplay")
+    )
+    assert len(pages) >= 3
+    assert texts(pages[1])[-1] == "(MORE)"
+    assert texts(pages[2])[:2] == ["2.", "MARY (CONT'D)"]
+    # The split lands after a full sentence
+    assert texts(pages[1])[-2].endswith(".")
+
+
+def test_manuscript_layout():
+    chapters = [
+        {"title": f"Chapter {n}", "scenes": [{"content": "<p>Opening</p>"}] * 2}
+        for n in (1, 2)
+    ]
+    metadata = {"author": "Jo Ames"}
+    project = {"title": "Novel", "chapters": chapters, "metadata": metadata}
+    pages = list(layout_pages(project))
+    assert texts(pages[0])[:2] == ["Jo Ames", "about 100 words"]
+    assert texts(pages[1]) == [
+        "Ames / NOVEL / 1",
+        "Chapter 1",
+        "Opening",
+        "#",
+        "Opening",
+    ]
+    assert texts(pages[2])[1] == "Chapter 2" and texts(pages[2])[-1] == "END"
+    ys = [y for _, y, _ in pages[1].lines]
+    assert ys[3] - ys[4] == 24  # Double-spaced
+    assert by_text(pages[1])["Opening"] == INCH  # First paragraph not indented
+
+
+def test_pdf_file_is_valid_and_deterministic(tmp_path):
+    project = screenplay("INT. ROOM - DAY\n\nA café — (quiet) \\ ☃")
+    paths = [tmp_path / "a.pdf", tmp_path / "b.pdf"]
+    for path in paths:
+        export_project(project, "Screenplay PDF", path)
+    data = paths[0].read_bytes()
+    assert data == paths[1].read_bytes()
+    assert data.startswith(b"%PDF-1.4") and data.endswith(b"%%EOF\n")
+    xref = int(re.search(rb"startxref\n(\d+)", data).group(1))
+    entries = data[xref:].split(b"\n")[3:]
+    for number, entry in enumerate(entries, 1):
+        if not entry.endswith(b" n "):
+            break
+        offset = int(entry[:10])
+        assert data[offset:].startswith(f"{number} 0 obj".encode())
+    assert data.count(b"/Type /Page ") == 2
+    streams = re.findall(rb"stream\n(.*?)\nendstream", data, re.S)
+    content = b"".join(zlib.decompress(s) for s in streams)
+    assert b"(A caf\xe9 \x97 \\(quiet\\) \\\\ ?) Tj" in content
+
+
+def test_cancel_and_dialog_mapping(tmp_path):
+    with pytest.raises(ExportCancelled):
+        export_project(
+            screenplay("x"), "PDF", tmp_path / "out.pdf", is_cancelled=lambda: True
+        )
+    assert list(tmp_path.iterdir()) == []
+    assert FORMAT_NAMES["Screenplay"] == "Screenplay PDF"
+    assert FORMATS["PDF"].binary and not FORMATS["PDF"].segmentable
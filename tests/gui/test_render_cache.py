@@ -0,0 +1,120 @@
+"""
+Tests for the on-disk export render cache (render_cache.py).
+Covers normal, edge, and failure cases.
+"""
+
+import sqlite3
+
+import pytest
+from GUI.export import ExportCancelled, RenderCache, clear_render_cache, export_project
+from GUI.export.formats import FountainFormat, MarkdownFormat
+from GUI.export import render_cache
+from GUI.export.render_cache import cache_namespace
+
+
+def make_project(scenes=6):
+    return {
+        "title": "Novel",
+        "chapters": [
+            {
+                "title": "One",
+                "scenes": [
+                    {"title": f"S{i}", "content": f"<p>Scene <b>{i}</b></p>"}
+                    for i in range(scenes)
+                ],
+            }
+        ],
+    }
+
+
+@pytest.fixture
+def conversions(monkeypatch):
+    """Count how many scene bodies are actually converted."""
+    calls = []
+    for cls in (MarkdownFormat, FountainFormat):
+        original = cls.convert_body
+
+        def counting(self, content, original=original):
+            calls.append(content)
+            return original(self, content)
+
+        monkeypatch.setattr(cls, "convert_body", counting)
+    return calls
+
+
+def test_reexport_renders_only_changed_scene(tmp_path, conversions):
+    cache = tmp_path / "cache.sqlite"
+    project = make_project()
+    first = tmp_path / "first.md"
+    export_project(project, "Markdown", first, cache_path=cache)
+    assert len(conversions) == 6
+
+    project["chapters"][0]["scenes"][2]["content"] = "<p>Edited <i>scene</i></p>"
+    second = tmp_path / "second.md"
+    export_project(project, "Markdown", second, cache_path=cache)
+    assert conversions[6:] == ["<p>Edited <i>scene</i></p>"]
+
+    uncached = tmp_path / "uncached.md"
+    export_project(project, "Markdown", uncached)
+    assert second.read_text(encoding="utf-8") == uncached.read_text(encoding="utf-8")
+    assert "Edited *scene*" in second.read_text(encoding="utf-8")
+
+
+def test_format_and_options_are_separate_keys(tmp_path, conversions):
+    cache = tmp_path / "cache.sqlite"
+    project = make_project(scenes=2)
+    export_project(project, "Markdown", tmp_path / "a.md", cache_path=cache)
+    export_project(project, "Fountain", tmp_path / "a.fountain", cache_path=cache)
+    export_project(
+        project,
+        "Markdown",
+        tmp_path / "b.md",
+        options={"highlights": False},
+        cache_path=cache,
+    )
+    assert len(conversions) == 6
+    assert cache_namespace("Markdown") != cache_namespace(
+        "Markdown", {"highlights": False}
+    )
+
+
+def test_cache_survives_cancel_and_clear(tmp_path, conversions):
+    cache = tmp_path / "cache.sqlite"
+    done = []
+    with pytest.raises(ExportCancelled):
+        export_project(
+            make_project(),
+            "Markdown",
+            tmp_path / "c.md",
+            progress=lambda d, t: done.append(d),
+            is_cancelled=lambda: len(done) >= 3,
+            cache_path=cache,
+        )
+    # Fragments rendered before the cancel are reused
+    export_project(make_project(), "Markdown", tmp_path / "c.md", cache_path=cache)
+    assert len(conversions) == 6
+
+    clear_render_cache(cache)
+    assert not cache.exists()
+    with RenderCache(cache, cache_namespace("Markdown")) as store:
+        assert store.get_or_render("<p>x</p>", str.upper) == "<P>X</P>"
+        assert store.get_or_render("<p>x</p>", str.upper) == "<P>X</P>"
+        assert (store.hits, store.misses) == (1, 1)
+
+
+def test_writers_never_hold_the_lock_between_renders(tmp_path, monkeypatch):
+    monkeypatch.setattr(render_cache, "COMMIT_EVERY", 4)
+    path = tmp_path / "cache.sqlite"
+    with RenderCache(path, cache_namespace("Markdown")) as store:
+        for i in range(6):
+            store.get_or_render(f"<p>{i}</p>", str.upper)
+        # Two renders are not written yet but are already served from memory
+        assert store.get_or_render("<p>5</p>", str.lower) == "<P>5</P>"
+        # Another worker writes straight away (timeout=0: no waiting)
+        other = sqlite3.connect(path, timeout=0)
+        with other:
+            other.execute("INSERT INTO fragments VALUES ('x', x'00', 'x', 0)")
+        assert other.execute("SELECT COUNT(*) FROM fragments").fetchone()[0] == 5
+    # Closing writes the last two and prunes the never-used "x" row
+    assert other.execute("SELECT COUNT(*) FROM fragments").fetchone()[0] == 6
+    other.close()
@@ -0,0 +1,78 @@
+"""
+Tests for compact scene content storage and its migration.
+Covers normal, edge, and failure cases.
+"""
+
+import pytest
+from PySide6.QtWidgets import QApplication, QTextEdit
+from GUI.storage.scene_content import (
+    compact_scene_html,
+    expand_scene_html,
+    migrate_projects,
+)
+from GUI.storage.scene_text import html_to_plain_text
+
+RICH_SAMPLE = (
+    "<p>Hello <b>bold</b> and <i>it</i></p><p></p><ul><li>one</li><li>two</li></ul>"
+    "<h1>Head</h1><p align='center'>center<br/>line</p>"
+    "<p style='margin-left:20px'>indented</p><p><a href='x'>link</a></p>"
+)
+
+
+@pytest.fixture(scope="module")
+def editor():
+    app = QApplication.instance() or QApplication([])
+    yield QTextEdit()
+
+
+@pytest.mark.parametrize("source", [RICH_SAMPLE, "typed\n\nmore  text\n\tTab"])
+def test_round_trip_is_lossless(editor, source):
+    if "<" in source:
+        editor.setHtml(source)
+    else:
+        editor.setPlainText(source)
+    full = editor.toHtml()
+    compact = compact_scene_html(full)
+    assert "<!DOCTYPE" not in compact and "<style" not in compact
+    assert len(compact) < len(full)
+    editor.setHtml(expand_scene_html(compact))
+    assert editor.toHtml() == full
+    assert compact_scene_html(editor.toHtml()) == compact
+    assert html_to_plain_text(compact) == editor.toPlainText()
+
+
+def test_plain_and_compact_content_pass_through():
+    assert compact_scene_html("") == ""
+    assert compact_scene_html("legacy plain text") == "legacy plain text"
+    assert compact_scene_html("<p>already compact</p>") == "<p>already compact</p>"
+    assert expand_scene_html("legacy plain text") == "legacy plain text"
+    assert expand_scene_html("") == ""
+
+
+def test_migrate_projects_rewrites_scenes_and_versions(editor):
+    editor.setPlainText("Scene text")
+    full = editor.toHtml()
+    projects = [
+        "Legacy title only",
+        {
+            "title": "P",
+            "chapters": [
+                {
+                    "title": "C",
+                    "scenes": [
+                        {"title": "S", "content": full, "versions": [{"content": full}]},
+                        {"title": "Plain", "content": "plain"},
+                        "legacy scene",
+                    ],
+                }
+            ],
+        },
+    ]
+    report = migrate_projects(projects)
+    scene = projects[1]["chapters"][0]["scenes"][0]
+    assert scene["content"] == "<p>Scene text</p>"
+    assert scene["versions"][0]["content"] == "<p>Scene text</p>"
+    assert (report["scenes"], report["versions"]) == (1, 1)
+    assert report["bytes_after"] < report["bytes_before"]
+    # Running it again is a no-op
+    assert migrate_projects(projects)["scenes"] == 0
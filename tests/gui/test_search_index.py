@@ -0,0 +1,115 @@
+"""
+Tests for the manuscript full-text search index and search panel.
+Covers normal, edge, and failure cases.
+"""
+
+import pytest
+from PySide6.QtWidgets import QApplication, QTextEdit
+from GUI.storage.scene_text import html_to_plain_text
+from GUI.storage.search_index import SearchIndex, ProjectSearchIndex, parse_query
+
+
+@pytest.fixture(scope="module")
+def app():
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+def test_plain_text_matches_qt_offsets(app):
+    editor = QTextEdit()
+    editor.setHtml(
+        "<p>First <b>bold</b> line<br/>wrapped</p><p></p><p>Third &amp; last</p>"
+    )
+    html = editor.toHtml()
+    assert html_to_plain_text(html) == editor.toPlainText()
+    # Plain (non-HTML) legacy content is returned unchanged
+    assert html_to_plain_text("Just text") == "Just text"
+    assert html_to_plain_text("") == ""
+
+
+def test_parse_query_clauses():
+    assert parse_query('alice "white rabbit" tea*') == [
+        [("alice", False)],
+        [("white", False), ("rabbit", False)],
+        [("tea", True)],
+    ]
+    assert parse_query("  ...  ") == []
+
+
+def test_search_phrase_prefix_and_terms():
+    index = SearchIndex()
+    index.add_document((0, 0), "Alice followed the White Rabbit.")
+    index.add_document((0, 1), "The rabbit was white and late for tea.")
+    index.add_document((1, 0), "Teatime at the Mad Hatter's table.")
+    phrase = index.search('"white rabbit"')
+    assert [(h.key, h.start, h.end) for h in phrase] == [((0, 0), 19, 31)]
+    assert [h.key for h in index.search("tea*")] == [(0, 1), (1, 0)]
+    # All clauses must match the same scene
+    assert [h.key for h in index.search("rabbit late")] == [(0, 1), (0, 1)]
+    assert index.search("rabbit hatter") == []
+    assert index.search('"rabbit white"') == []
+
+
+def test_search_limit_and_reindex():
+    index = SearchIndex()
+    index.add_document((0, 0), "word " * 50)
+    assert len(index.search("word", limit=10)) == 10
+    index.add_document((0, 0), "replaced text")
+    assert index.search("word") == []
+    index.remove_document((0, 0))
+    assert index.search("replaced") == []
+    assert len(index) == 0
+
+
+def test_project_index_refreshes_only_changed_scenes():
+    chapters = [
+        {
+            "title": "Chapter 1",
+            "scenes": [
+                {"title": "Scene 1", "content": "<p>The cat sat.</p>"},
+                {"title": "Scene 2", "content": "A dog barked."},
+            ],
+        }
+    ]
+    project_index = ProjectSearchIndex(lambda: chapters)
+    assert [h.key for h in project_index.search("cat")] == [(0, 0)]
+    calls = []
+    original = project_index.index.add_document
+    project_index.index.add_document = lambda k, t: (calls.append(k), original(k, t))
+    chapters[0]["scenes"][1]["content"] = "A cat barked."
+    project_index.scene_changed(0, 1)
+    assert [h.key for h in project_index.search("cat")] == [(0, 0), (0, 1)]
+    assert calls == [(0, 1)]
+    # Structural edit: deleted scene disappears from results
+    chapters[0]["scenes"].pop(0)
+    project_index.invalidate()
+    assert [h.key for h in project_index.search("cat")] == [(0, 0)]
+    assert project_index.describe((0, 0)) == ("Chapter 1", "Scene 2")
+    assert project_index.describe((5, 5)) == ("", "")
+
+
+def test_search_panel_jumps_to_scene(app, qtbot):
+    from GUI.windows.project_editor_window import ProjectEditorWindow
+
+    win = ProjectEditorWindow(
+        project={
+            "chapters": [
+                {"title": "Chapter 1", "scenes": [{"title": "S1", "content": "alpha"}]},
+                {
+                    "title": "Chapter 2",
+                    "scenes": [{"title": "S2", "content": "<p>beta gamma</p>"}],
+                },
+            ]
+        }
+    )
+    qtbot.addWidget(win)
+    win._open_search_panel()
+    panel = win._search_panel
+    hits = panel.run_search("gamma")
+    assert panel.results_list.count() == 1
+    panel._on_result_activated(panel.results_list.item(0))
+    assert win.chapter_list.currentRow() == 1
+    assert win.scene_list.currentRow() == 0
+    assert win.text_editor.textCursor().selectedText() == "gamma"
+    assert hits[0].start == 5
+    panel.close()
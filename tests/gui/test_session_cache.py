@@ -0,0 +1,200 @@
+"""
+Tests for the warm-start session cache (session_cache.py) and workspace restore.
+Covers normal, edge, and failure cases.
+"""
+
+import json
+import os
+
+import pytest
+from GUI.storage import session_cache
+from GUI.storage.character_store import Character, CharacterStore
+from GUI.windows import dashboard as dashboard_module
+from GUI.windows.dashboard import DashboardWindow
+
+OLD_NS = 1_000_000_000_000_000_000  # A settled mtime, long before "now"
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Count real JSON parses behind load_json."""
+    calls = []
+    real_loads = json.loads
+
+    def counting_loads(text, *args, **kwargs):
+        calls.append(1)
+        return real_loads(text, *args, **kwargs)
+
+    monkeypatch.setattr(session_cache.json, "loads", counting_loads)
+    return calls
+
+
+@pytest.fixture
+def workspace_file(tmp_path, monkeypatch):
+    path = tmp_path / "cache" / "workspace.bin"
+    monkeypatch.setattr(session_cache, "WORKSPACE_FILE", str(path))
+    return path
+
+
+def write(path, data, mtime_ns=None):
+    path.write_text(json.dumps(data), encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_second_load_comes_from_the_cache(tmp_path, parses):
+    source = tmp_path / "projects.json"
+    data = [{"title": "Novel", "chapters": [{"title": "Café", "scenes": []}]}]
+    write(source, data, OLD_NS)
+    assert session_cache.load_json(source) == data and len(parses) == 1
+    assert os.path.exists(session_cache.cache_path(source))
+    assert session_cache.load_json(source) == data and len(parses) == 1
+    # Each load returns fresh objects
+    assert session_cache.load_json(source) is not session_cache.load_json(source)
+    assert session_cache.load_json(tmp_path / "missing.json", []) == []
+
+
+def test_changed_or_touched_sources_are_detected(tmp_path, parses, monkeypatch):
+    source = tmp_path / "board.json"
+    write(source, {"a": 1})
+    session_cache.load_json(source)
+    # Same size, same timestamp tick: only the hash can tell
+    write(source, {"b": 2})
+    assert session_cache.load_json(source) == {"b": 2} and len(parses) == 2
+    # Touched but unchanged: verified by hash, then trusted by mtime
+    os.utime(source, ns=(OLD_NS, OLD_NS))
+    hashes = []
+    real_digest = session_cache._digest
+    monkeypatch.setattr(
+        session_cache, "_digest", lambda data: hashes.append(1) or real_digest(data)
+    )
+    assert session_cache.load_json(source) == {"b": 2} and len(parses) == 2
+    hashed = len(hashes)
+    assert session_cache.load_json(source) == {"b": 2} and len(hashes) == hashed
+
+
+def test_dump_json_drops_the_cache_entry(tmp_path, parses):
+    source = tmp_path / "characters.json"
+    write(source, [], OLD_NS)
+    session_cache.load_json(source)
+    session_cache.dump_json(source, [{"id": "1", "name": "Ann"}], indent=2)
+    assert json.loads(source.read_text()) == [{"id": "1", "name": "Ann"}]
+    # Saving neither parses nor caches; the next load does, once
+    assert not os.path.exists(session_cache.cache_path(source))
+    parses.clear()
+    assert session_cache.load_json(source) == [{"id": "1", "name": "Ann"}]
+    assert session_cache.load_json(source) == [{"id": "1", "name": "Ann"}]
+    assert len(parses) == 1
+
+
+def test_warm_and_cold_loads_agree_after_dump(tmp_path, parses):
+    source = tmp_path / "kanban_board.json"
+    session_cache.dump_json(source, {"a": (1, 2), 3: "x", "b": [(None, True)]})
+    first = session_cache.load_json(source)
+    warm = session_cache.load_json(source)
+    assert parses == [1]  # The first load parsed and cached; the second was warm
+    assert first == warm == {"a": [1, 2], "3": "x", "b": [[None, True]]}
+
+
+def test_bad_cache_or_source_falls_back(tmp_path, parses):
+    source = tmp_path / "events.json"
+    write(source, [1, 2, 3], OLD_NS)
+    session_cache.load_json(source)
+    with open(session_cache.cache_path(source), "wb") as f:
+        f.write(b"WSAC garbage")
+    assert session_cache.load_json(source) == [1, 2, 3] and len(parses) == 2
+    session_cache.clear(source)
+    session_cache.clear(source)  # Already gone
+    source.write_text("{ not json", encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        session_cache.load_json(source)
+    assert not os.path.exists(session_cache.cache_path(source))
+
+
+def test_disabled_cache_always_parses(tmp_path, parses, monkeypatch):
+    monkeypatch.setattr(session_cache, "ENABLED", False)
+    source = tmp_path / "projects.json"
+    write(source, [], OLD_NS)
+    session_cache.load_json(source)
+    session_cache.load_json(source)
+    assert len(parses) == 2 and not os.path.exists(session_cache.cache_path(source))
+    assert session_cache.load_workspace() == {}
+
+
+def test_entity_store_round_trip(tmp_path, parses):
+    path = tmp_path / "characters.json"
+    CharacterStore(path).add(Character("1", "Ann", traits={"age": 30}))
+    assert CharacterStore(path).get("1").traits == {"age": 30}
+    parses.clear()
+    store = CharacterStore(path)
+    assert store.get("1").traits == {"age": 30} and parses == []
+
+
+def test_workspace_round_trip_and_corruption(workspace_file):
+    assert session_cache.load_workspace() == {}
+    session_cache.save_workspace({"project": "Novel", "chapter": 1})
+    session_cache.update_workspace(scene=2)
+    assert session_cache.load_workspace() == {
+        "project": "Novel",
+        "chapter": 1,
+        "scene": 2,
+    }
+    workspace_file.write_bytes(b"nope")
+    assert session_cache.load_workspace() == {}
+
+
+def test_dashboard_reopens_last_workspace(qtbot, workspace_file, monkeypatch):
+    projects = [
+        {"title": "First", "chapters": []},
+        {
+            "title": "Second",
+            "chapters": [
+                {"title": "One", "scenes": [{"title": "A"}]},
+                {"title": "Two", "scenes": [{"title": "B"}, {"title": "C"}]},
+            ],
+        },
+    ]
+    monkeypatch.setattr(dashboard_module, "load_projects", lambda: projects)
+    session_cache.save_workspace({"project": "Second", "chapter": 1, "scene": 1})
+    window = DashboardWindow()
+    qtbot.addWidget(window)
+    assert window.list_widget.currentRow() == 1
+    window.open_selected_project()
+    editor = window.project_editor
+    assert editor.chapter_list.count() == 2
+    assert editor.chapter_list.currentRow() == 1 and editor.scene_list.currentRow() == 1
+    editor.chapter_list.setCurrentRow(0)
+    editor.close()
+    assert session_cache.load_workspace() == {
+        "project": "Second",
+        "chapter": 0,
+        "scene": -1,
+        "tab": 0,
+    }
+    # Opening another project starts a fresh workspace
+    window.list_widget.setCurrentRow(0)
+    window.open_selected_project()
+    assert session_cache.load_workspace() == {"project": "First"}
+    window.project_editor.close()
+    # A project without a saved workspace still lists its chapters
+    window.list_widget.setCurrentRow(1)
+    window.open_selected_project()
+    editor = window.project_editor
+    assert editor.chapter_list.count() == 2 and editor.chapter_list.currentRow() == -1
+    editor.close()
+
+
+def test_dashboard_counts_the_reselected_project_after_start(
+    qtbot, workspace_file, monkeypatch
+):
+    scene = {"title": "A", "content": "<p>three little words</p>"}
+    projects = [{"title": "Novel", "chapters": [{"title": "One", "scenes": [scene]}]}]
+    monkeypatch.setattr(dashboard_module, "load_projects", lambda: projects)
+    session_cache.save_workspace({"project": "Novel"})
+    window = DashboardWindow()
+    qtbot.addWidget(window)
+    assert window.list_widget.currentRow() == 0
+    # Nothing is counted while the dashboard is being built
+    assert window.stats_label.text() == "" and window._project_stats == {}
+    qtbot.waitUntil(lambda: window.stats_label.text() != "")
+    assert "3 words" in window.stats_label.text()
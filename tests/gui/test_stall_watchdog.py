@@ -0,0 +1,117 @@
+"""
+Tests for the event-loop stall watchdog (GUI/diagnostics/watchdog.py).
+Covers normal, edge, and failure cases.
+"""
+
+import json
+import os
+import sys
+import time
+
+import pytest
+from PySide6.QtCore import QTimer
+from GUI.diagnostics import watchdog
+from GUI.storage import kanban_store
+from GUI.windows.kanban_board import KanbanBoardWidget
+
+
+@pytest.fixture(autouse=True)
+def no_active_watchdog():
+    watchdog.stop()
+    yield
+    watchdog.stop()
+
+
+def stall_ended(dog):
+    return bool(dog.stalls) and dog.stalls[0].duration_ms is not None
+
+
+def test_parse_options_from_flags_and_environment():
+    argv = ["main.py", "--watchdog", "--other"]
+    assert watchdog.parse_options(argv, {}) == watchdog.THRESHOLD_MS
+    assert argv == ["main.py", "--other"]
+    assert watchdog.parse_options(["main.py", "--watchdog=250"], {}) == 250
+    assert watchdog.parse_options(["main.py"], {watchdog.ENV_VAR: "1"}) == 500
+    assert watchdog.parse_options(["main.py"], {watchdog.ENV_VAR: "80"}) == 80
+    assert watchdog.parse_options(["main.py"], {watchdog.ENV_VAR: "0"}) is None
+    assert watchdog.start_from_argv(["main.py"], {}) is None
+    assert watchdog.active() is None
+
+
+def test_bad_thresholds_fall_back_instead_of_failing(capsys):
+    assert watchdog.parse_options(["main.py"], {watchdog.ENV_VAR: "yes"}) == 500
+    argv = ["main.py", "--watchdog=abc"]
+    assert watchdog.parse_options(argv, {}) == 500 and argv == ["main.py"]
+    assert watchdog.parse_options(["main.py", "--watchdog=-5"], {}) == 500
+    err = capsys.readouterr().err
+    assert "WSA_WATCHDOG='yes'" in err and "--watchdog='abc'" in err
+
+
+def test_trigger_is_the_outermost_app_frame():
+    def loop():
+        return watchdog.capture_stack(sys._getframe(), skip_codes={loop.__code__})
+
+    trigger, stack = loop()
+    # Neither this test nor the loop frame is app code: innermost frame wins
+    assert trigger.endswith("loop") and stack[-1].endswith("in " + trigger)
+    assert watchdog.capture_stack(None) == ("<unknown>", [])
+
+
+def test_trigger_skips_the_launch_script_above_the_loop():
+    # Stand-ins for `python GUI/main.py`: <module> -> main() -> app code
+    main_path = os.path.join(watchdog.APP_ROOT, "main.py")
+    board_path = os.path.join(watchdog.APP_ROOT, "windows", "kanban_board.py")
+    scope = {"watchdog": watchdog, "sys": sys}
+    action = (
+        "def _autosave():\n"
+        "    return watchdog.capture_stack(sys._getframe(), SKIP)\n"
+    )
+    exec(compile(action, board_path, "exec"), scope)
+    exec(compile("def main():\n    return _autosave()\n", main_path, "exec"), scope)
+    scope["SKIP"] = {scope["main"].__code__}
+    exec(compile("result = main()\n", main_path, "exec"), scope)
+    trigger, stack = scope["result"]
+    assert trigger == "_autosave"
+    assert stack[-3].endswith("in <module>") and stack[-2].endswith("in main")
+
+
+def test_responsive_loop_records_latency_only(qtbot):
+    dog = watchdog.start(threshold_ms=300, heartbeat_ms=20)
+    qtbot.wait(200)
+    stats = dog.stats()
+    assert stats["beats"] > 0 and stats["stalls"] == 0
+    assert stats["max_latency_ms"] >= 0
+    watchdog.stop()
+    assert not dog._thread.is_alive() and watchdog.active() is None
+
+
+def test_stall_captures_stack_and_trigger(qtbot, tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(kanban_store, "KANBAN_FILE", str(tmp_path / "board.json"))
+    monkeypatch.setattr(kanban_store, "KANBAN_HISTORY_DIR", str(tmp_path / "hist"))
+    board = KanbanBoardWidget()
+    qtbot.addWidget(board)
+    monkeypatch.setattr(
+        kanban_store, "save_kanban_board", lambda state: time.sleep(0.5)
+    )
+    log_path = tmp_path / "stalls.jsonl"
+    dog = watchdog.start(threshold_ms=150, heartbeat_ms=20, log_path=str(log_path))
+    QTimer.singleShot(0, board._autosave)
+    qtbot.waitUntil(lambda: stall_ended(dog), timeout=5000)
+    stall = dog.stalls[0]
+    assert stall.trigger == "KanbanBoardWidget._autosave"
+    assert any("_autosave" in line for line in stall.stack)
+    assert stall.stack[-1].endswith("<lambda>")  # Still inside the sleep
+    assert stall.blocked_ms >= 150 and stall.duration_ms >= stall.blocked_ms - 20
+    err = capsys.readouterr().err
+    assert "blocked for" in err and "stalled" in err
+    (record,) = [json.loads(line) for line in log_path.read_text().splitlines()]
+    assert record["trigger"] == stall.trigger and record["stack"] == stall.stack
+    assert dog.stats()["stalls"] == 1 and dog.stats()["max_latency_ms"] >= 300
+
+
+def test_unwritable_log_is_reported(qtbot, tmp_path, capsys):
+    dog = watchdog.start(threshold_ms=100, heartbeat_ms=20, log_path=str(tmp_path))
+    QTimer.singleShot(0, lambda: time.sleep(0.3))
+    qtbot.waitUntil(lambda: stall_ended(dog), timeout=5000)
+    watchdog.stop()
+    assert "Could not write" in capsys.readouterr().err
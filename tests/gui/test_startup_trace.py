@@ -0,0 +1,99 @@
+"""
+Tests for the opt-in startup tracer (GUI/diagnostics/startup.py).
+Covers normal, edge, and failure cases.
+"""
+
+import json
+import sys
+
+import pytest
+from PySide6.QtWidgets import QLabel
+from GUI.diagnostics import startup
+
+
+@pytest.fixture(autouse=True)
+def no_active_trace():
+    startup.stop()
+    yield
+    startup.stop()
+
+
+@pytest.fixture
+def fake_package(tmp_path, monkeypatch):
+    package = tmp_path / "trace_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("from trace_pkg import inner\n")
+    (package / "inner.py").write_text("VALUE = sum(range(1000))\n")
+    (package / "broken.py").write_text("raise ImportError('nope')\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "trace_pkg"
+    for name in ("trace_pkg", "trace_pkg.inner", "trace_pkg.broken"):
+        sys.modules.pop(name, None)
+
+
+def test_parse_options_from_flags_and_environment():
+    argv = ["main.py", "--trace-startup", "--quit-after-startup", "--other"]
+    assert startup.parse_options(argv, {}) == ("startup-trace.json", True)
+    assert argv == ["main.py", "--other"]
+    argv = ["main.py", "--trace-startup=/tmp/t.json"]
+    assert startup.parse_options(argv, {}) == ("/tmp/t.json", False)
+    assert startup.parse_options(["main.py"], {startup.ENV_VAR: "1"})[0] == (
+        "startup-trace.json"
+    )
+    assert startup.parse_options(["main.py"], {startup.ENV_VAR: "x.json"})[0] == (
+        "x.json"
+    )
+    assert startup.parse_options(["main.py"], {startup.ENV_VAR: "0"})[0] is None
+    assert startup.start_from_argv(["main.py"], {}) is None
+    assert startup.active() is None
+
+
+def test_imports_are_timed_with_nesting(fake_package):
+    trace = startup.start()
+    import trace_pkg
+
+    with pytest.raises(ImportError):
+        import trace_pkg.broken  # noqa: F401
+    trace.stop_imports()
+    records = {record[0]: record for record in trace.imports}
+    assert records["trace_pkg"][4] == 0 and records["trace_pkg.inner"][4] == 1
+    assert records["trace_pkg"][2] >= records["trace_pkg.inner"][2]
+    assert "trace_pkg.broken" in records and trace._import_stack == []
+    # The wrapper loader is not left on the module
+    assert type(trace_pkg.__loader__).__name__ == "SourceFileLoader"
+    assert trace_pkg.inner.__spec__.loader is trace_pkg.inner.__loader__
+    assert not any(isinstance(f, startup._ImportHook) for f in sys.meta_path)
+
+
+def test_spans_nest_and_are_free_when_off():
+    assert startup.span("off") is startup.span("other")  # Shared no-op
+    trace = startup.start()
+    trace.stop_imports()
+    with startup.span("window"):
+        with startup.span("layout"):
+            pass
+    startup.mark("ready")
+    report = trace.report()
+    assert [(s["name"], s["depth"]) for s in report["spans"]] == [
+        ("window", 0),
+        ("layout", 1),
+    ]
+    assert report["spans"][0]["ms"] >= report["spans"][1]["ms"]
+    assert "ready" in report["marks"]
+
+
+def test_first_paint_writes_the_report(qtbot, tmp_path, capsys):
+    path = tmp_path / "trace.json"
+    trace = startup.start(str(path))
+    with startup.span("QLabel"):
+        label = QLabel("hello")
+    qtbot.addWidget(label)
+    startup.finish_on_first_paint(label)
+    label.show()
+    qtbot.waitUntil(lambda: trace.finished)
+    report = json.loads(path.read_text())
+    assert report["first_paint_ms"] > 0 and report["spans"][0]["name"] == "QLabel"
+    assert "First paint" in capsys.readouterr().out
+    # Later spans and a second window are ignored once finished
+    assert startup.span("late") is startup.span("other")
+    startup.finish_on_first_paint(label)
@@ -0,0 +1,120 @@
+"""
+Tests for trace-event spans and counters (GUI/diagnostics/tracing.py).
+Covers normal, edge, and failure cases.
+"""
+
+import json
+import threading
+
+import pytest
+from GUI.diagnostics import tracing
+from GUI.storage.character_store import Character, CharacterStore
+from GUI.windows.export_dialog import ExportWorker
+from GUI.windows.timeline_board import TimelineBoardWidget
+
+
+@pytest.fixture
+def recorder(tmp_path):
+    recorder = tracing.enable(str(tmp_path / "trace.json"))
+    yield recorder
+    tracing.disable()
+
+
+def named(recorder, phase):
+    return [e for e in recorder.events if e["ph"] == phase]
+
+
+def test_parse_options_from_flags_and_environment():
+    argv = ["main.py", "--trace", "--trace-startup"]
+    assert tracing.parse_options(argv, {}) == "trace.json"
+    assert argv == ["main.py", "--trace-startup"]
+    assert tracing.parse_options(["main.py", "--trace=t.json"], {}) == "t.json"
+    assert tracing.parse_options(["main.py"], {tracing.ENV_VAR: "1"}) == "trace.json"
+    assert tracing.parse_options(["main.py"], {tracing.ENV_VAR: "0"}) is None
+    assert tracing.enable_from_argv(["main.py"], {}) is None
+    assert tracing.active() is None
+
+
+def test_disabled_tracing_records_nothing():
+    assert tracing.span("a") is tracing.span("b")  # One shared no-op
+
+    @tracing.traced("test")
+    def double(x):
+        """Doubles."""
+        return x * 2
+
+    assert double(4) == 8 and double.__doc__ == "Doubles."
+    tracing.count("nothing")
+    tracing.instant("nothing")
+    assert tracing.active() is None
+
+
+def test_spans_counters_and_export(recorder, tmp_path):
+    @tracing.traced("test")
+    def work():
+        with tracing.span("inner", "test", {"n": 1}):
+            tracing.count("items", 2)
+            tracing.count("items")
+        tracing.instant("done")
+
+    work()
+    with pytest.raises(KeyError):
+        with tracing.span("fails"):
+            raise KeyError("x")
+    thread = threading.Thread(target=work, name="worker")
+    thread.start()
+    thread.join()
+    spans = named(recorder, "X")
+    assert [e["name"] for e in spans[:2]] == [
+        "inner",
+        "test_tracing.test_spans_counters_and_export.<locals>.work",
+    ]
+    outer, inner = spans[1], spans[0]
+    assert outer["ts"] <= inner["ts"] and outer["dur"] >= inner["dur"]
+    assert inner["args"] == {"n": 1} and spans[2]["args"] == {"error": "KeyError"}
+    assert spans[3]["tid"] != spans[0]["tid"]
+    assert [e["args"]["value"] for e in named(recorder, "C")] == [2, 3, 5, 6]
+    assert len(named(recorder, "i")) == 2
+    trace = json.loads(open(recorder.export()).read())
+    threads = {e["args"]["name"] for e in trace["traceEvents"] if e["ph"] == "M"}
+    assert "worker" in threads and trace["otherData"]["counters"] == {"items": 6}
+
+
+def test_storage_and_cache_are_traced(recorder, tmp_path):
+    path = tmp_path / "characters.json"
+    CharacterStore(path).add(Character("1", "Ann"))
+    CharacterStore(path)
+    CharacterStore(path)
+    names = [e["name"] for e in named(recorder, "X")]
+    assert names == [
+        "character_store.CharacterStore.load",
+        "character_store.CharacterStore.save",
+        "character_store.CharacterStore.load",
+        "character_store.CharacterStore.load",
+    ]
+    assert all(e["cat"] == "storage" for e in named(recorder, "X"))
+    # Saving drops the cache entry: the next load misses, the one after hits
+    assert recorder.counters == {"session_cache.miss": 1, "session_cache.hit": 1}
+
+
+def test_timeline_add_card_counts_instead_of_printing(qtbot, recorder, capsys):
+    board = TimelineBoardWidget()
+    qtbot.addWidget(board)
+    board.add_card("One")
+    board.add_card({"id": "2", "title": "Two"})
+    assert capsys.readouterr().out == ""
+    assert recorder.counters["timeline.cards_added"] == 2
+
+
+def test_export_worker_span_and_scene_counter(qtbot, recorder, tmp_path):
+    project = {
+        "title": "Traced",
+        "chapters": [
+            {"title": "One", "scenes": [{"title": "A", "content": "x"}] * 3}
+        ],
+    }
+    worker = ExportWorker(project, "Markdown", str(tmp_path / "out.md"))
+    worker.run()
+    (span,) = [e for e in named(recorder, "X") if e["cat"] == "export"]
+    assert span["name"] == "ExportWorker.run" and span["args"] == {"format": "Markdown"}
+    assert recorder.counters["export.scenes"] == 3